@@ -39,6 +39,14 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_name(name, type_, parent_names) -> bool:
+    # The full-text search table (and its FTS5 shadow tables on SQLite) is
+    # created by hand, see infrastructure/sqlalchemy/search/recipe_search.py
+    if type_ == "table":
+        return not (name or "").startswith("RecipeSearch")
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -55,6 +63,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,  # type: ignore
         target_metadata=target_metadata,
+        include_name=include_name,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -80,7 +89,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
         )
 
         with context.begin_transaction():
@@ -0,0 +1,40 @@
+"""add recipe rating counters
+
+Revision ID: 3c5e8a1f2b7d
+Revises: 7f8601d359b8
+Create Date: 2025-06-24 19:12:41.518342
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e8a1f2b7d'
+down_revision: str | Sequence[str] | None = '7f8601d359b8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('Recipes', sa.Column('rating_sum', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('Recipes', sa.Column('review_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill counters from existing reviews
+    op.execute(
+        'UPDATE "Recipes" SET '
+        'rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM "Reviews" '
+        'WHERE "Reviews".recipe_id = "Recipes".id), '
+        'review_count = (SELECT COUNT(*) FROM "Reviews" '
+        'WHERE "Reviews".recipe_id = "Recipes".id)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('Recipes') as batch_op:
+        batch_op.drop_column('review_count')
+        batch_op.drop_column('rating_sum')
@@ -0,0 +1,54 @@
+"""add reviews user recipe unique index
+
+Revision ID: 632822a8cd97
+Revises: 6574757f0ea8
+Create Date: 2025-06-29 11:04:19.226815
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '632822a8cd97'
+down_revision: str | Sequence[str] | None = '6574757f0ea8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Pairs listed in the error before the rest are only counted
+MAX_REPORTED_DUPLICATES = 50
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent submissions could pass the old exists check together.
+    # Which of the duplicate reviews to keep is for the operator to
+    # decide, the migration stops instead of deleting any of them
+    duplicates = op.get_bind().execute(
+        sa.text(
+            'SELECT user_id, recipe_id FROM "Reviews" '
+            'GROUP BY user_id, recipe_id HAVING COUNT(*) > 1 '
+            'ORDER BY user_id, recipe_id'
+        )
+    ).all()
+    if duplicates:
+        pairs = ", ".join(
+            f"({user_id}, {recipe_id})"
+            for user_id, recipe_id in duplicates[:MAX_REPORTED_DUPLICATES]
+        )
+        more = len(duplicates) - MAX_REPORTED_DUPLICATES
+        raise RuntimeError(
+            "Reviews has more than one review per (user_id, recipe_id): "
+            f"{pairs}{f' and {more} more' if more > 0 else ''}. Remove the "
+            "extra reviews, run `python -m src.run.database.repair_ratings` "
+            "and upgrade again."
+        )
+    op.create_index('uq_Reviews_user_recipe', 'Reviews', ['user_id', 'recipe_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_Reviews_user_recipe', table_name='Reviews')
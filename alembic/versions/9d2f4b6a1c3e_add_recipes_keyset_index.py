@@ -0,0 +1,27 @@
+"""add recipes keyset index
+
+Revision ID: 9d2f4b6a1c3e
+Revises: 3c5e8a1f2b7d
+Create Date: 2025-06-25 11:02:17.204815
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2f4b6a1c3e'
+down_revision: str | Sequence[str] | None = '3c5e8a1f2b7d'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_Recipes_created_id', 'Recipes', ['system_created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_Recipes_created_id', table_name='Recipes')
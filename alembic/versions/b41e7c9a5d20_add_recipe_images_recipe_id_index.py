@@ -0,0 +1,27 @@
+"""add recipe images recipe_id index
+
+Revision ID: b41e7c9a5d20
+Revises: 9d2f4b6a1c3e
+Create Date: 2025-06-25 16:40:52.381907
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41e7c9a5d20'
+down_revision: str | Sequence[str] | None = '9d2f4b6a1c3e'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_RecipeImages_recipe_id'), 'RecipeImages', ['recipe_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_RecipeImages_recipe_id'), table_name='RecipeImages')
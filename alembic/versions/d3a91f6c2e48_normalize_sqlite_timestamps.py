@@ -0,0 +1,54 @@
+"""normalize sqlite timestamps
+
+Revision ID: d3a91f6c2e48
+Revises: b05e43374854
+Create Date: 2025-07-01 10:12:45.118204
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a91f6c2e48'
+down_revision: str | Sequence[str] | None = 'b05e43374854'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Rows written by the CURRENT_TIMESTAMP server default carry no fraction
+# of a second ('YYYY-MM-DD HH:MM:SS'), dates typed in by hand no time at
+# all, the ones bound from Python six digits of a second. SQLite compares
+# them as strings, so a keyset cursor taken from such a row sorts after
+# the row itself and the next page repeats it
+TIMESTAMP_COLUMNS = {
+    'Roles': ['system_created_at', 'system_updated_at'],
+    'Users': ['system_created_at', 'system_updated_at'],
+    'Recipes': ['system_created_at', 'system_updated_at'],
+    'RecipeImages': ['system_created_at', 'system_updated_at'],
+    'RecipeIngredients': ['system_created_at', 'system_updated_at'],
+    'Reviews': ['system_created_at', 'system_updated_at', 'created_at'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # PostgreSQL stores timestamps as such, only SQLite needs the rewrite.
+    # The server default of existing tables stays CURRENT_TIMESTAMP, as
+    # SQLite cannot alter it in place; the application binds its own
+    # timestamps on every insert and update
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        for column in columns:
+            for length, suffix in ((10, ' 00:00:00.000000'), (19, '.000000')):
+                op.execute(
+                    f'UPDATE "{table}" SET {column} = {column} || \'{suffix}\' '
+                    f'WHERE length({column}) = {length}'
+                )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The normalized values read back the same, nothing to undo
@@ -0,0 +1,43 @@
+"""add recipe sort indexes
+
+Revision ID: e5a7c2d9f413
+Revises: b41e7c9a5d20
+Create Date: 2025-06-26 11:05:17.204631
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c2d9f413'
+down_revision: str | Sequence[str] | None = 'b41e7c9a5d20'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('Recipes', sa.Column('average_rating', sa.Float(), server_default='0', nullable=False))
+
+    # Backfill from the rating counters
+    op.execute(
+        'UPDATE "Recipes" SET average_rating = '
+        'CAST(rating_sum AS FLOAT) / review_count '
+        'WHERE review_count > 0'
+    )
+
+    op.create_index('ix_Recipes_rating_id', 'Recipes', ['average_rating', 'id'], unique=False)
+    op.create_index('ix_Recipes_review_count_id', 'Recipes', ['review_count', 'id'], unique=False)
+    op.create_index('ix_Recipes_preparation_time_id', 'Recipes', ['preparation_time', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_Recipes_preparation_time_id', table_name='Recipes')
+    op.drop_index('ix_Recipes_review_count_id', table_name='Recipes')
+    op.drop_index('ix_Recipes_rating_id', table_name='Recipes')
+    with op.batch_alter_table('Recipes') as batch_op:
+        batch_op.drop_column('average_rating')
@@ -0,0 +1,53 @@
+"""add recipe search index
+
+Revision ID: f2c84b1d6e57
+Revises: e5a7c2d9f413
+Create Date: 2025-06-27 10:24:09.517288
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c84b1d6e57'
+down_revision: str | Sequence[str] | None = 'e5a7c2d9f413'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# The table as of this revision, copied rather than imported from
+# infrastructure/sqlalchemy/search/recipe_search.py so later changes there
+# do not rewrite history. Existing recipes are indexed by
+# `python -m src.run.database.index_search`: on SQLite the documents are
+# stemmed in Python
+CREATE_DDL = {
+    'sqlite': (
+        'CREATE VIRTUAL TABLE IF NOT EXISTS "RecipeSearch" '
+        'USING fts5(title, body)',
+    ),
+    'postgresql': (
+        'CREATE TABLE IF NOT EXISTS "RecipeSearch" ('
+        'recipe_id INTEGER PRIMARY KEY REFERENCES "Recipes" (id) '
+        'ON DELETE CASCADE, '
+        'document TSVECTOR NOT NULL)',
+        'CREATE INDEX IF NOT EXISTS "ix_RecipeSearch_document" '
+        'ON "RecipeSearch" USING GIN (document)',
+    ),
+}
+DROP_DDL = 'DROP TABLE IF EXISTS "RecipeSearch"'
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect not in CREATE_DDL:
+        raise RuntimeError(f'Full-text search is not supported on {dialect}')
+    for statement in CREATE_DDL[dialect]:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(DROP_DDL)
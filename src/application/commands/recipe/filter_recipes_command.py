@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FilterRecipesCommand:
+    sort: str = "newest"
+    max_preparation_time: int | None = None
+    servings: int | None = None
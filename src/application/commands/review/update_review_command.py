@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class UpdateReviewCommand:
+    review_id: int
+    rating: int
+    text: str
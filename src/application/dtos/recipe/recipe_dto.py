@@ -1,10 +1,20 @@
 from dataclasses import dataclass
+from datetime import datetime
+from math import ceil
 from typing import Self
 
 from application.dtos.image.image_dto import ImageDTO
-from application.dtos.review.review_dto import AuthoredReviewDTO
+from application.dtos.review.review_dto import (
+    AuthoredReviewDTO,
+    RatingHistogramDTO,
+)
 from application.dtos.user.user_dto import UserDTO
-from domain.entities.recipe.recipe import Recipe
+from domain.entities.recipe.recipe import (
+    ContentVersion,
+    Recipe,
+    RecipeIngredientMatch,
+    RecipeSummary,
+)
 
 
 @dataclass
@@ -18,9 +28,14 @@ class RecipeDTO:
     steps: str
     author_id: int
     images: list[ImageDTO]
+    # Sanitized HTML of description, ingredients and steps, if rendered
+    description_html: str | None = None
+    ingredients_html: str | None = None
+    steps_html: str | None = None
 
     @classmethod
     def from_domain(cls, recipe: Recipe) -> Self:
+        markup = recipe.markup
         return cls(
             id=recipe.id_safe.value,
             title=recipe.content.title,
@@ -31,6 +46,9 @@ class RecipeDTO:
             steps=recipe.instruction.steps,
             author_id=recipe.author_id.value,
             images=[ImageDTO.from_domain(img) for img in recipe.images],
+            description_html=markup.description_html if markup else None,
+            ingredients_html=markup.ingredients_html if markup else None,
+            steps_html=markup.steps_html if markup else None,
         )
 
 
@@ -46,39 +64,149 @@ class RecipeSummaryDTO:
     images: list[ImageDTO]
 
     @classmethod
-    def from_domain(
-        cls,
-        recipe: Recipe,
-        average_rating: float,
-        review_count: int,
-    ) -> Self:
+    def from_domain(cls, recipe: Recipe) -> Self:
         return cls(
             id=recipe.id_safe.value,
             title=recipe.content.title,
             preparation_time=recipe.details.preparation_time,
             servings=recipe.details.servings,
-            average_rating=average_rating,
-            review_count=review_count,
+            average_rating=recipe.rating.average_rating,
+            review_count=recipe.rating.review_count,
             author_id=recipe.author_id.value,
             images=[ImageDTO.from_domain(img) for img in recipe.images],
         )
 
+    @classmethod
+    def from_summary(cls, summary: RecipeSummary) -> Self:
+        return cls(
+            id=summary.recipe_id.value,
+            title=summary.title,
+            preparation_time=summary.details.preparation_time,
+            servings=summary.details.servings,
+            average_rating=summary.rating.average_rating,
+            review_count=summary.rating.review_count,
+            author_id=summary.author_id.value,
+            images=[ImageDTO.from_domain(summary.cover)]
+            if summary.cover
+            else [],
+        )
+
+
+@dataclass
+class RecipePageDTO:
+    recipes: list[RecipeSummaryDTO]
+    page: int
+    per_page: int
+    total_count: int | None  # not counted for filtered lists
+    next_cursor: str | None
+    previous_cursor: str | None
+
+    @property
+    def total_pages(self) -> int | None:
+        if self.total_count is None:
+            return None
+        return max(1, ceil(self.total_count / self.per_page))
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+
+@dataclass
+class UserRecipePageDTO:
+    recipes: list[RecipeSummaryDTO]
+    next_cursor: str | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+@dataclass
+class RecipeSearchPageDTO:
+    query: str
+    recipes: list[RecipeSummaryDTO]
+    page: int
+    per_page: int
+    has_next: bool
+
+    @property
+    def has_previous(self) -> bool:
+        return self.page > 1
+
+
+@dataclass
+class RecipeIngredientMatchDTO:
+    recipe: RecipeSummaryDTO
+    matched_count: int
+
+    @classmethod
+    def from_domain(cls, match: RecipeIngredientMatch) -> Self:
+        return cls(
+            recipe=RecipeSummaryDTO.from_summary(match.summary),
+            matched_count=match.matched_count,
+        )
+
+
+@dataclass
+class IngredientSearchPageDTO:
+    ingredients: list[str]
+    matches: list[RecipeIngredientMatchDTO]
+    page: int
+    per_page: int
+    has_next: bool
+
+    @property
+    def has_previous(self) -> bool:
+        return self.page > 1
+
 
 @dataclass
 class FullRecipeDTO:
     recipe: RecipeDTO
     author: UserDTO
-    reviews: list[AuthoredReviewDTO]
+    reviews: list[AuthoredReviewDTO]  # the newest page only
     summary: RecipeSummaryDTO
+    rating_histogram: RatingHistogramDTO | None = None
+    next_reviews_cursor: str | None = None
+    reviewed_by_viewer: bool = False
 
     @classmethod
-    def create(
+    def create(  # noqa: PLR0913
         cls,
         recipe: RecipeDTO,
         author: UserDTO,
         reviews: list[AuthoredReviewDTO],
         summary: RecipeSummaryDTO,
+        rating_histogram: RatingHistogramDTO | None = None,
+        next_reviews_cursor: str | None = None,
+        reviewed_by_viewer: bool = False,
     ) -> Self:
         return cls(
-            recipe=recipe, author=author, reviews=reviews, summary=summary
+            recipe=recipe,
+            author=author,
+            reviews=reviews,
+            summary=summary,
+            rating_histogram=rating_histogram,
+            next_reviews_cursor=next_reviews_cursor,
+            reviewed_by_viewer=reviewed_by_viewer,
+        )
+
+
+@dataclass(frozen=True)
+class ContentVersionDTO:
+    last_modified: datetime | None
+    row_count: int
+    dates_deletions: bool = True
+
+    @classmethod
+    def from_domain(cls, version: ContentVersion) -> Self:
+        return cls(
+            last_modified=version.last_modified,
+            row_count=version.row_count,
+            dates_deletions=version.dates_deletions,
         )
@@ -3,7 +3,9 @@ from datetime import datetime
 from typing import Self
 
 from application.dtos.user.user_dto import UserDTO
+from domain.constants import MAX_RATING, MIN_RATING
 from domain.entities.review.review import Review
+from domain.entities.review.value_objects import RatingHistogram
 from domain.entities.user.user import User
 
 
@@ -14,6 +16,7 @@ class ReviewDTO:
     rating: int
     text: str
     created_at: datetime
+    text_html: str | None = None  # sanitized HTML of text, if rendered
 
     @classmethod
     def from_domain(cls, review: Review) -> "ReviewDTO":
@@ -23,6 +26,7 @@ class ReviewDTO:
             rating=review.rating,
             text=review.text,
             created_at=review.created_at,
+            text_html=review.text_html,
         )
 
 
@@ -37,3 +41,55 @@ class AuthoredReviewDTO:
             review=ReviewDTO.from_domain(review),
             user=UserDTO.from_domain(user),
         )
+
+
+@dataclass
+class ReviewPageDTO:
+    recipe_id: int
+    reviews: list[AuthoredReviewDTO]
+    next_cursor: str | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+@dataclass
+class UserReviewDTO:
+    review: ReviewDTO
+    recipe_id: int
+    recipe_title: str
+
+
+@dataclass
+class UserReviewPageDTO:
+    reviews: list[UserReviewDTO]
+    next_cursor: str | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+@dataclass(frozen=True)
+class RatingHistogramDTO:
+    counts: tuple[int, ...]  # counts[i] is for rating MIN_RATING + i
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def ratings(self) -> range:
+        return range(MAX_RATING, MIN_RATING - 1, -1)  # best first
+
+    def count(self, rating: int) -> int:
+        return self.counts[rating - MIN_RATING]
+
+    def percent(self, rating: int) -> float:
+        total = self.total
+        return 100 * self.count(rating) / total if total else 0.0
+
+    @classmethod
+    def from_domain(cls, histogram: RatingHistogram) -> Self:
+        return cls(counts=histogram.counts)
@@ -35,6 +35,18 @@ class DuplicateEntryError(RepositoryError):
         )
 
 
+class AlreadyReviewedError(ApplicationError):
+    def __init__(self, *, cause: Exception | None = None):
+        super().__init__("User has already reviewed this recipe.", cause=cause)
+
+
+class ReviewChangedError(ApplicationError):
+    def __init__(self):
+        super().__init__(
+            "The review was changed by another request, please try again."
+        )
+
+
 class InvalidCredentialsError(ApplicationError):
     def __init__(self, message: str):
         super().__init__(message)
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from domain.entities.recipe.recipe import Recipe
+from domain.entities.recipe.value_objects import RecipeMarkup
+
+
+class IHtmlRenderer(ABC):
+    """
+    Renders user-written markdown into sanitized HTML that is stored
+    next to it and shown as is.
+    """
+
+    @abstractmethod
+    def render(self, text: str) -> str: ...
+
+    def render_many(self, texts: Sequence[str]) -> list[str]:
+        return [self.render(text) for text in texts]
+
+    def render_recipe(self, recipe: Recipe) -> RecipeMarkup:
+        return RecipeMarkup(
+            description_html=self.render(recipe.content.description),
+            ingredients_html=self.render(recipe.instruction.ingredients),
+            steps_html=self.render(recipe.instruction.steps),
+        )
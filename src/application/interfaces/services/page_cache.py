@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+
+INDEX_PAGE_TAG = "index"
+
+
+def recipe_page_tag(recipe_id: int) -> str:
+    return f"recipe:{recipe_id}"
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    body: bytes
+    status: int
+    content_type: str
+
+
+@dataclass(frozen=True)
+class PageCacheStats:
+    hits: int
+    misses: int
+    entries: int
+
+
+class IPageCacheInvalidator(ABC):
+    @abstractmethod
+    def invalidate_recipe(self, recipe_id: int) -> None:
+        """
+        Drops every cached page that shows the recipe: its own page and
+        the index pages.
+        """
+
+
+class IPageCache(IPageCacheInvalidator):
+    @abstractmethod
+    def get(self, key: str) -> CachedPage | None: ...
+    @abstractmethod
+    def set(self, key: str, page: CachedPage, tags: Iterable[str]) -> None: ...
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str]) -> None: ...
+    @abstractmethod
+    def clear(self) -> None: ...
+    @abstractmethod
+    def stats(self) -> PageCacheStats: ...
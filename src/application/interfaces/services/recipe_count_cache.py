@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class IRecipeCountCache(ABC):
+    @abstractmethod
+    def get(self) -> int | None: ...
+    @abstractmethod
+    def set(self, count: int) -> None: ...
+    @abstractmethod
+    def adjust(self, delta: int) -> None: ...
+    @abstractmethod
+    def invalidate(self) -> None: ...
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.user.user_descriptor import UserDescriptor
+
+
+class IUserDescriptorCache(ABC):
+    @abstractmethod
+    def get(self, user_id: int) -> UserDescriptor | None: ...
+    @abstractmethod
+    def set(self, descriptor: UserDescriptor) -> None: ...
+    @abstractmethod
+    def clear(self) -> None: ...
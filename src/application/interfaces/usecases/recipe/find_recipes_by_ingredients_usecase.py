@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from application.dtos.recipe.recipe_dto import IngredientSearchPageDTO
+
+
+class IFindRecipesByIngredientsUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self, ingredients: Sequence[str], page: int, per_page: int
+    ) -> IngredientSearchPageDTO: ...
@@ -5,4 +5,6 @@ from application.dtos.recipe.recipe_dto import FullRecipeDTO
 
 class IGetRecipeByIdUseCase(ABC):
     @abstractmethod
-    def execute(self, recipe_id: int) -> FullRecipeDTO: ...
+    def execute(
+        self, recipe_id: int, viewer_id: int | None = None
+    ) -> FullRecipeDTO: ...
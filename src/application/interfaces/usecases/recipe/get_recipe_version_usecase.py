@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.recipe.recipe_dto import ContentVersionDTO
+
+
+class IGetRecipeVersionUseCase(ABC):
+    @abstractmethod
+    def execute(self, recipe_id: int) -> ContentVersionDTO: ...
@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+
+from application.dtos.recipe.recipe_dto import RecipeSummaryDTO
+
+
+class IGetRecipesByIdsUseCase(ABC):
+    @abstractmethod
+    def execute(self, recipe_ids: Sequence[int]) -> list[RecipeSummaryDTO]: ...
@@ -1,8 +1,18 @@
 from abc import ABC, abstractmethod
 
-from application.dtos.recipe.recipe_dto import RecipeSummaryDTO
+from application.commands.recipe.filter_recipes_command import (
+    FilterRecipesCommand,
+)
+from application.dtos.recipe.recipe_dto import RecipePageDTO
 
 
 class IListRecipesUseCase(ABC):
     @abstractmethod
-    def execute(self, page: int, per_page: int) -> list[RecipeSummaryDTO]: ...
+    def execute(
+        self,
+        page: int,
+        per_page: int,
+        after: str | None = None,
+        before: str | None = None,
+        filters: FilterRecipesCommand | None = None,
+    ) -> RecipePageDTO: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.recipe.recipe_dto import UserRecipePageDTO
+
+
+class IListUserRecipesUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self, user_id: int, after: str | None = None
+    ) -> UserRecipePageDTO: ...
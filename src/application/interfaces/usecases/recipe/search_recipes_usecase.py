@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.recipe.recipe_dto import RecipeSearchPageDTO
+
+
+class ISearchRecipesUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self, query: str, page: int, per_page: int
+    ) -> RecipeSearchPageDTO: ...
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.user.user_descriptor import UserDescriptor
+
+
+class IDeleteReviewUseCase(ABC):
+    @abstractmethod
+    def execute(self, review_id: int, descriptor: UserDescriptor) -> None: ...
@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.review.review_dto import ReviewDTO
+
+
+class IGetReviewByIdUseCase(ABC):
+    @abstractmethod
+    def execute(self, review_id: int) -> ReviewDTO: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.review.review_dto import ReviewPageDTO
+
+
+class IListReviewsUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self, recipe_id: int, after: str | None = None
+    ) -> ReviewPageDTO: ...
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+
+from application.dtos.review.review_dto import UserReviewPageDTO
+
+
+class IListUserReviewsUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self, user_id: int, after: str | None = None
+    ) -> UserReviewPageDTO: ...
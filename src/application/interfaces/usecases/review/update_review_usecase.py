@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from application.commands.review.update_review_command import (
+    UpdateReviewCommand,
+)
+from application.dtos.review.review_dto import ReviewDTO
+from application.dtos.user.user_descriptor import UserDescriptor
+
+
+class IUpdateReviewUseCase(ABC):
+    @abstractmethod
+    def execute(
+        self, command: UpdateReviewCommand, descriptor: UserDescriptor
+    ) -> ReviewDTO: ...
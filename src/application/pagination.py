@@ -0,0 +1,53 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from datetime import datetime
+from typing import Any
+
+from domain.pagination import Cursor, CursorValue
+
+
+DEFAULT_CURSOR_KEY = "newest"
+REVIEWS_CURSOR_KEY = "reviews"
+USER_RECIPES_CURSOR_KEY = "user_recipes"
+USER_REVIEWS_CURSOR_KEY = "user_reviews"
+
+
+def encode_cursor(cursor: Cursor, key: str = DEFAULT_CURSOR_KEY) -> str:
+    # The key names the ordering, a cursor is meaningless in any other one
+    value = cursor.value
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([key, value, cursor.entity_id])
+    return urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    token: str,
+    key: str = DEFAULT_CURSOR_KEY,
+    value_type: type[CursorValue] = datetime,
+) -> Cursor:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        token_key, value, entity_id = json.loads(urlsafe_b64decode(padded))
+        if token_key != key:
+            raise ValueError(f"Cursor of another ordering: {token_key}")
+        return Cursor(_parse_value(value, value_type), int(entity_id))
+    except (
+        AssertionError,
+        BinasciiError,
+        TypeError,
+        UnicodeDecodeError,
+        ValueError,
+    ) as e:
+        raise ValueError("Invalid pagination cursor.") from e
+
+
+def _parse_value(value: Any, value_type: type[CursorValue]) -> CursorValue:
+    if value_type is datetime:
+        return datetime.fromisoformat(value)
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        raise TypeError(f"Not a number: {value!r}")
+    if value_type is int and not isinstance(value, int):
+        raise TypeError(f"Not an integer: {value!r}")
+    return value_type(value)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
 from typing import Self
 
 
@@ -8,6 +9,8 @@ class ITransactionManager(ABC):
     @abstractmethod
     def commit(self): ...
     @abstractmethod
+    def read_only(self) -> AbstractContextManager[Self]: ...
+    @abstractmethod
     def __enter__(self) -> Self: ...
     @abstractmethod
     def __exit__(
@@ -1,6 +1,6 @@
 import functools
 from collections.abc import Callable
-from typing import Any, TypeVar
+from typing import Any, TypeVar, overload
 
 from .configuration import CurrentTransactionManager
 
@@ -8,13 +8,29 @@ from .configuration import CurrentTransactionManager
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def transactional(func: F) -> F:
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        manager = CurrentTransactionManager.get()
-        if not manager:
-            raise ValueError("Transaction manager is not set.")
-        with manager:
-            return func(*args, **kwargs)
+@overload
+def transactional(func: F) -> F: ...
+@overload
+def transactional(*, read_only: bool = False) -> Callable[[F], F]: ...
+def transactional(
+    func: F | None = None, *, read_only: bool = False
+) -> F | Callable[[F], F]:
+    """
+    Runs the function in a transaction: @transactional, or
+    @transactional(read_only=True) for one that is never committed.
+    """
 
-    return wrapper  # type: ignore
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            manager = CurrentTransactionManager.get()
+            if not manager:
+                raise ValueError("Transaction manager is not set.")
+            with manager.read_only() if read_only else manager:
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    if func is None:
+        return decorator
+    return decorator(func)
@@ -6,7 +6,14 @@ from application.commands.recipe.create_recipe_command import (
 )
 from application.dtos.recipe.recipe_dto import RecipeDTO
 from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.html_renderer import IHtmlRenderer
 from application.interfaces.services.image_store import IImageStore
+from application.interfaces.services.page_cache import (
+    IPageCacheInvalidator,
+)
+from application.interfaces.services.recipe_count_cache import (
+    IRecipeCountCache,
+)
 from application.interfaces.usecases.recipe.create_recipe_usecase import (
     ICreateRecipeUseCase,
 )
@@ -20,21 +27,38 @@ from domain.repositories.recipe_repository import IRecipeRepository
 
 
 class CreateRecipeUseCase(ICreateRecipeUseCase):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         recipe_factory: IRecipeFactory,
         image_factory: IRecipeImageFactory,
         recipe_repository: IRecipeRepository,
         image_store: IImageStore,
+        count_cache: IRecipeCountCache,
+        page_cache: IPageCacheInvalidator,
+        html_renderer: IHtmlRenderer,
     ):
         self.recipe_factory = recipe_factory
         self.image_factory = image_factory
         self.recipe_repository = recipe_repository
         self.image_store = image_store
+        self.count_cache = count_cache
+        self.page_cache = page_cache
+        self.html_renderer = html_renderer
 
-    @transactional
     def execute(
         self, command: CreateRecipeCommand, descriptor: UserDescriptor
+    ) -> RecipeDTO:
+        recipe = self._create(command, descriptor)
+        # The caches follow the committed rows: a rolled back insert
+        # leaves them as they were, and a request in between cannot cache
+        # a page without the recipe again
+        self.count_cache.adjust(1)
+        self.page_cache.invalidate_recipe(recipe.id)
+        return recipe
+
+    @transactional
+    def _create(
+        self, command: CreateRecipeCommand, descriptor: UserDescriptor
     ) -> RecipeDTO:
         recipe = self.recipe_factory.create(
             RecipeData(
@@ -47,6 +71,7 @@ class CreateRecipeUseCase(ICreateRecipeUseCase):
                 author_id=descriptor.user_id,
             )
         )
+        recipe.markup = self.html_renderer.render_recipe(recipe)
 
         recipe = self.recipe_repository.save(recipe)
 
@@ -1,20 +1,42 @@
 from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.page_cache import (
+    IPageCacheInvalidator,
+)
+from application.interfaces.services.recipe_count_cache import (
+    IRecipeCountCache,
+)
 from application.interfaces.usecases.recipe.delete_recipe_usecase import (
     IDeleteRecipeUseCase,
 )
 from application.transactions.transactional import transactional
-from domain.repositories.recipe_repository import IRecipeRepository
+from domain.repositories.recipe_repository import (
+    IRecipeRepository,
+    RecipeLoadProfile,
+)
 
 
 class DeleteRecipeUseCase(IDeleteRecipeUseCase):
     def __init__(
         self,
         recipe_repository: IRecipeRepository,
+        count_cache: IRecipeCountCache,
+        page_cache: IPageCacheInvalidator,
     ):
         self.recipe_repository = recipe_repository
+        self.count_cache = count_cache
+        self.page_cache = page_cache
 
-    @transactional
     def execute(self, recipe_id: int, descriptor: UserDescriptor) -> None:
-        recipe = self.recipe_repository.get_by_id(recipe_id)
+        self._delete(recipe_id, descriptor)
+        # A failed delete leaves the count alone, and the index page is
+        # invalidated only once the recipe is gone for every reader
+        self.count_cache.adjust(-1)
+        self.page_cache.invalidate_recipe(recipe_id)
+
+    @transactional
+    def _delete(self, recipe_id: int, descriptor: UserDescriptor) -> None:
+        recipe = self.recipe_repository.get_by_id(
+            recipe_id, RecipeLoadProfile.OWNERSHIP_CHECK
+        )
         recipe.ensure_can_mutate(descriptor.user_id, descriptor.role)
         self.recipe_repository.remove(recipe)
@@ -0,0 +1,47 @@
+from collections.abc import Sequence
+
+from application.dtos.recipe.recipe_dto import (
+    IngredientSearchPageDTO,
+    RecipeIngredientMatchDTO,
+)
+from application.interfaces.usecases.recipe.find_recipes_by_ingredients_usecase import (
+    IFindRecipesByIngredientsUseCase,
+)
+from domain.constants import MAX_INGREDIENTS_PER_QUERY, MAX_PER_PAGE
+from domain.repositories.recipe_repository import IRecipeRepository
+
+
+class FindRecipesByIngredientsUseCase(IFindRecipesByIngredientsUseCase):
+    def __init__(self, recipe_repository: IRecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    def execute(
+        self, ingredients: Sequence[str], page: int, per_page: int
+    ) -> IngredientSearchPageDTO:
+        # Blanks and case-insensitive duplicates are dropped, order is kept
+        unique: dict[str, str] = {}
+        for name in map(str.strip, ingredients):
+            if name:
+                unique.setdefault(name.lower(), name)
+        requested = list(unique.values())
+        if not requested:
+            raise ValueError("No ingredients given.")
+        if len(requested) > MAX_INGREDIENTS_PER_QUERY:
+            raise ValueError("Too many ingredients.")
+        if page < 1 or per_page < 1 or per_page > MAX_PER_PAGE:
+            raise ValueError("Invalid pagination parameters.")
+
+        # One extra match tells whether there is a next page
+        matches = self.recipe_repository.find_by_ingredients(
+            requested, limit=per_page + 1, offset=(page - 1) * per_page
+        )
+        return IngredientSearchPageDTO(
+            ingredients=requested,
+            matches=[
+                RecipeIngredientMatchDTO.from_domain(match)
+                for match in matches[:per_page]
+            ],
+            page=page,
+            per_page=per_page,
+            has_next=len(matches) > per_page,
+        )
@@ -0,0 +1,35 @@
+from application.dtos.recipe.recipe_dto import ContentVersionDTO
+from application.interfaces.services.recipe_count_cache import (
+    IRecipeCountCache,
+)
+from application.interfaces.usecases.recipe.get_catalog_version_usecase import (
+    IGetCatalogVersionUseCase,
+)
+from domain.entities.recipe.recipe import ContentVersion
+from domain.repositories.recipe_repository import IRecipeRepository
+
+
+class GetCatalogVersionUseCase(IGetCatalogVersionUseCase):
+    def __init__(
+        self,
+        recipe_repository: IRecipeRepository,
+        count_cache: IRecipeCountCache,
+    ):
+        self.recipe_repository = recipe_repository
+        self.count_cache = count_cache
+
+    def execute(self) -> ContentVersionDTO:
+        # Runs on every anonymous listing request, ahead of the page cache:
+        # one index lookup and the cached recipe count, never a table scan.
+        # Reviews bump their recipe's row; only a deleted recipe leaves the
+        # timestamp, so the count has to tell it apart
+        count = self.count_cache.get()
+        if count is None:
+            count = self.recipe_repository.count()
+            self.count_cache.set(count)
+        version = ContentVersion(
+            self.recipe_repository.get_catalog_updated_at(),
+            count,
+            dates_deletions=False,
+        )
+        return ContentVersionDTO.from_domain(version)
@@ -5,14 +5,17 @@ from application.dtos.recipe.recipe_dto import (
 )
 from application.dtos.review.review_dto import (
     AuthoredReviewDTO,
+    RatingHistogramDTO,
 )
 from application.dtos.user.user_dto import UserDTO
 from application.interfaces.usecases.recipe.get_recipe_by_id_usecase import (
     IGetRecipeByIdUseCase,
 )
+from application.pagination import REVIEWS_CURSOR_KEY, encode_cursor
+from application.transactions.transactional import transactional
+from domain.constants import REVIEWS_PER_PAGE
 from domain.repositories.recipe_repository import IRecipeRepository
 from domain.repositories.review_repository import IReviewRepository
-from domain.repositories.user_repository import IUserRepository
 
 
 class GetRecipeByIdUseCase(IGetRecipeByIdUseCase):
@@ -20,32 +23,36 @@ class GetRecipeByIdUseCase(IGetRecipeByIdUseCase):
         self,
         recipe_repository: IRecipeRepository,
         review_repository: IReviewRepository,
-        user_repository: IUserRepository,
     ):
         self.recipe_repository = recipe_repository
         self.review_repository = review_repository
-        self.user_repository = user_repository
 
-    def execute(self, recipe_id: int) -> FullRecipeDTO:
-        recipe = self.recipe_repository.get_by_id(recipe_id)
-        author = self.user_repository.get_by_id(recipe.author_id.value)
-        reviews = self.review_repository.get_with_author_by_recipe_id(
-            recipe_id
-        )
-        avg_rating = (
-            (sum(i.review.rating for i in reviews) / len(reviews))
-            if reviews
-            else 0
+    @transactional(read_only=True)
+    def execute(
+        self, recipe_id: int, viewer_id: int | None = None
+    ) -> FullRecipeDTO:
+        detail = self.recipe_repository.get_detail(recipe_id, viewer_id)
+        # Only the newest reviews, the rest are loaded on demand; the
+        # summary rating comes from the recipe's counters of all of them
+        reviews = self.review_repository.get_page_by_recipe_id(
+            recipe_id, limit=REVIEWS_PER_PAGE
         )
 
         return FullRecipeDTO.create(
-            RecipeDTO.from_domain(recipe),
-            UserDTO.from_domain(author),
+            RecipeDTO.from_domain(detail.recipe),
+            UserDTO.from_domain(detail.author),
             reviews=[
                 AuthoredReviewDTO.from_domain(r.review, r.author)
-                for r in reviews
+                for r in reviews.items
             ],
-            summary=RecipeSummaryDTO.from_domain(
-                recipe, avg_rating, len(reviews)
+            summary=RecipeSummaryDTO.from_domain(detail.recipe),
+            rating_histogram=RatingHistogramDTO.from_domain(
+                detail.rating_histogram
+            ),
+            next_reviews_cursor=(
+                encode_cursor(reviews.next_cursor, REVIEWS_CURSOR_KEY)
+                if reviews.next_cursor
+                else None
             ),
+            reviewed_by_viewer=detail.reviewed_by_viewer,
         )
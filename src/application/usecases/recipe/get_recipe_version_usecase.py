@@ -0,0 +1,15 @@
+from application.dtos.recipe.recipe_dto import ContentVersionDTO
+from application.interfaces.usecases.recipe.get_recipe_version_usecase import (
+    IGetRecipeVersionUseCase,
+)
+from domain.repositories.recipe_repository import IRecipeRepository
+
+
+class GetRecipeVersionUseCase(IGetRecipeVersionUseCase):
+    def __init__(self, recipe_repository: IRecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    def execute(self, recipe_id: int) -> ContentVersionDTO:
+        # The recipe and its reviews, all a recipe page shows
+        version = self.recipe_repository.get_version(recipe_id)
+        return ContentVersionDTO.from_domain(version)
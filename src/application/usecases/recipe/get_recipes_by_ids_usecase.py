@@ -0,0 +1,33 @@
+from collections.abc import Sequence
+
+from application.dtos.recipe.recipe_dto import RecipeSummaryDTO
+from application.interfaces.usecases.recipe.get_recipes_by_ids_usecase import (
+    IGetRecipesByIdsUseCase,
+)
+from domain.constants import MAX_IDS_PER_QUERY
+from domain.repositories.recipe_repository import IRecipeRepository
+
+
+class GetRecipesByIdsUseCase(IGetRecipesByIdsUseCase):
+    def __init__(self, recipe_repository: IRecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    def execute(self, recipe_ids: Sequence[int]) -> list[RecipeSummaryDTO]:
+        requested = list(dict.fromkeys(recipe_ids))
+        if not requested:
+            raise ValueError("No recipe ids given.")
+        if len(requested) > MAX_IDS_PER_QUERY:
+            raise ValueError("Too many recipe ids.")
+
+        # In the requested order; ids of missing recipes are skipped
+        summaries = {
+            summary.recipe_id.value: summary
+            for summary in self.recipe_repository.get_summaries_by_ids(
+                requested
+            )
+        }
+        return [
+            RecipeSummaryDTO.from_summary(summaries[recipe_id])
+            for recipe_id in requested
+            if recipe_id in summaries
+        ]
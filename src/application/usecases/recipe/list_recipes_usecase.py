@@ -1,37 +1,119 @@
-from application.dtos.recipe.recipe_dto import RecipeSummaryDTO
+from datetime import datetime
+
+from application.commands.recipe.filter_recipes_command import (
+    FilterRecipesCommand,
+)
+from application.dtos.recipe.recipe_dto import RecipePageDTO, RecipeSummaryDTO
+from application.interfaces.services.recipe_count_cache import (
+    IRecipeCountCache,
+)
 from application.interfaces.usecases.recipe.list_recipes_usecase import (
     IListRecipesUseCase,
 )
+from application.pagination import decode_cursor, encode_cursor
 from domain.constants import MAX_PER_PAGE
-from domain.repositories.recipe_repository import IRecipeRepository
-from domain.repositories.review_repository import IReviewRepository
+from domain.pagination import Cursor, CursorValue
+from domain.repositories.recipe_repository import (
+    IRecipeRepository,
+    RecipeFilter,
+    RecipeListSpec,
+    RecipeSort,
+)
+
+
+# Type of the sort key a cursor of each ordering carries
+_CURSOR_VALUE_TYPES: dict[RecipeSort, type[CursorValue]] = {
+    RecipeSort.NEWEST: datetime,
+    RecipeSort.RATING: float,
+    RecipeSort.REVIEW_COUNT: int,
+    RecipeSort.PREPARATION_TIME: int,
+}
 
 
 class ListRecipesUseCase(IListRecipesUseCase):
     def __init__(
         self,
         recipe_repository: IRecipeRepository,
-        review_repository: IReviewRepository,
+        count_cache: IRecipeCountCache,
     ):
         self.recipe_repository = recipe_repository
-        self.review_repository = review_repository
+        self.count_cache = count_cache
 
-    def execute(self, page: int, per_page: int) -> list[RecipeSummaryDTO]:
+    def execute(
+        self,
+        page: int,
+        per_page: int,
+        after: str | None = None,
+        before: str | None = None,
+        filters: FilterRecipesCommand | None = None,
+    ) -> RecipePageDTO:
         if page < 1 or per_page < 1 or per_page > MAX_PER_PAGE:
             raise ValueError("Invalid pagination parameters.")
+        if after and before:
+            raise ValueError("Invalid pagination parameters.")
+        spec = self._to_spec(filters or FilterRecipesCommand())
 
-        recipes = self.recipe_repository.get_all(page=page, per_page=per_page)
-
-        result: list[RecipeSummaryDTO] = []
-        for recipe in recipes:
-            reviews = self.review_repository.get_by_recipe_id(
-                recipe.id_safe.value
+        if after or before:
+            result = self.recipe_repository.get_summary_page(
+                limit=per_page,
+                after=self._decode_cursor(after, spec.sort),
+                before=self._decode_cursor(before, spec.sort),
+                spec=spec,
             )
-            avg_rating = (
-                sum(r.rating for r in reviews) / len(reviews) if reviews else 0
+        else:
+            # Plain ?page= links: seek by offset once, the links rendered
+            # for the neighbouring pages carry cursors again
+            result = self.recipe_repository.get_summary_page(
+                limit=per_page, offset=(page - 1) * per_page, spec=spec
             )
-            result.append(
-                RecipeSummaryDTO.from_domain(recipe, avg_rating, len(reviews))
+
+        return RecipePageDTO(
+            recipes=[
+                RecipeSummaryDTO.from_summary(summary)
+                for summary in result.items
+            ],
+            page=page,
+            per_page=per_page,
+            # Only the unfiltered total is cached; counting every filter
+            # combination would cost a scan per request
+            total_count=(
+                self._count_recipes() if spec.filters.is_empty else None
+            ),
+            next_cursor=self._encode_cursor(result.next_cursor, spec.sort),
+            previous_cursor=self._encode_cursor(
+                result.previous_cursor, spec.sort
+            ),
+        )
+
+    def _to_spec(self, command: FilterRecipesCommand) -> RecipeListSpec:
+        try:
+            sort = RecipeSort(command.sort)
+        except ValueError as e:
+            raise ValueError("Invalid sort order.") from e
+        try:
+            filters = RecipeFilter(
+                max_preparation_time=command.max_preparation_time,
+                servings=command.servings,
             )
+        except AssertionError as e:
+            raise ValueError("Invalid filter parameters.") from e
+        return RecipeListSpec(sort=sort, filters=filters)
+
+    def _decode_cursor(
+        self, token: str | None, sort: RecipeSort
+    ) -> Cursor | None:
+        if not token:
+            return None
+        return decode_cursor(token, sort.value, _CURSOR_VALUE_TYPES[sort])
+
+    def _encode_cursor(
+        self, cursor: Cursor | None, sort: RecipeSort
+    ) -> str | None:
+        return encode_cursor(cursor, sort.value) if cursor else None
 
-        return result
+    def _count_recipes(self) -> int:
+        count = self.count_cache.get()
+        if count is None:
+            count = self.recipe_repository.count()
+            self.count_cache.set(count)
+        return count
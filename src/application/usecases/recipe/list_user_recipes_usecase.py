@@ -0,0 +1,43 @@
+from application.dtos.recipe.recipe_dto import (
+    RecipeSummaryDTO,
+    UserRecipePageDTO,
+)
+from application.interfaces.usecases.recipe.list_user_recipes_usecase import (
+    IListUserRecipesUseCase,
+)
+from application.pagination import (
+    USER_RECIPES_CURSOR_KEY,
+    decode_cursor,
+    encode_cursor,
+)
+from domain.constants import MAX_PER_PAGE
+from domain.repositories.recipe_repository import IRecipeRepository
+
+
+class ListUserRecipesUseCase(IListUserRecipesUseCase):
+    def __init__(self, recipe_repository: IRecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    def execute(
+        self, user_id: int, after: str | None = None
+    ) -> UserRecipePageDTO:
+        result = self.recipe_repository.get_by_author(
+            user_id,
+            limit=MAX_PER_PAGE,
+            after=(
+                decode_cursor(after, USER_RECIPES_CURSOR_KEY)
+                if after
+                else None
+            ),
+        )
+        return UserRecipePageDTO(
+            recipes=[
+                RecipeSummaryDTO.from_summary(summary)
+                for summary in result.items
+            ],
+            next_cursor=(
+                encode_cursor(result.next_cursor, USER_RECIPES_CURSOR_KEY)
+                if result.next_cursor
+                else None
+            ),
+        )
@@ -0,0 +1,40 @@
+from application.dtos.recipe.recipe_dto import (
+    RecipeSearchPageDTO,
+    RecipeSummaryDTO,
+)
+from application.interfaces.usecases.recipe.search_recipes_usecase import (
+    ISearchRecipesUseCase,
+)
+from domain.constants import MAX_PER_PAGE, MAX_SEARCH_QUERY_LENGTH
+from domain.repositories.recipe_repository import IRecipeRepository
+
+
+class SearchRecipesUseCase(ISearchRecipesUseCase):
+    def __init__(self, recipe_repository: IRecipeRepository):
+        self.recipe_repository = recipe_repository
+
+    def execute(
+        self, query: str, page: int, per_page: int
+    ) -> RecipeSearchPageDTO:
+        query = query.strip()
+        if not query:
+            raise ValueError("Search query is empty.")
+        if len(query) > MAX_SEARCH_QUERY_LENGTH:
+            raise ValueError("Search query is too long.")
+        if page < 1 or per_page < 1 or per_page > MAX_PER_PAGE:
+            raise ValueError("Invalid pagination parameters.")
+
+        # One extra result tells whether there is a next page
+        summaries = self.recipe_repository.search(
+            query, limit=per_page + 1, offset=(page - 1) * per_page
+        )
+        return RecipeSearchPageDTO(
+            query=query,
+            recipes=[
+                RecipeSummaryDTO.from_summary(summary)
+                for summary in summaries[:per_page]
+            ],
+            page=page,
+            per_page=per_page,
+            has_next=len(summaries) > per_page,
+        )
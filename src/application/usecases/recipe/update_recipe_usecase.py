@@ -3,6 +3,10 @@ from application.commands.recipe.update_recipe_command import (
 )
 from application.dtos.recipe.recipe_dto import RecipeDTO
 from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from application.interfaces.services.page_cache import (
+    IPageCacheInvalidator,
+)
 from application.interfaces.usecases.recipe.update_recipe_usecase import (
     IUpdateRecipeUseCase,
 )
@@ -12,21 +16,38 @@ from domain.entities.recipe.value_objects import (
     RecipeDetails,
     RecipeInstruction,
 )
-from domain.repositories.recipe_repository import IRecipeRepository
+from domain.repositories.recipe_repository import (
+    IRecipeRepository,
+    RecipeLoadProfile,
+)
 
 
 class UpdateRecipeUseCase(IUpdateRecipeUseCase):
     def __init__(
         self,
         recipe_repository: IRecipeRepository,
+        page_cache: IPageCacheInvalidator,
+        html_renderer: IHtmlRenderer,
     ):
         self.recipe_repository = recipe_repository
+        self.page_cache = page_cache
+        self.html_renderer = html_renderer
 
-    @transactional
     def execute(
         self, command: UpdateRecipeCommand, descriptor: UserDescriptor
     ) -> RecipeDTO:
-        recipe = self.recipe_repository.get_by_id(command.recipe_id)
+        recipe = self._update(command, descriptor)
+        # After the commit, the old page must not be cached again
+        self.page_cache.invalidate_recipe(command.recipe_id)
+        return recipe
+
+    @transactional
+    def _update(
+        self, command: UpdateRecipeCommand, descriptor: UserDescriptor
+    ) -> RecipeDTO:
+        recipe = self.recipe_repository.get_by_id(
+            command.recipe_id, RecipeLoadProfile.FULL
+        )
         recipe.ensure_can_mutate(descriptor.user_id, descriptor.role)
 
         recipe.update(
@@ -34,6 +55,7 @@ class UpdateRecipeUseCase(IUpdateRecipeUseCase):
             RecipeDetails(command.preparation_time, command.servings),
             RecipeInstruction(command.ingredients, command.steps),
         )
+        recipe.markup = self.html_renderer.render_recipe(recipe)
 
         recipe = self.recipe_repository.save(recipe)
         return RecipeDTO.from_domain(recipe)
@@ -3,6 +3,10 @@ from application.commands.review.create_review_command import (
 )
 from application.dtos.review.review_dto import ReviewDTO
 from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from application.interfaces.services.page_cache import (
+    IPageCacheInvalidator,
+)
 from application.interfaces.usecases.review.create_review_usecase import (
     ICreateReviewUseCase,
 )
@@ -20,23 +24,31 @@ class CreateReviewUseCase(ICreateReviewUseCase):
         review_factory: IReviewFactory,
         recipe_repository: IRecipeRepository,
         review_repository: IReviewRepository,
+        page_cache: IPageCacheInvalidator,
+        html_renderer: IHtmlRenderer,
     ):
         self.review_factory = review_factory
         self.recipe_repository = recipe_repository
         self.review_repository = review_repository
+        self.page_cache = page_cache
+        self.html_renderer = html_renderer
 
-    @transactional
     def execute(
         self, command: CreateReviewCommand, descriptor: UserDescriptor
+    ) -> ReviewDTO:
+        review = self._create(command, descriptor)
+        # Only once committed: an anonymous request in between would put
+        # the page without the review back in the cache
+        self.page_cache.invalidate_recipe(command.recipe_id)
+        return review
+
+    @transactional
+    def _create(
+        self, command: CreateReviewCommand, descriptor: UserDescriptor
     ) -> ReviewDTO:
         if descriptor.role not in [RoleEnum.ADMIN.value, RoleEnum.USER.value]:
             raise PermissionError("User cannot create reviews.")
 
-        if self.review_repository.exists_for_user_and_recipe(
-            command.user_id, command.recipe_id
-        ):
-            raise ValueError("User has already reviewed this recipe.")
-
         review = self.review_factory.create(
             ReviewData(
                 recipe_id=command.recipe_id,
@@ -45,6 +57,12 @@ class CreateReviewUseCase(ICreateReviewUseCase):
                 text=command.text,
             )
         )
+        review.text_html = self.html_renderer.render(review.text)
 
+        # A second review of the recipe fails on the unique index and
+        # surfaces as AlreadyReviewedError
         review = self.review_repository.save(review)
+        self.recipe_repository.adjust_rating(
+            command.recipe_id, rating_delta=review.rating, count_delta=1
+        )
         return ReviewDTO.from_domain(review)
@@ -0,0 +1,40 @@
+from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.page_cache import (
+    IPageCacheInvalidator,
+)
+from application.interfaces.usecases.review.delete_review_usecase import (
+    IDeleteReviewUseCase,
+)
+from application.transactions.transactional import transactional
+from domain.repositories.recipe_repository import IRecipeRepository
+from domain.repositories.review_repository import IReviewRepository
+
+
+class DeleteReviewUseCase(IDeleteReviewUseCase):
+    def __init__(
+        self,
+        recipe_repository: IRecipeRepository,
+        review_repository: IReviewRepository,
+        page_cache: IPageCacheInvalidator,
+    ):
+        self.recipe_repository = recipe_repository
+        self.review_repository = review_repository
+        self.page_cache = page_cache
+
+    def execute(self, review_id: int, descriptor: UserDescriptor) -> None:
+        recipe_id = self._delete(review_id, descriptor)
+        # After the commit, the old page must not be cached again
+        self.page_cache.invalidate_recipe(recipe_id)
+
+    @transactional
+    def _delete(self, review_id: int, descriptor: UserDescriptor) -> int:
+        review = self.review_repository.get_by_id(review_id)
+        review.ensure_can_mutate(descriptor.user_id, descriptor.role)
+
+        self.review_repository.remove(review)
+        self.recipe_repository.adjust_rating(
+            review.recipe_id.value,
+            rating_delta=-review.rating,
+            count_delta=-1,
+        )
+        return review.recipe_id.value
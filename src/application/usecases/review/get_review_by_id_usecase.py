@@ -0,0 +1,17 @@
+from application.dtos.review.review_dto import ReviewDTO
+from application.interfaces.usecases.review.get_review_by_id_usecase import (
+    IGetReviewByIdUseCase,
+)
+from application.transactions.transactional import transactional
+from domain.repositories.review_repository import IReviewRepository
+
+
+class GetReviewByIdUseCase(IGetReviewByIdUseCase):
+    def __init__(self, review_repository: IReviewRepository):
+        self.review_repository = review_repository
+
+    @transactional(read_only=True)
+    def execute(self, review_id: int) -> ReviewDTO:
+        return ReviewDTO.from_domain(
+            self.review_repository.get_by_id(review_id)
+        )
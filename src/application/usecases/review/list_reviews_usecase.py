@@ -0,0 +1,40 @@
+from application.dtos.review.review_dto import (
+    AuthoredReviewDTO,
+    ReviewPageDTO,
+)
+from application.interfaces.usecases.review.list_reviews_usecase import (
+    IListReviewsUseCase,
+)
+from application.pagination import (
+    REVIEWS_CURSOR_KEY,
+    decode_cursor,
+    encode_cursor,
+)
+from domain.constants import REVIEWS_PER_PAGE
+from domain.repositories.review_repository import IReviewRepository
+
+
+class ListReviewsUseCase(IListReviewsUseCase):
+    def __init__(self, review_repository: IReviewRepository):
+        self.review_repository = review_repository
+
+    def execute(
+        self, recipe_id: int, after: str | None = None
+    ) -> ReviewPageDTO:
+        result = self.review_repository.get_page_by_recipe_id(
+            recipe_id,
+            limit=REVIEWS_PER_PAGE,
+            after=decode_cursor(after, REVIEWS_CURSOR_KEY) if after else None,
+        )
+        return ReviewPageDTO(
+            recipe_id=recipe_id,
+            reviews=[
+                AuthoredReviewDTO.from_domain(r.review, r.author)
+                for r in result.items
+            ],
+            next_cursor=(
+                encode_cursor(result.next_cursor, REVIEWS_CURSOR_KEY)
+                if result.next_cursor
+                else None
+            ),
+        )
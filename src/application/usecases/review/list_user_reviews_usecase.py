@@ -0,0 +1,65 @@
+from application.dtos.review.review_dto import (
+    ReviewDTO,
+    UserReviewDTO,
+    UserReviewPageDTO,
+)
+from application.interfaces.usecases.review.list_user_reviews_usecase import (
+    IListUserReviewsUseCase,
+)
+from application.pagination import (
+    USER_REVIEWS_CURSOR_KEY,
+    decode_cursor,
+    encode_cursor,
+)
+from application.transactions.transactional import transactional
+from domain.constants import REVIEWS_PER_PAGE
+from domain.repositories.recipe_repository import IRecipeRepository
+from domain.repositories.review_repository import IReviewRepository
+
+
+class ListUserReviewsUseCase(IListUserReviewsUseCase):
+    def __init__(
+        self,
+        recipe_repository: IRecipeRepository,
+        review_repository: IReviewRepository,
+    ):
+        self.recipe_repository = recipe_repository
+        self.review_repository = review_repository
+
+    @transactional(read_only=True)
+    def execute(
+        self, user_id: int, after: str | None = None
+    ) -> UserReviewPageDTO:
+        result = self.review_repository.get_by_user(
+            user_id,
+            limit=REVIEWS_PER_PAGE,
+            after=(
+                decode_cursor(after, USER_REVIEWS_CURSOR_KEY)
+                if after
+                else None
+            ),
+        )
+        # The titles of the page's recipes in one primary key lookup
+        titles = {
+            summary.recipe_id.value: summary.title
+            for summary in self.recipe_repository.get_summaries_by_ids(
+                list({review.recipe_id.value for review in result.items})
+            )
+        }
+        return UserReviewPageDTO(
+            reviews=[
+                UserReviewDTO(
+                    review=ReviewDTO.from_domain(review),
+                    recipe_id=review.recipe_id.value,
+                    recipe_title=titles[review.recipe_id.value],
+                )
+                for review in result.items
+                # Unless the recipe went away between the two statements
+                if review.recipe_id.value in titles
+            ],
+            next_cursor=(
+                encode_cursor(result.next_cursor, USER_REVIEWS_CURSOR_KEY)
+                if result.next_cursor
+                else None
+            ),
+        )
@@ -0,0 +1,61 @@
+from application.commands.review.update_review_command import (
+    UpdateReviewCommand,
+)
+from application.dtos.review.review_dto import ReviewDTO
+from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from application.interfaces.services.page_cache import (
+    IPageCacheInvalidator,
+)
+from application.interfaces.usecases.review.update_review_usecase import (
+    IUpdateReviewUseCase,
+)
+from application.transactions.transactional import transactional
+from domain.entities.review.review import Review
+from domain.repositories.recipe_repository import IRecipeRepository
+from domain.repositories.review_repository import IReviewRepository
+
+
+class UpdateReviewUseCase(IUpdateReviewUseCase):
+    def __init__(
+        self,
+        recipe_repository: IRecipeRepository,
+        review_repository: IReviewRepository,
+        page_cache: IPageCacheInvalidator,
+        html_renderer: IHtmlRenderer,
+    ):
+        self.recipe_repository = recipe_repository
+        self.review_repository = review_repository
+        self.page_cache = page_cache
+        self.html_renderer = html_renderer
+
+    def execute(
+        self, command: UpdateReviewCommand, descriptor: UserDescriptor
+    ) -> ReviewDTO:
+        review = self._update(command, descriptor)
+        # After the commit, the old page must not be cached again
+        self.page_cache.invalidate_recipe(review.recipe_id.value)
+        return ReviewDTO.from_domain(review)
+
+    @transactional
+    def _update(
+        self, command: UpdateReviewCommand, descriptor: UserDescriptor
+    ) -> Review:
+        review = self.review_repository.get_by_id(command.review_id)
+        review.ensure_can_mutate(descriptor.user_id, descriptor.role)
+
+        previous_rating = review.rating
+        review.update(command.rating, command.text)
+        review.text_html = self.html_renderer.render(review.text)
+
+        # Fails with ReviewChangedError if a concurrent edit got there
+        # first; the recipe's counters move by the difference, the other
+        # reviews are never read
+        self.review_repository.update(review, previous_rating)
+        if review.rating != previous_rating:
+            self.recipe_repository.adjust_rating(
+                review.recipe_id.value,
+                rating_delta=review.rating - previous_rating,
+                count_delta=0,
+            )
+        return review
@@ -6,16 +6,49 @@ from application.usecases.recipe.create_recipe_usecase import (
 from application.usecases.recipe.delete_recipe_usecase import (
     DeleteRecipeUseCase,
 )
+from application.usecases.recipe.find_recipes_by_ingredients_usecase import (
+    FindRecipesByIngredientsUseCase,
+)
+from application.usecases.recipe.get_catalog_version_usecase import (
+    GetCatalogVersionUseCase,
+)
 from application.usecases.recipe.get_recipe_by_id_usecase import (
     GetRecipeByIdUseCase,
 )
+from application.usecases.recipe.get_recipe_version_usecase import (
+    GetRecipeVersionUseCase,
+)
+from application.usecases.recipe.get_recipes_by_ids_usecase import (
+    GetRecipesByIdsUseCase,
+)
 from application.usecases.recipe.list_recipes_usecase import ListRecipesUseCase
+from application.usecases.recipe.list_user_recipes_usecase import (
+    ListUserRecipesUseCase,
+)
+from application.usecases.recipe.search_recipes_usecase import (
+    SearchRecipesUseCase,
+)
 from application.usecases.recipe.update_recipe_usecase import (
     UpdateRecipeUseCase,
 )
 from application.usecases.review.create_review_usecase import (
     CreateReviewUseCase,
 )
+from application.usecases.review.delete_review_usecase import (
+    DeleteReviewUseCase,
+)
+from application.usecases.review.get_review_by_id_usecase import (
+    GetReviewByIdUseCase,
+)
+from application.usecases.review.list_reviews_usecase import (
+    ListReviewsUseCase,
+)
+from application.usecases.review.list_user_reviews_usecase import (
+    ListUserReviewsUseCase,
+)
+from application.usecases.review.update_review_usecase import (
+    UpdateReviewUseCase,
+)
 from application.usecases.user.authenticate_user_usecase import (
     AuthenticateUserUseCase,
 )
@@ -23,13 +56,29 @@ from application.usecases.user.logout_user_usecase import LogoutUserUseCase
 from domain.clock import GlobalClock, SystemClock
 from domain.entities.recipe.factories import RecipeFactory, RecipeImageFactory
 from domain.entities.review.factories import ReviewFactory
+from infrastructure.cache.in_memory_page_cache import InMemoryPageCache
+from infrastructure.cache.in_memory_recipe_count_cache import (
+    InMemoryRecipeCountCache,
+)
+from infrastructure.cache.in_memory_user_descriptor_cache import (
+    InMemoryUserDescriptorCache,
+)
 from infrastructure.config.config import Config
 from infrastructure.password_hasher.bcrypt_password_hasher import (
     BcryptPasswordHasher,
 )
+from infrastructure.presentation.presentators.caching_markdown_renderer import (
+    CachingMarkdownRenderer,
+)
 from infrastructure.presentation.presentators.markdown_renderer import (
     MarkdownRenderer,
 )
+from infrastructure.presentation.presentators.process_pool_markdown_renderer import (
+    ProcessPoolMarkdownRenderer,
+)
+from infrastructure.presentation.presentators.sanitized_html_renderer import (
+    SanitizedHtmlRenderer,
+)
 from infrastructure.presentation.sanitizer.bleach_markdown_sanitizer import (
     BleachMarkdownSanitizer,
 )
@@ -44,6 +93,7 @@ from infrastructure.sqlalchemy.repositories.review_repository import (
 from infrastructure.sqlalchemy.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
+from infrastructure.sqlalchemy.role_registry import RoleRegistry
 from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
 from infrastructure.store.image.local_image_store import LocalImageStore
 from presentation.web.flask.main import FlaskLoginManager
@@ -55,13 +105,15 @@ def session_factory(db: Database):
 
 class Container(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
-        packages=["presentation", "run", "infrastructure"],
+        packages=["presentation", "infrastructure"],
     )
 
     config = providers.Singleton(Config.load)
     auth_config = config.provided.AUTH
     db_config = config.provided.DB
     file_storage_config = config.provided.FILE
+    cache_config = config.provided.CACHE
+    render_config = config.provided.RENDER
 
     clock = providers.Singleton(SystemClock)
     GlobalClock.set_clock(clock())
@@ -73,20 +125,47 @@ class Container(containers.DeclarativeContainer):
         SQLAlchemyTransactionManager, session_factory=session_factory
     )
     query_executor = providers.Singleton(QueryExecutor, transaction_manager)
+    role_registry = providers.Singleton(RoleRegistry)
 
-    markdown_renderer = providers.Singleton(MarkdownRenderer)
+    plain_markdown_renderer = providers.Singleton(MarkdownRenderer)
+    # Long batches of texts go to a process pool, single texts never do
+    batch_markdown_renderer = providers.Singleton(
+        ProcessPoolMarkdownRenderer,
+        plain_markdown_renderer,
+        render_config.PARALLEL_THRESHOLD,
+        render_config.PARALLEL_CHUNK_SIZE,
+        render_config.PARALLEL_WORKERS,
+    )
+    markdown_renderer = providers.Singleton(
+        CachingMarkdownRenderer,
+        batch_markdown_renderer,
+        cache_config.RENDER_CACHE_MAX_BYTES,
+    )
     markdown_sanitizer = providers.Singleton(BleachMarkdownSanitizer)
+    # Written texts are rendered once and stored, they skip the cache
+    html_renderer = providers.Singleton(
+        SanitizedHtmlRenderer, batch_markdown_renderer, markdown_sanitizer
+    )
     password_hasher = providers.Singleton(BcryptPasswordHasher)
 
     # ---------------------- Repository ----------------------
     recipe_repo = providers.Singleton(
-        SQLAlchemyRecipeRepository, query_executor, transaction_manager
+        SQLAlchemyRecipeRepository,
+        query_executor,
+        transaction_manager,
+        role_registry,
     )
     review_repo = providers.Singleton(
-        SQLAlchemyReviewRepository, query_executor, transaction_manager
+        SQLAlchemyReviewRepository,
+        query_executor,
+        transaction_manager,
+        role_registry,
     )
     user_repo = providers.Singleton(
-        SQLAlchemyUserRepository, query_executor, transaction_manager
+        SQLAlchemyUserRepository,
+        query_executor,
+        transaction_manager,
+        role_registry,
     )
 
     # ---------------------- Image Store ----------------------
@@ -94,6 +173,21 @@ class Container(containers.DeclarativeContainer):
         LocalImageStore, file_storage_config.ACCESS
     )
 
+    # ---------------------- Cache ----------------------
+    recipe_count_cache = providers.Singleton(
+        InMemoryRecipeCountCache, cache_config.RECIPE_COUNT_TTL
+    )
+    page_cache = providers.Singleton(
+        InMemoryPageCache,
+        cache_config.PAGE_CACHE_TTL,
+        cache_config.PAGE_CACHE_MAX_ENTRIES,
+    )
+    user_descriptor_cache = providers.Singleton(
+        InMemoryUserDescriptorCache,
+        cache_config.USER_CACHE_TTL,
+        cache_config.USER_CACHE_MAX_ENTRIES,
+    )
+
     # ---------------------- Domain Factory ----------------------
     recipe_factory = providers.Singleton(RecipeFactory)
     recipe_image_factory = providers.Singleton(RecipeImageFactory)
@@ -106,17 +200,60 @@ class Container(containers.DeclarativeContainer):
         recipe_image_factory,
         recipe_repo,
         image_store,  # TODO
+        recipe_count_cache,
+        page_cache,
+        html_renderer,
+    )
+    update_recipe_uc = providers.Singleton(
+        UpdateRecipeUseCase, recipe_repo, page_cache, html_renderer
+    )
+    delete_recipe_uc = providers.Singleton(
+        DeleteRecipeUseCase, recipe_repo, recipe_count_cache, page_cache
     )
-    update_recipe_uc = providers.Singleton(UpdateRecipeUseCase, recipe_repo)
-    delete_recipe_uc = providers.Singleton(DeleteRecipeUseCase, recipe_repo)
     get_recipe_uc = providers.Singleton(
-        GetRecipeByIdUseCase, recipe_repo, review_repo, user_repo
+        GetRecipeByIdUseCase, recipe_repo, review_repo
+    )
+    get_recipe_version_uc = providers.Singleton(
+        GetRecipeVersionUseCase, recipe_repo
+    )
+    get_catalog_version_uc = providers.Singleton(
+        GetCatalogVersionUseCase, recipe_repo, recipe_count_cache
     )
     list_recipes_uc = providers.Singleton(
-        ListRecipesUseCase, recipe_repo, review_repo
+        ListRecipesUseCase, recipe_repo, recipe_count_cache
+    )
+    list_user_recipes_uc = providers.Singleton(
+        ListUserRecipesUseCase, recipe_repo
+    )
+    get_recipes_by_ids_uc = providers.Singleton(
+        GetRecipesByIdsUseCase, recipe_repo
+    )
+    search_recipes_uc = providers.Singleton(SearchRecipesUseCase, recipe_repo)
+    find_by_ingredients_uc = providers.Singleton(
+        FindRecipesByIngredientsUseCase, recipe_repo
     )
     create_review_uc = providers.Singleton(
-        CreateReviewUseCase, review_factory, recipe_repo, review_repo
+        CreateReviewUseCase,
+        review_factory,
+        recipe_repo,
+        review_repo,
+        page_cache,
+        html_renderer,
+    )
+    get_review_uc = providers.Singleton(GetReviewByIdUseCase, review_repo)
+    update_review_uc = providers.Singleton(
+        UpdateReviewUseCase,
+        recipe_repo,
+        review_repo,
+        page_cache,
+        html_renderer,
+    )
+    delete_review_uc = providers.Singleton(
+        DeleteReviewUseCase, recipe_repo, review_repo, page_cache
+    )
+    list_reviews_uc = providers.Singleton(ListReviewsUseCase, review_repo)
+    list_user_reviews_uc = providers.Singleton(
+        ListUserReviewsUseCase, recipe_repo, review_repo
     )
     auth_uc = providers.Singleton(
         AuthenticateUserUseCase, user_repo, password_hasher
@@ -124,4 +261,8 @@ class Container(containers.DeclarativeContainer):
     logout_uc = providers.Singleton(LogoutUserUseCase)
 
     # ---------------------- Flask ----------------------
-    login_manager = providers.Singleton(FlaskLoginManager, user_repo=user_repo)
+    login_manager = providers.Singleton(
+        FlaskLoginManager,
+        user_repo=user_repo,
+        descriptor_cache=user_descriptor_cache,
+    )
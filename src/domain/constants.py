@@ -13,3 +13,7 @@ ALLOWED_MIME_TYPES = {
     "image/gif",
 }
 MAX_PER_PAGE = 10
+MAX_SEARCH_QUERY_LENGTH = 200
+MAX_INGREDIENTS_PER_QUERY = 10
+REVIEWS_PER_PAGE = 10
+MAX_IDS_PER_QUERY = 50
@@ -1,12 +1,17 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 
 from domain.entities.entity import Entity, Id
 from domain.entities.recipe.value_objects import (
     RecipeContent,
     RecipeDetails,
     RecipeInstruction,
+    RecipeMarkup,
+    RecipeRating,
 )
+from domain.entities.review.value_objects import RatingHistogram
 from domain.entities.user.role import Role, RoleEnum
+from domain.entities.user.user import User
 
 from .image import RecipeImage
 
@@ -22,6 +27,8 @@ class Recipe(Entity):
     instruction: RecipeInstruction
     author_id: Id
     images: list[RecipeImage] = field(default_factory=list[RecipeImage])
+    rating: RecipeRating = field(default_factory=RecipeRating.empty)
+    markup: RecipeMarkup | None = None
 
     def __post_init__(self):
         assert self.author_id, "Author ID is required."
@@ -51,6 +58,8 @@ class Recipe(Entity):
         self.content = content
         self.details = details
         self.instruction = instruction
+        # The texts changed, their HTML has to be rendered again
+        self.markup = None
 
     def add_image(self, image: RecipeImage) -> None:
         self.images.append(image)
@@ -79,3 +88,65 @@ class Recipe(Entity):
             author_id=Id(author_id),
             images=images,
         )
+
+
+@dataclass(frozen=True)
+class RecipeSummary:
+    """
+    Read model of a recipe for listings: no long texts, first image only.
+    """
+
+    recipe_id: Id
+    title: str
+    details: RecipeDetails
+    author_id: Id
+    rating: RecipeRating
+    cover: RecipeImage | None
+
+
+@dataclass(frozen=True)
+class RecipeIngredientMatch:
+    """
+    A recipe found by ingredients, with how many of them it contains.
+    """
+
+    summary: RecipeSummary
+    matched_count: int
+
+
+@dataclass(frozen=True)
+class RecipeDetail:
+    """
+    Read model of a recipe page: the recipe with its author and how many
+    reviews gave each rating. Reviews are paged separately, see
+    IReviewRepository.get_page_by_recipe_id.
+    """
+
+    recipe: Recipe
+    author: User
+    reviewed_by_viewer: bool = False
+    rating_histogram: RatingHistogram = field(
+        default_factory=RatingHistogram.empty
+    )
+
+
+@dataclass(frozen=True)
+class ContentVersion:
+    """
+    When the rows a page shows last changed, and how many there are.
+    Deleting a row moves the count; unless `dates_deletions`, it may leave
+    the timestamp as it was.
+    """
+
+    last_modified: datetime | None
+    row_count: int
+    dates_deletions: bool = True
+
+    @classmethod
+    def combine(cls, *versions: "ContentVersion") -> "ContentVersion":
+        timestamps = [v.last_modified for v in versions if v.last_modified]
+        return cls(
+            last_modified=max(timestamps, default=None),
+            row_count=sum(v.row_count for v in versions),
+            dates_deletions=all(v.dates_deletions for v in versions),
+        )
@@ -41,3 +41,34 @@ class RecipeDetails:
     @classmethod
     def create(cls, preparation_time: int, servings: int) -> "RecipeDetails":
         return cls(preparation_time=preparation_time, servings=servings)
+
+
+@dataclass(frozen=True)
+class RecipeRating:
+    rating_sum: int
+    review_count: int
+
+    def __post_init__(self):
+        assert self.rating_sum >= 0, "Rating sum must not be negative."
+        assert self.review_count >= 0, "Review count must not be negative."
+
+    @property
+    def average_rating(self) -> float:
+        if not self.review_count:
+            return 0
+        return self.rating_sum / self.review_count
+
+    @classmethod
+    def empty(cls) -> "RecipeRating":
+        return cls(rating_sum=0, review_count=0)
+
+
+@dataclass(frozen=True)
+class RecipeMarkup:
+    """
+    HTML of the recipe texts, rendered and sanitized when they are written.
+    """
+
+    description_html: str
+    ingredients_html: str
+    steps_html: str
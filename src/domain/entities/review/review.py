@@ -3,6 +3,7 @@ from datetime import datetime
 
 from domain.constants import MAX_RATING, MIN_RATING
 from domain.entities.entity import Entity, Id
+from domain.entities.user.role import Role, RoleEnum
 from domain.entities.user.user import User
 
 
@@ -17,12 +18,10 @@ class Review(Entity):
     rating: int
     text: str
     created_at: datetime
+    text_html: str | None = None  # rendered and sanitized when written
 
     def __post_init__(self):
-        assert (
-            MIN_RATING <= self.rating <= MAX_RATING
-        ), "Rating must be between 0 and 5."
-        assert self.text.strip(), "Review text is required."
+        self._check_content(self.rating, self.text)
         assert self.recipe_id, "Recipe ID is required."
         assert self.user_id, "User ID is required."
 
@@ -30,6 +29,32 @@ class Review(Entity):
     def review_id(self) -> Id | None:
         return self.id
 
+    def is_owner(self, user_id: int) -> bool:
+        return self.user_id.value == user_id
+
+    def can_mutate(self, user_id: int, role: Role) -> bool:
+        return role == RoleEnum.ADMIN.value or self.is_owner(user_id)
+
+    def ensure_can_mutate(self, user_id: int, role: Role):
+        if not self.can_mutate(user_id, role):
+            raise PermissionError(
+                "Insufficient permissions to change this review."
+            )
+
+    def update(self, rating: int, text: str):
+        self._check_content(rating, text)
+        self.rating = rating
+        self.text = text
+        # The text changed, its HTML has to be rendered again
+        self.text_html = None
+
+    @staticmethod
+    def _check_content(rating: int, text: str):
+        assert (
+            MIN_RATING <= rating <= MAX_RATING
+        ), "Rating must be between 0 and 5."
+        assert text.strip(), "Review text is required."
+
     @classmethod
     def create(
         cls,
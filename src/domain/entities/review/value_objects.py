@@ -0,0 +1,33 @@
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from domain.constants import MAX_RATING, MIN_RATING
+
+
+@dataclass(frozen=True)
+class RatingHistogram:
+    """
+    Number of reviews per rating, counts[i] is for rating MIN_RATING + i.
+    """
+
+    counts: tuple[int, ...]
+
+    def __post_init__(self):
+        assert len(self.counts) == MAX_RATING - MIN_RATING + 1, (
+            "Histogram needs a count for every rating."
+        )
+        assert all(c >= 0 for c in self.counts), "Counts must not be negative."
+
+    @classmethod
+    def from_counts(cls, counts: Mapping[int, int]) -> "RatingHistogram":
+        # Ratings nobody gave are absent from a grouped query
+        return cls(
+            tuple(
+                counts.get(rating, 0)
+                for rating in range(MIN_RATING, MAX_RATING + 1)
+            )
+        )
+
+    @classmethod
+    def empty(cls) -> "RatingHistogram":
+        return cls.from_counts({})
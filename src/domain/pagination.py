@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, TypeVar
+
+
+T = TypeVar("T")
+
+
+CursorValue = datetime | int | float
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Keyset position of an item: its sort key and id, the tie-breaker.
+    """
+
+    value: CursorValue
+    entity_id: int
+
+    def __post_init__(self):
+        assert self.entity_id > 0, "ID must be positive"
+
+
+@dataclass(frozen=True)
+class KeysetPage(Generic[T]):
+    items: list[T]
+    next_cursor: Cursor | None
+    previous_cursor: Cursor | None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
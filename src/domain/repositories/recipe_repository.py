@@ -1,7 +1,70 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
 
-from domain.entities.recipe.recipe import Recipe
+from domain.entities.recipe.recipe import (
+    ContentVersion,
+    Recipe,
+    RecipeDetail,
+    RecipeIngredientMatch,
+    RecipeSummary,
+)
+from domain.pagination import Cursor, KeysetPage
+
+
+class RecipeLoadProfile(Enum):
+    """
+    Which parts of the Recipe aggregate a query loads.
+    """
+
+    SUMMARY = "summary"  # lists of recipes, with their images
+    FULL = "full"  # a single recipe with all of its images
+    OWNERSHIP_CHECK = "ownership-check"  # the recipe row only, no images
+
+
+class RecipeSort(Enum):
+    """
+    Orderings of recipe lists, each backed by a (key, id) index.
+    """
+
+    NEWEST = "newest"
+    RATING = "rating"  # highest average rating first
+    REVIEW_COUNT = "reviews"  # most reviewed first
+    PREPARATION_TIME = "time"  # quickest first
+
+    @property
+    def descending(self) -> bool:
+        return self is not RecipeSort.PREPARATION_TIME
+
+
+@dataclass(frozen=True)
+class RecipeFilter:
+    max_preparation_time: int | None = None
+    servings: int | None = None
+
+    def __post_init__(self):
+        assert (
+            self.max_preparation_time is None or self.max_preparation_time > 0
+        ), "Preparation time must be positive"
+        assert self.servings is None or self.servings > 0, (
+            "Servings must be positive"
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return self.max_preparation_time is None and self.servings is None
+
+
+@dataclass(frozen=True)
+class RecipeListSpec:
+    """
+    Ordering and filters of a recipe list query.
+    """
+
+    sort: RecipeSort = RecipeSort.NEWEST
+    filters: RecipeFilter = field(default_factory=RecipeFilter)
 
 
 class IRecipeRepository(ABC):
@@ -10,10 +73,51 @@ class IRecipeRepository(ABC):
     """
 
     @abstractmethod
-    def get_by_id(self, recipe_id: int) -> Recipe: ...
+    def get_by_id(
+        self,
+        recipe_id: int,
+        profile: RecipeLoadProfile = RecipeLoadProfile.FULL,
+    ) -> Recipe: ...
+    @abstractmethod
+    def get_detail(
+        self, recipe_id: int, viewer_id: int | None = None
+    ) -> RecipeDetail: ...
+    @abstractmethod
+    def get_version(self, recipe_id: int) -> ContentVersion: ...
     @abstractmethod
-    def get_all(self, page: int, per_page: int) -> Sequence[Recipe]: ...
+    def get_catalog_updated_at(self) -> datetime | None: ...
+    @abstractmethod
+    def get_summary_page(
+        self,
+        limit: int,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        offset: int = 0,
+        spec: RecipeListSpec | None = None,
+    ) -> KeysetPage[RecipeSummary]: ...
+    @abstractmethod
+    def get_by_author(
+        self, author_id: int, limit: int, after: Cursor | None = None
+    ) -> KeysetPage[RecipeSummary]: ...  # the newest first
+    @abstractmethod
+    def get_summaries_by_ids(
+        self, recipe_ids: Sequence[int]
+    ) -> Sequence[RecipeSummary]: ...  # in no particular order
+    @abstractmethod
+    def search(
+        self, query: str, limit: int, offset: int = 0
+    ) -> Sequence[RecipeSummary]: ...  # the most relevant first
+    @abstractmethod
+    def find_by_ingredients(
+        self, ingredients: Sequence[str], limit: int, offset: int = 0
+    ) -> Sequence[RecipeIngredientMatch]: ...  # the most matches first
+    @abstractmethod
+    def count(self) -> int: ...
     @abstractmethod
     def save(self, recipe: Recipe) -> Recipe: ...
     @abstractmethod
     def remove(self, recipe: Recipe) -> None: ...
+    @abstractmethod
+    def adjust_rating(
+        self, recipe_id: int, rating_delta: int, count_delta: int
+    ) -> None: ...
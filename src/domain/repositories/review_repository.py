@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from collections.abc import Sequence
 
 from domain.entities.review.review import AuthoredReview, Review
+from domain.pagination import Cursor, KeysetPage
 
 
 class IReviewRepository(ABC):
@@ -18,8 +19,18 @@ class IReviewRepository(ABC):
         self, recipe_id: int
     ) -> Sequence[AuthoredReview]: ...
     @abstractmethod
+    def get_page_by_recipe_id(
+        self, recipe_id: int, limit: int, after: Cursor | None = None
+    ) -> KeysetPage[AuthoredReview]: ...
+    @abstractmethod
+    def get_by_user(
+        self, user_id: int, limit: int, after: Cursor | None = None
+    ) -> KeysetPage[Review]: ...  # the newest first
+    @abstractmethod
     def save(self, review: Review) -> Review: ...
     @abstractmethod
-    def exists_for_user_and_recipe(
-        self, user_id: int, recipe_id: int
-    ) -> bool: ...
+    def update(
+        self, review: Review, previous_rating: int
+    ) -> None: ...  # fails if the stored rating is no longer the previous
+    @abstractmethod
+    def remove(self, review: Review) -> None: ...
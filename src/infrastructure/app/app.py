@@ -13,11 +13,13 @@ class App:
 
         self.database = Database(self.config.DB)
         self.server = FlaskServer(
-            BASE_FILE_DIR, self.container, self.config.AUTH
+            BASE_FILE_DIR, self.container, self.config.AUTH, self.config.CACHE
         )
 
     def configure(self):
         CurrentTransactionManager.set(self.container.transaction_manager())
+        with self.container.session_factory()() as session:
+            self.container.role_registry().verify(session)
 
         self.server.configure()
         self.server.setup_routes()
@@ -0,0 +1,91 @@
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from threading import Lock
+
+from application.interfaces.services.page_cache import (
+    INDEX_PAGE_TAG,
+    CachedPage,
+    IPageCache,
+    PageCacheStats,
+    recipe_page_tag,
+)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    page: CachedPage
+    tags: frozenset[str]
+    expires_at: float
+
+
+class InMemoryPageCache(IPageCache):
+    """
+    Process-local page cache with a TTL, evicting the oldest entry once
+    max_entries is reached. Entries are tagged so that a write can drop
+    exactly the pages it affects.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._keys_by_tag: defaultdict[str, set[str]] = defaultdict(set)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> CachedPage | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry.page
+
+    def set(self, key: str, page: CachedPage, tags: Iterable[str]) -> None:
+        with self._lock:
+            self._remove(key)
+            while len(self._entries) >= self.max_entries:
+                self._remove(next(iter(self._entries)))
+            entry = _Entry(page, frozenset(tags), time.monotonic() + self.ttl)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._keys_by_tag[tag].add(key)
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._remove(key)
+
+    def invalidate_recipe(self, recipe_id: int) -> None:
+        self.invalidate([INDEX_PAGE_TAG, recipe_page_tag(recipe_id)])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def stats(self) -> PageCacheStats:
+        with self._lock:
+            return PageCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+            )
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
@@ -0,0 +1,39 @@
+import time
+from threading import Lock
+
+from application.interfaces.services.recipe_count_cache import (
+    IRecipeCountCache,
+)
+
+
+class InMemoryRecipeCountCache(IRecipeCountCache):
+    """
+    Process-local recipe count. Writes in this process adjust it in place;
+    the TTL bounds drift caused by other processes or rolled back writes.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = Lock()
+        self._count: int | None = None
+        self._expires_at = 0.0
+
+    def get(self) -> int | None:
+        with self._lock:
+            if self._count is None or time.monotonic() >= self._expires_at:
+                return None
+            return self._count
+
+    def set(self, count: int) -> None:
+        with self._lock:
+            self._count = count
+            self._expires_at = time.monotonic() + self.ttl
+
+    def adjust(self, delta: int) -> None:
+        with self._lock:
+            if self._count is not None:
+                self._count = max(0, self._count + delta)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._count = None
@@ -0,0 +1,52 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.user_descriptor_cache import (
+    IUserDescriptorCache,
+)
+
+
+class InMemoryUserDescriptorCache(IUserDescriptorCache):
+    """
+    Process-local descriptors of signed in users with a TTL, evicting the
+    oldest entry once max_entries is reached. Roles are changed in the
+    database only, outside of any app process, so the TTL bounds how long
+    a change goes unnoticed. A TTL of 0 turns the cache off.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._entries: OrderedDict[int, tuple[UserDescriptor, float]] = (
+            OrderedDict()
+        )
+
+    def get(self, user_id: int) -> UserDescriptor | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            descriptor, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            return descriptor
+
+    def set(self, descriptor: UserDescriptor) -> None:
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries.pop(descriptor.user_id, None)
+            while len(self._entries) >= self.max_entries:
+                self._entries.popitem(last=False)
+            self._entries[descriptor.user_id] = (
+                descriptor,
+                time.monotonic() + self.ttl,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -66,11 +66,29 @@ class FileStoreConfig(BaseModel):
     ACCESS: str = BASE_UPLOAD_DIR
 
 
+class CacheConfig(BaseModel):
+    RECIPE_COUNT_TTL: float = 300
+    PAGE_CACHE_ENABLED: bool = False
+    PAGE_CACHE_TTL: float = 30
+    PAGE_CACHE_MAX_ENTRIES: int = 1000
+    RENDER_CACHE_MAX_BYTES: int = 8 * 1024 * 1024
+    USER_CACHE_TTL: float = 10
+    USER_CACHE_MAX_ENTRIES: int = 10000
+
+
+class RenderConfig(BaseModel):
+    PARALLEL_THRESHOLD: int = 0
+    PARALLEL_CHUNK_SIZE: int = 25
+    PARALLEL_WORKERS: int | None = None
+
+
 class Config(BaseModel):
     ENV: RunEnvironment
     AUTH: AuthConfig
     DB: DatabaseConfig
     FILE: FileStoreConfig = FileStoreConfig()
+    CACHE: CacheConfig = CacheConfig()
+    RENDER: RenderConfig = RenderConfig()
 
     @classmethod
     def load(cls) -> "Config":
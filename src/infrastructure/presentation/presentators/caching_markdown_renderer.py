@@ -0,0 +1,112 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from threading import Lock
+
+from presentation.presentators.markdown_renderer import IMarkdownRenderer
+
+
+# Per-entry bookkeeping not covered by the key and HTML lengths: the
+# OrderedDict node and the str object header, roughly
+_ENTRY_OVERHEAD = 100
+
+
+def _key(text: str) -> bytes:
+    return hashlib.sha256(text.encode()).digest()
+
+
+@dataclass(frozen=True)
+class _Entry:
+    html: str
+    size: int
+
+
+@dataclass(frozen=True)
+class RenderCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    resident_bytes: int
+
+
+class CachingMarkdownRenderer(IMarkdownRenderer):
+    """
+    Remembers the HTML of recently rendered texts, keyed by their SHA-256.
+    Least recently used entries are evicted once the HTML held exceeds
+    max_bytes; a single result larger than that is not cached at all.
+    """
+
+    def __init__(self, renderer: IMarkdownRenderer, max_bytes: int):
+        self.renderer = renderer
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def render(self, text: str) -> str:
+        key = _key(text)
+        html = self._lookup(key)
+        if html is not None:
+            return html
+
+        # Rendered outside the lock, a concurrent miss on the same text
+        # only renders it twice
+        html = self.renderer.render(text)
+        self._store(key, html)
+        return html
+
+    def render_many(self, texts: Sequence[str]) -> list[str]:
+        keys = [_key(text) for text in texts]
+        results = [self._lookup(key) for key in keys]
+        misses = [i for i, html in enumerate(results) if html is None]
+        # The misses go to the wrapped renderer as one batch, it decides
+        # whether they are worth spreading over processes
+        rendered = self.renderer.render_many([texts[i] for i in misses])
+        for i, html in zip(misses, rendered, strict=True):
+            self._store(keys[i], html)
+            results[i] = html
+        return [html for html in results if html is not None]
+
+    def _lookup(self, key: bytes) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.html
+            self._misses += 1
+            return None
+
+    def _store(self, key: bytes, html: str) -> None:
+        entry = _Entry(html, len(key) + len(html.encode()) + _ENTRY_OVERHEAD)
+        if entry.size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self._resident_bytes += entry.size
+            while self._resident_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._resident_bytes -= evicted.size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._resident_bytes = 0
+
+    def stats(self) -> RenderCacheStats:
+        with self._lock:
+            return RenderCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                resident_bytes=self._resident_bytes,
+            )
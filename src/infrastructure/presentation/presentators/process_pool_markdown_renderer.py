@@ -0,0 +1,78 @@
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from threading import Lock
+
+from presentation.presentators.markdown_renderer import IMarkdownRenderer
+
+
+# Set once in every worker process by the pool initializer, the renderer
+# itself is pickled a single time instead of with every chunk
+_worker_renderer: IMarkdownRenderer | None = None
+
+
+def _init_worker(renderer: IMarkdownRenderer) -> None:
+    global _worker_renderer  # noqa: PLW0603
+    _worker_renderer = renderer
+
+
+def _render_chunk(texts: Sequence[str]) -> list[str]:
+    if _worker_renderer is None:
+        raise RuntimeError("Render worker is not initialized")
+    return _worker_renderer.render_many(texts)
+
+
+def _chunks(texts: Sequence[str], size: int) -> list[Sequence[str]]:
+    return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+
+class ProcessPoolMarkdownRenderer(IMarkdownRenderer):
+    """
+    Spreads batches of at least `threshold` texts over a process pool in
+    chunks of `chunk_size`; markdown2 is pure Python, so threads would
+    wait on the GIL. Smaller batches and single texts are rendered in
+    place, and a threshold of 0 never starts the pool.
+    """
+
+    def __init__(
+        self,
+        renderer: IMarkdownRenderer,
+        threshold: int,
+        chunk_size: int,
+        max_workers: int | None = None,
+    ):
+        self.renderer = renderer
+        self.threshold = threshold
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self._lock = Lock()
+        self._executor: Executor | None = None
+
+    def render(self, text: str) -> str:
+        return self.renderer.render(text)
+
+    def render_many(self, texts: Sequence[str]) -> list[str]:
+        if not self.threshold or len(texts) < self.threshold:
+            return self.renderer.render_many(texts)
+
+        chunks = self._executor_or_start().map(
+            _render_chunk, _chunks(texts, self.chunk_size)
+        )
+        return [html for chunk in chunks for html in chunk]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _executor_or_start(self) -> Executor:
+        # Started on first use, a process that never sees a long batch
+        # never forks
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.renderer,),
+                )
+            return self._executor
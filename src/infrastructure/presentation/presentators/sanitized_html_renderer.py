@@ -0,0 +1,24 @@
+from collections.abc import Sequence
+
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from presentation.presentators.markdown_renderer import IMarkdownRenderer
+from presentation.sanitizer.markdown_sanitizer import IMarkdownSanitizer
+
+
+class SanitizedHtmlRenderer(IHtmlRenderer):
+    def __init__(
+        self,
+        markdown_renderer: IMarkdownRenderer,
+        sanitizer: IMarkdownSanitizer,
+    ):
+        self.markdown_renderer = markdown_renderer
+        self.sanitizer = sanitizer
+
+    def render(self, text: str) -> str:
+        return self.sanitizer.sanitize(self.markdown_renderer.render(text))
+
+    def render_many(self, texts: Sequence[str]) -> list[str]:
+        return [
+            self.sanitizer.sanitize(html)
+            for html in self.markdown_renderer.render_many(texts)
+        ]
@@ -5,7 +5,7 @@ from presentation.sanitizer.markdown_sanitizer import IMarkdownSanitizer
 
 
 class BleachMarkdownSanitizer(IMarkdownSanitizer):
-    def __init__(self, allowed_tags: list[str] | None) -> None:
+    def __init__(self, allowed_tags: list[str] | None = None) -> None:
         self.allowed_tags = allowed_tags or ALLOWED_TAGS
 
     def sanitize(self, text: str) -> str:
@@ -1,15 +1,29 @@
 import os
+from collections.abc import Callable, Iterable
 
 from flask import Flask
 from flask.typing import RouteCallable
 from flask_cors import CORS
 
+from application.dtos.recipe.recipe_dto import ContentVersionDTO
+from application.interfaces.services.page_cache import (
+    INDEX_PAGE_TAG,
+    recipe_page_tag,
+)
 from di.container import Container
-from infrastructure.config.config import AuthConfig
+from infrastructure.config.config import AuthConfig, CacheConfig
+from presentation.web.flask.conditional_get import conditional_page
+from presentation.web.flask.page_cache import cache_anonymous_page
 
 
 class FlaskServer:
-    def __init__(self, base_dir: str, container: Container, auth: AuthConfig):
+    def __init__(
+        self,
+        base_dir: str,
+        container: Container,
+        auth: AuthConfig,
+        cache: CacheConfig,
+    ):
         self.app = Flask(
             __name__,
             static_folder=os.path.join(base_dir, "static"),
@@ -19,6 +33,7 @@ class FlaskServer:
         self.app.extensions["di_container"] = container
         self.app.secret_key = auth.SECRET_KEY
         self.login_manager = container.login_manager()
+        self.page_cache_enabled = cache.PAGE_CACHE_ENABLED
 
         CORS(self.app, supports_credentials=True)
 
@@ -34,6 +49,8 @@ class FlaskServer:
         self._register_auth_views()
         self._register_main_views()
         self._register_recipe_views()
+        self._register_profile_views()
+        self._register_api_views()
 
         print("Registered routes:")
         for rule in self.app.url_map.iter_rules():
@@ -58,13 +75,35 @@ class FlaskServer:
         )
 
     def _register_main_views(self):
-        from presentation.web.flask.blueprints.main import IndexView
+        from presentation.web.flask.blueprints.main import (
+            IndexView,
+            IngredientSearchView,
+            SearchView,
+        )
 
         self._add_view(
             "/",
             IndexView.as_view(
                 "main.index", list_recipes_uc=self.container.list_recipes_uc()
             ),
+            cache_tags=lambda: [INDEX_PAGE_TAG],
+            version=self.container.get_catalog_version_uc().execute,
+        )
+        self._add_view(
+            "/search",
+            SearchView.as_view(
+                "main.search",
+                search_recipes_uc=self.container.search_recipes_uc(),
+            ),
+            cache_tags=lambda: [INDEX_PAGE_TAG],
+        )
+        self._add_view(
+            "/by-ingredients",
+            IngredientSearchView.as_view(
+                "main.by_ingredients",
+                find_by_ingredients_uc=self.container.find_by_ingredients_uc(),
+            ),
+            cache_tags=lambda: [INDEX_PAGE_TAG],
         )
 
     def _register_recipe_views(self):
@@ -74,6 +113,9 @@ class FlaskServer:
             RecipeEditView,
             RecipeView,
             ReviewCreateView,
+            ReviewDeleteView,
+            ReviewEditView,
+            ReviewListView,
         )
 
         self._add_view(
@@ -83,6 +125,17 @@ class FlaskServer:
                 get_recipe_uc=self.container.get_recipe_uc(),
                 markdown_renderer=self.container.markdown_renderer(),
             ),
+            cache_tags=lambda recipe_id: [recipe_page_tag(recipe_id)],
+            version=self.container.get_recipe_version_uc().execute,
+        )
+        self._add_view(
+            "/recipes/<int:recipe_id>/reviews",
+            ReviewListView.as_view(
+                "recipes.review_list",
+                list_reviews_uc=self.container.list_reviews_uc(),
+                markdown_renderer=self.container.markdown_renderer(),
+            ),
+            cache_tags=lambda recipe_id: [recipe_page_tag(recipe_id)],
         )
         self._add_view(
             "/recipes/add",
@@ -113,10 +166,81 @@ class FlaskServer:
                 create_review_uc=self.container.create_review_uc(),
             ),
         )
+        self._add_view(
+            "/recipes/<int:recipe_id>/reviews/<int:review_id>/edit",
+            ReviewEditView.as_view(
+                "recipes.review_edit",
+                update_review_uc=self.container.update_review_uc(),
+                get_review_uc=self.container.get_review_uc(),
+            ),
+        )
+        self._add_view(
+            "/recipes/<int:recipe_id>/reviews/<int:review_id>/delete",
+            ReviewDeleteView.as_view(
+                "recipes.review_delete",
+                delete_review_uc=self.container.delete_review_uc(),
+            ),
+        )
+
+    def _register_profile_views(self):
+        from presentation.web.flask.blueprints.profile import (
+            UserRecipesView,
+            UserReviewsView,
+        )
+
+        self._add_view(
+            "/profile/recipes",
+            UserRecipesView.as_view(
+                "profile.recipes",
+                list_user_recipes_uc=self.container.list_user_recipes_uc(),
+            ),
+        )
+        self._add_view(
+            "/profile/reviews",
+            UserReviewsView.as_view(
+                "profile.reviews",
+                list_user_reviews_uc=self.container.list_user_reviews_uc(),
+            ),
+        )
+
+    def _register_api_views(self):
+        from presentation.web.flask.blueprints.api import (
+            RecipeApiView,
+            RecipeListApiView,
+        )
+
+        self._add_view(
+            "/api/recipes",
+            RecipeListApiView.as_view(
+                "api.recipes",
+                list_recipes_uc=self.container.list_recipes_uc(),
+                get_recipes_by_ids_uc=self.container.get_recipes_by_ids_uc(),
+            ),
+            cache_tags=lambda: [INDEX_PAGE_TAG],
+            version=self.container.get_catalog_version_uc().execute,
+        )
+        self._add_view(
+            "/api/recipes/<int:recipe_id>",
+            RecipeApiView.as_view(
+                "api.recipe",
+                get_recipe_uc=self.container.get_recipe_uc(),
+            ),
+            cache_tags=lambda recipe_id: [recipe_page_tag(recipe_id)],
+            version=self.container.get_recipe_version_uc().execute,
+        )
 
     def _add_view(
         self,
         route: str,
         view_func: RouteCallable,
+        cache_tags: Callable[..., Iterable[str]] | None = None,
+        version: Callable[..., ContentVersionDTO] | None = None,
     ):
+        if cache_tags and self.page_cache_enabled:
+            view_func = cache_anonymous_page(
+                self.container.page_cache(), cache_tags
+            )(view_func)
+        # Outermost, so a 304 skips the page cache lookup as well
+        if version:
+            view_func = conditional_page(version)(view_func)
         self.app.add_url_rule(route, view_func=view_func)
@@ -0,0 +1,44 @@
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from infrastructure.sqlalchemy.models.recipe import (
+    RecipeIngredientModel,
+    RecipeModel,
+)
+from infrastructure.sqlalchemy.search.ingredients import ingredient_tokens
+
+
+def rebuild_ingredient_index(session: Session, batch_size: int = 500) -> int:
+    """
+    Re-tokenizes the ingredients of every recipe, a batch per transaction.
+    Returns the number of recipes indexed.
+    """
+    indexed = 0
+    last_id = 0
+    while True:
+        recipes = session.execute(
+            select(RecipeModel.id, RecipeModel.ingredients)
+            .where(RecipeModel.id > last_id)
+            .order_by(RecipeModel.id)
+            .limit(batch_size)
+        ).all()
+        if not recipes:
+            return indexed
+
+        recipe_ids = [recipe.id for recipe in recipes]
+        session.execute(
+            delete(RecipeIngredientModel).where(
+                RecipeIngredientModel.recipe_id.in_(recipe_ids)
+            )
+        )
+        rows = [
+            {"token": token, "recipe_id": recipe.id}
+            for recipe in recipes
+            for token in sorted(ingredient_tokens(recipe.ingredients))
+        ]
+        if rows:
+            session.execute(insert(RecipeIngredientModel), rows)
+        session.commit()
+
+        indexed += len(recipes)
+        last_id = recipe_ids[-1]
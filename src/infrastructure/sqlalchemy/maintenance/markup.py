@@ -0,0 +1,124 @@
+from dataclasses import dataclass
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from infrastructure.sqlalchemy.models.review import ReviewModel
+
+
+@dataclass(frozen=True)
+class RenderedMarkup:
+    recipes: int
+    reviews: int
+
+
+def render_markup(
+    session: Session,
+    renderer: IHtmlRenderer,
+    batch_size: int = 500,
+    missing_only: bool = False,
+) -> RenderedMarkup:
+    """
+    Renders the stored HTML of recipes and reviews again, a batch per
+    transaction: all of it when the renderer changed, or with missing_only
+    just the rows written before HTML was stored.
+    """
+    return RenderedMarkup(
+        recipes=_render_recipes(session, renderer, batch_size, missing_only),
+        reviews=_render_reviews(session, renderer, batch_size, missing_only),
+    )
+
+
+def _render_recipes(
+    session: Session,
+    renderer: IHtmlRenderer,
+    batch_size: int,
+    missing_only: bool,
+) -> int:
+    rendered = 0
+    last_id = 0
+    while True:
+        statement = (
+            select(
+                RecipeModel.id,
+                RecipeModel.description,
+                RecipeModel.ingredients,
+                RecipeModel.steps,
+            )
+            .where(RecipeModel.id > last_id)
+            .order_by(RecipeModel.id)
+            .limit(batch_size)
+        )
+        if missing_only:
+            statement = statement.where(RecipeModel.description_html.is_(None))
+        recipes = session.execute(statement).all()
+        if not recipes:
+            return rendered
+
+        # One batch for the renderer, which may spread it over processes
+        html = iter(
+            renderer.render_many(
+                [
+                    text
+                    for recipe in recipes
+                    for text in (
+                        recipe.description,
+                        recipe.ingredients,
+                        recipe.steps,
+                    )
+                ]
+            )
+        )
+        session.execute(
+            update(RecipeModel),
+            [
+                {
+                    "id": recipe.id,
+                    "description_html": next(html),
+                    "ingredients_html": next(html),
+                    "steps_html": next(html),
+                }
+                for recipe in recipes
+            ],
+        )
+        session.commit()
+
+        rendered += len(recipes)
+        last_id = recipes[-1].id
+
+
+def _render_reviews(
+    session: Session,
+    renderer: IHtmlRenderer,
+    batch_size: int,
+    missing_only: bool,
+) -> int:
+    rendered = 0
+    last_id = 0
+    while True:
+        statement = (
+            select(ReviewModel.id, ReviewModel.text)
+            .where(ReviewModel.id > last_id)
+            .order_by(ReviewModel.id)
+            .limit(batch_size)
+        )
+        if missing_only:
+            statement = statement.where(ReviewModel.text_html.is_(None))
+        reviews = session.execute(statement).all()
+        if not reviews:
+            return rendered
+
+        html = renderer.render_many([review.text for review in reviews])
+        session.execute(
+            update(ReviewModel),
+            [
+                {"id": review.id, "text_html": text_html}
+                for review, text_html in zip(reviews, html, strict=True)
+            ],
+        )
+        session.commit()
+
+        rendered += len(reviews)
+        last_id = reviews[-1].id
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from infrastructure.sqlalchemy.models.review import ReviewModel
+
+
+@dataclass(frozen=True)
+class RatingDrift:
+    recipe_id: int
+    stored_rating_sum: int
+    stored_review_count: int
+    actual_rating_sum: int
+    actual_review_count: int
+
+
+def find_rating_drift(session: Session) -> list[RatingDrift]:
+    actual = (
+        select(
+            ReviewModel.recipe_id.label("recipe_id"),
+            func.sum(ReviewModel.rating).label("rating_sum"),
+            func.count(ReviewModel.id).label("review_count"),
+        )
+        .group_by(ReviewModel.recipe_id)
+        .subquery()
+    )
+    actual_sum = func.coalesce(actual.c.rating_sum, 0)
+    actual_count = func.coalesce(actual.c.review_count, 0)
+
+    stmt = (
+        select(
+            RecipeModel.id,
+            RecipeModel.rating_sum,
+            RecipeModel.review_count,
+            actual_sum,
+            actual_count,
+        )
+        .outerjoin(actual, actual.c.recipe_id == RecipeModel.id)
+        .where(
+            (RecipeModel.rating_sum != actual_sum)
+            | (RecipeModel.review_count != actual_count)
+        )
+        .order_by(RecipeModel.id)
+    )
+    return [
+        RatingDrift(
+            recipe_id=row[0],
+            stored_rating_sum=row[1],
+            stored_review_count=row[2],
+            actual_rating_sum=row[3],
+            actual_review_count=row[4],
+        )
+        for row in session.execute(stmt)
+    ]
+
+
+def repair_rating_drift(session: Session) -> list[RatingDrift]:
+    drift = find_rating_drift(session)
+    for item in drift:
+        session.execute(
+            update(RecipeModel)
+            .where(RecipeModel.id == item.recipe_id)
+            .values(
+                rating_sum=item.actual_rating_sum,
+                review_count=item.actual_review_count,
+                average_rating=(
+                    item.actual_rating_sum / item.actual_review_count
+                    if item.actual_review_count
+                    else 0
+                ),
+            )
+        )
+    session.commit()
+    return drift
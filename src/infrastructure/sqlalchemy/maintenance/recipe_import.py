@@ -0,0 +1,340 @@
+import json
+import mimetypes
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from application.interfaces.services.image_store import IImageStore
+from domain.entities.recipe.dtos import RecipeData, RecipeImageData
+from domain.entities.recipe.factories import (
+    IRecipeFactory,
+    IRecipeImageFactory,
+)
+from domain.entities.recipe.image import RecipeImage
+from domain.entities.recipe.recipe import Recipe
+from domain.entities.review.dtos import ReviewData
+from domain.entities.review.factories import IReviewFactory
+from domain.entities.review.review import Review
+from infrastructure.sqlalchemy.models.recipe import (
+    RecipeImageModel,
+    RecipeIngredientModel,
+    RecipeModel,
+)
+from infrastructure.sqlalchemy.models.review import ReviewModel
+from infrastructure.sqlalchemy.models.user import UserModel
+from infrastructure.sqlalchemy.search.ingredients import ingredient_tokens
+from infrastructure.sqlalchemy.search.recipe_search import (
+    SearchDocument,
+    recipe_search_index,
+)
+
+
+# Records that fail validation are reported by line; a few hundred are
+# enough to fix the export, the rest are only counted
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass(frozen=True)
+class RejectedRecord:
+    line: int
+    reason: str
+
+
+@dataclass
+class ImportReport:
+    records: int = 0
+    recipes: int = 0
+    reviews: int = 0
+    images: int = 0
+    rejected: int = 0
+    errors: list[RejectedRecord] = field(default_factory=list)
+
+    def reject(self, line: int, reason: str) -> None:
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RejectedRecord(line, reason))
+
+
+@dataclass
+class _Record:
+    line: int
+    recipe: Recipe
+    reviews: list[Review]
+    images: list[tuple[RecipeImage, Path]]
+
+    @property
+    def user_ids(self) -> set[int]:
+        return {self.recipe.author_id.value} | {
+            review.user_id.value for review in self.reviews
+        }
+
+
+class RecipeImporter:
+    """
+    Imports recipes with their images and reviews from JSON Lines, one
+    recipe per line:
+
+        {"title": ..., "description": ..., "preparation_time": 30,
+         "servings": 4, "ingredients": ..., "steps": ..., "author_id": 1,
+         "images": ["borscht.jpg"],
+         "reviews": [{"user_id": 2, "rating": 5, "text": ...,
+                      "created_at": "2025-05-01T12:00:00"}]}
+
+    Every record is validated by the domain factories; a record that
+    fails, or refers to a user that does not exist, is rejected as a
+    whole. The rest is written a batch per transaction with one
+    multi-row INSERT per table, instead of the merge, flush and commit
+    per row of the use cases.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        recipe_factory: IRecipeFactory,
+        image_factory: IRecipeImageFactory,
+        review_factory: IReviewFactory,
+        image_store: IImageStore,
+        html_renderer: IHtmlRenderer,
+        images_dir: Path,
+    ):
+        self.recipe_factory = recipe_factory
+        self.image_factory = image_factory
+        self.review_factory = review_factory
+        self.image_store = image_store
+        self.html_renderer = html_renderer
+        self.images_dir = images_dir
+
+    def run(
+        self,
+        session: Session,
+        lines: Iterable[str],
+        batch_size: int = 500,
+        progress: Callable[[ImportReport], None] | None = None,
+    ) -> ImportReport:
+        report = ImportReport()
+        numbered = enumerate(lines, start=1)
+        while batch := list(islice(numbered, batch_size)):
+            records = list(self._parse(batch, report))
+            if records:
+                records = self._with_known_users(session, records, report)
+            if records:
+                uploads = self._write(session, records, report)
+                session.commit()
+                # Only a committed batch gets its files: one that rolls back
+                # leaves no orphans in the image store
+                self._upload(uploads)
+            if progress:
+                progress(report)
+        return report
+
+    def _parse(
+        self, batch: list[tuple[int, str]], report: ImportReport
+    ) -> Iterator[_Record]:
+        for line, raw in batch:
+            if not raw.strip():
+                continue
+            report.records += 1
+            try:
+                yield self._validate(line, json.loads(raw))
+            except (
+                AssertionError,
+                KeyError,
+                TypeError,
+                ValueError,
+                FileNotFoundError,
+            ) as e:
+                report.reject(line, f"{type(e).__name__}: {e}")
+
+    def _validate(self, line: int, data: dict[str, Any]) -> _Record:
+        recipe = self.recipe_factory.create(
+            RecipeData(
+                title=data["title"],
+                description=data["description"],
+                preparation_time=int(data["preparation_time"]),
+                servings=int(data["servings"]),
+                ingredients=data["ingredients"],
+                steps=data["steps"],
+                author_id=int(data["author_id"]),
+            )
+        )
+        # The recipe id is known only after the insert: the factories see
+        # the line number in its place, the rows get the real one
+        reviews = [
+            self._review(line, review) for review in data.get("reviews", [])
+        ]
+        reviewers = [review.user_id for review in reviews]
+        if len(set(reviewers)) != len(reviewers):
+            raise ValueError("A user reviews the recipe more than once.")
+        images = [self._image(line, name) for name in data.get("images", [])]
+        return _Record(line, recipe, reviews, images)
+
+    def _review(self, line: int, data: dict[str, Any]) -> Review:
+        review = self.review_factory.create(
+            ReviewData(
+                recipe_id=line,
+                user_id=int(data["user_id"]),
+                rating=int(data["rating"]),
+                text=data["text"],
+            )
+        )
+        if "created_at" in data:
+            review.created_at = datetime.fromisoformat(data["created_at"])
+        return review
+
+    def _image(self, line: int, name: str) -> tuple[RecipeImage, Path]:
+        path = (self.images_dir / name).resolve()
+        if not path.is_relative_to(self.images_dir.resolve()):
+            raise ValueError(f"Image {name} is outside the images directory.")
+        if not path.is_file():
+            raise FileNotFoundError(f"Image {name} not found.")
+        mime_type, _ = mimetypes.guess_type(path.name)
+        image = self.image_factory.create(
+            RecipeImageData(
+                filename=f"{uuid4()}{path.suffix.lower()}",
+                mime_type=mime_type or "",
+                recipe_id=line,
+            )
+        )
+        return image, path
+
+    def _with_known_users(
+        self, session: Session, records: list[_Record], report: ImportReport
+    ) -> list[_Record]:
+        # One lookup per batch instead of a foreign key error that would
+        # fail all of it
+        user_ids = set().union(*(record.user_ids for record in records))
+        known = set(
+            session.scalars(
+                select(UserModel.id).where(UserModel.id.in_(user_ids))
+            )
+        )
+        accepted = []
+        for record in records:
+            unknown = record.user_ids - known
+            if unknown:
+                report.reject(
+                    record.line,
+                    f"Unknown users: {', '.join(map(str, sorted(unknown)))}.",
+                )
+            else:
+                accepted.append(record)
+        return accepted
+
+    def _upload(self, uploads: list[tuple[str, Path]]) -> None:
+        for filename, path in uploads:
+            with path.open("rb") as content:
+                self.image_store.upload(filename, content)
+
+    def _write(
+        self, session: Session, records: list[_Record], report: ImportReport
+    ) -> list[tuple[str, Path]]:
+        # All texts of the batch go to the renderer at once, which may
+        # spread them over processes
+        texts = [
+            text
+            for record in records
+            for text in (
+                record.recipe.content.description,
+                record.recipe.instruction.ingredients,
+                record.recipe.instruction.steps,
+                *(review.text for review in record.reviews),
+            )
+        ]
+        html = iter(self.html_renderer.render_many(texts))
+
+        recipe_rows = []
+        for record in records:
+            recipe = record.recipe
+            rating_sum = sum(review.rating for review in record.reviews)
+            review_count = len(record.reviews)
+            recipe_rows.append(
+                {
+                    "title": recipe.content.title,
+                    "description": recipe.content.description,
+                    "description_html": next(html),
+                    "preparation_time": recipe.details.preparation_time,
+                    "servings": recipe.details.servings,
+                    "ingredients": recipe.instruction.ingredients,
+                    "ingredients_html": next(html),
+                    "steps": recipe.instruction.steps,
+                    "steps_html": next(html),
+                    "author_id": recipe.author_id.value,
+                    "rating_sum": rating_sum,
+                    "review_count": review_count,
+                    "average_rating": rating_sum / review_count
+                    if review_count
+                    else 0,
+                }
+            )
+            for review in record.reviews:
+                review.text_html = next(html)
+
+        recipe_ids = session.scalars(
+            insert(RecipeModel).returning(
+                RecipeModel.id, sort_by_parameter_order=True
+            ),
+            recipe_rows,
+        ).all()
+
+        image_rows, review_rows, token_rows = [], [], []
+        uploads = []
+        documents = []
+        for record, recipe_id in zip(records, recipe_ids, strict=True):
+            for image, path in record.images:
+                uploads.append((image.filename, path))
+                image_rows.append(
+                    {
+                        "filename": image.filename,
+                        "mime_type": image.mime_type,
+                        "recipe_id": recipe_id,
+                    }
+                )
+            review_rows.extend(
+                {
+                    "recipe_id": recipe_id,
+                    "user_id": review.user_id.value,
+                    "rating": review.rating,
+                    "text": review.text,
+                    "text_html": review.text_html,
+                    "created_at": review.created_at,
+                }
+                for review in record.reviews
+            )
+            recipe = record.recipe
+            token_rows.extend(
+                {"token": token, "recipe_id": recipe_id}
+                for token in sorted(
+                    ingredient_tokens(recipe.instruction.ingredients)
+                )
+            )
+            documents.append(
+                SearchDocument(
+                    recipe_id,
+                    recipe.content.title,
+                    f"{recipe.content.description}\n"
+                    f"{recipe.instruction.ingredients}",
+                )
+            )
+
+        for model, rows in (
+            (RecipeImageModel, image_rows),
+            (ReviewModel, review_rows),
+            (RecipeIngredientModel, token_rows),
+        ):
+            if rows:
+                session.execute(insert(model), rows)
+        # The recipes were just inserted, there is nothing to replace
+        search_index = recipe_search_index(session.get_bind().dialect.name)
+        search_index.add_many(session, documents)
+
+        report.recipes += len(recipe_rows)
+        report.reviews += len(review_rows)
+        report.images += len(image_rows)
+        return uploads
@@ -0,0 +1,51 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from infrastructure.sqlalchemy.models.recipe import RecipeModel
+from infrastructure.sqlalchemy.search.recipe_search import (
+    SearchDocument,
+    recipe_search_index,
+)
+
+
+def rebuild_search_index(session: Session, batch_size: int = 500) -> int:
+    """
+    Re-indexes the title, description and ingredients of every recipe for
+    full-text search, a batch per transaction. Returns the number of
+    recipes indexed.
+    """
+    search_index = recipe_search_index(session.get_bind().dialect.name)
+    indexed = 0
+    last_id = 0
+    while True:
+        recipes = session.execute(
+            select(
+                RecipeModel.id,
+                RecipeModel.title,
+                RecipeModel.description,
+                RecipeModel.ingredients,
+            )
+            .where(RecipeModel.id > last_id)
+            .order_by(RecipeModel.id)
+            .limit(batch_size)
+        ).all()
+        if not recipes:
+            return indexed
+
+        recipe_ids = [recipe.id for recipe in recipes]
+        search_index.remove_many(session, recipe_ids)
+        search_index.add_many(
+            session,
+            [
+                SearchDocument(
+                    recipe.id,
+                    recipe.title,
+                    f"{recipe.description}\n{recipe.ingredients}",
+                )
+                for recipe in recipes
+            ],
+        )
+        session.commit()
+
+        indexed += len(recipes)
+        last_id = recipe_ids[-1]
@@ -1,4 +1,4 @@
-from .recipe import RecipeImageModel, RecipeModel
+from .recipe import RecipeImageModel, RecipeIngredientModel, RecipeModel
 from .review import ReviewModel
 from .role import RoleModel
 from .user import UserModel
@@ -6,6 +6,7 @@ from .user import UserModel
 
 __all__ = [
     "RecipeImageModel",
+    "RecipeIngredientModel",
     "RecipeModel",
     "ReviewModel",
     "RoleModel",
@@ -1,16 +1,56 @@
 from datetime import datetime
+from typing import Any
 
 from sqlalchemy import func
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.sql.sqltypes import DateTime
 
+from domain.clock import GlobalClock
+
+
+class current_timestamp(FunctionElement):  # noqa: N801
+    """
+    `now()` of the database. On SQLite it is written in the format bound
+    for Python datetimes, with microseconds: the keyset cursors compare
+    timestamps as strings there, and `CURRENT_TIMESTAMP` without them
+    sorts before a cursor taken from the very same row.
+    """
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(current_timestamp)
+def _compile_current_timestamp(
+    element: current_timestamp, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return compiler.process(func.now(), **kw)
+
+
+@compiles(current_timestamp, "sqlite")
+def _compile_sqlite_current_timestamp(
+    element: current_timestamp, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return "strftime('%Y-%m-%d %H:%M:%f000', 'now')"
+
 
 class Base(DeclarativeBase):
     __abstract__ = True
 
+    # Set on the Python side as well, so that stored values have the same
+    # precision and format as the ones bound in keyset pagination queries,
+    # and two changes within a second still get different page versions
     system_created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True),
+        default=GlobalClock.now,
+        server_default=current_timestamp(),
     )
     system_updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True),
+        default=GlobalClock.now,
+        server_default=current_timestamp(),
+        onupdate=GlobalClock.now,
     )
@@ -1,8 +1,10 @@
 from .recipe import RecipeModel
 from .recipe_image import RecipeImageModel
+from .recipe_ingredient import RecipeIngredientModel
 
 
 __all__ = [
     "RecipeImageModel",
+    "RecipeIngredientModel",
     "RecipeModel",
 ]
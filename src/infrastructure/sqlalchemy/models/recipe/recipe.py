@@ -1,11 +1,39 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    DDL,
+    Column,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.orm import relationship
 
 from infrastructure.sqlalchemy.models.base import Base
+from infrastructure.sqlalchemy.search.recipe_search import SEARCH_INDEXES
 
 
 class RecipeModel(Base):
     __tablename__ = "Recipes"
+    __table_args__ = (
+        # One (key, id) index per RecipeSort, so every listing is an
+        # ordered index scan however it is filtered
+        Index("ix_Recipes_created_id", "system_created_at", "id"),
+        Index("ix_Recipes_rating_id", "average_rating", "id"),
+        Index("ix_Recipes_review_count_id", "review_count", "id"),
+        Index("ix_Recipes_preparation_time_id", "preparation_time", "id"),
+        # An author's recipes, newest first; serves the foreign key too
+        Index(
+            "ix_Recipes_author_created_id",
+            "author_id",
+            "system_created_at",
+            "id",
+        ),
+        # MAX() of the catalog version behind conditional GETs of the index
+        Index("ix_Recipes_updated_at", "system_updated_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
@@ -14,11 +42,40 @@ class RecipeModel(Base):
     servings = Column(Integer, nullable=False)
     ingredients = Column(Text, nullable=False)
     steps = Column(Text, nullable=False)
+    # Sanitized HTML of the texts above, rendered on write; NULL until the
+    # render_markup command has run over rows written before it existed
+    description_html = Column(Text, nullable=True)
+    ingredients_html = Column(Text, nullable=True)
+    steps_html = Column(Text, nullable=True)
     author_id = Column(Integer, ForeignKey("Users.id"), nullable=False)
-
-    images = relationship(
-        "RecipeImageModel", cascade="all, delete-orphan", lazy="joined"
+    rating_sum = Column(Integer, nullable=False, default=0, server_default="0")
+    review_count = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # rating_sum / review_count, stored only to be sorted on
+    average_rating = Column(
+        Float, nullable=False, default=0, server_default="0"
     )
+
+    # Loading strategy is chosen per query, see RecipeLoadProfile
+    images = relationship("RecipeImageModel", cascade="all, delete-orphan")
     reviews = relationship(
         "ReviewModel", cascade="all, delete-orphan", lazy="raise"
     )
+
+
+# The full-text index has a different shape on every DBMS and is not a
+# mapped table, it follows the Recipes table in create_all and drop_all
+for dialect, search_index in SEARCH_INDEXES.items():
+    for statement in search_index.create_ddl:
+        event.listen(
+            RecipeModel.__table__,
+            "after_create",
+            DDL(statement).execute_if(dialect=dialect),
+        )
+    for statement in search_index.drop_ddl:
+        event.listen(
+            RecipeModel.__table__,
+            "before_drop",
+            DDL(statement).execute_if(dialect=dialect),
+        )
@@ -10,5 +10,8 @@ class RecipeImageModel(Base):
     filename = Column(String(255), nullable=False)
     mime_type = Column(String(100), nullable=False)
     recipe_id = Column(
-        Integer, ForeignKey("Recipes.id", ondelete="CASCADE"), nullable=False
+        Integer,
+        ForeignKey("Recipes.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, ForeignKey, Integer, String
+
+from infrastructure.sqlalchemy.models.base import Base
+
+
+class RecipeIngredientModel(Base):
+    """
+    Inverted index of recipe ingredients: one row per normalized token.
+    """
+
+    __tablename__ = "RecipeIngredients"
+
+    # Token first, so that the primary key serves lookups by ingredient
+    token = Column(String(64), primary_key=True)
+    recipe_id = Column(
+        Integer,
+        ForeignKey("Recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
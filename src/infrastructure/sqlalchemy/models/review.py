@@ -1,10 +1,21 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text
 
 from infrastructure.sqlalchemy.models.base import Base
 
 
+# A user reviews a recipe once; the insert conflict is the only check
+UQ_REVIEWS_USER_RECIPE = "uq_Reviews_user_recipe"
+
+
 class ReviewModel(Base):
     __tablename__ = "Reviews"
+    __table_args__ = (
+        # Newest-first pages of a recipe's reviews
+        Index("ix_Reviews_recipe_created_id", "recipe_id", "created_at", "id"),
+        Index(UQ_REVIEWS_USER_RECIPE, "user_id", "recipe_id", unique=True),
+        # A user's reviews, newest first
+        Index("ix_Reviews_user_created_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     recipe_id = Column(
@@ -13,4 +24,5 @@ class ReviewModel(Base):
     user_id = Column(Integer, ForeignKey("Users.id"), nullable=False)
     rating = Column(Integer, nullable=False)
     text = Column(Text, nullable=False)
+    text_html = Column(Text, nullable=True)  # sanitized, rendered on write
     created_at = Column(DateTime(timezone=True), nullable=False)
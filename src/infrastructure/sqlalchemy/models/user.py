@@ -1,5 +1,4 @@
 from sqlalchemy import Column, ForeignKey, Integer, String
-from sqlalchemy.orm import relationship
 
 from infrastructure.sqlalchemy.models.base import Base
 
@@ -14,5 +13,3 @@ class UserModel(Base):
     name = Column(String(100), nullable=False)
     patronymic = Column(String(100), nullable=True)
     role_id = Column(Integer, ForeignKey("Roles.id"), nullable=False)
-
-    role = relationship("RoleModel", lazy="joined")
@@ -33,7 +33,8 @@ class QueryExecutor:
         ),
     ) -> RESULT | None:
         with self.transaction_manager.get_session():
-            return self.execute(statement).scalar_one_or_none()
+            # unique() collapses rows repeated by joined eager loads
+            return self.execute(statement).unique().scalar_one_or_none()
 
     def execute_scalar_many(
         self,
@@ -47,7 +48,7 @@ class QueryExecutor:
         ),
     ) -> Sequence[RESULT]:
         with self.transaction_manager.get_session():
-            return self.execute(statement).scalars().all()
+            return self.execute(statement).unique().scalars().all()
 
     def execute_one(
         self,
@@ -1,36 +1,99 @@
-from typing import cast
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, cast
 
-from sqlalchemy import delete, select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    Float,
+    Row,
+    Select,
+    asc,
+    cast as sql_cast,
+    delete,
+    desc,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import Session, joinedload, noload, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from application.exceptions import ApplicationError, NotFoundError
 from domain.entities.entity import Id
 from domain.entities.recipe.image import RecipeImage
-from domain.entities.recipe.recipe import Recipe
+from domain.entities.recipe.recipe import (
+    ContentVersion,
+    Recipe,
+    RecipeDetail,
+    RecipeIngredientMatch,
+    RecipeSummary,
+)
 from domain.entities.recipe.value_objects import (
     RecipeContent,
     RecipeDetails,
     RecipeInstruction,
+    RecipeMarkup,
+    RecipeRating,
+)
+from domain.entities.review.value_objects import RatingHistogram
+from domain.entities.user.user import User
+from domain.entities.user.value_objects import FullName
+from domain.pagination import Cursor, KeysetPage
+from domain.repositories.recipe_repository import (
+    IRecipeRepository,
+    RecipeListSpec,
+    RecipeLoadProfile,
+    RecipeSort,
+)
+from infrastructure.sqlalchemy.models import (
+    RecipeImageModel,
+    RecipeIngredientModel,
+    RecipeModel,
+    ReviewModel,
+    UserModel,
 )
-from domain.repositories.recipe_repository import IRecipeRepository
-from infrastructure.sqlalchemy.models import RecipeImageModel, RecipeModel
 from infrastructure.sqlalchemy.query_executor import QueryExecutor
+from infrastructure.sqlalchemy.role_registry import RoleRegistry
+from infrastructure.sqlalchemy.search.ingredients import ingredient_tokens
+from infrastructure.sqlalchemy.search.recipe_search import (
+    RecipeSearchIndex,
+    recipe_search_index,
+)
 from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
 
 
+_SORT_COLUMNS = {
+    RecipeSort.NEWEST: RecipeModel.system_created_at,
+    RecipeSort.RATING: RecipeModel.average_rating,
+    RecipeSort.REVIEW_COUNT: RecipeModel.review_count,
+    RecipeSort.PREPARATION_TIME: RecipeModel.preparation_time,
+}
+
+
 class SQLAlchemyRecipeRepository(IRecipeRepository):
     def __init__(
         self,
         query_executor: QueryExecutor,
         transaction_manager: SQLAlchemyTransactionManager,
+        role_registry: RoleRegistry,
     ):
         self.query_executor = query_executor
         self.transaction_manager = transaction_manager
+        self.role_registry = role_registry
 
-    def get_by_id(self, recipe_id: int) -> Recipe:
+    def get_by_id(
+        self,
+        recipe_id: int,
+        profile: RecipeLoadProfile = RecipeLoadProfile.FULL,
+    ) -> Recipe:
         statement = (
             select(RecipeModel)
-            .options(selectinload(RecipeModel.images))
+            .options(*self._load_options(profile))
             .where(RecipeModel.id == recipe_id)
         )
         recipe_model = self.query_executor.execute_scalar_one(statement)
@@ -38,17 +101,238 @@ class SQLAlchemyRecipeRepository(IRecipeRepository):
             raise NotFoundError(recipe_id, "Recipe")
         return self._to_domain(recipe_model)
 
-    def get_all(self, page: int, per_page: int) -> list[Recipe]:
-        offset = (page - 1) * per_page
+    def get_detail(
+        self, recipe_id: int, viewer_id: int | None = None
+    ) -> RecipeDetail:
+        # One statement: the recipe with its images and author, whether
+        # the viewer has reviewed it and its reviews counted per rating by
+        # one GROUP BY over a single range of the (recipe_id, ...) review
+        # index. The join repeats the recipe once per rating given, at
+        # most six rows per image. The reviews are paged by the review
+        # repository; joining them here would repeat every image
+        reviewed = (
+            exists()
+            .where(
+                ReviewModel.recipe_id == RecipeModel.id,
+                ReviewModel.user_id == viewer_id,
+            )
+            .label("reviewed_by_viewer")
+            if viewer_id is not None
+            else literal(False).label("reviewed_by_viewer")
+        )
+        rating_counts = (
+            select(
+                ReviewModel.rating,
+                func.count().label("review_count"),
+            )
+            .where(ReviewModel.recipe_id == recipe_id)
+            .group_by(ReviewModel.rating)
+            .subquery("rating_counts")
+        )
         statement = (
-            select(RecipeModel)
-            .options(selectinload(RecipeModel.images))
-            .order_by(RecipeModel.system_created_at.desc())
+            select(
+                RecipeModel,
+                UserModel,
+                reviewed,
+                rating_counts.c.rating,
+                rating_counts.c.review_count,
+            )
+            .join(UserModel, RecipeModel.author_id == UserModel.id)
+            .outerjoin(rating_counts, true())
+            .options(*self._load_options(RecipeLoadProfile.FULL))
+            .where(RecipeModel.id == recipe_id)
+        )
+        with self.transaction_manager.get_session():
+            rows = self.query_executor.execute(statement).unique().all()
+        if not rows:
+            raise NotFoundError(recipe_id, "Recipe")
+
+        row = rows[0]
+        return RecipeDetail(
+            recipe=self._to_domain(row.RecipeModel),
+            author=self._to_user_domain(row.UserModel),
+            reviewed_by_viewer=bool(row.reviewed_by_viewer),
+            # No reviews at all leave a single row with a NULL rating
+            rating_histogram=RatingHistogram.from_counts(
+                {
+                    r.rating: r.review_count
+                    for r in rows
+                    if r.rating is not None
+                }
+            ),
+        )
+
+    def get_version(self, recipe_id: int) -> ContentVersion:
+        # The recipe row, bumped by edits and by every review written or
+        # deleted through its rating counters, and its reviews
+        of_recipe = ReviewModel.recipe_id == RecipeModel.id
+        statement = select(
+            RecipeModel.system_updated_at,
+            select(func.max(ReviewModel.system_updated_at))
+            .where(of_recipe)
+            .scalar_subquery()
+            .label("reviews_updated_at"),
+            select(func.count(ReviewModel.id))
+            .where(of_recipe)
+            .scalar_subquery()
+            .label("review_count"),
+        ).where(RecipeModel.id == recipe_id)
+        row = self.query_executor.execute_one(statement)  # type: ignore
+        if not row:
+            raise NotFoundError(recipe_id, "Recipe")
+        return ContentVersion.combine(
+            ContentVersion(row.system_updated_at, 1),
+            ContentVersion(row.reviews_updated_at, row.review_count),
+        )
+
+    def get_catalog_updated_at(self) -> datetime | None:
+        # The last entry of ix_Recipes_updated_at. Review writes move their
+        # recipe's counters, which bumps the recipe row as well
+        statement = select(func.max(RecipeModel.system_updated_at))
+        return self.query_executor.execute_scalar_one(statement)  # type: ignore
+
+    def get_summary_page(
+        self,
+        limit: int,
+        after: Cursor | None = None,
+        before: Cursor | None = None,
+        offset: int = 0,
+        spec: RecipeListSpec | None = None,
+    ) -> KeysetPage[RecipeSummary]:
+        # Ordered by the sort key, ties broken by id; every ordering has its
+        # own (key, id) index. One extra row is fetched to learn whether the
+        # page has a neighbour
+        spec = spec or RecipeListSpec()
+        column = _SORT_COLUMNS[spec.sort]
+        # Walk backwards in the opposite order, then restore the page order
+        descending = spec.sort.descending != bool(before)
+        statement = self._apply_filters(self._summary_statement(), spec)
+        cursor = before or after
+        if cursor:
+            key = tuple_(column, RecipeModel.id)
+            bound = tuple_(cursor.value, cursor.entity_id)
+            statement = statement.where(
+                key < bound if descending else key > bound
+            )
+        statement = statement.order_by(*self._order_by(spec.sort, descending))
+        if not before:
+            statement = statement.offset(offset)
+        statement = statement.limit(limit + 1)
+
+        rows = list(self.query_executor.execute_many(statement))  # type: ignore
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if before:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, bool(after) or offset > 0
+
+        return KeysetPage(
+            items=[self._to_summary(row) for row in rows],
+            next_cursor=(
+                Cursor(getattr(rows[-1], column.key), rows[-1].id)
+                if rows and has_next
+                else None
+            ),
+            previous_cursor=(
+                Cursor(getattr(rows[0], column.key), rows[0].id)
+                if rows and has_previous
+                else None
+            ),
+        )
+
+    def get_by_author(
+        self, author_id: int, limit: int, after: Cursor | None = None
+    ) -> KeysetPage[RecipeSummary]:
+        # A range scan of the (author_id, created, id) index, however many
+        # recipes the author has written before the page
+        statement = self._summary_statement().where(
+            RecipeModel.author_id == author_id
+        )
+        if after:
+            statement = statement.where(
+                tuple_(RecipeModel.system_created_at, RecipeModel.id)
+                < tuple_(after.value, after.entity_id)
+            )
+        statement = statement.order_by(
+            *self._order_by(RecipeSort.NEWEST, descending=True)
+        ).limit(limit + 1)
+
+        rows = list(self.query_executor.execute_many(statement))  # type: ignore
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        return KeysetPage(
+            items=[self._to_summary(row) for row in rows],
+            next_cursor=(
+                Cursor(rows[-1].system_created_at, rows[-1].id)
+                if rows and has_next
+                else None
+            ),
+            previous_cursor=None,
+        )
+
+    def get_summaries_by_ids(
+        self, recipe_ids: Sequence[int]
+    ) -> list[RecipeSummary]:
+        if not recipe_ids:
+            return []
+        statement = self._summary_statement().where(
+            RecipeModel.id.in_(recipe_ids)
+        )
+        rows = self.query_executor.execute_many(statement)  # type: ignore
+        return [self._to_summary(row) for row in rows]
+
+    def find_by_ingredients(
+        self, ingredients: Sequence[str], limit: int, offset: int = 0
+    ) -> list[RecipeIngredientMatch]:
+        token_sets = {
+            frozenset(tokens)
+            for tokens in map(ingredient_tokens, ingredients)
+            if tokens
+        }
+        if not token_sets:
+            return []
+        # A recipe contains an ingredient when it has all of its tokens;
+        # every branch is a range scan of the (token, recipe_id) key
+        contained = union_all(
+            *(
+                select(RecipeIngredientModel.recipe_id)
+                .where(RecipeIngredientModel.token.in_(sorted(tokens)))
+                .group_by(RecipeIngredientModel.recipe_id)
+                .having(func.count() == len(tokens))
+                for tokens in token_sets
+            )
+        ).subquery("contained")
+        ranked = (
+            select(
+                contained.c.recipe_id,
+                func.count().label("matched_count"),
+            )
+            .group_by(contained.c.recipe_id)
+            .subquery("ranked")
+        )
+        statement = (
+            self._summary_statement()
+            .add_columns(ranked.c.matched_count)
+            .join(ranked, ranked.c.recipe_id == RecipeModel.id)
+            .order_by(
+                ranked.c.matched_count.desc(),
+                RecipeModel.average_rating.desc(),
+                RecipeModel.id.desc(),
+            )
             .offset(offset)
-            .limit(per_page)
+            .limit(limit)
         )
-        recipe_models = self.query_executor.execute_scalar_many(statement)
-        return [self._to_domain(model) for model in recipe_models]
+        rows = self.query_executor.execute_many(statement)  # type: ignore
+        return [
+            RecipeIngredientMatch(self._to_summary(row), row.matched_count)
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        statement = select(func.count(RecipeModel.id))
+        return self.query_executor.execute_scalar_one(statement) or 0  # type: ignore
 
     def save(self, recipe: Recipe) -> Recipe:
         with self.transaction_manager.get_session():
@@ -66,6 +350,8 @@ class SQLAlchemyRecipeRepository(IRecipeRepository):
             ]
             for image in image_models:
                 self.query_executor.save(image)
+            self._reindex(recipe_model)
+            self._replace_ingredients(recipe_model)
             return self._to_domain(recipe_model)
 
     def remove(self, recipe: Recipe) -> None:
@@ -74,7 +360,82 @@ class SQLAlchemyRecipeRepository(IRecipeRepository):
         statement = delete(RecipeModel).where(
             RecipeModel.id == recipe.id_safe.value
         )
-        self.query_executor.execute(statement)
+        with self.transaction_manager.get_session() as session:
+            self.query_executor.execute(
+                delete(RecipeIngredientModel).where(
+                    RecipeIngredientModel.recipe_id == recipe.id_safe.value
+                )
+            )
+            self.query_executor.execute(statement)
+            self._search_index(session).remove(session, recipe.id_safe.value)
+
+    def search(
+        self, query: str, limit: int, offset: int = 0
+    ) -> list[RecipeSummary]:
+        with self.transaction_manager.get_session() as session:
+            match = self._search_index(session).match(query)
+        if match is None:
+            return []
+        statement = (
+            self._summary_statement()
+            .join(match, match.c.recipe_id == RecipeModel.id)
+            .order_by(match.c.relevance.desc(), RecipeModel.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = self.query_executor.execute_many(statement)  # type: ignore
+        return [self._to_summary(row) for row in rows]
+
+    def adjust_rating(
+        self, recipe_id: int, rating_delta: int, count_delta: int
+    ) -> None:
+        # Atomic in-place update, so concurrent reviews never lose a delta
+        statement = (
+            update(RecipeModel)
+            .where(RecipeModel.id == recipe_id)
+            .values(
+                rating_sum=RecipeModel.rating_sum + rating_delta,
+                review_count=RecipeModel.review_count + count_delta,
+                average_rating=func.coalesce(
+                    sql_cast(RecipeModel.rating_sum + rating_delta, Float)
+                    / func.nullif(RecipeModel.review_count + count_delta, 0),
+                    0,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = self.query_executor.execute(statement)
+        if not result.rowcount:
+            raise NotFoundError(recipe_id, "Recipe")
+
+    def _reindex(self, model: RecipeModel) -> None:
+        with self.transaction_manager.get_session() as session:
+            self._search_index(session).index(
+                session,
+                cast(int, model.id),
+                cast(str, model.title),
+                f"{model.description}\n{model.ingredients}",
+            )
+
+    def _replace_ingredients(self, model: RecipeModel) -> None:
+        self.query_executor.execute(
+            delete(RecipeIngredientModel).where(
+                RecipeIngredientModel.recipe_id == model.id
+            )
+        )
+        tokens = ingredient_tokens(cast(str, model.ingredients))
+        if tokens:
+            with self.transaction_manager.get_session() as session:
+                session.execute(
+                    insert(RecipeIngredientModel),
+                    [
+                        {"token": token, "recipe_id": model.id}
+                        for token in sorted(tokens)
+                    ],
+                )
+
+    def _search_index(self, session: Session) -> RecipeSearchIndex:
+        return recipe_search_index(session.get_bind().dialect.name)
 
     def _to_domain(self, model: RecipeModel) -> Recipe:
         recipe = Recipe(
@@ -101,10 +462,118 @@ class SQLAlchemyRecipeRepository(IRecipeRepository):
                 )
                 for img in model.images
             ],
+            rating=RecipeRating(
+                cast(int, model.rating_sum or 0),
+                cast(int, model.review_count or 0),
+            ),
+            markup=self._to_markup(model),
         )
         return recipe
 
+    def _to_markup(self, model: RecipeModel) -> RecipeMarkup | None:
+        # The three columns are always written together
+        if model.description_html is None:
+            return None
+        return RecipeMarkup(
+            cast(str, model.description_html),
+            cast(str, model.ingredients_html),
+            cast(str, model.steps_html),
+        )
+
+    def _to_user_domain(self, model: UserModel) -> User:
+        return User(
+            entity_id=Id(cast(int, model.id)),
+            username=cast(str, model.username),
+            password_hash=cast(str, model.password_hash),
+            full_name=FullName(
+                surname=cast(str, model.surname),
+                name=cast(str, model.name),
+                patronymic=cast(str, model.patronymic),
+            ),
+            role=self.role_registry.get(cast(int, model.role_id)),
+        )
+
+    def _load_options(self, profile: RecipeLoadProfile) -> list[ORMOption]:
+        # Images are never loaded implicitly, every query picks its strategy:
+        # one JOIN for a single recipe, one extra SELECT for a whole list
+        # (a JOIN would multiply rows under LIMIT), or none at all
+        match profile:
+            case RecipeLoadProfile.SUMMARY:
+                return [selectinload(RecipeModel.images)]
+            case RecipeLoadProfile.FULL:
+                return [joinedload(RecipeModel.images)]
+            case RecipeLoadProfile.OWNERSHIP_CHECK:
+                return [noload(RecipeModel.images)]
+
+    def _order_by(self, sort: RecipeSort, descending: bool) -> list[Any]:
+        direction = desc if descending else asc
+        return [direction(_SORT_COLUMNS[sort]), direction(RecipeModel.id)]
+
+    def _apply_filters(self, statement: Select, spec: RecipeListSpec) -> Any:
+        filters = spec.filters
+        if filters.max_preparation_time is not None:
+            preparation_time = RecipeModel.preparation_time
+            if spec.sort is not RecipeSort.PREPARATION_TIME:
+                # "+ 0" keeps the range off ix_Recipes_preparation_time_id:
+                # the planner would rather range-scan it and sort the whole
+                # result than walk the index of the sort key and filter
+                preparation_time = preparation_time + 0
+            statement = statement.where(
+                preparation_time <= filters.max_preparation_time
+            )
+        if filters.servings is not None:
+            statement = statement.where(
+                RecipeModel.servings == filters.servings
+            )
+        return statement
+
+    def _summary_statement(self):
+        # Only the columns a listing renders, plus the first image (lowest
+        # id) of each recipe; description, ingredients and steps stay behind
+        first_image_id = (
+            select(func.min(RecipeImageModel.id))
+            .where(RecipeImageModel.recipe_id == RecipeModel.id)
+            .correlate(RecipeModel)
+            .scalar_subquery()
+        )
+        return select(
+            RecipeModel.id,
+            RecipeModel.title,
+            RecipeModel.preparation_time,
+            RecipeModel.servings,
+            RecipeModel.author_id,
+            RecipeModel.rating_sum,
+            RecipeModel.review_count,
+            RecipeModel.average_rating,
+            RecipeModel.system_created_at,
+            RecipeImageModel.id.label("image_id"),
+            RecipeImageModel.filename,
+            RecipeImageModel.mime_type,
+        ).outerjoin(RecipeImageModel, RecipeImageModel.id == first_image_id)
+
+    def _to_summary(self, row: Row[Any]) -> RecipeSummary:
+        return RecipeSummary(
+            recipe_id=Id(row.id),
+            title=row.title,
+            details=RecipeDetails(row.preparation_time, row.servings),
+            author_id=Id(row.author_id),
+            rating=RecipeRating(row.rating_sum, row.review_count),
+            cover=(
+                RecipeImage(
+                    entity_id=Id(row.image_id),
+                    filename=row.filename,
+                    mime_type=row.mime_type,
+                    recipe_id=Id(row.id),
+                )
+                if row.image_id
+                else None
+            ),
+        )
+
     def _to_model(self, recipe: Recipe) -> RecipeModel:
+        # Rating counters are left unset so that merge() never overwrites
+        # them: they are maintained by adjust_rating only
+        markup = recipe.markup
         return RecipeModel(
             id=recipe.id.value if recipe.id else None,
             title=recipe.content.title,
@@ -114,4 +583,7 @@ class SQLAlchemyRecipeRepository(IRecipeRepository):
             ingredients=recipe.instruction.ingredients,
             steps=recipe.instruction.steps,
             author_id=recipe.author_id.value,
+            description_html=markup.description_html if markup else None,
+            ingredients_html=markup.ingredients_html if markup else None,
+            steps_html=markup.steps_html if markup else None,
         )
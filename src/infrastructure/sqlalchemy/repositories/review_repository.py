@@ -2,19 +2,23 @@ from collections.abc import Sequence
 from datetime import datetime
 from typing import cast
 
-from sqlalchemy import select
+from sqlalchemy import Select, delete, select, tuple_, update
 
-from application.exceptions import NotFoundError
+from application.exceptions import (
+    ApplicationError,
+    NotFoundError,
+    ReviewChangedError,
+)
 from domain.entities.entity import Id
 from domain.entities.review.review import AuthoredReview, Review
-from domain.entities.user.role import Role
 from domain.entities.user.user import User
 from domain.entities.user.value_objects import FullName
+from domain.pagination import Cursor, KeysetPage
 from domain.repositories.review_repository import IReviewRepository
 from infrastructure.sqlalchemy.models.review import ReviewModel
-from infrastructure.sqlalchemy.models.role import RoleModel
 from infrastructure.sqlalchemy.models.user import UserModel
 from infrastructure.sqlalchemy.query_executor import QueryExecutor
+from infrastructure.sqlalchemy.role_registry import RoleRegistry
 from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
 
 
@@ -23,9 +27,11 @@ class SQLAlchemyReviewRepository(IReviewRepository):
         self,
         query_executor: QueryExecutor,
         transaction_manager: SQLAlchemyTransactionManager,
+        role_registry: RoleRegistry,
     ):
         self.query_executor = query_executor
         self.transaction_manager = transaction_manager
+        self.role_registry = role_registry
 
     def get_by_id(self, review_id: int) -> Review:
         statement = select(ReviewModel).where(ReviewModel.id == review_id)
@@ -44,40 +50,128 @@ class SQLAlchemyReviewRepository(IReviewRepository):
     def get_with_author_by_recipe_id(
         self, recipe_id: int
     ) -> Sequence[AuthoredReview]:
-        statement = (
-            select(ReviewModel, UserModel, RoleModel)
-            .join(UserModel, ReviewModel.user_id == UserModel.id)
-            .join(RoleModel, UserModel.role_id == RoleModel.id)
-            .where(ReviewModel.recipe_id == recipe_id)
+        statement = self._authored_statement(recipe_id).order_by(
+            ReviewModel.created_at.desc(), ReviewModel.id.desc()
         )
         result = self.query_executor.execute_many(statement)
 
         return [
-            self._to_authored_review(
-                row.ReviewModel, row.UserModel, row.RoleModel
-            )
+            self._to_authored_review(row.ReviewModel, row.UserModel)
             for row in result
         ]
 
+    def get_page_by_recipe_id(
+        self, recipe_id: int, limit: int, after: Cursor | None = None
+    ) -> KeysetPage[AuthoredReview]:
+        # Newest first, ties broken by id: a range scan of the
+        # (recipe_id, created_at, id) index. One extra row is fetched to
+        # learn whether there is a next page
+        statement = self._authored_statement(recipe_id)
+        if after:
+            statement = statement.where(
+                tuple_(ReviewModel.created_at, ReviewModel.id)
+                < tuple_(after.value, after.entity_id)
+            )
+        statement = statement.order_by(
+            ReviewModel.created_at.desc(), ReviewModel.id.desc()
+        ).limit(limit + 1)
+
+        rows = list(self.query_executor.execute_many(statement))
+        has_next = len(rows) > limit
+        reviews = [
+            self._to_authored_review(row.ReviewModel, row.UserModel)
+            for row in rows[:limit]
+        ]
+        last = reviews[-1].review if reviews else None
+        return KeysetPage(
+            items=reviews,
+            next_cursor=(
+                Cursor(last.created_at, last.id.value)
+                if last and last.id and has_next
+                else None
+            ),
+            previous_cursor=None,
+        )
+
+    def get_by_user(
+        self, user_id: int, limit: int, after: Cursor | None = None
+    ) -> KeysetPage[Review]:
+        # Newest first, a range scan of the (user_id, created_at, id) index
+        statement = select(ReviewModel).where(ReviewModel.user_id == user_id)
+        if after:
+            statement = statement.where(
+                tuple_(ReviewModel.created_at, ReviewModel.id)
+                < tuple_(after.value, after.entity_id)
+            )
+        statement = statement.order_by(
+            ReviewModel.created_at.desc(), ReviewModel.id.desc()
+        ).limit(limit + 1)
+
+        models = list(self.query_executor.execute_scalar_many(statement))
+        has_next = len(models) > limit
+        reviews = [self._to_domain(model) for model in models[:limit]]
+        last = reviews[-1] if reviews else None
+        return KeysetPage(
+            items=reviews,
+            next_cursor=(
+                Cursor(last.created_at, last.id.value)
+                if last and last.id and has_next
+                else None
+            ),
+            previous_cursor=None,
+        )
+
     def save(self, review: Review) -> Review:
         with self.transaction_manager.get_session():
             review_model = self._to_model(review)
             review_model = self.query_executor.save(review_model)
             return self._to_domain(review_model)
 
-    def exists_for_user_and_recipe(self, user_id: int, recipe_id: int) -> bool:
-        statement = select(ReviewModel).where(
-            ReviewModel.user_id == user_id, ReviewModel.recipe_id == recipe_id
+    def update(self, review: Review, previous_rating: int) -> None:
+        # Conditional on the rating the caller's delta was computed from:
+        # of two concurrent edits the second finds the rating moved and
+        # fails, instead of both moving the recipe's counters from it
+        statement = (
+            update(ReviewModel)
+            .where(
+                ReviewModel.id == review.id_safe.value,
+                ReviewModel.rating == previous_rating,
+            )
+            .values(
+                rating=review.rating,
+                text=review.text,
+                text_html=review.text_html,
+            )
+        )
+        result = self.query_executor.execute(statement)
+        if not result.rowcount:
+            raise ReviewChangedError()
+
+    def remove(self, review: Review) -> None:
+        if not review.id:
+            raise ApplicationError("Review without id cannot be removed")
+        statement = delete(ReviewModel).where(
+            ReviewModel.id == review.id_safe.value
+        )
+        result = self.query_executor.execute(statement)
+        # Deleted by a concurrent request, whose rating delta already
+        # counts; applying ours too would take the review out twice
+        if not result.rowcount:
+            raise NotFoundError(review.id_safe.value, "Review")
+
+    def _authored_statement(self, recipe_id: int) -> Select:
+        return (
+            select(ReviewModel, UserModel)
+            .join(UserModel, ReviewModel.user_id == UserModel.id)
+            .where(ReviewModel.recipe_id == recipe_id)
         )
-        review_model = self.query_executor.execute_scalar_one(statement)
-        return review_model is not None
 
     def _to_authored_review(
-        self, review: ReviewModel, user: UserModel, role: RoleModel
+        self, review: ReviewModel, user: UserModel
     ) -> AuthoredReview:
         return AuthoredReview(
             review=self._to_domain(review),
-            author=self._to_user_domain(user, role),
+            author=self._to_user_domain(user),
         )
 
     def _to_domain(self, model: ReviewModel) -> Review:
@@ -88,9 +182,10 @@ class SQLAlchemyReviewRepository(IReviewRepository):
             rating=cast(int, model.rating),
             text=cast(str, model.text),
             created_at=cast(datetime, model.created_at),
+            text_html=cast(str | None, model.text_html),
         )
 
-    def _to_user_domain(self, model: UserModel, role: RoleModel) -> User:
+    def _to_user_domain(self, model: UserModel) -> User:
         return User(
             entity_id=Id(cast(int, model.id)),
             username=cast(str, model.username),
@@ -100,13 +195,7 @@ class SQLAlchemyReviewRepository(IReviewRepository):
                 name=cast(str, model.name),
                 patronymic=cast(str, model.patronymic),
             ),
-            role=(
-                Role(
-                    entity_id=Id(cast(int, role.id)),
-                    name=cast(str, role.name),
-                    description=cast(str, role.description),
-                )
-            ),
+            role=self.role_registry.get(cast(int, model.role_id)),
         )
 
     def _to_model(self, review: Review) -> ReviewModel:
@@ -116,5 +205,6 @@ class SQLAlchemyReviewRepository(IReviewRepository):
             user_id=review.user_id.value,
             rating=review.rating,
             text=review.text,
+            text_html=review.text_html,
             created_at=review.created_at,
         )
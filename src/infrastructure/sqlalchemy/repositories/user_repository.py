@@ -1,16 +1,15 @@
-from typing import cast, overload
+from typing import cast
 
 from sqlalchemy import select
 
 from application.exceptions import NotFoundError
 from domain.entities.entity import Id
-from domain.entities.user.role import Role
 from domain.entities.user.user import User
 from domain.entities.user.value_objects import FullName
 from domain.repositories.user_repository import IUserRepository
-from infrastructure.sqlalchemy.models.role import RoleModel
 from infrastructure.sqlalchemy.models.user import UserModel
 from infrastructure.sqlalchemy.query_executor import QueryExecutor
+from infrastructure.sqlalchemy.role_registry import RoleRegistry
 from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
 
 
@@ -19,39 +18,25 @@ class SQLAlchemyUserRepository(IUserRepository):
         self,
         query_executor: QueryExecutor,
         transaction_manager: SQLAlchemyTransactionManager,
+        role_registry: RoleRegistry,
     ):
         self.query_executor = query_executor
         self.transaction_manager = transaction_manager
+        self.role_registry = role_registry
 
     def get_by_id(self, user_id: int) -> User:
-        statement = (
-            select(UserModel, RoleModel)
-            .join(RoleModel, UserModel.role_id == RoleModel.id)
-            .where(UserModel.id == user_id)
-        )
-        row = self.query_executor.execute_one(statement)
-        if not row:
+        statement = select(UserModel).where(UserModel.id == user_id)
+        user_model = self.query_executor.execute_scalar_one(statement)
+        if not user_model:
             raise NotFoundError(user_id, "User")
-
-        user_model = row.UserModel
-        role_model = row.RoleModel
-
-        return self._to_domain(user_model, role_model)
+        return self._to_domain(user_model)
 
     def get_by_username(self, username: str) -> User:
-        statement = (
-            select(UserModel, RoleModel)
-            .join(RoleModel, UserModel.role_id == RoleModel.id)
-            .where(UserModel.username == username)
-        )
-        row = self.query_executor.execute_one(statement)
-        if not row:
+        statement = select(UserModel).where(UserModel.username == username)
+        user_model = self.query_executor.execute_scalar_one(statement)
+        if not user_model:
             raise NotFoundError(username, "User")
-
-        user_model = row.UserModel
-        role_model = row.RoleModel
-
-        return self._to_domain(user_model, role_model)
+        return self._to_domain(user_model)
 
     def exists(self, user_id: int) -> bool:
         statement = select(1).where(UserModel.id == user_id)
@@ -67,13 +52,9 @@ class SQLAlchemyUserRepository(IUserRepository):
         with self.transaction_manager.get_session():
             user_model = self._to_model(user)
             user_model = self.query_executor.save(user_model)
-            return self._to_domain(user_model, user_model.role)
+            return self._to_domain(user_model)
 
-    @overload
-    def _to_domain(self, model: UserModel, role: Role) -> User: ...
-    @overload
-    def _to_domain(self, model: UserModel, role: RoleModel) -> User: ...
-    def _to_domain(self, model: UserModel, role: Role | RoleModel) -> User:
+    def _to_domain(self, model: UserModel) -> User:
         return User(
             entity_id=Id(cast(int, model.id)),
             username=cast(str, model.username),
@@ -83,15 +64,7 @@ class SQLAlchemyUserRepository(IUserRepository):
                 name=cast(str, model.name),
                 patronymic=cast(str, model.patronymic),
             ),
-            role=(
-                Role(
-                    entity_id=Id(cast(int, role.id)),
-                    name=cast(str, role.name),
-                    description=cast(str, role.description),
-                )
-                if isinstance(role, RoleModel)
-                else role
-            ),
+            role=self.role_registry.get(cast(int, model.role_id)),
         )
 
     def _to_model(self, user: User) -> UserModel:
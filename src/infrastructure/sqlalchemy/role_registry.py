@@ -0,0 +1,44 @@
+from collections.abc import Iterable
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from application.exceptions import NotFoundError
+from domain.entities.user.role import Role, RoleEnum
+from infrastructure.sqlalchemy.models.role import RoleModel
+
+
+class RoleRegistry:
+    """
+    Resolves `role_id` to a role in memory. Roles are fixed by `RoleEnum`
+    and seeded by `seed_roles`, so user queries need not join the Roles
+    table; `verify` checks once at startup that the table still agrees.
+    """
+
+    def __init__(self, roles: Iterable[Role] | None = None):
+        roles = roles if roles is not None else [r.value for r in RoleEnum]
+        self._roles = {role.id_safe.value: role for role in roles}
+
+    def get(self, role_id: int) -> Role:
+        role = self._roles.get(role_id)
+        if role is None:
+            raise NotFoundError(role_id, "Role")
+        return role
+
+    def verify(self, session: Session) -> None:
+        stored = dict(
+            session.execute(select(RoleModel.id, RoleModel.name)).all()
+        )
+        expected = {
+            role_id: role.name for role_id, role in self._roles.items()
+        }
+        if stored != expected:
+            mismatched = sorted(
+                role_id
+                for role_id in stored.keys() | expected.keys()
+                if stored.get(role_id) != expected.get(role_id)
+            )
+            raise RuntimeError(
+                "Roles table does not match RoleEnum for role ids: "
+                f"{', '.join(map(str, mismatched))}."
+            )
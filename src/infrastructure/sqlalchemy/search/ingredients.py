@@ -0,0 +1,30 @@
+# ruff: noqa: RUF001 -- Cyrillic units look like Latin letters
+import re
+
+from infrastructure.sqlalchemy.search.russian_stemmer import stem
+
+
+# Quantities, units and filler words of ingredient lists
+STOP_WORDS = (
+    "г", "гр", "грамм", "кг", "килограмм", "мг", "мл", "л", "литр",
+    "шт", "штука", "ст", "стакан", "ч", "ложка", "щепотка", "пучок",
+    "зубчик", "упаковка", "банка", "по", "вкус", "для", "и", "или", "с",
+    "со", "без", "на", "в", "из", "к", "до", "около", "примерно",
+)  # fmt: skip
+STOP_STEMS = frozenset(stem(word) for word in STOP_WORDS)
+
+LETTERS = re.compile(r"[^\W\d_]+")
+TOKEN_MAX_LENGTH = 64
+
+
+def ingredient_tokens(text: str) -> set[str]:
+    """
+    Normalized tokens of an ingredient list or of a single ingredient:
+    stems of its words, without numbers, units and filler words.
+    """
+    tokens = set()
+    for word in LETTERS.findall(text.lower()):
+        token = stem(word)[:TOKEN_MAX_LENGTH]
+        if len(token) > 1 and token not in STOP_STEMS:
+            tokens.add(token)
+    return tokens
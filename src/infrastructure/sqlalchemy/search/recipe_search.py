@@ -0,0 +1,218 @@
+import re
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import NamedTuple
+
+from sqlalchemy import Connection, Float, Integer, Subquery, text
+from sqlalchemy.orm import Session
+
+from application.exceptions import RepositoryError
+from infrastructure.sqlalchemy.search.russian_stemmer import stem
+
+
+WORD = re.compile(r"\w+")
+
+
+def search_terms(text: str) -> list[str]:
+    return [stem(word) for word in WORD.findall(text.lower())]
+
+
+class SearchDocument(NamedTuple):
+    recipe_id: int
+    title: str
+    body: str
+
+
+class RecipeSearchIndex(ABC):
+    """
+    Full-text index over recipe titles, descriptions and ingredients.
+
+    Lives in the "RecipeSearch" table, created by hand since its shape
+    depends on the DBMS, and is kept in sync by the recipe repository.
+    """
+
+    create_ddl: tuple[str, ...]
+    drop_ddl: tuple[str, ...]
+
+    @abstractmethod
+    def index(
+        self,
+        connection: Session | Connection,
+        recipe_id: int,
+        title: str,
+        body: str,
+    ) -> None: ...
+
+    @abstractmethod
+    def add_many(
+        self,
+        connection: Session | Connection,
+        documents: Sequence[SearchDocument],
+    ) -> None:
+        """
+        Indexes recipes that are not in the index yet, with one executemany
+        and without looking for rows to replace.
+        """
+
+    def remove(self, connection: Session | Connection, recipe_id: int) -> None:
+        self.remove_many(connection, [recipe_id])
+
+    @abstractmethod
+    def remove_many(
+        self, connection: Session | Connection, recipe_ids: Sequence[int]
+    ) -> None: ...
+
+    @abstractmethod
+    def match(self, query: str) -> Subquery | None:
+        """
+        (recipe_id, relevance) of the matching recipes, higher relevance
+        first; None if the query has no words to search for.
+        """
+
+
+class SQLiteRecipeSearchIndex(RecipeSearchIndex):
+    # FTS5 has no Russian stemmer: documents and queries are stemmed here
+    # and the index only ever sees stems
+    create_ddl = (
+        'CREATE VIRTUAL TABLE IF NOT EXISTS "RecipeSearch" '
+        "USING fts5(title, body)",
+    )
+    drop_ddl = ('DROP TABLE IF EXISTS "RecipeSearch"',)
+
+    def index(
+        self,
+        connection: Session | Connection,
+        recipe_id: int,
+        title: str,
+        body: str,
+    ) -> None:
+        self.remove(connection, recipe_id)
+        self.add_many(connection, [SearchDocument(recipe_id, title, body)])
+
+    def add_many(
+        self,
+        connection: Session | Connection,
+        documents: Sequence[SearchDocument],
+    ) -> None:
+        connection.execute(
+            text(
+                'INSERT INTO "RecipeSearch" (rowid, title, body) '
+                "VALUES (:recipe_id, :title, :body)"
+            ),
+            [
+                {
+                    "recipe_id": document.recipe_id,
+                    "title": " ".join(search_terms(document.title)),
+                    "body": " ".join(search_terms(document.body)),
+                }
+                for document in documents
+            ],
+        )
+
+    def remove_many(
+        self, connection: Session | Connection, recipe_ids: Sequence[int]
+    ) -> None:
+        connection.execute(
+            text('DELETE FROM "RecipeSearch" WHERE rowid = :recipe_id'),
+            [{"recipe_id": recipe_id} for recipe_id in recipe_ids],
+        )
+
+    def match(self, query: str) -> Subquery | None:
+        terms = search_terms(query)
+        if not terms:
+            return None
+        # Every term must occur; quoting keeps FTS5 syntax out of the input.
+        # bm25() is lower for better matches and weighs titles 4 times more
+        return (
+            text(
+                'SELECT rowid AS recipe_id, -bm25("RecipeSearch", 4.0, 1.0) '
+                'AS relevance FROM "RecipeSearch" '
+                'WHERE "RecipeSearch" MATCH :query'
+            )
+            .bindparams(query=" ".join(f'"{term}"' for term in terms))
+            .columns(recipe_id=Integer, relevance=Float)
+            .subquery("search")
+        )
+
+
+class PostgresRecipeSearchIndex(RecipeSearchIndex):
+    create_ddl = (
+        'CREATE TABLE IF NOT EXISTS "RecipeSearch" ('
+        'recipe_id INTEGER PRIMARY KEY REFERENCES "Recipes" (id) '
+        "ON DELETE CASCADE, "
+        "document TSVECTOR NOT NULL)",
+        'CREATE INDEX IF NOT EXISTS "ix_RecipeSearch_document" '
+        'ON "RecipeSearch" USING GIN (document)',
+    )
+    drop_ddl = ('DROP TABLE IF EXISTS "RecipeSearch"',)
+
+    def index(
+        self,
+        connection: Session | Connection,
+        recipe_id: int,
+        title: str,
+        body: str,
+    ) -> None:
+        connection.execute(
+            text(
+                'INSERT INTO "RecipeSearch" (recipe_id, document) VALUES '
+                "(:recipe_id, "
+                "setweight(to_tsvector('russian', :title), 'A') || "
+                "setweight(to_tsvector('russian', :body), 'B')) "
+                "ON CONFLICT (recipe_id) "
+                "DO UPDATE SET document = EXCLUDED.document"
+            ),
+            {"recipe_id": recipe_id, "title": title, "body": body},
+        )
+
+    def add_many(
+        self,
+        connection: Session | Connection,
+        documents: Sequence[SearchDocument],
+    ) -> None:
+        connection.execute(
+            text(
+                'INSERT INTO "RecipeSearch" (recipe_id, document) VALUES '
+                "(:recipe_id, "
+                "setweight(to_tsvector('russian', :title), 'A') || "
+                "setweight(to_tsvector('russian', :body), 'B'))"
+            ),
+            [document._asdict() for document in documents],
+        )
+
+    def remove_many(
+        self, connection: Session | Connection, recipe_ids: Sequence[int]
+    ) -> None:
+        connection.execute(
+            text('DELETE FROM "RecipeSearch" WHERE recipe_id = :recipe_id'),
+            [{"recipe_id": recipe_id} for recipe_id in recipe_ids],
+        )
+
+    def match(self, query: str) -> Subquery | None:
+        if not WORD.search(query):
+            return None
+        return (
+            text(
+                "SELECT recipe_id, ts_rank(document, query) AS relevance "
+                "FROM \"RecipeSearch\", plainto_tsquery('russian', :query) "
+                "AS query WHERE document @@ query"
+            )
+            .bindparams(query=query)
+            .columns(recipe_id=Integer, relevance=Float)
+            .subquery("search")
+        )
+
+
+SEARCH_INDEXES: dict[str, RecipeSearchIndex] = {
+    "sqlite": SQLiteRecipeSearchIndex(),
+    "postgresql": PostgresRecipeSearchIndex(),
+}
+
+
+def recipe_search_index(dialect_name: str) -> RecipeSearchIndex:
+    try:
+        return SEARCH_INDEXES[dialect_name]
+    except KeyError:
+        raise RepositoryError(
+            f"Full-text search is not supported on {dialect_name}"
+        ) from None
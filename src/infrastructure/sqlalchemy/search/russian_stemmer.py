@@ -0,0 +1,129 @@
+# ruff: noqa: RUF001, RUF003 -- Cyrillic endings look like Latin letters
+"""
+Snowball stemmer for Russian, used where the database has none (SQLite FTS5).
+
+Follows https://snowballstem.org/algorithms/russian/stemmer.html; words in
+other alphabets pass through unchanged.
+"""
+
+VOWELS = frozenset("аеиоуыэюя")
+
+# Endings of the "group 1" kind only count after "а" or "я"
+PERFECTIVE_GERUND_AFTER_A = ("вшись", "вши", "в")
+PERFECTIVE_GERUND = ("ившись", "ывшись", "ивши", "ывши", "ив", "ыв")
+ADJECTIVE = (
+    "ими", "ыми", "его", "ого", "ему", "ому",
+    "ее", "ие", "ые", "ое", "ей", "ий", "ый", "ой", "ем", "им", "ым", "ом",
+    "их", "ых", "ую", "юю", "ая", "яя", "ою", "ею",
+)  # fmt: skip
+PARTICIPLE_AFTER_A = ("ем", "нн", "вш", "ющ", "щ")
+PARTICIPLE = ("ивш", "ывш", "ующ")
+REFLEXIVE = ("ся", "сь")
+VERB_AFTER_A = (
+    "ла", "на", "ете", "йте", "ли", "й", "л", "ем", "н", "ло", "но", "ет",
+    "ют", "ны", "ть", "ешь", "нно",
+)  # fmt: skip
+VERB = (
+    "ила", "ыла", "ена", "ейте", "уйте", "ите", "или", "ыли", "ей", "уй",
+    "ил", "ыл", "им", "ым", "ен", "ило", "ыло", "ено", "ят", "ует", "уют",
+    "ит", "ыт", "ены", "ить", "ыть", "ишь", "ую", "ю",
+)  # fmt: skip
+NOUN = (
+    "иями", "ями", "ами", "ией", "иям", "ием", "иях",
+    "ев", "ов", "ие", "ье", "еи", "ии", "ей", "ой", "ий", "ям", "ем", "ам",
+    "ом", "ах", "ях", "ию", "ью", "ия", "ья",
+    "а", "е", "и", "й", "о", "у", "ы", "ь", "ю", "я",
+)  # fmt: skip
+SUPERLATIVE = ("ейше", "ейш")
+DERIVATIONAL = ("ость", "ост")
+
+
+def stem(word: str) -> str:
+    word = word.lower().replace("ё", "е")
+    rv, r2 = _regions(word)
+    if rv is None:
+        return word
+
+    # Every step works inside RV only; the prefix before it is kept as is
+    prefix, rest = word[:rv], word[rv:]
+    rest = _step_1(rest)
+    if rest.endswith("и"):
+        rest = rest[:-1]
+    rest = _remove_derivational(rest, r2 - rv)
+    rest = _tidy_up(rest)
+    return prefix + rest
+
+
+def _regions(word: str) -> tuple[int | None, int]:
+    rv = next(
+        (i + 1 for i, letter in enumerate(word) if letter in VOWELS), None
+    )
+    r1 = _region_after(word, 0)
+    return rv, _region_after(word, r1)
+
+
+def _region_after(word: str, start: int) -> int:
+    # Just past the first non-vowel that follows a vowel
+    for i in range(max(start, 1), len(word)):
+        if word[i] not in VOWELS and word[i - 1] in VOWELS:
+            return i + 1
+    return len(word)
+
+
+def _longest_ending(
+    word: str, after_a: tuple[str, ...], plain: tuple[str, ...]
+) -> str | None:
+    # The longest ending wins, an "after а/я" one fails if not preceded so
+    candidates = [e for e in (*after_a, *plain) if word.endswith(e)]
+    if not candidates:
+        return None
+    ending = max(candidates, key=len)
+    if ending in after_a and ending not in plain:
+        preceding = word[: -len(ending)]
+        if not preceding.endswith(("а", "я")):
+            return None
+    return ending
+
+
+def _remove(word: str, ending: str | None) -> str:
+    return word[: -len(ending)] if ending else word
+
+
+def _step_1(word: str) -> str:
+    gerund = _longest_ending(
+        word, PERFECTIVE_GERUND_AFTER_A, PERFECTIVE_GERUND
+    )
+    if gerund:
+        return _remove(word, gerund)
+
+    word = _remove(word, _longest_ending(word, (), REFLEXIVE))
+
+    adjective = _longest_ending(word, (), ADJECTIVE)
+    if adjective:
+        word = _remove(word, adjective)
+        participle = _longest_ending(word, PARTICIPLE_AFTER_A, PARTICIPLE)
+        return _remove(word, participle)
+
+    verb = _longest_ending(word, VERB_AFTER_A, VERB)
+    if verb:
+        return _remove(word, verb)
+
+    return _remove(word, _longest_ending(word, (), NOUN))
+
+
+def _remove_derivational(word: str, r2: int) -> str:
+    ending = _longest_ending(word, (), DERIVATIONAL)
+    if ending and len(word) - len(ending) >= r2:
+        return _remove(word, ending)
+    return word
+
+
+def _tidy_up(word: str) -> str:
+    superlative = _longest_ending(word, (), SUPERLATIVE)
+    if superlative:
+        word = _remove(word, superlative)
+    if word.endswith("нн"):
+        return word[:-1]
+    if not superlative and word.endswith("ь"):
+        return word[:-1]
+    return word
@@ -1,5 +1,6 @@
 import re
-from collections.abc import Generator
+import sqlite3
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Self
@@ -10,12 +11,24 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 
 from application.exceptions import (
+    AlreadyReviewedError,
     ApplicationError,
     DuplicateEntryError,
     IntegrityError,
     RepositoryError,
 )
 from application.transactions.transaction_manager import ITransactionManager
+from infrastructure.sqlalchemy.models.base import Base
+from infrastructure.sqlalchemy.models.review import UQ_REVIEWS_USER_RECIPE
+
+
+# Unique indexes that use cases rely on instead of checking first: their
+# violation is an expected outcome with its own error
+UNIQUE_VIOLATIONS: dict[str, Callable[..., ApplicationError]] = {
+    UQ_REVIEWS_USER_RECIPE: AlreadyReviewedError,
+}
+
+SQLITE_UNIQUE_PREFIX = "UNIQUE constraint failed: "
 
 
 class SQLAlchemyTransactionManager(ITransactionManager):
@@ -48,10 +61,35 @@ class SQLAlchemyTransactionManager(ITransactionManager):
             return match.group(1), match.group(2)
         return "unknown_field", "unknown_value"
 
+    def _violated_unique_index(self, error: BaseException) -> str | None:
+        if isinstance(error, psycopg2.errors.UniqueViolation):
+            return error.diag.constraint_name
+        message = str(error)
+        if not isinstance(
+            error, sqlite3.IntegrityError
+        ) or not message.startswith(SQLITE_UNIQUE_PREFIX):
+            return None
+
+        # SQLite names the columns, not the index: "T.a, T.b"
+        qualified = message.removeprefix(SQLITE_UNIQUE_PREFIX).split(", ")
+        table = Base.metadata.tables.get(qualified[0].split(".")[0])
+        columns = [column.split(".")[-1] for column in qualified]
+        for index in table.indexes if table is not None else ():
+            if index.unique and [c.name for c in index.columns] == columns:
+                return index.name
+        return None
+
     def _handle_exception(self, exception: BaseException):
         if isinstance(exception, ApplicationError):
             raise exception
 
+        if isinstance(exception, sqlalchemy.exc.IntegrityError):
+            index = self._violated_unique_index(exception.orig)
+            if index in UNIQUE_VIOLATIONS:
+                # Raised without the chain, whose text would end up in the
+                # message shown to the user; it stays reachable as cause
+                raise UNIQUE_VIOLATIONS[index](cause=exception) from None
+
         if isinstance(exception, sqlalchemy.exc.DatabaseError):
             if isinstance(exception.orig, psycopg2.errors.UniqueViolation):
                 field, value = self._extract_duplicate_info(exception.orig)
@@ -109,13 +147,36 @@ class SQLAlchemyTransactionManager(ITransactionManager):
             self._handle_exception(exc)  # raises
             raise
 
-    def _finalize_transaction(self, has_error: bool):
+    @contextmanager
+    def read_only(self) -> Generator[Self, None, None]:
+        """
+        Транзакция только для чтения: всегда откатывается;
+        в PostgreSQL выполняется как READ ONLY.
+        Внутри уже открытой транзакции использует её.
+        """
+        if self._get_session():
+            yield self
+            return
+
+        session = self._create_session()
+        self._set_session(session)
+
+        try:
+            session.connection(execution_options={"postgresql_readonly": True})
+            yield self
+            self._finalize_transaction(has_error=False, read_only=True)
+        except Exception as exc:
+            self._finalize_transaction(has_error=True)
+            self._handle_exception(exc)  # raises
+            raise
+
+    def _finalize_transaction(self, has_error: bool, read_only: bool = False):
         session = self._get_session()
         if not session:
             return
 
         try:
-            if has_error:
+            if has_error or read_only:
                 self.rollback()
             else:
                 self.commit()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import replace
 
 from application.dtos.recipe.recipe_dto import FullRecipeDTO, RecipeDTO
@@ -9,10 +10,19 @@ class IMarkdownRenderer(ABC):
     @abstractmethod
     def render(self, text: str) -> str: ...
 
+    def render_many(self, texts: Sequence[str]) -> list[str]:
+        return [self.render(text) for text in texts]
+
     def render_recipe(self, recipe: RecipeDTO) -> RecipeDTO:
-        description = self.render(recipe.description)
-        ingredients = self.render(recipe.ingredients)
-        steps = self.render(recipe.steps)
+        # HTML stored at write time is used as is, only rows that predate
+        # it are rendered here
+        description = self._stored_or_render(
+            recipe.description_html, recipe.description
+        )
+        ingredients = self._stored_or_render(
+            recipe.ingredients_html, recipe.ingredients
+        )
+        steps = self._stored_or_render(recipe.steps_html, recipe.steps)
         return replace(
             recipe,
             description=description,
@@ -21,7 +31,7 @@ class IMarkdownRenderer(ABC):
         )
 
     def render_review(self, review: ReviewDTO) -> ReviewDTO:
-        text = self.render(review.text)
+        text = self._stored_or_render(review.text_html, review.text)
         return replace(review, text=text)
 
     def render_authored_review(
@@ -30,7 +40,34 @@ class IMarkdownRenderer(ABC):
         review = self.render_review(authored_review.review)
         return replace(authored_review, review=review)
 
+    def render_authored_reviews(
+        self, authored_reviews: Sequence[AuthoredReviewDTO]
+    ) -> list[AuthoredReviewDTO]:
+        # Texts without stored HTML are rendered as one batch, so that an
+        # implementation can spread a long list over several processes
+        pending = [
+            authored.review.text
+            for authored in authored_reviews
+            if authored.review.text_html is None
+        ]
+        rendered = iter(self.render_many(pending))
+        return [
+            replace(
+                authored,
+                review=replace(
+                    authored.review,
+                    text=authored.review.text_html
+                    if authored.review.text_html is not None
+                    else next(rendered),
+                ),
+            )
+            for authored in authored_reviews
+        ]
+
     def render_full_recipe(self, full_recipe: FullRecipeDTO) -> FullRecipeDTO:
         recipe = self.render_recipe(full_recipe.recipe)
-        reviews = [self.render_authored_review(i) for i in full_recipe.reviews]
+        reviews = self.render_authored_reviews(full_recipe.reviews)
         return replace(full_recipe, recipe=recipe, reviews=reviews)
+
+    def _stored_or_render(self, html: str | None, text: str) -> str:
+        return html if html is not None else self.render(text)
@@ -0,0 +1,94 @@
+from collections.abc import Callable, Mapping, Sequence
+from operator import attrgetter
+from typing import Any
+
+from application.dtos.image.image_dto import ImageDTO
+from application.dtos.review.review_dto import (
+    AuthoredReviewDTO,
+    RatingHistogramDTO,
+)
+from application.dtos.user.user_dto import UserDTO
+
+
+# Every field of a resource is computed on its own, only when requested:
+# a client asking for titles never pays for serializing the reviews
+FieldTable = Mapping[str, Callable[[Any], Any]]
+
+
+def _image(image: ImageDTO) -> dict[str, Any]:
+    return {"filename": image.filename, "mime_type": image.mime_type}
+
+
+def _images(images: list[ImageDTO]) -> list[dict[str, Any]]:
+    return [_image(image) for image in images]
+
+
+def _user(user: UserDTO) -> dict[str, Any]:
+    return {"id": user.id, "username": user.username}
+
+
+def _review(authored_review: AuthoredReviewDTO) -> dict[str, Any]:
+    review = authored_review.review
+    return {
+        "id": review.review_id,
+        "rating": review.rating,
+        "text": review.text,
+        "text_html": review.text_html,
+        "created_at": review.created_at.isoformat(),
+        "author": _user(authored_review.user),
+    }
+
+
+def _histogram(histogram: RatingHistogramDTO | None) -> list[int] | None:
+    return list(histogram.counts) if histogram else None
+
+
+RECIPE_SUMMARY_FIELDS: FieldTable = {
+    "id": attrgetter("id"),
+    "title": attrgetter("title"),
+    "preparation_time": attrgetter("preparation_time"),
+    "servings": attrgetter("servings"),
+    "average_rating": attrgetter("average_rating"),
+    "review_count": attrgetter("review_count"),
+    "author_id": attrgetter("author_id"),
+    "images": lambda r: _images(r.images),
+}
+
+FULL_RECIPE_FIELDS: FieldTable = {
+    "id": attrgetter("recipe.id"),
+    "title": attrgetter("recipe.title"),
+    "description": attrgetter("recipe.description"),
+    "description_html": attrgetter("recipe.description_html"),
+    "preparation_time": attrgetter("recipe.preparation_time"),
+    "servings": attrgetter("recipe.servings"),
+    "ingredients": attrgetter("recipe.ingredients"),
+    "ingredients_html": attrgetter("recipe.ingredients_html"),
+    "steps": attrgetter("recipe.steps"),
+    "steps_html": attrgetter("recipe.steps_html"),
+    "images": lambda r: _images(r.recipe.images),
+    "author": lambda r: _user(r.author),
+    "average_rating": attrgetter("summary.average_rating"),
+    "review_count": attrgetter("summary.review_count"),
+    "rating_histogram": lambda r: _histogram(r.rating_histogram),
+    "reviews": lambda r: [_review(review) for review in r.reviews],
+    "next_reviews_cursor": attrgetter("next_reviews_cursor"),
+}
+
+
+def parse_fields(raw: str | None, table: FieldTable) -> list[str]:
+    """
+    Parses a `fields=a,b` sparse fieldset; no fieldset means every field.
+    """
+    fields = list(
+        dict.fromkeys(f.strip() for f in (raw or "").split(",") if f.strip())
+    )
+    unknown = [field for field in fields if field not in table]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}.")
+    return fields or list(table)
+
+
+def serialize(
+    dto: Any, table: FieldTable, fields: Sequence[str]
+) -> dict[str, Any]:
+    return {field: table[field](dto) for field in fields}
@@ -0,0 +1,115 @@
+from http import HTTPStatus
+
+from flask import jsonify, request
+from flask.views import MethodView
+
+from application.commands.recipe.filter_recipes_command import (
+    FilterRecipesCommand,
+)
+from application.exceptions import NotFoundError
+from application.interfaces.usecases.recipe.get_recipe_by_id_usecase import (
+    IGetRecipeByIdUseCase,
+)
+from application.interfaces.usecases.recipe.get_recipes_by_ids_usecase import (
+    IGetRecipesByIdsUseCase,
+)
+from application.interfaces.usecases.recipe.list_recipes_usecase import (
+    IListRecipesUseCase,
+)
+from presentation.presentators.recipe_json import (
+    FULL_RECIPE_FIELDS,
+    RECIPE_SUMMARY_FIELDS,
+    parse_fields,
+    serialize,
+)
+
+
+def _error(message: str, status: HTTPStatus):
+    return jsonify({"error": message}), status
+
+
+def _parse_ids(raw: str) -> list[int]:
+    try:
+        return [int(i) for i in raw.split(",") if i.strip()]
+    except ValueError as e:
+        raise ValueError("Invalid recipe ids.") from e
+
+
+class RecipeListApiView(MethodView):
+    """
+    GET /api/recipes: a page of recipe summaries, filtered and sorted as
+    on the index page, or the recipes of `ids=1,2,3` in that order.
+    """
+
+    def __init__(
+        self,
+        list_recipes_uc: IListRecipesUseCase,
+        get_recipes_by_ids_uc: IGetRecipesByIdsUseCase,
+    ):
+        self.list_recipes_uc = list_recipes_uc
+        self.get_recipes_by_ids_uc = get_recipes_by_ids_uc
+
+    def get(self):
+        try:
+            fields = parse_fields(
+                request.args.get("fields"), RECIPE_SUMMARY_FIELDS
+            )
+            ids = request.args.get("ids")
+            if ids is not None:
+                recipes = self.get_recipes_by_ids_uc.execute(_parse_ids(ids))
+                return jsonify(
+                    {
+                        "recipes": [
+                            serialize(r, RECIPE_SUMMARY_FIELDS, fields)
+                            for r in recipes
+                        ]
+                    }
+                )
+            recipe_page = self.list_recipes_uc.execute(
+                page=request.args.get("page", 1, type=int),
+                per_page=request.args.get("per_page", 10, type=int),
+                after=request.args.get("after"),
+                before=request.args.get("before"),
+                filters=FilterRecipesCommand(
+                    sort=request.args.get("sort", "newest"),
+                    max_preparation_time=request.args.get(
+                        "max_time", type=int
+                    ),
+                    servings=request.args.get("servings", type=int),
+                ),
+            )
+        except ValueError as e:
+            return _error(str(e), HTTPStatus.BAD_REQUEST)
+        return jsonify(
+            {
+                "recipes": [
+                    serialize(r, RECIPE_SUMMARY_FIELDS, fields)
+                    for r in recipe_page.recipes
+                ],
+                "total_count": recipe_page.total_count,
+                "next_cursor": recipe_page.next_cursor,
+                "previous_cursor": recipe_page.previous_cursor,
+            }
+        )
+
+
+class RecipeApiView(MethodView):
+    """
+    GET /api/recipes/<id>: a recipe with its author, rating and newest
+    reviews.
+    """
+
+    def __init__(self, get_recipe_uc: IGetRecipeByIdUseCase):
+        self.get_recipe_uc = get_recipe_uc
+
+    def get(self, recipe_id: int):
+        try:
+            fields = parse_fields(
+                request.args.get("fields"), FULL_RECIPE_FIELDS
+            )
+            recipe = self.get_recipe_uc.execute(recipe_id)
+        except NotFoundError:
+            return _error("Recipe not found.", HTTPStatus.NOT_FOUND)
+        except ValueError as e:
+            return _error(str(e), HTTPStatus.BAD_REQUEST)
+        return jsonify(serialize(recipe, FULL_RECIPE_FIELDS, fields))
@@ -1,9 +1,18 @@
-from flask import render_template, request
+from flask import flash, redirect, render_template, request, url_for
 from flask.views import MethodView
 
+from application.commands.recipe.filter_recipes_command import (
+    FilterRecipesCommand,
+)
+from application.interfaces.usecases.recipe.find_recipes_by_ingredients_usecase import (
+    IFindRecipesByIngredientsUseCase,
+)
 from application.interfaces.usecases.recipe.list_recipes_usecase import (
     IListRecipesUseCase,
 )
+from application.interfaces.usecases.recipe.search_recipes_usecase import (
+    ISearchRecipesUseCase,
+)
 
 
 class IndexView(MethodView):
@@ -11,6 +20,84 @@ class IndexView(MethodView):
         self.list_recipes_uc = list_recipes_uc
 
     def get(self):
-        page = int(request.args.get("page", 1))
-        recipes = self.list_recipes_uc.execute(page=page, per_page=10)
-        return render_template("index.html", recipes=recipes, page=page)
+        page = request.args.get("page", 1, type=int)
+        filters = FilterRecipesCommand(
+            sort=request.args.get("sort", "newest"),
+            max_preparation_time=request.args.get("max_time", type=int),
+            servings=request.args.get("servings", type=int),
+        )
+        try:
+            recipe_page = self.list_recipes_uc.execute(
+                page=page,
+                per_page=10,
+                after=request.args.get("after"),
+                before=request.args.get("before"),
+                filters=filters,
+            )
+        except ValueError as e:
+            flash(str(e), "error")
+            return redirect(url_for("main.index"))
+        # Carried over by the pagination links
+        filter_args = {
+            "sort": filters.sort if filters.sort != "newest" else None,
+            "max_time": filters.max_preparation_time,
+            "servings": filters.servings,
+        }
+        return render_template(
+            "index.html",
+            recipes=recipe_page.recipes,
+            page=page,
+            recipe_page=recipe_page,
+            filters=filters,
+            filter_args={k: v for k, v in filter_args.items() if v},
+        )
+
+
+class SearchView(MethodView):
+    def __init__(self, search_recipes_uc: ISearchRecipesUseCase):
+        self.search_recipes_uc = search_recipes_uc
+
+    def get(self):
+        query = request.args.get("q", "")
+        if not query.strip():
+            return render_template("search.html", query="", search_page=None)
+        try:
+            search_page = self.search_recipes_uc.execute(
+                query=query,
+                page=request.args.get("page", 1, type=int),
+                per_page=10,
+            )
+        except ValueError as e:
+            flash(str(e), "error")
+            return redirect(url_for("main.search"))
+        return render_template(
+            "search.html", query=search_page.query, search_page=search_page
+        )
+
+
+class IngredientSearchView(MethodView):
+    def __init__(
+        self, find_by_ingredients_uc: IFindRecipesByIngredientsUseCase
+    ):
+        self.find_by_ingredients_uc = find_by_ingredients_uc
+
+    def get(self):
+        ingredients = request.args.get("ingredients", "")
+        if not ingredients.strip(" ,"):
+            return render_template(
+                "by_ingredients.html", ingredients="", search_page=None
+            )
+        try:
+            search_page = self.find_by_ingredients_uc.execute(
+                ingredients=ingredients.split(","),
+                page=request.args.get("page", 1, type=int),
+                per_page=10,
+            )
+        except ValueError as e:
+            flash(str(e), "error")
+            return redirect(url_for("main.by_ingredients"))
+        return render_template(
+            "by_ingredients.html",
+            ingredients=", ".join(search_page.ingredients),
+            search_page=search_page,
+        )
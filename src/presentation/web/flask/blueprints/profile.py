@@ -0,0 +1,55 @@
+from typing import ClassVar
+
+from flask import flash, redirect, render_template, request, url_for
+from flask.views import MethodView
+from flask_login import login_required  # type: ignore
+
+from application.interfaces.usecases.recipe.list_user_recipes_usecase import (
+    IListUserRecipesUseCase,
+)
+from application.interfaces.usecases.review.list_user_reviews_usecase import (
+    IListUserReviewsUseCase,
+)
+from presentation.web.flask.utils import get_current_user
+
+
+class UserRecipesView(MethodView):
+    """
+    The recipes of the signed in user, newest first.
+    """
+
+    decorators: ClassVar = [login_required]  # type: ignore
+
+    def __init__(self, list_user_recipes_uc: IListUserRecipesUseCase):
+        self.list_user_recipes_uc = list_user_recipes_uc
+
+    def get(self):
+        try:
+            recipe_page = self.list_user_recipes_uc.execute(
+                get_current_user().user_id, after=request.args.get("after")
+            )
+        except ValueError as e:
+            flash(str(e), "error")
+            return redirect(url_for("profile.recipes"))
+        return render_template("user_recipes.html", recipe_page=recipe_page)
+
+
+class UserReviewsView(MethodView):
+    """
+    The reviews of the signed in user, newest first.
+    """
+
+    decorators: ClassVar = [login_required]  # type: ignore
+
+    def __init__(self, list_user_reviews_uc: IListUserReviewsUseCase):
+        self.list_user_reviews_uc = list_user_reviews_uc
+
+    def get(self):
+        try:
+            review_page = self.list_user_reviews_uc.execute(
+                get_current_user().user_id, after=request.args.get("after")
+            )
+        except ValueError as e:
+            flash(str(e), "error")
+            return redirect(url_for("profile.reviews"))
+        return render_template("user_reviews.html", review_page=review_page)
@@ -2,6 +2,7 @@ from io import BytesIO
 from typing import ClassVar
 
 from flask import (
+    abort,
     flash,
     redirect,
     render_template,
@@ -21,6 +22,9 @@ from application.commands.recipe.upload_image_command import UploadImageCommand
 from application.commands.review.create_review_command import (
     CreateReviewCommand,
 )
+from application.commands.review.update_review_command import (
+    UpdateReviewCommand,
+)
 from application.exceptions import NotFoundError
 from application.interfaces.usecases.recipe.create_recipe_usecase import (
     ICreateRecipeUseCase,
@@ -37,6 +41,18 @@ from application.interfaces.usecases.recipe.update_recipe_usecase import (
 from application.interfaces.usecases.review.create_review_usecase import (
     ICreateReviewUseCase,
 )
+from application.interfaces.usecases.review.delete_review_usecase import (
+    IDeleteReviewUseCase,
+)
+from application.interfaces.usecases.review.get_review_by_id_usecase import (
+    IGetReviewByIdUseCase,
+)
+from application.interfaces.usecases.review.list_reviews_usecase import (
+    IListReviewsUseCase,
+)
+from application.interfaces.usecases.review.update_review_usecase import (
+    IUpdateReviewUseCase,
+)
 from domain.constants import ALLOWED_TYPES
 from domain.entities.user.role import RoleEnum
 from presentation.presentators.markdown_renderer import IMarkdownRenderer
@@ -60,8 +76,10 @@ class RecipeView(MethodView):
         self.markdown_renderer = markdown_renderer
 
     def get(self, recipe_id: int):
+        user = get_current_user()
+        viewer_id = user.user_id if user.is_authenticated else None
         try:
-            recipe_dto = self.get_recipe_uc.execute(recipe_id)
+            recipe_dto = self.get_recipe_uc.execute(recipe_id, viewer_id)
             recipe_dto = self.markdown_renderer.render_full_recipe(recipe_dto)
             return render_template(
                 "recipe_view.html",
@@ -76,6 +94,36 @@ class RecipeView(MethodView):
         return redirect(url_for("main.index"))
 
 
+class ReviewListView(MethodView):
+    """
+    The "load more" fragment: the next page of a recipe's reviews.
+    """
+
+    def __init__(
+        self,
+        list_reviews_uc: IListReviewsUseCase,
+        markdown_renderer: IMarkdownRenderer,
+    ):
+        self.list_reviews_uc = list_reviews_uc
+        self.markdown_renderer = markdown_renderer
+
+    def get(self, recipe_id: int):
+        try:
+            review_page = self.list_reviews_uc.execute(
+                recipe_id, after=request.args.get("after")
+            )
+        except ValueError:
+            abort(400)
+        return render_template(
+            "review_list.html",
+            recipe_id=recipe_id,
+            reviews=self.markdown_renderer.render_authored_reviews(
+                review_page.reviews
+            ),
+            next_cursor=review_page.next_cursor,
+        )
+
+
 class RecipeAddView(MethodView):
     decorators: ClassVar = [login_required]  # type: ignore
 
@@ -212,3 +260,71 @@ class ReviewCreateView(MethodView):
             except Exception as e:
                 flash(str(e), "error")
         return redirect(url_for("recipes.recipe_view", recipe_id=recipe_id))
+
+
+class ReviewEditView(MethodView):
+    decorators: ClassVar = [login_required]  # type: ignore
+
+    def __init__(
+        self,
+        update_review_uc: IUpdateReviewUseCase,
+        get_review_uc: IGetReviewByIdUseCase,
+    ):
+        self.update_review_uc = update_review_uc
+        self.get_review_uc = get_review_uc
+
+    def get(self, recipe_id: int, review_id: int):
+        try:
+            review_dto = self.get_review_uc.execute(review_id)
+        except NotFoundError:
+            flash("Review not found.", "error")
+            return redirect(
+                url_for("recipes.recipe_view", recipe_id=recipe_id)
+            )
+
+        if (
+            get_current_user().role.name != RoleEnum.ADMIN.value.name
+            and review_dto.user_id != get_current_user().user_id
+        ):
+            flash("No permission.", "error")
+            return redirect(
+                url_for("recipes.recipe_view", recipe_id=recipe_id)
+            )
+
+        return render_template(
+            "review_form.html", form=ReviewForm(obj=review_dto)
+        )
+
+    def post(self, recipe_id: int, review_id: int):
+        form = ReviewForm()
+        if form.validate_on_submit():  # type: ignore
+            try:
+                command = UpdateReviewCommand(
+                    review_id=review_id,
+                    rating=int(form.rating.data),
+                    text=form.text.data,  # type: ignore
+                )
+                self.update_review_uc.execute(command, get_current_user())
+                flash("Review updated.", "success")
+                return redirect(
+                    url_for("recipes.recipe_view", recipe_id=recipe_id)
+                )
+            except Exception as e:
+                flash(str(e), "error")
+
+        return render_template("review_form.html", form=form)
+
+
+class ReviewDeleteView(MethodView):
+    decorators: ClassVar = [login_required]  # type: ignore
+
+    def __init__(self, delete_review_uc: IDeleteReviewUseCase):
+        self.delete_review_uc = delete_review_uc
+
+    def post(self, recipe_id: int, review_id: int):
+        try:
+            self.delete_review_uc.execute(review_id, get_current_user())
+            flash("Review deleted.", "success")
+        except Exception as e:
+            flash(str(e), "error")
+        return redirect(url_for("recipes.recipe_view", recipe_id=recipe_id))
@@ -0,0 +1,71 @@
+import functools
+import hashlib
+from collections.abc import Callable
+from http import HTTPStatus
+from typing import Any
+
+from flask import Response, make_response, request, session
+from flask.typing import RouteCallable
+from flask_login import current_user  # type: ignore
+
+from application.dtos.recipe.recipe_dto import ContentVersionDTO
+from application.exceptions import NotFoundError
+
+
+def conditional_page(
+    version: Callable[..., ContentVersionDTO],
+) -> Callable[[RouteCallable], RouteCallable]:
+    """
+    Answers GET requests of anonymous users with 304 Not Modified when
+    their If-None-Match / If-Modified-Since still match the page. `version`
+    receives the view arguments and reads what the page shows; it runs
+    before the view, so a 304 renders no template and no markdown.
+    """
+
+    def decorator(view: RouteCallable) -> RouteCallable:
+        @functools.wraps(view)
+        def wrapper(**kwargs: Any) -> Response:
+            # The pages of signed in users carry their name and a CSRF
+            # token that expires, and flash messages are shown only once
+            if (
+                request.method != "GET"
+                or current_user.is_authenticated
+                or "_flashes" in session
+            ):
+                return make_response(view(**kwargs))
+            try:
+                current = version(**kwargs)
+            except NotFoundError:
+                return make_response(view(**kwargs))
+
+            validators = _with_validators(Response(), current)
+            validators.make_conditional(request)
+            if validators.status_code == HTTPStatus.NOT_MODIFIED:
+                return validators
+
+            response = make_response(view(**kwargs))
+            if response.status_code == HTTPStatus.OK:
+                _with_validators(response, current)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _with_validators(
+    response: Response, version: ContentVersionDTO
+) -> Response:
+    # The ETag covers the row count as well, so it notices deletions. It is
+    # weak: it vouches for the content, not for the bytes of the HTML
+    # around it
+    payload = f"{version.last_modified}|{version.row_count}"
+    response.set_etag(
+        hashlib.sha256(payload.encode()).hexdigest()[:32], weak=True
+    )
+    # If-Modified-Since alone is answered from the date: a version whose
+    # deletions leave the date would keep deleted rows on clients and CDNs
+    if version.last_modified and version.dates_deletions:
+        response.last_modified = version.last_modified
+    response.vary.add("Cookie")
+    return response
@@ -8,6 +8,9 @@ from flask_login import (  # type: ignore
 )
 
 from application.dtos.user.user_descriptor import UserDescriptor
+from application.interfaces.services.user_descriptor_cache import (
+    IUserDescriptorCache,
+)
 from domain.repositories.user_repository import IUserRepository
 
 
@@ -23,9 +26,11 @@ class FlaskLoginManager(LoginManager):
     def __init__(
         self,
         user_repo: IUserRepository,
+        descriptor_cache: IUserDescriptorCache,
     ):
         super().__init__()  # type: ignore
         self.user_repo = user_repo
+        self.descriptor_cache = descriptor_cache
         self.set_user_loader(self.load_user)
 
     def configure(self, app: Flask, add_context_processor: bool = True):
@@ -46,9 +51,18 @@ class FlaskLoginManager(LoginManager):
         self.login_message_category = category
 
     def load_user(self, user_id: str) -> FlaskUserDescriptor | None:
+        # Runs on every request of a signed in user; the descriptor is
+        # cached so that identifying the user costs no query
         try:
+            cached = self.descriptor_cache.get(int(user_id))
+            if isinstance(cached, FlaskUserDescriptor):
+                return cached
             user = self.user_repo.get_by_id(int(user_id))
-            return FlaskUserDescriptor(int(user_id), user.username, user.role)
+            descriptor = FlaskUserDescriptor(
+                int(user_id), user.username, user.role
+            )
+            self.descriptor_cache.set(descriptor)
+            return descriptor
         except Exception:
             # Защита от падения при некорректном user_id и др. ошибках
             session.clear()
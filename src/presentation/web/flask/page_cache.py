@@ -0,0 +1,67 @@
+import functools
+from collections.abc import Callable, Iterable
+from http import HTTPStatus
+from typing import Any
+
+from flask import Response, make_response, request, session
+from flask.typing import RouteCallable
+from flask_login import current_user  # type: ignore
+
+from application.interfaces.services.page_cache import CachedPage, IPageCache
+
+
+CACHE_HEADER = "X-Cache"
+
+
+def cache_anonymous_page(
+    cache: IPageCache, tags: Callable[..., Iterable[str]]
+) -> Callable[[RouteCallable], RouteCallable]:
+    """
+    Serves GET requests of anonymous users from the page cache, keyed by
+    the URL. `tags` receives the view arguments and names what the page
+    shows, so that use cases can invalidate it. Every response passing
+    through reports HIT, MISS or BYPASS in the X-Cache header.
+    """
+
+    def decorator(view: RouteCallable) -> RouteCallable:
+        @functools.wraps(view)
+        def wrapper(**kwargs: Any) -> Response:
+            # Pending flash messages would be rendered into the page
+            if (
+                request.method != "GET"
+                or current_user.is_authenticated
+                or "_flashes" in session
+            ):
+                response = make_response(view(**kwargs))
+                response.headers[CACHE_HEADER] = "BYPASS"
+                return response
+
+            key = request.full_path
+            page = cache.get(key)
+            if page:
+                response = Response(
+                    page.body, page.status, content_type=page.content_type
+                )
+                response.headers[CACHE_HEADER] = "HIT"
+                response.vary.add("Cookie")
+                return response
+
+            response = make_response(view(**kwargs))
+            # Pages that touched the session are specific to this visitor
+            if response.status_code == HTTPStatus.OK and not session.modified:
+                cache.set(
+                    key,
+                    CachedPage(
+                        body=response.get_data(),
+                        status=response.status_code,
+                        content_type=response.content_type,
+                    ),
+                    tags(**kwargs),
+                )
+            response.headers[CACHE_HEADER] = "MISS"
+            response.vary.add("Cookie")
+            return response
+
+        return wrapper
+
+    return decorator
@@ -9,6 +9,19 @@ function showDeleteModal(recipeTitle, url) {
   modal.show();
 }
 
+async function loadMoreReviews(event) {
+  const link = event.target.closest("[data-load-more] a");
+  if (!link) {
+    return;
+  }
+  event.preventDefault();
+  const response = await fetch(link.href);
+  if (response.ok) {
+    // The fragment ends with the button for the page after it, if any
+    link.closest("[data-load-more]").outerHTML = await response.text();
+  }
+}
+
 window.addEventListener("DOMContentLoaded", () => {
   const gallery = document.getElementById("recipe-images");
   if (gallery) {
@@ -21,4 +34,8 @@ window.addEventListener("DOMContentLoaded", () => {
       forceSync: true,
     });
   }
+  const reviewList = document.getElementById("review-list");
+  if (reviewList) {
+    reviewList.addEventListener("click", loadMoreReviews);
+  }
 });
@@ -0,0 +1,118 @@
+import argparse
+import os
+import time
+
+from infrastructure.presentation.presentators.markdown_renderer import (
+    MarkdownRenderer,
+)
+from infrastructure.presentation.presentators.process_pool_markdown_renderer import (
+    ProcessPoolMarkdownRenderer,
+)
+
+
+REVIEW_TEMPLATE = """Отличный рецепт **номер {i}**, готовили всей семьёй.
+
+* тесто получилось *мягким*
+* начинки хватило на всё
+* духовку лучше разогреть заранее
+
+Добавлю в следующий раз больше зелени и немного перца.
+"""
+
+
+def _reviews(count: int, repeat: int) -> list[str]:
+    # The index keeps texts distinct, like real reviews
+    return [REVIEW_TEMPLATE.format(i=i) * repeat for i in range(count)]
+
+
+def _best_of(runs: int, render, texts: list[str]) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        render(texts)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare serial and process pool rendering of review batches "
+            "to pick RENDER.PARALLEL_THRESHOLD."
+        )
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10, 25, 50, 100, 200, 400, 800],
+        help="numbers of reviews per batch",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="copies of the sample text in one review",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=25,
+        help="reviews sent to a worker at once",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker processes, the CPU count by default",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="runs per batch size, the fastest one is reported",
+    )
+    args = parser.parse_args()
+
+    serial = MarkdownRenderer()
+    parallel = ProcessPoolMarkdownRenderer(
+        serial,
+        threshold=1,
+        chunk_size=args.chunk_size,
+        max_workers=args.workers,
+    )
+    # Starting the workers is paid once per process, not per request
+    parallel.render_many(_reviews(args.chunk_size * 4, args.repeat))
+
+    print(
+        f"workers: {args.workers or os.cpu_count()}, "
+        f"chunk size: {args.chunk_size}"
+    )
+    print(f"{'reviews':>8} {'serial, ms':>11} {'pool, ms':>9} {'speedup':>8}")
+    crossover = None
+    try:
+        for size in sorted(args.sizes):
+            texts = _reviews(size, args.repeat)
+            serial_time = _best_of(args.runs, serial.render_many, texts)
+            pool_time = _best_of(args.runs, parallel.render_many, texts)
+            speedup = serial_time / pool_time
+            # The smallest size from which every larger one is faster too
+            if speedup <= 1:
+                crossover = None
+            elif crossover is None:
+                crossover = size
+            print(
+                f"{size:>8} {serial_time * 1000:>11.1f} "
+                f"{pool_time * 1000:>9.1f} {speedup:>7.2f}x"
+            )
+    finally:
+        parallel.shutdown()
+
+    if crossover is None:
+        print("The pool is not faster for any of the batch sizes")
+    else:
+        print(f"The pool is faster from {crossover} reviews per batch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import time
+from pathlib import Path
+
+from di.container import Container
+from infrastructure.sqlalchemy.database import Database
+from infrastructure.sqlalchemy.maintenance.recipe_import import (
+    ImportReport,
+    RecipeImporter,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Import recipes with their images and reviews from a "
+        "JSON Lines file."
+    )
+    parser.add_argument(
+        "path", type=Path, help="JSONL file, one recipe per line"
+    )
+    parser.add_argument(
+        "--images-dir",
+        type=Path,
+        default=None,
+        help="directory the image names are relative to, by default the "
+        "one of the file",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="recipes written per transaction",
+    )
+    args = parser.parse_args()
+
+    container = Container()
+    container.init_resources()
+    config = container.config()
+
+    importer = RecipeImporter(
+        container.recipe_factory(),
+        container.recipe_image_factory(),
+        container.review_factory(),
+        container.image_store(),
+        container.html_renderer(),
+        args.images_dir or args.path.parent,
+    )
+    started = time.perf_counter()
+
+    def progress(report: ImportReport) -> None:
+        elapsed = time.perf_counter() - started
+        print(
+            f"{report.records} record(s) read, {report.recipes} recipe(s) "
+            f"imported, {report.recipes / elapsed:.0f} recipe(s)/s"
+        )
+
+    database = Database(config.DB)
+    with (
+        database.get_session_factory()() as session,
+        args.path.open(encoding="utf-8") as lines,
+    ):
+        report = importer.run(session, lines, args.batch_size, progress)
+
+    elapsed = time.perf_counter() - started
+    for error in report.errors:
+        print(f"line {error.line}: {error.reason}")
+    print(
+        f"{report.recipes} recipe(s), {report.reviews} review(s) and "
+        f"{report.images} image(s) imported in {elapsed:.1f} s "
+        f"({report.recipes / elapsed:.0f} recipe(s)/s, "
+        f"{report.reviews / elapsed:.0f} review(s)/s); "
+        f"{report.rejected} record(s) rejected"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import argparse
+
+from di.container import Container
+from infrastructure.sqlalchemy.database import Database
+from infrastructure.sqlalchemy.maintenance.ingredient_index import (
+    rebuild_ingredient_index,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild the ingredient index of all recipes."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="recipes indexed per transaction",
+    )
+    args = parser.parse_args()
+
+    container = Container()
+    container.init_resources()
+    config = container.config()
+
+    database = Database(config.DB)
+    with database.get_session_factory()() as session:
+        indexed = rebuild_ingredient_index(session, args.batch_size)
+
+    print(f"{indexed} recipe(s) indexed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+
+from di.container import Container
+from infrastructure.sqlalchemy.database import Database
+from infrastructure.sqlalchemy.maintenance.markup import render_markup
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render the stored HTML of recipes and reviews again."
+    )
+    parser.add_argument(
+        "--missing-only",
+        action="store_true",
+        help="only render rows that have no HTML yet",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="rows rendered per transaction",
+    )
+    args = parser.parse_args()
+
+    container = Container()
+    container.init_resources()
+    config = container.config()
+
+    database = Database(config.DB)
+    with database.get_session_factory()() as session:
+        rendered = render_markup(
+            session,
+            container.html_renderer(),
+            args.batch_size,
+            args.missing_only,
+        )
+
+    print(
+        f"{rendered.recipes} recipe(s) and {rendered.reviews} review(s) "
+        "rendered"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+
+from di.container import Container
+from infrastructure.sqlalchemy.database import Database
+from infrastructure.sqlalchemy.maintenance.rating_counters import (
+    find_rating_drift,
+    repair_rating_drift,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Detect and repair drift in recipe rating counters."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="only report drifted recipes, do not update them",
+    )
+    args = parser.parse_args()
+
+    container = Container()
+    container.init_resources()
+    config = container.config()
+
+    database = Database(config.DB)
+    with database.get_session_factory()() as session:
+        if args.dry_run:
+            drift = find_rating_drift(session)
+        else:
+            drift = repair_rating_drift(session)
+
+    for item in drift:
+        print(
+            f"recipe {item.recipe_id}: "
+            f"sum {item.stored_rating_sum} -> {item.actual_rating_sum}, "
+            f"count {item.stored_review_count} -> {item.actual_review_count}"
+        )
+    action = "found" if args.dry_run else "repaired"
+    print(f"{len(drift)} drifted recipe(s) {action}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,9 @@
+import re
+from collections.abc import Callable
+from typing import Any, Self
+
 import pytest
+from sqlalchemy import Connection, Engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.session import Session
 
@@ -17,9 +22,82 @@ from infrastructure.sqlalchemy.repositories.review_repository import (
 from infrastructure.sqlalchemy.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
+from infrastructure.sqlalchemy.role_registry import RoleRegistry
 from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
 
 
+class StatementCounter:
+    """
+    Counts SQL statements sent to the database inside a with-block; an
+    executemany is one statement.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.statements: list[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _on_execute(self, conn: Any, cursor: Any, statement: str, *args: Any):
+        self.statements.append(statement)
+
+    def __enter__(self) -> Self:
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+
+class QueryPlanner:
+    """
+    Explains the last SQL statement a callable sends to the database.
+    """
+
+    def __init__(
+        self, engine: Engine, transaction_manager: SQLAlchemyTransactionManager
+    ):
+        self.engine = engine
+        self.transaction_manager = transaction_manager
+
+    def explain(self, query: Callable[[], Any]) -> str:
+        return self.explain_all(query)[-1]
+
+    def explain_all(self, query: Callable[[], Any]) -> list[str]:
+        """
+        Plans of every statement the callable sends, in order.
+        """
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, *args):
+            captured.append((statement, parameters))
+
+        event.listen(self.engine, "before_cursor_execute", capture)
+        try:
+            with self.transaction_manager:
+                query()
+        finally:
+            event.remove(self.engine, "before_cursor_execute", capture)
+        with self.engine.connect() as connection:
+            return [
+                self._plan(connection, statement, parameters)
+                for statement, parameters in captured
+            ]
+
+    def _plan(
+        self, connection: Connection, statement: str, parameters: Any
+    ) -> str:
+        # Values are inlined, as a planner with statistics would weigh them:
+        # behind "?" SQLite never favours the filters over the sort index
+        values = iter(parameters)
+        statement = re.sub(r"\?", lambda _: repr(next(values)), statement)
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}")
+        return "\n".join(row[-1] for row in rows)
+
+
 @pytest.fixture(scope="session")
 def config():
     return Config.load_from_path("config/test_config.yaml")
@@ -40,6 +118,18 @@ def init(database: Database):
     database.drop_database(Base.metadata)
 
 
+@pytest.fixture
+def statement_counter(database: Database) -> StatementCounter:
+    return StatementCounter(database.get_engine())
+
+
+@pytest.fixture
+def query_planner(
+    database: Database, transaction_manager: SQLAlchemyTransactionManager
+) -> QueryPlanner:
+    return QueryPlanner(database.get_engine(), transaction_manager)
+
+
 @pytest.fixture(scope="session")
 def session_factory(database: Database):
     return database.get_session_factory()
@@ -47,9 +137,15 @@ def session_factory(database: Database):
 
 @pytest.fixture(scope="session")
 def transaction_manager(session_factory: sessionmaker[Session]):
-    manager = SQLAlchemyTransactionManager(session_factory)
-    CurrentTransactionManager.set(manager)
-    return manager
+    return SQLAlchemyTransactionManager(session_factory)
+
+
+@pytest.fixture(autouse=True)
+def current_transaction_manager(
+    transaction_manager: SQLAlchemyTransactionManager,
+):
+    # Flask apps built by earlier tests install managers of their own
+    CurrentTransactionManager.set(transaction_manager)
 
 
 @pytest.fixture(scope="session")
@@ -57,25 +153,39 @@ def query_executor(transaction_manager: SQLAlchemyTransactionManager):
     return QueryExecutor(transaction_manager)
 
 
+@pytest.fixture(scope="session")
+def role_registry():
+    return RoleRegistry()
+
+
 @pytest.fixture(scope="session")
 def user_repository(
     query_executor: QueryExecutor,
     transaction_manager: SQLAlchemyTransactionManager,
+    role_registry: RoleRegistry,
 ):
-    return SQLAlchemyUserRepository(query_executor, transaction_manager)
+    return SQLAlchemyUserRepository(
+        query_executor, transaction_manager, role_registry
+    )
 
 
 @pytest.fixture(scope="session")
 def recipe_repository(
     query_executor: QueryExecutor,
     transaction_manager: SQLAlchemyTransactionManager,
+    role_registry: RoleRegistry,
 ):
-    return SQLAlchemyRecipeRepository(query_executor, transaction_manager)
+    return SQLAlchemyRecipeRepository(
+        query_executor, transaction_manager, role_registry
+    )
 
 
 @pytest.fixture(scope="session")
 def review_repository(
     query_executor: QueryExecutor,
     transaction_manager: SQLAlchemyTransactionManager,
+    role_registry: RoleRegistry,
 ):
-    return SQLAlchemyReviewRepository(query_executor, transaction_manager)
+    return SQLAlchemyReviewRepository(
+        query_executor, transaction_manager, role_registry
+    )
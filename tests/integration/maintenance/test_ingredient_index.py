@@ -0,0 +1,83 @@
+# ruff: noqa: RUF001 -- Cyrillic units look like Latin letters
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.entities.user.role import RoleEnum
+from infrastructure.sqlalchemy.maintenance.ingredient_index import (
+    rebuild_ingredient_index,
+)
+from infrastructure.sqlalchemy.models.recipe import (
+    RecipeIngredientModel,
+    RecipeModel,
+)
+from infrastructure.sqlalchemy.models.user import UserModel
+
+
+class TestIngredientIndex:
+    @pytest.fixture(autouse=True)
+    def setup(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+        with self.session_factory() as session:
+            session.add(
+                UserModel(
+                    id=1,
+                    username="user",
+                    password_hash="hash",
+                    surname="Doe",
+                    name="John",
+                    role_id=RoleEnum.USER.value.id_safe.value,
+                )
+            )
+            for recipe_id, ingredients in (
+                (1, "Мука, молоко"),
+                (2, "Яйца"),
+                (3, "200 г"),
+            ):
+                session.add(
+                    RecipeModel(
+                        id=recipe_id,
+                        title=f"Recipe {recipe_id}",
+                        description="Delicious dish",
+                        preparation_time=30,
+                        servings=4,
+                        ingredients=ingredients,
+                        steps="Mix and bake",
+                        author_id=1,
+                    )
+                )
+            # A stale token left from an earlier version of recipe 2
+            session.add(RecipeIngredientModel(token="сахар", recipe_id=2))
+            session.commit()
+
+    def _index(self) -> set[tuple[str, int]]:
+        with self.session_factory() as session:
+            rows = session.execute(
+                select(
+                    RecipeIngredientModel.token,
+                    RecipeIngredientModel.recipe_id,
+                )
+            )
+            return {(row.token, row.recipe_id) for row in rows}
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 500])
+    def test_rebuild_ingredient_index(self, batch_size: int):
+        with self.session_factory() as session:
+            indexed = rebuild_ingredient_index(session, batch_size)
+
+        assert indexed == 3  # noqa: PLR2004
+        assert self._index() == {
+            ("мук", 1),
+            ("молок", 1),
+            ("яйц", 2),
+        }
+
+    def test_rebuild_is_idempotent(self):
+        with self.session_factory() as session:
+            rebuild_ingredient_index(session)
+        first = self._index()
+
+        with self.session_factory() as session:
+            rebuild_ingredient_index(session)
+
+        assert self._index() == first
@@ -0,0 +1,111 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from domain.entities.user.role import RoleEnum
+from infrastructure.sqlalchemy.maintenance.markup import (
+    RenderedMarkup,
+    render_markup,
+)
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from infrastructure.sqlalchemy.models.review import ReviewModel
+from infrastructure.sqlalchemy.models.user import UserModel
+
+
+# Written with an older renderer, the others before HTML was stored
+OUTDATED_RECIPE_ID = 3
+
+
+class TaggingRenderer(IHtmlRenderer):
+    def render(self, text: str) -> str:
+        return f"<p>{text}</p>"
+
+
+class TestRenderMarkup:
+    @pytest.fixture(autouse=True)
+    def setup(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+        with self.session_factory() as session:
+            session.add(
+                UserModel(
+                    id=1,
+                    username="user",
+                    password_hash="hash",
+                    surname="Doe",
+                    name="John",
+                    role_id=RoleEnum.USER.value.id_safe.value,
+                )
+            )
+            for recipe_id in (1, 2, 3):
+                outdated = recipe_id == OUTDATED_RECIPE_ID
+                session.add(
+                    RecipeModel(
+                        id=recipe_id,
+                        title=f"Recipe {recipe_id}",
+                        description=f"Description {recipe_id}",
+                        preparation_time=30,
+                        servings=4,
+                        ingredients="Flour, Sugar",
+                        steps="Mix and bake",
+                        author_id=1,
+                        description_html="old" if outdated else None,
+                        ingredients_html="old" if outdated else None,
+                        steps_html="old" if outdated else None,
+                    )
+                )
+            session.flush()
+            session.add(
+                ReviewModel(
+                    id=1,
+                    recipe_id=1,
+                    user_id=1,
+                    rating=5,
+                    text="Tasty",
+                    created_at=datetime.now(),
+                )
+            )
+            session.commit()
+
+    def _descriptions(self) -> list[str | None]:
+        with self.session_factory() as session:
+            return list(
+                session.scalars(
+                    select(RecipeModel.description_html).order_by(
+                        RecipeModel.id
+                    )
+                )
+            )
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 500])
+    def test_render_markup(self, batch_size: int):
+        with self.session_factory() as session:
+            rendered = render_markup(session, TaggingRenderer(), batch_size)
+
+        assert rendered == RenderedMarkup(recipes=3, reviews=1)
+        assert self._descriptions() == [
+            "<p>Description 1</p>",
+            "<p>Description 2</p>",
+            "<p>Description 3</p>",
+        ]
+        with self.session_factory() as session:
+            recipe = session.get_one(RecipeModel, 1)
+            review = session.get_one(ReviewModel, 1)
+            assert recipe.ingredients_html == "<p>Flour, Sugar</p>"
+            assert recipe.steps_html == "<p>Mix and bake</p>"
+            assert review.text_html == "<p>Tasty</p>"
+
+    def test_render_missing_only(self):
+        with self.session_factory() as session:
+            rendered = render_markup(
+                session, TaggingRenderer(), batch_size=1, missing_only=True
+            )
+
+        assert rendered == RenderedMarkup(recipes=2, reviews=1)
+        assert self._descriptions() == [
+            "<p>Description 1</p>",
+            "<p>Description 2</p>",
+            "old",
+        ]
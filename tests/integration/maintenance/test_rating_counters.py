@@ -0,0 +1,89 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.entities.user.role import RoleEnum
+from infrastructure.sqlalchemy.maintenance.rating_counters import (
+    RatingDrift,
+    find_rating_drift,
+    repair_rating_drift,
+)
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from infrastructure.sqlalchemy.models.review import ReviewModel
+from infrastructure.sqlalchemy.models.user import UserModel
+
+
+class TestRatingCounters:
+    @pytest.fixture(autouse=True)
+    def setup(self, session_factory: sessionmaker[Session]):
+        self.session_factory = session_factory
+        with self.session_factory() as session:
+            for user_id in (1, 2):
+                session.add(
+                    UserModel(
+                        id=user_id,
+                        username=f"user{user_id}",
+                        password_hash="hash",
+                        surname="Doe",
+                        name="John",
+                        role_id=RoleEnum.USER.value.id_safe.value,
+                    )
+                )
+            for recipe_id in (1, 2):
+                session.add(
+                    RecipeModel(
+                        id=recipe_id,
+                        title=f"Recipe {recipe_id}",
+                        description="Delicious dish",
+                        preparation_time=30,
+                        servings=4,
+                        ingredients="Flour, Sugar",
+                        steps="Mix and bake",
+                        author_id=1,
+                    )
+                )
+            session.flush()
+            for review_id, rating in ((1, 5), (2, 2)):
+                session.add(
+                    ReviewModel(
+                        id=review_id,
+                        recipe_id=1,
+                        user_id=review_id,
+                        rating=rating,
+                        text="Review",
+                        created_at=datetime.now(),
+                    )
+                )
+            session.commit()
+
+    def test_find_rating_drift(self):
+        with self.session_factory() as session:
+            drift = find_rating_drift(session)
+
+        assert drift == [
+            RatingDrift(
+                recipe_id=1,
+                stored_rating_sum=0,
+                stored_review_count=0,
+                actual_rating_sum=7,
+                actual_review_count=2,
+            )
+        ]
+
+    def test_repair_rating_drift(self):
+        with self.session_factory() as session:
+            session.get_one(RecipeModel, 2).review_count = 3
+            session.commit()
+
+        with self.session_factory() as session:
+            repaired = repair_rating_drift(session)
+
+        assert [item.recipe_id for item in repaired] == [1, 2]
+
+        with self.session_factory() as session:
+            assert find_rating_drift(session) == []
+            first = session.get_one(RecipeModel, 1)
+            second = session.get_one(RecipeModel, 2)
+            assert (first.rating_sum, first.review_count) == (7, 2)
+            assert (second.rating_sum, second.review_count) == (0, 0)
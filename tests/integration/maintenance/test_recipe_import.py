@@ -0,0 +1,231 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session, sessionmaker
+
+from application.interfaces.services.html_renderer import IHtmlRenderer
+from domain.clock import FixedClock
+from domain.entities.recipe.factories import RecipeFactory, RecipeImageFactory
+from domain.entities.review.factories import ReviewFactory
+from domain.entities.user.role import RoleEnum
+from infrastructure.sqlalchemy.maintenance.recipe_import import (
+    ImportReport,
+    RecipeImporter,
+    RejectedRecord,
+)
+from infrastructure.sqlalchemy.models.recipe import (
+    RecipeImageModel,
+    RecipeIngredientModel,
+    RecipeModel,
+)
+from infrastructure.sqlalchemy.models.review import ReviewModel
+from infrastructure.sqlalchemy.models.user import UserModel
+from infrastructure.sqlalchemy.repositories.recipe_repository import (
+    SQLAlchemyRecipeRepository,
+)
+from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
+from infrastructure.store.image.local_image_store import LocalImageStore
+from tests.integration.conftest import StatementCounter
+
+
+class TaggingRenderer(IHtmlRenderer):
+    def render(self, text: str) -> str:
+        return f"<p>{text}</p>"
+
+
+def record(title: str, **fields: Any) -> str:
+    data = {
+        "title": title,
+        "description": "Наваристый суп",
+        "preparation_time": 90,
+        "servings": 6,
+        "ingredients": "свёкла, капуста",
+        "steps": "Варить",
+        "author_id": 1,
+        **fields,
+    }
+    return json.dumps(data, ensure_ascii=False)
+
+
+class TestRecipeImport:
+    @pytest.fixture(autouse=True)
+    def setup(self, session_factory: sessionmaker[Session], tmp_path: Path):
+        self.session_factory = session_factory
+        with self.session_factory() as session:
+            for user_id in (1, 2, 3):
+                session.add(
+                    UserModel(
+                        id=user_id,
+                        username=f"user{user_id}",
+                        password_hash="hash",
+                        surname="Doe",
+                        name="John",
+                        role_id=RoleEnum.USER.value.id_safe.value,
+                    )
+                )
+            session.commit()
+
+        self.images_dir = tmp_path / "export"
+        self.images_dir.mkdir()
+        (self.images_dir / "borscht.jpg").write_bytes(b"jpeg")
+        self.uploads = tmp_path / "uploads"
+        self.importer = RecipeImporter(
+            RecipeFactory(),
+            RecipeImageFactory(),
+            ReviewFactory(FixedClock(datetime(2025, 6, 29))),
+            LocalImageStore(str(self.uploads)),
+            TaggingRenderer(),
+            self.images_dir,
+        )
+
+    def run(self, lines: list[str], batch_size: int = 500) -> ImportReport:
+        with self.session_factory() as session:
+            return self.importer.run(session, lines, batch_size)
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 500])
+    def test_import(self, batch_size: int):
+        lines = [
+            record(
+                "Борщ",
+                images=["borscht.jpg"],
+                reviews=[
+                    {"user_id": 2, "rating": 5, "text": "Вкусно"},
+                    {
+                        "user_id": 3,
+                        "rating": 4,
+                        "text": "Неплохо",
+                        "created_at": "2025-05-01T12:00:00",
+                    },
+                ],
+            ),
+            "",
+            record("Щи"),
+            record("Окрошка", author_id=2),
+        ]
+
+        report = self.run(lines, batch_size)
+
+        assert report == ImportReport(
+            records=3, recipes=3, reviews=2, images=1
+        )
+        with self.session_factory() as session:
+            recipes = session.scalars(
+                select(RecipeModel).order_by(RecipeModel.id)
+            ).all()
+            assert [r.title for r in recipes] == ["Борщ", "Щи", "Окрошка"]
+            borscht = recipes[0]
+            assert borscht.description_html == "<p>Наваристый суп</p>"
+            assert borscht.steps_html == "<p>Варить</p>"
+            assert (borscht.rating_sum, borscht.review_count) == (9, 2)
+            assert borscht.average_rating == 4.5  # noqa: PLR2004
+
+            reviews = session.scalars(
+                select(ReviewModel).order_by(ReviewModel.user_id)
+            ).all()
+            assert [r.text_html for r in reviews] == [
+                "<p>Вкусно</p>",
+                "<p>Неплохо</p>",
+            ]
+            assert reviews[0].created_at.date() == datetime(2025, 6, 29).date()
+            assert reviews[1].created_at.date() == datetime(2025, 5, 1).date()
+
+            image = session.scalars(select(RecipeImageModel)).one()
+            assert image.recipe_id == borscht.id
+            assert image.mime_type == "image/jpeg"
+            assert (self.uploads / image.filename).read_bytes() == b"jpeg"
+
+            tokens = session.scalars(
+                select(RecipeIngredientModel.recipe_id).distinct()
+            ).all()
+            assert sorted(tokens) == [r.id for r in recipes]
+
+    def test_imported_recipes_are_searchable(
+        self,
+        recipe_repository: SQLAlchemyRecipeRepository,
+        transaction_manager: SQLAlchemyTransactionManager,
+    ):
+        self.run([record("Борщ"), record("Щи", ingredients="капуста")])
+
+        with transaction_manager:
+            found = recipe_repository.search("борщ", limit=10)
+            by_ingredient = recipe_repository.find_by_ingredients(
+                ["свёкла"], limit=10
+            )
+
+        assert [summary.title for summary in found] == ["Борщ"]
+        assert [match.summary.title for match in by_ingredient] == ["Борщ"]
+
+    def test_search_index_is_written_once_per_batch(
+        self, statement_counter: StatementCounter
+    ):
+        lines = [record(title) for title in ("Борщ", "Щи", "Окрошка")]
+
+        with statement_counter as counter:
+            self.run(lines)
+
+        search = [s for s in counter.statements if '"RecipeSearch"' in s]
+        assert len(search) == 1
+        assert search[0].startswith('INSERT INTO "RecipeSearch"')
+
+    def test_invalid_records_are_rejected_by_line(self):
+        lines = [
+            record("Борщ"),
+            "{not json",
+            json.dumps({"title": "Без полей"}),
+            record("Борщ", reviews=[{"user_id": 2, "rating": 9, "text": "!"}]),
+            record("Борщ", author_id=42),
+            record("Борщ", reviews=[{"user_id": 7, "rating": 5, "text": "!"}]),
+            record("Борщ", images=["missing.jpg"]),
+            record("Борщ", images=["../uploads/escape.jpg"]),
+            record(
+                "Борщ",
+                reviews=[
+                    {"user_id": 2, "rating": 5, "text": "Раз"},
+                    {"user_id": 2, "rating": 1, "text": "Два"},
+                ],
+            ),
+            record("Щи"),
+        ]
+
+        report = self.run(lines, batch_size=4)
+
+        assert (report.records, report.recipes, report.rejected) == (10, 2, 8)
+        errors = {error.line: error for error in report.errors}
+        assert sorted(errors) == [2, 3, 4, 5, 6, 7, 8, 9]
+        assert errors[5] == RejectedRecord(5, "Unknown users: 42.")
+        assert errors[6] == RejectedRecord(6, "Unknown users: 7.")
+        assert errors[9].reason == (
+            "ValueError: A user reviews the recipe more than once."
+        )
+        with self.session_factory() as session:
+            assert session.scalars(select(ReviewModel)).all() == []
+
+    def test_rolled_back_batch_uploads_no_images(self):
+        with (
+            self.session_factory() as session,
+            patch.object(session, "commit", side_effect=RuntimeError),
+            pytest.raises(RuntimeError),
+        ):
+            self.importer.run(
+                session, [record("Борщ", images=["borscht.jpg"])]
+            )
+
+        assert list(self.uploads.iterdir()) == []
+
+    def test_progress_is_reported_per_batch(self):
+        reports = []
+
+        with self.session_factory() as session:
+            self.importer.run(
+                session,
+                [record(f"Рецепт {i}") for i in range(5)],
+                batch_size=2,
+                progress=lambda report: reports.append(report.recipes),
+            )
+
+        assert reports == [2, 4, 5]
@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session, sessionmaker
+
+from domain.entities.user.role import RoleEnum
+from infrastructure.sqlalchemy.maintenance.search_index import (
+    rebuild_search_index,
+)
+from infrastructure.sqlalchemy.models.recipe import RecipeModel
+from infrastructure.sqlalchemy.models.user import UserModel
+from infrastructure.sqlalchemy.repositories.recipe_repository import (
+    SQLAlchemyRecipeRepository,
+)
+from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
+
+
+class TestSearchIndex:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        session_factory: sessionmaker[Session],
+        recipe_repository: SQLAlchemyRecipeRepository,
+        transaction_manager: SQLAlchemyTransactionManager,
+    ):
+        self.session_factory = session_factory
+        self.recipe_repository = recipe_repository
+        self.transaction_manager = transaction_manager
+        # Rows added past the repository, as the migration leaves them
+        with self.session_factory() as session:
+            session.add(
+                UserModel(
+                    id=1,
+                    username="user",
+                    password_hash="hash",
+                    surname="Doe",
+                    name="John",
+                    role_id=RoleEnum.USER.value.id_safe.value,
+                )
+            )
+            for recipe_id, title, ingredients in (
+                (1, "Борщ", "свёкла, капуста"),
+                (2, "Щи", "капуста"),
+                (3, "Блины", "мука, молоко"),
+            ):
+                session.add(
+                    RecipeModel(
+                        id=recipe_id,
+                        title=title,
+                        description="Домашнее блюдо",
+                        preparation_time=30,
+                        servings=4,
+                        ingredients=ingredients,
+                        steps="Готовить",
+                        author_id=1,
+                    )
+                )
+            # A stale document left from an earlier title of recipe 2
+            session.execute(
+                text(
+                    'INSERT INTO "RecipeSearch" (rowid, title, body) '
+                    "VALUES (2, 'окрошк', '')"
+                )
+            )
+            session.commit()
+
+    def _search(self, query: str) -> list[str]:
+        with self.transaction_manager:
+            found = self.recipe_repository.search(query, limit=10)
+        return sorted(summary.title for summary in found)
+
+    @pytest.mark.parametrize("batch_size", [1, 2, 500])
+    def test_rebuild_search_index(self, batch_size: int):
+        with self.session_factory() as session:
+            indexed = rebuild_search_index(session, batch_size)
+
+        assert indexed == 3  # noqa: PLR2004
+        assert self._search("капуста") == ["Борщ", "Щи"]
+        assert self._search("блины") == ["Блины"]
+        assert self._search("окрошка") == []
+
+    def test_rebuild_is_idempotent(self):
+        with self.session_factory() as session:
+            rebuild_search_index(session)
+            rebuild_search_index(session)
+
+        assert self._search("капуста") == ["Борщ", "Щи"]
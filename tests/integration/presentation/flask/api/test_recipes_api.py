@@ -0,0 +1,146 @@
+from datetime import datetime
+from http import HTTPStatus
+
+import pytest
+from flask import Flask
+
+from di.container import Container
+from domain.constants import MAX_IDS_PER_QUERY
+from infrastructure.sqlalchemy.models import RecipeImageModel
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from infrastructure.sqlalchemy.models.review import ReviewModel
+from presentation.web.flask.main import FlaskUserDescriptor
+
+
+class TestRecipesApi:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        flask_app: Flask,
+        container: Container,
+        user_descriptor: FlaskUserDescriptor,
+    ):
+        self.client = flask_app.test_client()
+        self.user = user_descriptor
+        session = container.database().get_session_factory()()
+        session.add_all(
+            RecipeModel(
+                id=recipe_id,
+                title=f"Recipe {recipe_id}",
+                description="**Bold** description",
+                preparation_time=10 * recipe_id,
+                servings=recipe_id,
+                ingredients="ingredients",
+                steps="steps",
+                author_id=self.user.user_id,
+                rating_sum=5 if recipe_id == 1 else 0,
+                review_count=1 if recipe_id == 1 else 0,
+                average_rating=5 if recipe_id == 1 else 0,
+            )
+            for recipe_id in (1, 2, 3)
+        )
+        session.flush()
+        session.add(
+            RecipeImageModel(
+                filename="cover.jpg", mime_type="image/jpeg", recipe_id=1
+            )
+        )
+        session.add(
+            ReviewModel(
+                recipe_id=1,
+                user_id=self.user.user_id,
+                rating=5,
+                text="Great!",
+                created_at=datetime(2025, 6, 16, 21, 51),
+            )
+        )
+        session.commit()
+        session.close()
+
+    def test_list(self):
+        response = self.client.get("/api/recipes")
+
+        assert response.status_code == HTTPStatus.OK
+        body = response.get_json()
+        assert [r["id"] for r in body["recipes"]] == [3, 2, 1]
+        assert body["total_count"] == 3  # noqa: PLR2004
+        assert body["next_cursor"] is None
+        assert body["recipes"][2]["images"] == [
+            {"filename": "cover.jpg", "mime_type": "image/jpeg"}
+        ]
+
+    def test_list_with_sparse_fieldset(self):
+        response = self.client.get("/api/recipes?fields=id,title&per_page=2")
+
+        body = response.get_json()
+        assert body["recipes"] == [
+            {"id": 3, "title": "Recipe 3"},
+            {"id": 2, "title": "Recipe 2"},
+        ]
+        assert body["next_cursor"]
+
+    def test_list_by_ids_keeps_requested_order(self):
+        response = self.client.get("/api/recipes?ids=2,999,1,2&fields=id")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.get_json() == {"recipes": [{"id": 2}, {"id": 1}]}
+
+    @pytest.mark.parametrize(
+        ("query", "message"),
+        [
+            ("fields=id,secret", "Unknown fields: secret."),
+            ("ids=1,x", "Invalid recipe ids."),
+            ("ids=", "No recipe ids given."),
+            (
+                "ids=" + ",".join(map(str, range(1, MAX_IDS_PER_QUERY + 2))),
+                "Too many recipe ids.",
+            ),
+            ("sort=unknown", "Invalid sort order."),
+        ],
+    )
+    def test_list_bad_request(self, query: str, message: str):
+        response = self.client.get(f"/api/recipes?{query}")
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.get_json() == {"error": message}
+
+    def test_recipe(self):
+        response = self.client.get("/api/recipes/1")
+
+        assert response.status_code == HTTPStatus.OK
+        body = response.get_json()
+        assert body["title"] == "Recipe 1"
+        assert body["description"] == "**Bold** description"
+        assert body["author"] == {"id": self.user.user_id, "username": "user"}
+        assert body["average_rating"] == 5  # noqa: PLR2004
+        assert body["rating_histogram"] == [0, 0, 0, 0, 0, 1]
+        (review,) = body["reviews"]
+        assert review["text"] == "Great!"
+        assert review["created_at"].startswith("2025-06-16T21:51")
+        assert review["author"]["username"] == "user"
+        assert body["next_reviews_cursor"] is None
+
+    def test_recipe_with_sparse_fieldset(self):
+        response = self.client.get("/api/recipes/1?fields=title,review_count")
+
+        assert response.get_json() == {"title": "Recipe 1", "review_count": 1}
+
+    def test_recipe_not_found(self):
+        response = self.client.get("/api/recipes/999")
+
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert response.get_json() == {"error": "Recipe not found."}
+
+    def test_recipe_unknown_field(self):
+        response = self.client.get("/api/recipes/1?fields=reviews,password")
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_recipe_supports_conditional_get(self):
+        etag = self.client.get("/api/recipes/1").headers["ETag"]
+
+        response = self.client.get(
+            "/api/recipes/1", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from sqlalchemy import update
+
+from di.container import Container
+from domain.entities.user.role import RoleEnum
+from infrastructure.sqlalchemy.models.user import UserModel
+from presentation.web.flask.main import FlaskUserDescriptor
+
+
+class TestLoadUser:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        flask_app: Flask,
+        container: Container,
+        user_descriptor: FlaskUserDescriptor,
+    ):
+        self.container = container
+        self.user = user_descriptor
+        self.client = flask_app.test_client(user=self.user)
+        self.user_repo = container.user_repo()
+
+    def test_user_is_loaded_once_per_ttl(self):
+        with patch.object(
+            self.user_repo, "get_by_id", wraps=self.user_repo.get_by_id
+        ) as get_by_id:
+            first = self.client.get("/")
+            second = self.client.get("/")
+
+        assert get_by_id.call_count == 1
+        assert "user (Пользователь)" in first.text
+        assert "user (Пользователь)" in second.text
+
+    def test_role_change_waits_for_ttl(self):
+        self.client.get("/")
+        session = self.container.database().get_session_factory()()
+        session.execute(
+            update(UserModel)
+            .where(UserModel.id == self.user.user_id)
+            .values(role_id=RoleEnum.ADMIN.value.id_safe.value)
+        )
+        session.commit()
+
+        cached = self.client.get("/")
+        self.container.user_descriptor_cache().clear()
+        reloaded = self.client.get("/")
+
+        assert "user (Пользователь)" in cached.text
+        assert "user (Администратор)" in reloaded.text
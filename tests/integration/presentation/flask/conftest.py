@@ -2,7 +2,7 @@ from typing import Any
 
 import pytest
 from flask_login import FlaskLoginClient  # type: ignore
-from sqlalchemy import insert
+from sqlalchemy import insert, text
 
 from di.container import Container
 from domain.entities.user.role import RoleEnum
@@ -16,8 +16,14 @@ from presentation.web.flask.main import FlaskUserDescriptor
 @pytest.fixture(scope="session")
 def app():
     app = App()
+    # Roles are verified at startup, the tables must exist before
+    database = app.container.database()
+    Base.metadata.create_all(database.engine)
+    with database.get_session_factory()() as session:
+        seed_roles(session)
     app.configure()
     yield app
+    Base.metadata.drop_all(database.engine)
     app.shutdown()
 
 
@@ -72,17 +78,6 @@ def users_data(
     return [admin_data, user_data]
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_database(container: Container):
-    database = container.database()
-    Base.metadata.create_all(database.engine)
-    session = container.database().get_session_factory()()
-    seed_roles(session)
-    session.close()
-    yield
-    Base.metadata.drop_all(database.engine)
-
-
 @pytest.fixture(autouse=True)
 def clean_and_seed(container: Container, users_data: list[dict[str, Any]]):
     session = container.database().get_session_factory()()
@@ -91,10 +86,14 @@ def clean_and_seed(container: Container, users_data: list[dict[str, Any]]):
         if table.name == "Roles":
             continue
         session.execute(table.delete())
+    session.execute(text('DELETE FROM "RecipeSearch"'))
 
     stmt = insert(UserModel)
     session.execute(stmt, users_data)
     session.commit()
+    container.recipe_count_cache().invalidate()
+    container.page_cache().clear()
+    container.user_descriptor_cache().clear()
 
     yield
     session.close()
@@ -0,0 +1,64 @@
+from http import HTTPStatus
+
+import pytest
+from flask import Flask
+
+from presentation.web.flask.main import FlaskUserDescriptor
+
+
+class TestByIngredients:
+    @pytest.fixture(autouse=True)
+    def setup(self, flask_app: Flask, user_descriptor: FlaskUserDescriptor):
+        self.app = flask_app
+        self.client = flask_app.test_client()
+        self.author = flask_app.test_client(user=user_descriptor)
+
+    def add_recipe(self, title: str, ingredients: str):
+        self.author.post(
+            "/recipes/add",
+            data={
+                "title": title,
+                "description": "description",
+                "preparation_time": 10,
+                "servings": 2,
+                "ingredients": ingredients,
+                "steps": "steps",
+            },
+        )
+
+    def test_form_without_ingredients(self):
+        response = self.client.get("/by-ingredients")
+
+        assert response.status_code == HTTPStatus.OK
+        assert "Ничего не найдено" not in response.text
+
+    def test_ranks_recipes_by_matched_ingredients(self):
+        self.add_recipe("Омлет", "Яйца, молоко")
+        self.add_recipe("Блины", "Мука, молоко, яйцо")
+        self.add_recipe("Салат", "Огурцы, помидоры")
+
+        response = self.client.get(
+            "/by-ingredients?ingredients=мука, молоко, яйца"
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.text.index("Блины") < response.text.index("Омлет")
+        assert "Есть ингредиентов: 3 из 3" in response.text
+        assert "Есть ингредиентов: 2 из 3" in response.text
+        assert "Салат" not in response.text
+
+    def test_without_matches(self):
+        self.add_recipe("Омлет", "Яйца, молоко")
+
+        response = self.client.get("/by-ingredients?ingredients=рис")
+
+        assert "Ничего не найдено" in response.text
+
+    def test_too_many_ingredients_redirects(self):
+        ingredients = ",".join(f"ингредиент{i}" for i in range(11))
+
+        response = self.client.get(
+            f"/by-ingredients?ingredients={ingredients}"
+        )
+
+        assert response.status_code == HTTPStatus.FOUND
@@ -1,3 +1,5 @@
+import html
+import re
 from http import HTTPStatus
 
 import pytest
@@ -68,3 +70,124 @@ class TestIndex:
 
         assert "Редактировать" in response.text
         assert "Удалить" in response.text
+
+    def add_recipes(self, count: int):
+        session = self.container.database().get_session_factory()()
+        session.add_all(
+            RecipeModel(
+                id=i,
+                title=f"title {i:02}",
+                description="description",
+                preparation_time=60,
+                servings=4,
+                ingredients="ingredients",
+                steps="steps",
+                author_id=self.user.user_id,
+            )
+            for i in range(1, count + 1)
+        )
+        session.commit()
+
+    def test_index_next_page_uses_cursor(self):
+        self.add_recipes(11)
+
+        response = self.client.get("/")
+
+        assert "Страница 1 из 2" in response.text
+        assert "Следующая" in response.text
+        assert "Предыдущая" not in response.text
+        next_url = re.search(r'href="(/\?[^"]*after=[^"]+)"', response.text)
+        assert next_url
+
+        response = self.client.get(html.unescape(next_url.group(1)))
+
+        assert "title 01" in response.text
+        assert "title 11" not in response.text
+        assert "Предыдущая" in response.text
+        assert "Следующая" not in response.text
+
+    def test_index_legacy_page_link(self):
+        self.add_recipes(11)
+
+        response = self.client.get("/?page=2")
+
+        assert response.status_code == HTTPStatus.OK
+        assert "title 01" in response.text
+        assert "Страница 2" in response.text
+
+    def test_index_invalid_cursor_redirects(self):
+        response = self.client.get("/?after=broken")
+
+        assert response.status_code == HTTPStatus.FOUND
+
+    def test_index_total_follows_created_recipes(self):
+        self.add_recipes(10)
+        self.client.get("/")
+        client = self.app.test_client(user=self.user)
+
+        client.post(
+            "/recipes/add",
+            data={
+                "title": "new",
+                "description": "description",
+                "preparation_time": 10,
+                "servings": 2,
+                "ingredients": "ingredients",
+                "steps": "steps",
+            },
+        )
+        response = self.client.get("/")
+
+        assert "Страница 1 из 2" in response.text
+
+    def test_index_sorts_and_filters(self):
+        session = self.container.database().get_session_factory()()
+        session.add_all(
+            RecipeModel(
+                id=i,
+                title=f"title {i:02}",
+                description="description",
+                preparation_time=preparation_time,
+                servings=servings,
+                ingredients="ingredients",
+                steps="steps",
+                author_id=self.user.user_id,
+            )
+            for i, preparation_time, servings in [
+                (1, 40, 4),
+                (2, 10, 4),
+                (3, 20, 2),
+                (4, 90, 4),
+            ]
+        )
+        session.commit()
+
+        response = self.client.get("/?sort=time&max_time=60&servings=4")
+
+        assert response.status_code == HTTPStatus.OK
+        assert re.findall(r"title \d\d", response.text) == [
+            "title 02",
+            "title 01",
+        ]
+        assert "Страница 1</span>" in response.text
+
+    def test_index_pagination_keeps_filters(self):
+        self.add_recipes(11)
+
+        response = self.client.get("/?sort=reviews&servings=4")
+
+        next_url = re.search(r'href="(/\?[^"]*after=[^"]+)"', response.text)
+        assert next_url
+        assert "sort=reviews" in next_url.group(1)
+        assert "servings=4" in next_url.group(1)
+
+        response = self.client.get(html.unescape(next_url.group(1)))
+
+        assert response.status_code == HTTPStatus.OK
+        assert "title 01" in response.text
+        assert "title 11" not in response.text
+
+    def test_index_invalid_sort_redirects(self):
+        response = self.client.get("/?sort=title")
+
+        assert response.status_code == HTTPStatus.FOUND
@@ -0,0 +1,63 @@
+from http import HTTPStatus
+
+import pytest
+from flask import Flask
+
+from presentation.web.flask.main import FlaskUserDescriptor
+
+
+class TestSearch:
+    @pytest.fixture(autouse=True)
+    def setup(self, flask_app: Flask, user_descriptor: FlaskUserDescriptor):
+        self.app = flask_app
+        self.client = flask_app.test_client()
+        self.author = flask_app.test_client(user=user_descriptor)
+
+    def add_recipe(self, title: str, ingredients: str):
+        self.author.post(
+            "/recipes/add",
+            data={
+                "title": title,
+                "description": "description",
+                "preparation_time": 10,
+                "servings": 2,
+                "ingredients": ingredients,
+                "steps": "steps",
+            },
+        )
+
+    def test_search_form_without_query(self):
+        response = self.client.get("/search")
+
+        assert response.status_code == HTTPStatus.OK
+        assert "Ничего не найдено" not in response.text
+
+    def test_search_finds_word_forms(self):
+        self.add_recipe("Борщ", "Свёкла, картофель")
+        self.add_recipe("Оладьи", "Мука, молоко")
+
+        response = self.client.get("/search?q=картофелем")
+
+        assert response.status_code == HTTPStatus.OK
+        assert "Борщ" in response.text
+        assert "Оладьи" not in response.text
+
+    def test_search_without_results(self):
+        self.add_recipe("Борщ", "Свёкла, картофель")
+
+        response = self.client.get("/search?q=пицца")
+
+        assert "Ничего не найдено" in response.text
+
+    def test_search_sees_new_recipes_through_page_cache(self):
+        self.client.get("/search?q=борщ")
+        self.add_recipe("Борщ", "Свёкла, картофель")
+
+        response = self.client.get("/search?q=борщ")
+
+        assert "Ничего не найдено" not in response.text
+
+    def test_search_too_long_query_redirects(self):
+        response = self.client.get("/search?q=" + "a" * 201)
+
+        assert response.status_code == HTTPStatus.FOUND
@@ -0,0 +1,134 @@
+import html
+import re
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+from flask import Flask
+from sqlalchemy.orm import Session
+
+from di.container import Container
+from domain.constants import MAX_PER_PAGE, REVIEWS_PER_PAGE
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from infrastructure.sqlalchemy.models.review import ReviewModel
+from presentation.web.flask.main import FlaskUserDescriptor
+
+
+class TestProfile:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        flask_app: Flask,
+        container: Container,
+        admin_descriptor: FlaskUserDescriptor,
+        user_descriptor: FlaskUserDescriptor,
+    ):
+        self.app = flask_app
+        self.container = container
+        self.admin = admin_descriptor
+        self.user = user_descriptor
+        self.client = flask_app.test_client()
+
+    def add_recipes(self, author_id: int, titles: list[str]) -> list[int]:
+        session: Session = self.container.database().get_session_factory()()
+        recipes = [
+            RecipeModel(
+                title=title,
+                description="description",
+                preparation_time=60,
+                servings=4,
+                ingredients="ingredients",
+                steps="steps",
+                author_id=author_id,
+            )
+            for title in titles
+        ]
+        session.add_all(recipes)
+        session.commit()
+        return [recipe.id for recipe in recipes]  # type: ignore
+
+    def add_reviews(self, user_id: int, recipe_ids: list[int]) -> None:
+        session: Session = self.container.database().get_session_factory()()
+        session.add_all(
+            ReviewModel(
+                recipe_id=recipe_id,
+                user_id=user_id,
+                rating=4,
+                text=f"Review of {recipe_id}",
+                created_at=datetime(2025, 6, 1) + timedelta(hours=i),
+            )
+            for i, recipe_id in enumerate(recipe_ids)
+        )
+        session.commit()
+
+    def follow_pages(self, client, url: str) -> list[str]:
+        pages = []
+        while url:
+            response = client.get(url)
+            assert response.status_code == HTTPStatus.OK
+            pages.append(response.text)
+            link = re.search(r'href="([^"]*after=[^"]*)"', response.text)
+            url = html.unescape(link.group(1)) if link else ""
+        return pages
+
+    @pytest.mark.parametrize("path", ["/profile/recipes", "/profile/reviews"])
+    def test_requires_login(self, path: str):
+        response = self.client.get(path)
+
+        assert response.status_code == HTTPStatus.FOUND
+        assert "/login" in response.headers["Location"]
+
+    def test_user_recipes_lists_only_own_recipes(self):
+        self.add_recipes(self.user.user_id, ["Мой борщ"])
+        self.add_recipes(self.admin.user_id, ["Чужие щи"])
+        client = self.app.test_client(user=self.user)
+
+        response = client.get("/profile/recipes")
+
+        assert "Мой борщ" in response.text
+        assert "Чужие щи" not in response.text
+
+    def test_user_recipes_walks_pages_by_cursor(self):
+        titles = [f"Рецепт {i}" for i in range(MAX_PER_PAGE + 2)]
+        self.add_recipes(self.user.user_id, titles)
+        client = self.app.test_client(user=self.user)
+
+        pages = self.follow_pages(client, "/profile/recipes")
+
+        assert len(pages) == 2  # noqa: PLR2004
+        shown = [t for t in titles for page in pages if f">{t}<" in page]
+        assert sorted(shown) == sorted(titles)
+
+    def test_user_reviews_lists_own_reviews_with_recipes(self):
+        (own, other) = self.add_recipes(self.admin.user_id, ["Борщ", "Щи"])
+        self.add_reviews(self.user.user_id, [own])
+        self.add_reviews(self.admin.user_id, [other])
+        client = self.app.test_client(user=self.user)
+
+        response = client.get("/profile/reviews")
+
+        assert "Борщ" in response.text
+        assert f"Review of {own}" in response.text
+        assert f"Review of {other}" not in response.text
+
+    def test_user_reviews_walks_pages_by_cursor(self):
+        recipe_ids = self.add_recipes(
+            self.admin.user_id,
+            [f"Рецепт {i}" for i in range(REVIEWS_PER_PAGE + 1)],
+        )
+        self.add_reviews(self.user.user_id, recipe_ids)
+        client = self.app.test_client(user=self.user)
+
+        pages = self.follow_pages(client, "/profile/reviews")
+
+        assert len(pages) == 2  # noqa: PLR2004
+        assert f"Review of {recipe_ids[0]}<" in pages[-1]
+
+    def test_invalid_cursor_flashes_error(self):
+        client = self.app.test_client(user=self.user)
+
+        response = client.get(
+            "/profile/reviews?after=garbage", follow_redirects=True
+        )
+
+        assert "Invalid pagination cursor." in response.text
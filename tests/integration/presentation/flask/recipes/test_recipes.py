@@ -1,13 +1,19 @@
+import re
+from datetime import datetime, timedelta
 from http import HTTPStatus
 from typing import Any
 
 import pytest
 from flask import Flask
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from di.container import Container
+from domain.constants import REVIEWS_PER_PAGE
+from domain.entities.user.role import RoleEnum
 from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
 from infrastructure.sqlalchemy.models.review import ReviewModel
+from infrastructure.sqlalchemy.models.user import UserModel
 from presentation.web.flask.main import FlaskUserDescriptor
 
 
@@ -42,6 +48,38 @@ class TestRecipeViews:
         session.add(recipe)
         session.commit()
 
+    def add_reviews(self, count: int) -> None:
+        # One reviewer per review, "Review 0" is the oldest
+        session: Session = self.container.database().get_session_factory()()
+        for i in range(count):
+            user_id = 100 + i
+            session.add(
+                UserModel(
+                    id=user_id,
+                    username=f"reviewer{i}",
+                    password_hash="hash",
+                    surname="doe",
+                    name="reviewer",
+                    role_id=RoleEnum.USER.value.id_safe.value,
+                )
+            )
+            session.add(
+                ReviewModel(
+                    recipe_id=self.recipe.id,
+                    user_id=user_id,
+                    rating=4,
+                    text=f"Review {i}",
+                    created_at=datetime(2025, 6, 1) + timedelta(hours=i),
+                )
+            )
+        # The counters the use cases keep in step with the reviews
+        session.execute(
+            update(RecipeModel)
+            .where(RecipeModel.id == self.recipe.id)
+            .values(rating_sum=4 * count, review_count=count, average_rating=4)
+        )
+        session.commit()
+
     def test_recipe_view_get_success(self):
         self.add_recipe(self.recipe)
         response = self.client.get(f"/recipes/{self.recipe.id}")
@@ -50,6 +88,40 @@ class TestRecipeViews:
         assert self.recipe.title in response.text  # type: ignore
         assert self.recipe.description in response.text  # type: ignore
 
+    def test_recipe_view_uses_stored_html(self):
+        self.recipe.description_html = "<p><em>stored</em> description</p>"
+        self.recipe.ingredients_html = "<p>stored ingredients</p>"
+        self.recipe.steps_html = "<p>stored steps</p>"
+        self.add_recipe(self.recipe)
+
+        response = self.client.get(f"/recipes/{self.recipe.id}")
+
+        assert "<em>stored</em> description" in response.text
+        assert "stored ingredients" in response.text
+        assert self.recipe.description not in response.text  # type: ignore
+
+    def test_recipe_add_post_stores_sanitized_html(self):
+        client = self.app.test_client(user=self.user)
+        form_data = {
+            "title": "New Recipe",
+            "description": "**Bold** <script>alert(1)</script>",
+            "preparation_time": "45",
+            "servings": "2",
+            "ingredients": "- Flour\n- Sugar",
+            "steps": "Mix and bake.",
+        }
+        client.post("/recipes/add", data=form_data)
+
+        session: Session = self.container.database().get_session_factory()()
+        recipe = session.query(RecipeModel).filter_by(title="New Recipe").one()
+        assert "<strong>Bold</strong>" in recipe.description_html  # type: ignore
+        assert "<script>" not in recipe.description_html  # type: ignore
+        assert "<li>Flour</li>" in recipe.ingredients_html  # type: ignore
+
+        response = client.get(f"/recipes/{recipe.id}")
+        assert "<strong>Bold</strong>" in response.text
+        assert "<script>alert(1)" not in response.text
+
     def test_recipe_view_get_not_found(self):
         response = self.client.get("/recipes/999", follow_redirects=True)
 
@@ -256,8 +328,87 @@ class TestRecipeViews:
         assert review is not None
         assert review.rating == 5  # type: ignore
         assert review.text == "Great recipe!"  # type: ignore
+        assert review.text_html == "<p>Great recipe!</p>\n"  # type: ignore
         assert review.user_id == self.user.user_id  # type: ignore
 
+    def test_recipe_view_shows_newest_reviews_page(self):
+        self.add_recipe(self.recipe)
+        self.add_reviews(REVIEWS_PER_PAGE + 2)
+
+        response = self.client.get(f"/recipes/{self.recipe.id}")
+
+        assert response.status_code == HTTPStatus.OK
+        shown = re.findall(r"Review (\d+)", response.text)
+        newest = range(REVIEWS_PER_PAGE + 1, 1, -1)
+        assert shown == [str(i) for i in newest]
+        # The summary counts every review, not only the shown ones
+        assert f"({REVIEWS_PER_PAGE + 2} отзывов)" in response.text
+        assert "Показать ещё" in response.text
+
+    def test_recipe_view_shows_rating_histogram(self):
+        self.add_recipe(self.recipe)
+        self.add_reviews(4)
+
+        response = self.client.get(f"/recipes/{self.recipe.id}")
+
+        assert "5★" in response.text
+        assert "width: 100.0%;" in response.text  # every review rated 4
+
+    def test_review_list_loads_the_next_page(self):
+        self.add_recipe(self.recipe)
+        self.add_reviews(REVIEWS_PER_PAGE + 2)
+        page = self.client.get(f"/recipes/{self.recipe.id}")
+        (url,) = re.findall(r'href="([^"]*/reviews\?after=[^"]*)"', page.text)
+
+        response = self.client.get(url.replace("&amp;", "&"))
+
+        assert response.status_code == HTTPStatus.OK
+        assert re.findall(r"Review (\d+)", response.text) == ["1", "0"]
+        assert "Показать ещё" not in response.text
+        assert "<html" not in response.text
+
+    def test_review_list_invalid_cursor(self):
+        self.add_recipe(self.recipe)
+
+        response = self.client.get(
+            f"/recipes/{self.recipe.id}/reviews?after=garbage"
+        )
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_recipe_view_already_reviewed(self):
+        self.add_recipe(self.recipe)
+        client = self.app.test_client(user=self.user)
+        client.post(
+            f"/recipes/{self.recipe.id}/review",
+            data={"rating": "5", "text": "Great recipe!"},
+        )
+
+        response = client.get(f"/recipes/{self.recipe.id}")
+
+        assert "Вы уже оставили отзыв на этот рецепт." in response.text
+        assert "Оставить отзыв" not in response.text
+
+    def test_review_create_post_twice_flashes_already_reviewed(self):
+        self.add_recipe(self.recipe)
+        client = self.app.test_client(user=self.user)
+        url = f"/recipes/{self.recipe.id}/review"
+        client.post(url, data={"rating": "5", "text": "Great recipe!"})
+
+        response = client.post(
+            url, data={"rating": "1", "text": "Again"}, follow_redirects=True
+        )
+
+        assert "User has already reviewed this recipe." in response.text
+        assert "caused by" not in response.text
+        session: Session = self.container.database().get_session_factory()()
+        reviews = session.query(ReviewModel).filter_by(
+            recipe_id=self.recipe.id
+        )
+        assert [review.rating for review in reviews] == [5]
+        recipe = session.get_one(RecipeModel, self.recipe.id)
+        assert (recipe.rating_sum, recipe.review_count) == (5, 1)
+
     def test_review_create_post_invalid_form(self):
         self.add_recipe(self.recipe)
         client = self.app.test_client(user=self.user)
@@ -273,3 +424,151 @@ class TestRecipeViews:
 
         assert response.status_code == HTTPStatus.OK
         assert b"Review added." not in response.data
+
+    def review_of(self, username: str) -> ReviewModel:
+        session: Session = self.container.database().get_session_factory()()
+        return (
+            session.query(ReviewModel)
+            .join(UserModel, ReviewModel.user_id == UserModel.id)
+            .filter(UserModel.username == username)
+            .one()
+        )
+
+    def rating_counters(self) -> tuple[int, int, float]:
+        session: Session = self.container.database().get_session_factory()()
+        recipe = session.get_one(RecipeModel, self.recipe.id)
+        return (
+            recipe.rating_sum,  # type: ignore
+            recipe.review_count,  # type: ignore
+            recipe.average_rating,  # type: ignore
+        )
+
+    def test_review_edit_get_author(self):
+        self.add_recipe(self.recipe)
+        client = self.app.test_client(user=self.user)
+        client.post(
+            f"/recipes/{self.recipe.id}/review",
+            data={"rating": "5", "text": "Great recipe!"},
+        )
+        review = self.review_of("user")
+
+        response = client.get(
+            f"/recipes/{self.recipe.id}/reviews/{review.id}/edit"
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert "Great recipe!" in response.text
+
+    def test_review_edit_get_unauthorized(
+        self, third_user_descriptor: FlaskUserDescriptor
+    ):
+        self.add_recipe(self.recipe)
+        self.add_reviews(1)
+        review = self.review_of("reviewer0")
+        client = self.app.test_client(user=third_user_descriptor)
+
+        response = client.get(
+            f"/recipes/{self.recipe.id}/reviews/{review.id}/edit",
+            follow_redirects=True,
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert "No permission." in response.text
+
+    def test_review_edit_post_adjusts_rating_by_delta(self):
+        self.add_recipe(self.recipe)
+        self.add_reviews(2)
+        review = self.review_of("reviewer0")
+        client = self.app.test_client(user=self.admin)
+
+        response = client.post(
+            f"/recipes/{self.recipe.id}/reviews/{review.id}/edit",
+            data={"rating": "1", "text": "Changed my mind"},
+            follow_redirects=True,
+        )
+
+        assert "Review updated." in response.text
+        assert "Changed my mind" in response.text
+        edited = self.review_of("reviewer0")
+        assert (edited.rating, edited.text) == (1, "Changed my mind")
+        assert edited.text_html == "<p>Changed my mind</p>\n"
+        assert self.rating_counters() == (5, 2, 2.5)
+
+    def test_review_edit_post_unauthorized(
+        self, third_user_descriptor: FlaskUserDescriptor
+    ):
+        self.add_recipe(self.recipe)
+        self.add_reviews(1)
+        review = self.review_of("reviewer0")
+        client = self.app.test_client(user=third_user_descriptor)
+
+        response = client.post(
+            f"/recipes/{self.recipe.id}/reviews/{review.id}/edit",
+            data={"rating": "0", "text": "Terrible"},
+            follow_redirects=True,
+        )
+
+        assert (
+            "Insufficient permissions to change this review." in response.text
+        )
+        assert self.review_of("reviewer0").rating == 4  # noqa: PLR2004
+        assert self.rating_counters() == (4, 1, 4)
+
+    def test_review_delete_post_adjusts_rating_by_delta(self):
+        self.add_recipe(self.recipe)
+        self.add_reviews(2)
+        session: Session = self.container.database().get_session_factory()()
+        session.execute(
+            update(ReviewModel)
+            .where(ReviewModel.text == "Review 1")
+            .values(rating=2)
+        )
+        session.execute(
+            update(RecipeModel).values(rating_sum=6, average_rating=3)
+        )
+        session.commit()
+        review = self.review_of("reviewer1")
+        client = self.app.test_client(user=self.admin)
+
+        response = client.post(
+            f"/recipes/{self.recipe.id}/reviews/{review.id}/delete",
+            follow_redirects=True,
+        )
+
+        assert "Review deleted." in response.text
+        assert "Review 1" not in response.text
+        assert self.rating_counters() == (4, 1, 4)
+
+    def test_review_delete_post_unauthorized(
+        self, third_user_descriptor: FlaskUserDescriptor
+    ):
+        self.add_recipe(self.recipe)
+        self.add_reviews(1)
+        review = self.review_of("reviewer0")
+        client = self.app.test_client(user=third_user_descriptor)
+
+        response = client.post(
+            f"/recipes/{self.recipe.id}/reviews/{review.id}/delete",
+            follow_redirects=True,
+        )
+
+        assert (
+            "Insufficient permissions to change this review." in response.text
+        )
+        assert self.rating_counters() == (4, 1, 4)
+
+    def test_recipe_view_shows_review_controls_to_its_author(self):
+        self.add_recipe(self.recipe)
+        self.add_reviews(1)
+        client = self.app.test_client(user=self.user)
+        client.post(
+            f"/recipes/{self.recipe.id}/review",
+            data={"rating": "5", "text": "Great recipe!"},
+        )
+        own = self.review_of("user")
+        other = self.review_of("reviewer0")
+
+        response = client.get(f"/recipes/{self.recipe.id}")
+
+        assert f"/reviews/{own.id}/edit" in response.text
+        assert f"/reviews/{other.id}/edit" not in response.text
@@ -0,0 +1,143 @@
+from http import HTTPStatus
+
+import pytest
+from flask import Flask
+
+from di.container import Container
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from presentation.web.flask.main import FlaskUserDescriptor
+from presentation.web.flask.page_cache import CACHE_HEADER
+
+
+class TestConditionalGet:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        flask_app: Flask,
+        container: Container,
+        user_descriptor: FlaskUserDescriptor,
+        admin_descriptor: FlaskUserDescriptor,
+    ):
+        self.app = flask_app
+        self.container = container
+        self.user = user_descriptor
+        self.admin = admin_descriptor
+        self.client = flask_app.test_client()
+        self.add_recipe(1)
+
+    def add_recipe(self, recipe_id: int) -> None:
+        session = self.container.database().get_session_factory()()
+        session.add(
+            RecipeModel(
+                id=recipe_id,
+                title="title",
+                description="description",
+                preparation_time=60,
+                servings=4,
+                ingredients="ingredients",
+                steps="steps",
+                author_id=self.user.user_id,
+            )
+        )
+        session.commit()
+        session.close()
+
+    def add_review(self, recipe_id: int = 1) -> None:
+        client = self.app.test_client(user=self.user)
+        client.post(
+            f"/recipes/{recipe_id}/review",
+            data={"rating": 4, "text": "Nice recipe"},
+        )
+
+    @pytest.mark.parametrize("url", ["/", "/recipes/1"])
+    def test_response_carries_validators(self, url: str):
+        response = self.client.get(url)
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"].startswith('W/"')
+        assert "Cookie" in response.vary
+
+    def test_index_has_no_last_modified(self):
+        # A deleted recipe leaves the catalog timestamp, only the ETag
+        # notices it
+        assert self.client.get("/").last_modified is None
+        assert self.client.get("/recipes/1").last_modified is not None
+
+    @pytest.mark.parametrize("url", ["/", "/recipes/1"])
+    def test_matching_etag_is_not_modified(self, url: str):
+        etag = self.client.get(url).headers["ETag"]
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+        assert response.data == b""
+        assert response.headers["ETag"] == etag
+        # Answered before the page cache and the view were reached
+        assert CACHE_HEADER not in response.headers
+
+    def test_if_modified_since_is_not_modified(self):
+        last_modified = self.client.get("/recipes/1").headers["Last-Modified"]
+
+        response = self.client.get(
+            "/recipes/1", headers={"If-Modified-Since": last_modified}
+        )
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    @pytest.mark.parametrize("url", ["/", "/recipes/1"])
+    def test_review_changes_etag(self, url: str):
+        etag = self.client.get(url).headers["ETag"]
+        self.add_review()
+
+        response = self.client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["ETag"] != etag
+
+    def test_recipe_of_another_page_keeps_etag(self):
+        self.add_recipe(2)
+        etag = self.client.get("/recipes/1").headers["ETag"]
+        self.add_review(recipe_id=2)
+
+        response = self.client.get(
+            "/recipes/1", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    def test_deletion_changes_index_etag(self):
+        self.add_recipe(2)
+        etag = self.client.get("/").headers["ETag"]
+        admin = self.app.test_client(user=self.admin)
+        admin.post("/recipes/2/delete")
+
+        response = self.client.get("/", headers={"If-None-Match": etag})
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_deletion_is_not_hidden_by_if_modified_since(self):
+        self.add_recipe(2)
+        last_modified = self.client.get("/recipes/2").headers["Last-Modified"]
+        admin = self.app.test_client(user=self.admin)
+        admin.post("/recipes/2/delete")
+
+        response = self.client.get(
+            "/", headers={"If-Modified-Since": last_modified}
+        )
+
+        assert response.status_code == HTTPStatus.OK
+
+    def test_authenticated_user_gets_no_validators(self):
+        client = self.app.test_client(user=self.user)
+
+        response = client.get("/recipes/1")
+
+        assert response.status_code == HTTPStatus.OK
+        assert "ETag" not in response.headers
+
+    def test_missing_recipe_is_left_to_the_view(self):
+        response = self.client.get(
+            "/recipes/999", headers={"If-None-Match": 'W/"anything"'}
+        )
+
+        assert response.status_code == HTTPStatus.FOUND
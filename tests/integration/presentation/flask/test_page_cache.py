@@ -0,0 +1,98 @@
+from http import HTTPStatus
+
+import pytest
+from flask import Flask
+
+from di.container import Container
+from infrastructure.sqlalchemy.models.recipe.recipe import RecipeModel
+from presentation.web.flask.main import FlaskUserDescriptor
+from presentation.web.flask.page_cache import CACHE_HEADER
+
+
+class TestPageCache:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        flask_app: Flask,
+        container: Container,
+        user_descriptor: FlaskUserDescriptor,
+    ):
+        self.app = flask_app
+        self.container = container
+        self.user = user_descriptor
+        self.client = flask_app.test_client()
+        session = self.container.database().get_session_factory()()
+        session.add(
+            RecipeModel(
+                id=1,
+                title="title",
+                description="description",
+                preparation_time=60,
+                servings=4,
+                ingredients="ingredients",
+                steps="steps",
+                author_id=self.user.user_id,
+            )
+        )
+        session.commit()
+        session.close()
+
+    def test_anonymous_index_is_cached(self):
+        first = self.client.get("/")
+        second = self.client.get("/")
+
+        assert first.headers[CACHE_HEADER] == "MISS"
+        assert second.headers[CACHE_HEADER] == "HIT"
+        assert second.status_code == HTTPStatus.OK
+        assert second.text == first.text
+        stats = self.container.page_cache().stats()
+        assert stats.hits >= 1
+
+    def test_cache_is_keyed_by_url(self):
+        self.client.get("/")
+
+        response = self.client.get("/?page=1")
+
+        assert response.headers[CACHE_HEADER] == "MISS"
+
+    def test_authenticated_user_bypasses_cache(self):
+        self.client.get("/")
+        client = self.app.test_client(user=self.user)
+
+        response = client.get("/")
+
+        assert response.headers[CACHE_HEADER] == "BYPASS"
+        assert "Добавить рецепт" in response.text
+
+    def test_review_invalidates_recipe_page(self):
+        assert self.client.get("/recipes/1").headers[CACHE_HEADER] == "MISS"
+        assert self.client.get("/recipes/1").headers[CACHE_HEADER] == "HIT"
+        client = self.app.test_client(user=self.user)
+
+        client.post(
+            "/recipes/1/review", data={"rating": 4, "text": "Nice recipe"}
+        )
+        response = self.client.get("/recipes/1")
+
+        assert response.headers[CACHE_HEADER] == "MISS"
+        assert "Nice recipe" in response.text
+
+    def test_recipe_update_invalidates_index(self):
+        self.client.get("/")
+        client = self.app.test_client(user=self.user)
+
+        client.post(
+            "/recipes/1/edit",
+            data={
+                "title": "renamed",
+                "description": "description",
+                "preparation_time": 60,
+                "servings": 4,
+                "ingredients": "ingredients",
+                "steps": "steps",
+            },
+        )
+        response = self.client.get("/")
+
+        assert response.headers[CACHE_HEADER] == "MISS"
+        assert "renamed" in response.text
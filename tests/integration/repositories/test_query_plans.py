@@ -0,0 +1,220 @@
+import re
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from domain.entities.entity import Id
+from domain.entities.recipe.image import RecipeImage
+from domain.entities.recipe.recipe import Recipe
+from domain.entities.recipe.value_objects import (
+    RecipeContent,
+    RecipeDetails,
+    RecipeInstruction,
+)
+from domain.entities.review.review import Review
+from domain.entities.user.role import RoleEnum
+from domain.entities.user.user import User
+from domain.entities.user.value_objects import FullName
+from domain.repositories.recipe_repository import RecipeLoadProfile
+from infrastructure.sqlalchemy.repositories.recipe_repository import (
+    SQLAlchemyRecipeRepository,
+)
+from infrastructure.sqlalchemy.repositories.review_repository import (
+    SQLAlchemyReviewRepository,
+)
+from infrastructure.sqlalchemy.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
+from tests.integration.conftest import QueryPlanner
+
+
+USERS = 4
+RECIPES = 6
+
+# A plan line naming a table and nothing else reads all of its rows
+# ("SEARCH T" is a MAX() without an index); "SCAN T USING INDEX" walks an
+# index in order and stops at the LIMIT. Aliases are numbered "T_1"
+FULL_SCAN = re.compile(r"^\W*(?:SCAN|SEARCH) (\w+?)(?:_\d+)?$", re.M)
+TABLES = {"Recipes", "RecipeImages", "RecipeIngredients", "Reviews", "Users"}
+
+
+def full_scans(plans: list[str]) -> list[str]:
+    return [
+        table
+        for plan in plans
+        for table in FULL_SCAN.findall(plan)
+        if table in TABLES
+    ]
+
+
+class TestQueryPlans:
+    """
+    Every repository query reaches its rows through an index. Seeded with
+    a handful of rows, SQLite picks a full scan only when no index fits.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        recipe_repository: SQLAlchemyRecipeRepository,
+        review_repository: SQLAlchemyReviewRepository,
+        user_repository: SQLAlchemyUserRepository,
+        transaction_manager: SQLAlchemyTransactionManager,
+        query_planner: QueryPlanner,
+    ):
+        self.recipe_repository = recipe_repository
+        self.review_repository = review_repository
+        self.user_repository = user_repository
+        self.transaction_manager = transaction_manager
+        self.query_planner = query_planner
+        self._seed()
+
+    def _seed(self) -> None:
+        created_at = datetime(2025, 6, 1)
+        with self.transaction_manager:
+            for user_id in range(1, USERS + 1):
+                self.user_repository.save(
+                    User(
+                        entity_id=Id(user_id),
+                        username=f"user{user_id}",
+                        full_name=FullName("Doe", "John", None),
+                        password_hash="hash",
+                        role=RoleEnum.USER.value,
+                    )
+                )
+            for recipe_id in range(1, RECIPES + 1):
+                self.recipe_repository.save(
+                    Recipe(
+                        entity_id=Id(recipe_id),
+                        content=RecipeContent(
+                            title=f"Борщ {recipe_id}",
+                            description="Наваристый суп",
+                        ),
+                        details=RecipeDetails(
+                            preparation_time=10 * recipe_id, servings=4
+                        ),
+                        instruction=RecipeInstruction(
+                            ingredients="свёкла, картофель", steps="Варить"
+                        ),
+                        author_id=Id(recipe_id % USERS + 1),
+                        images=[
+                            RecipeImage(
+                                entity_id=Id(recipe_id),
+                                filename="image.jpg",
+                                mime_type="image/jpeg",
+                                recipe_id=Id(recipe_id),
+                            )
+                        ],
+                    )
+                )
+                for user_id in range(1, USERS + 1):
+                    self.review_repository.save(
+                        Review(
+                            entity_id=None,
+                            recipe_id=Id(recipe_id),
+                            user_id=Id(user_id),
+                            rating=user_id,
+                            text="Вкусно",
+                            created_at=created_at
+                            + timedelta(hours=recipe_id * USERS + user_id),
+                        )
+                    )
+
+    @pytest.mark.parametrize(
+        "repository,method,args,index",
+        [
+            ("recipe", "get_by_id", (1,), "ix_RecipeImages_recipe_id"),
+            (
+                "recipe",
+                "get_by_id",
+                (1, RecipeLoadProfile.OWNERSHIP_CHECK),
+                "Recipes USING INTEGER PRIMARY KEY",
+            ),
+            ("recipe", "get_detail", (1, 2), "uq_Reviews_user_recipe"),
+            ("recipe", "get_version", (1,), "ix_Reviews_recipe_created_id"),
+            ("recipe", "get_catalog_updated_at", (), "ix_Recipes_updated_at"),
+            ("recipe", "get_summary_page", (3,), "ix_Recipes_created_id"),
+            (
+                "recipe",
+                "get_by_author",
+                (2, 3),
+                "ix_Recipes_author_created_id",
+            ),
+            (
+                "recipe",
+                "get_summaries_by_ids",
+                ([1, 2],),
+                "Recipes USING INTEGER PRIMARY KEY",
+            ),
+            (
+                "recipe",
+                "find_by_ingredients",
+                (["свёкла"], 3),
+                "sqlite_autoindex_RecipeIngredients_1",
+            ),
+            ("recipe", "search", ("борщ", 3), "RecipeSearch VIRTUAL TABLE"),
+            (
+                "recipe",
+                "adjust_rating",
+                (1, 5, 1),
+                "Recipes USING INTEGER PRIMARY KEY",
+            ),
+            (
+                "review",
+                "get_by_recipe_id",
+                (1,),
+                "ix_Reviews_recipe_created_id",
+            ),
+            (
+                "review",
+                "get_with_author_by_recipe_id",
+                (1,),
+                "ix_Reviews_recipe_created_id",
+            ),
+            (
+                "review",
+                "get_page_by_recipe_id",
+                (1, 2),
+                "ix_Reviews_recipe_created_id",
+            ),
+            ("review", "get_by_user", (2, 3), "ix_Reviews_user_created_id"),
+            ("user", "get_by_username", ("user1",), "sqlite_autoindex_Users"),
+            (
+                "user",
+                "exists_by_username",
+                ("user1",),
+                "sqlite_autoindex_Users",
+            ),
+        ],
+    )
+    def test_query_uses_an_index(
+        self, repository: str, method: str, args: tuple, index: str
+    ):
+        query = getattr(getattr(self, f"{repository}_repository"), method)
+
+        plans = self.query_planner.explain_all(lambda: query(*args))
+
+        assert full_scans(plans) == []
+        assert any(index in plan for plan in plans), "\n\n".join(plans)
+
+    def test_recipe_remove_uses_an_index(self):
+        with self.transaction_manager:
+            recipe = self.recipe_repository.get_by_id(1)
+
+        plans = self.query_planner.explain_all(
+            lambda: self.recipe_repository.remove(recipe)
+        )
+
+        assert full_scans(plans) == []
+        assert any("ix_RecipeIngredients_recipe_id" in plan for plan in plans)
+
+    def test_full_scan_is_detected(self):
+        plans = self.query_planner.explain_all(
+            lambda: self.transaction_manager._get_session().execute(  # type: ignore
+                text('SELECT * FROM "Reviews" WHERE rating = 5')
+            )
+        )
+
+        assert full_scans(plans) == ["Reviews"]
@@ -0,0 +1,112 @@
+import pytest
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from application.exceptions import NotFoundError
+from domain.entities.entity import Id
+from domain.entities.user.role import RoleEnum
+from domain.entities.user.user import User
+from domain.entities.user.value_objects import FullName
+from infrastructure.sqlalchemy.models.role import RoleModel
+from infrastructure.sqlalchemy.repositories.review_repository import (
+    SQLAlchemyReviewRepository,
+)
+from infrastructure.sqlalchemy.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from infrastructure.sqlalchemy.role_registry import RoleRegistry
+from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
+from tests.integration.conftest import QueryPlanner
+
+
+class TestRoleRegistry:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        session_factory: sessionmaker[Session],
+        role_registry: RoleRegistry,
+    ):
+        self.session_factory = session_factory
+        self.role_registry = role_registry
+
+    def test_roles_are_resolved_in_memory(self):
+        assert self.role_registry.get(1) is RoleEnum.ADMIN.value
+        assert self.role_registry.get(2) is RoleEnum.USER.value
+
+    def test_unknown_role(self):
+        with pytest.raises(NotFoundError, match="Role"):
+            self.role_registry.get(42)
+
+    def test_seeded_roles_are_verified(self):
+        with self.session_factory() as session:
+            self.role_registry.verify(session)
+
+    def test_missing_role_fails_verification(self):
+        with self.session_factory() as session:
+            session.execute(
+                delete(RoleModel).where(
+                    RoleModel.id == RoleEnum.USER.value.id_safe.value
+                )
+            )
+
+            with pytest.raises(RuntimeError, match="role ids: 2"):
+                self.role_registry.verify(session)
+
+    def test_renamed_role_fails_verification(self):
+        with self.session_factory() as session:
+            session.execute(
+                update(RoleModel)
+                .where(RoleModel.id == 1)
+                .values(name="Модератор")
+            )
+            session.add(RoleModel(id=3, name="Гость", description="Гость"))
+
+            with pytest.raises(RuntimeError, match="role ids: 1, 3"):
+                self.role_registry.verify(session)
+
+
+class TestUserQueriesWithoutRoles:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        user_repository: SQLAlchemyUserRepository,
+        review_repository: SQLAlchemyReviewRepository,
+        transaction_manager: SQLAlchemyTransactionManager,
+        query_planner: QueryPlanner,
+    ):
+        self.user_repository = user_repository
+        self.review_repository = review_repository
+        self.query_planner = query_planner
+        with transaction_manager:
+            self.user_repository.save(
+                User(
+                    entity_id=Id(1),
+                    username="admin",
+                    full_name=FullName("Doe", "John", None),
+                    password_hash="hash",
+                    role=RoleEnum.ADMIN.value,
+                )
+            )
+
+    @pytest.mark.parametrize(
+        "repository,method,args",
+        [
+            ("user", "get_by_id", (1,)),
+            ("user", "get_by_username", ("admin",)),
+            ("review", "get_with_author_by_recipe_id", (1,)),
+            ("review", "get_page_by_recipe_id", (1, 2)),
+        ],
+    )
+    def test_roles_table_is_not_read(
+        self, repository: str, method: str, args: tuple
+    ):
+        query = getattr(getattr(self, f"{repository}_repository"), method)
+
+        plans = self.query_planner.explain_all(lambda: query(*args))
+
+        assert not any("Roles" in plan for plan in plans), plans
+
+    def test_user_gets_the_registered_role(self):
+        user = self.user_repository.get_by_username("admin")
+
+        assert user.role is RoleEnum.ADMIN.value
@@ -1,24 +1,49 @@
+from collections.abc import Callable
+from datetime import date, datetime
+from typing import Any
+
 import pytest
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import Session, sessionmaker
 
 from application.exceptions import NotFoundError
+from application.usecases.recipe.get_recipe_by_id_usecase import (
+    GetRecipeByIdUseCase,
+)
+from domain.clock import FixedClock, GlobalClock, SystemClock
 from domain.entities.entity import Id
 from domain.entities.recipe.image import RecipeImage
-from domain.entities.recipe.recipe import Recipe
+from domain.entities.recipe.recipe import ContentVersion, Recipe
 from domain.entities.recipe.value_objects import (
     RecipeContent,
     RecipeDetails,
     RecipeInstruction,
+    RecipeMarkup,
 )
+from domain.entities.review.review import Review
+from domain.entities.review.value_objects import RatingHistogram
 from domain.entities.user.role import RoleEnum
 from domain.entities.user.user import User
 from domain.entities.user.value_objects import FullName
+from domain.pagination import Cursor
+from domain.repositories.recipe_repository import (
+    RecipeFilter,
+    RecipeListSpec,
+    RecipeLoadProfile,
+    RecipeSort,
+)
+from infrastructure.sqlalchemy.models import RecipeModel
 from infrastructure.sqlalchemy.repositories.recipe_repository import (
     SQLAlchemyRecipeRepository,
 )
+from infrastructure.sqlalchemy.repositories.review_repository import (
+    SQLAlchemyReviewRepository,
+)
 from infrastructure.sqlalchemy.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
 from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
+from tests.integration.conftest import QueryPlanner, StatementCounter
 
 
 class Counter:
@@ -32,10 +57,14 @@ class TestSQLAlchemyRecipeRepository:
         recipe_repository: SQLAlchemyRecipeRepository,
         user_repository: SQLAlchemyUserRepository,
         transaction_manager: SQLAlchemyTransactionManager,
+        statement_counter: StatementCounter,
+        query_planner: QueryPlanner,
     ):
         self.recipe_repository = recipe_repository
         self.user_repository = user_repository
         self.transaction_manager = transaction_manager
+        self.statement_counter = statement_counter
+        self.query_planner = query_planner
 
     def _get_user(self) -> User:
         Counter.counter += 1
@@ -86,31 +115,776 @@ class TestSQLAlchemyRecipeRepository:
         assert len(retrieved_recipe.images) == len(recipe.images)
         assert retrieved_recipe.author_id == saved_user.id
 
+    def test_markup_follows_the_texts(self):
+        (recipe,) = self._save_recipes(1)
+        markup = RecipeMarkup("<p>d</p>", "<p>i</p>", "<p>s</p>")
+
+        with self.transaction_manager:
+            assert recipe.markup is None
+            recipe.markup = markup
+            self.recipe_repository.save(recipe)
+        with self.transaction_manager:
+            retrieved = self.recipe_repository.get_by_id(recipe.id_safe.value)
+            assert retrieved.markup == markup
+            # Changed texts drop the HTML until it is rendered again
+            retrieved.update(
+                retrieved.content, retrieved.details, retrieved.instruction
+            )
+            self.recipe_repository.save(retrieved)
+        with self.transaction_manager:
+            retrieved = self.recipe_repository.get_by_id(recipe.id_safe.value)
+
+        assert retrieved.markup is None
+
     def test_get_by_id_not_found(self):
         with self.transaction_manager:
             with pytest.raises(NotFoundError, match="Recipe"):
                 self.recipe_repository.get_by_id(999)
 
-    def test_get_all_success(self):
+    def test_get_by_id_full_profile_statements(self):
+        (recipe,) = self._save_recipes(1)
+
+        with self.transaction_manager, self.statement_counter as counter:
+            retrieved_recipe = self.recipe_repository.get_by_id(
+                recipe.id_safe.value, RecipeLoadProfile.FULL
+            )
+
+        assert counter.count == 1
+        assert len(retrieved_recipe.images) == 1
+
+    def test_get_by_id_ownership_check_profile_statements(self):
+        (recipe,) = self._save_recipes(1)
+
+        with self.transaction_manager, self.statement_counter as counter:
+            retrieved_recipe = self.recipe_repository.get_by_id(
+                recipe.id_safe.value, RecipeLoadProfile.OWNERSHIP_CHECK
+            )
+
+        assert counter.count == 1
+        assert retrieved_recipe.author_id == recipe.author_id
+        assert retrieved_recipe.images == []
+
+    def _save_detailed_recipe(
+        self, review_repository: SQLAlchemyReviewRepository
+    ) -> tuple[Recipe, list[User]]:
+        (recipe,) = self._save_recipes(1)
+        recipe.images.append(
+            RecipeImage(None, "second.jpg", "image/jpeg", recipe.id)
+        )
+        reviewers = [self._get_user() for _ in range(2)]
+        with self.transaction_manager:
+            recipe = self.recipe_repository.save(recipe)
+            for day, reviewer in enumerate(reviewers, start=1):
+                self.user_repository.save(reviewer)
+                review_repository.save(
+                    Review.create(
+                        recipe.id_safe.value,
+                        reviewer.id_safe.value,
+                        rating=4,
+                        text="Tasty",
+                        created_at=datetime(2025, 6, day),
+                    )
+                )
+        return recipe, reviewers
+
+    def test_get_detail(self, review_repository: SQLAlchemyReviewRepository):
+        recipe, reviewers = self._save_detailed_recipe(review_repository)
+
+        with self.transaction_manager, self.statement_counter as counter:
+            detail = self.recipe_repository.get_detail(
+                recipe.id_safe.value, viewer_id=reviewers[0].id_safe.value
+            )
+
+        assert counter.count == 1
+        assert detail.recipe.id == recipe.id
+        assert len(detail.recipe.images) == 2  # noqa: PLR2004
+        assert detail.author.id == recipe.author_id
+        assert detail.author.role == RoleEnum.USER.value
+        assert detail.reviewed_by_viewer is True
+        assert detail.rating_histogram.counts == (0, 0, 0, 0, 2, 0)
+
+    def test_get_detail_counts_ratings_in_one_index_range(
+        self, review_repository: SQLAlchemyReviewRepository
+    ):
+        recipe, reviewers = self._save_detailed_recipe(review_repository)
+
+        plan = self.query_planner.explain(
+            lambda: self.recipe_repository.get_detail(
+                recipe.id_safe.value, viewer_id=reviewers[0].id_safe.value
+            )
+        )
+
+        assert plan.count("ix_Reviews_recipe_created_id") == 1, plan
+
+    def test_get_detail_not_reviewed_by_viewer(
+        self, review_repository: SQLAlchemyReviewRepository
+    ):
+        recipe, _ = self._save_detailed_recipe(review_repository)
+
+        with self.transaction_manager:
+            anonymous = self.recipe_repository.get_detail(recipe.id_safe.value)
+            author = self.recipe_repository.get_detail(
+                recipe.id_safe.value, viewer_id=recipe.author_id.value
+            )
+
+        assert anonymous.reviewed_by_viewer is False
+        assert author.reviewed_by_viewer is False
+
+    def test_get_detail_without_reviews(self):
+        [recipe] = self._save_recipes(1)
+
+        with self.transaction_manager:
+            detail = self.recipe_repository.get_detail(recipe.id_safe.value)
+
+        assert len(detail.recipe.images) == 1
+        assert detail.rating_histogram == RatingHistogram.empty()
+
+    def test_get_detail_not_found(self):
+        with self.transaction_manager:
+            with pytest.raises(NotFoundError, match="Recipe"):
+                self.recipe_repository.get_detail(999)
+
+    def test_recipe_page_statements_on_one_session(
+        self, review_repository: SQLAlchemyReviewRepository
+    ):
+        recipe, _ = self._save_detailed_recipe(review_repository)
+        use_case = GetRecipeByIdUseCase(
+            self.recipe_repository, review_repository
+        )
+        sessions: list[Session] = []
+
+        def on_begin(session: Session, *args: Any) -> None:
+            sessions.append(session)
+
+        event.listen(Session, "after_begin", on_begin)
+        try:
+            with self.statement_counter as counter:
+                page = use_case.execute(recipe.id_safe.value)
+        finally:
+            event.remove(Session, "after_begin", on_begin)
+
+        # The recipe with its rating histogram, and the newest reviews
+        assert counter.count <= 2  # noqa: PLR2004
+        assert len(sessions) == 1
+        assert len(page.reviews) == 2  # noqa: PLR2004
+        assert page.rating_histogram
+        assert page.rating_histogram.count(4) == 2  # noqa: PLR2004
+        assert page.next_reviews_cursor is None
+        assert page.author.id == recipe.author_id.value
+
+    def _at(self, moment: datetime, action: Any) -> Any:
+        GlobalClock.set_clock(FixedClock(moment))
+        try:
+            return action()
+        finally:
+            GlobalClock.set_clock(SystemClock())
+
+    def _version(self, recipe_id: int) -> ContentVersion:
+        with self.transaction_manager:
+            return self.recipe_repository.get_version(recipe_id)
+
+    def _catalog_updated_at(self) -> datetime | None:
+        with self.transaction_manager:
+            return self.recipe_repository.get_catalog_updated_at()
+
+    def test_get_version_follows_recipe_and_reviews(
+        self, review_repository: SQLAlchemyReviewRepository
+    ):
+        (recipe,) = self._at(
+            datetime(2025, 6, 1), lambda: self._save_recipes(1)
+        )
+        recipe_id = recipe.id_safe.value
+        created = self._version(recipe_id)
+
+        def add_review() -> None:
+            user = self._get_user()
+            with self.transaction_manager:
+                self.user_repository.save(user)
+                review_repository.save(
+                    Review.create(
+                        recipe_id,
+                        user.id_safe.value,
+                        4,
+                        "Tasty",
+                        datetime.now(),
+                    )
+                )
+
+        self._at(datetime(2025, 6, 2), add_review)
+        reviewed = self._version(recipe_id)
+
+        def update_recipe() -> None:
+            with self.transaction_manager:
+                recipe.update(
+                    RecipeContent("New title", "New description"),
+                    recipe.details,
+                    recipe.instruction,
+                )
+                self.recipe_repository.save(recipe)
+
+        self._at(datetime(2025, 6, 3), update_recipe)
+        updated = self._version(recipe_id)
+
+        assert created.row_count == 1
+        assert reviewed.row_count == 2  # noqa: PLR2004
+        assert reviewed.last_modified
+        assert reviewed.last_modified.date() == date(2025, 6, 2)
+        assert updated.row_count == 2  # noqa: PLR2004
+        assert updated.last_modified
+        assert updated.last_modified.date() == date(2025, 6, 3)
+
+    def test_get_version_not_found(self):
+        with self.transaction_manager:
+            with pytest.raises(NotFoundError, match="Recipe"):
+                self.recipe_repository.get_version(999)
+
+    def test_get_catalog_updated_at(
+        self, review_repository: SQLAlchemyReviewRepository
+    ):
+        empty = self._catalog_updated_at()
+        (recipe,) = self._at(
+            datetime(2025, 6, 1), lambda: self._save_recipes(1)
+        )
+        recipe_id = recipe.id_safe.value
+
+        def add_review() -> None:
+            user = self._get_user()
+            with self.transaction_manager:
+                self.user_repository.save(user)
+                review_repository.save(
+                    Review.create(
+                        recipe_id,
+                        user.id_safe.value,
+                        4,
+                        "Tasty",
+                        datetime.now(),
+                    )
+                )
+                self.recipe_repository.adjust_rating(recipe_id, 4, 1)
+
+        self._at(datetime(2025, 6, 2), add_review)
+        reviewed = self._catalog_updated_at()
+
+        assert empty is None
+        # Writing a review moves the recipe's counters, which dates it
+        assert reviewed
+        assert reviewed.date() == date(2025, 6, 2)
+
+    def test_get_summaries_by_ids(self):
+        recipes = self._save_recipes(3)
+        wanted = [recipes[2].id_safe.value, recipes[0].id_safe.value, 999]
+
+        with self.transaction_manager, self.statement_counter as counter:
+            summaries = self.recipe_repository.get_summaries_by_ids(wanted)
+            empty = self.recipe_repository.get_summaries_by_ids([])
+
+        assert counter.count == 1
+        assert {s.recipe_id.value for s in summaries} == set(wanted[:2])
+        assert all(s.cover for s in summaries)
+        assert empty == []
+
+    def test_get_summary_page_statements(self):
+        self._save_recipes(3)
+
+        with self.transaction_manager, self.statement_counter as counter:
+            page = self.recipe_repository.get_summary_page(limit=10)
+
+        assert counter.count == 1
+        assert all(summary.cover for summary in page.items)
+
+    def _save_recipes(self, count: int) -> list[Recipe]:
         user = self._get_user()
         with self.transaction_manager:
             saved_user = self.user_repository.save(user)
-            recipe1 = self._get_recipe(saved_user.id_safe.value)
-            recipe2 = self._get_recipe(saved_user.id_safe.value)
-            self.recipe_repository.save(recipe1)
-            self.recipe_repository.save(recipe2)
+            return [
+                self.recipe_repository.save(
+                    self._get_recipe(saved_user.id_safe.value)
+                )
+                for _ in range(count)
+            ]
+
+    def test_get_summary_page_walks_forward_and_back(self):
+        recipes = self._save_recipes(5)
+        newest_first = [r.id_safe.value for r in reversed(recipes)]
 
         with self.transaction_manager:
-            recipes = self.recipe_repository.get_all(page=1, per_page=10)
+            first = self.recipe_repository.get_summary_page(limit=2)
+            second = self.recipe_repository.get_summary_page(
+                limit=2, after=first.next_cursor
+            )
+            third = self.recipe_repository.get_summary_page(
+                limit=2, after=second.next_cursor
+            )
+            back = self.recipe_repository.get_summary_page(
+                limit=2, before=second.previous_cursor
+            )
+
+        pages = [first, second, third]
+        walked = [r.recipe_id.value for page in pages for r in page.items]
+        assert walked == newest_first
+        assert [p.has_next for p in pages] == [True, True, False]
+        assert [p.has_previous for p in pages] == [False, True, True]
+        assert [r.recipe_id.value for r in back.items] == newest_first[:2]
+        assert not back.has_previous
+        assert back.has_next
 
-        assert len(recipes) == 2
-        assert all(isinstance(r, Recipe) for r in recipes)
+    def test_get_by_author_walks_newest_first(self):
+        recipes = self._save_recipes(3)
+        self._save_recipes(2)
+        author_id = recipes[0].author_id.value
 
-    def test_get_all_empty(self):
         with self.transaction_manager:
-            recipes = self.recipe_repository.get_all(page=1, per_page=10)
+            first = self.recipe_repository.get_by_author(author_id, limit=2)
+            second = self.recipe_repository.get_by_author(
+                author_id, limit=2, after=first.next_cursor
+            )
+
+        walked = [r.recipe_id.value for r in [*first.items, *second.items]]
+        assert walked == [r.id_safe.value for r in reversed(recipes)]
+        assert [first.has_next, second.has_next] == [True, False]
+        assert first.items[0].cover is not None
 
-        assert isinstance(recipes, list)
+    @pytest.mark.parametrize("after", [False, True])
+    def test_get_by_author_is_an_index_scan(self, after: bool):
+        (recipe, *_) = self._save_recipes(3)
+        author_id = recipe.author_id.value
+        with self.transaction_manager:
+            cursor = self.recipe_repository.get_by_author(
+                author_id, limit=1
+            ).next_cursor
+
+        plan = self.query_planner.explain(
+            lambda: self.recipe_repository.get_by_author(
+                author_id, limit=1, after=cursor if after else None
+            )
+        )
+
+        assert "Recipes USING INDEX ix_Recipes_author_created_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_get_summary_page_is_stable_under_inserts(self):
+        recipes = self._save_recipes(3)
+
+        with self.transaction_manager:
+            first = self.recipe_repository.get_summary_page(limit=2)
+        self._save_recipes(1)
+        with self.transaction_manager:
+            second = self.recipe_repository.get_summary_page(
+                limit=2, after=first.next_cursor
+            )
+
+        assert [r.recipe_id.value for r in second.items] == [
+            recipes[0].id_safe.value
+        ]
+
+    def test_get_summary_page_breaks_timestamp_ties_by_id(self):
+        GlobalClock.set_clock(FixedClock(datetime(2025, 6, 16, 0, 0)))
+        try:
+            recipes = self._save_recipes(3)
+        finally:
+            GlobalClock.set_clock(SystemClock())
+
+        with self.transaction_manager:
+            first = self.recipe_repository.get_summary_page(limit=2)
+            second = self.recipe_repository.get_summary_page(
+                limit=2, after=first.next_cursor
+            )
+
+        walked = [r.recipe_id.value for r in [*first.items, *second.items]]
+        assert walked == [r.id_safe.value for r in reversed(recipes)]
+
+    def test_server_default_timestamps_walk_without_repeats(
+        self, session_factory: sessionmaker[Session]
+    ):
+        # Rows inserted past the ORM get their timestamps from the
+        # database, in the format the cursors are bound in
+        with self.transaction_manager:
+            author_id = self.user_repository.save(self._get_user()).id_safe
+        with session_factory() as session:
+            for recipe_id in range(1, 6):
+                session.execute(
+                    text(
+                        'INSERT INTO "Recipes" (id, title, description, '
+                        "preparation_time, servings, ingredients, steps, "
+                        "author_id) VALUES (:id, 'Борщ', 'Суп', 10, 2, "
+                        "'свёкла', 'Варить', :author_id)"
+                    ),
+                    {"id": recipe_id, "author_id": author_id.value},
+                )
+            session.commit()
+
+        def walk(page: Callable[[Cursor | None], Any]) -> list[int]:
+            walked: list[int] = []
+            cursor = None
+            for _ in range(5):
+                result = page(cursor)
+                walked += [r.recipe_id.value for r in result.items]
+                if not (cursor := result.next_cursor):
+                    break
+            return walked
+
+        with self.transaction_manager:
+            walks = [
+                walk(
+                    lambda after: self.recipe_repository.get_summary_page(
+                        limit=2, after=after
+                    )
+                ),
+                walk(
+                    lambda after: self.recipe_repository.get_by_author(
+                        author_id.value, limit=2, after=after
+                    )
+                ),
+            ]
+
+        assert walks == [[5, 4, 3, 2, 1], [5, 4, 3, 2, 1]]
+
+    def test_get_summary_page_by_offset(self):
+        recipes = self._save_recipes(3)
+
+        with self.transaction_manager:
+            page = self.recipe_repository.get_summary_page(limit=2, offset=2)
+
+        assert [r.recipe_id.value for r in page.items] == [
+            recipes[0].id_safe.value
+        ]
+        assert page.has_previous
+        assert not page.has_next
+
+    def test_get_summary_page_projects_first_image(self):
+        user = self._get_user()
+        with self.transaction_manager:
+            saved_user = self.user_repository.save(user)
+            recipe = self._get_recipe(saved_user.id_safe.value)
+            recipe.images.append(
+                RecipeImage(
+                    entity_id=None,
+                    filename="second.jpg",
+                    mime_type="image/jpeg",
+                    recipe_id=recipe.id_safe,
+                )
+            )
+            saved_recipe = self.recipe_repository.save(recipe)
+            without_images = self._get_recipe(saved_user.id_safe.value)
+            without_images.images = []
+            self.recipe_repository.save(without_images)
+            self.recipe_repository.adjust_rating(
+                saved_recipe.id_safe.value, rating_delta=9, count_delta=2
+            )
+
+        with self.transaction_manager:
+            page = self.recipe_repository.get_summary_page(limit=10)
+
+        bare, summary = page.items
+        assert bare.cover is None
+        assert summary.recipe_id == saved_recipe.id
+        assert summary.title == recipe.content.title
+        assert summary.details == recipe.details
+        assert summary.author_id == saved_user.id
+        assert summary.rating.average_rating == 4.5  # noqa: PLR2004
+        assert summary.cover is not None
+        assert summary.cover.filename == "image.jpg"
+
+    def _save_varied_recipes(self) -> list[int]:
+        # (preparation_time, servings, rating_sum, review_count)
+        varieties = [
+            (45, 4, 9, 2),
+            (15, 2, 3, 1),
+            (30, 4, 0, 0),
+            (15, 4, 12, 3),
+            (60, 2, 5, 1),
+        ]
+        user = self._get_user()
+        ids = []
+        with self.transaction_manager:
+            saved_user = self.user_repository.save(user)
+            for prep, servings, rating_sum, review_count in varieties:
+                recipe = self._get_recipe(saved_user.id_safe.value)
+                recipe.details = RecipeDetails(prep, servings)
+                recipe_id = self.recipe_repository.save(recipe).id_safe.value
+                self.recipe_repository.adjust_rating(
+                    recipe_id, rating_sum, review_count
+                )
+                ids.append(recipe_id)
+        return ids
+
+    @pytest.mark.parametrize(
+        "sort,order",
+        [
+            (RecipeSort.NEWEST, [4, 3, 2, 1, 0]),
+            (RecipeSort.RATING, [4, 0, 3, 1, 2]),  # 5, 4.5, 4, 3, 0
+            (RecipeSort.REVIEW_COUNT, [3, 0, 4, 1, 2]),
+            (RecipeSort.PREPARATION_TIME, [1, 3, 2, 0, 4]),
+        ],
+    )
+    def test_get_summary_page_sorts_and_walks(
+        self, sort: RecipeSort, order: list[int]
+    ):
+        ids = self._save_varied_recipes()
+        expected = [ids[i] for i in order]
+        spec = RecipeListSpec(sort=sort)
+
+        with self.transaction_manager:
+            first = self.recipe_repository.get_summary_page(2, spec=spec)
+            second = self.recipe_repository.get_summary_page(
+                2, after=first.next_cursor, spec=spec
+            )
+            third = self.recipe_repository.get_summary_page(
+                2, after=second.next_cursor, spec=spec
+            )
+            back = self.recipe_repository.get_summary_page(
+                2, before=third.previous_cursor, spec=spec
+            )
+
+        pages = [first, second, third]
+        walked = [r.recipe_id.value for page in pages for r in page.items]
+        assert walked == expected
+        assert not third.has_next
+        assert [r.recipe_id.value for r in back.items] == expected[2:4]
+        assert back.has_previous
+
+    @pytest.mark.parametrize(
+        "filters,order",
+        [
+            (RecipeFilter(max_preparation_time=30), [3, 2, 1]),
+            (RecipeFilter(servings=2), [4, 1]),
+            (RecipeFilter(max_preparation_time=30, servings=4), [3, 2]),
+        ],
+    )
+    def test_get_summary_page_filters(
+        self, filters: RecipeFilter, order: list[int]
+    ):
+        ids = self._save_varied_recipes()
+
+        with self.transaction_manager:
+            page = self.recipe_repository.get_summary_page(
+                10, spec=RecipeListSpec(filters=filters)
+            )
+
+        assert [r.recipe_id.value for r in page.items] == [
+            ids[i] for i in order
+        ]
+
+    @pytest.mark.parametrize("sort", list(RecipeSort))
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            RecipeFilter(),
+            RecipeFilter(max_preparation_time=30),
+            RecipeFilter(servings=4),
+            RecipeFilter(max_preparation_time=30, servings=4),
+        ],
+    )
+    @pytest.mark.parametrize("direction", ["first", "after", "before"])
+    def test_get_summary_page_is_an_index_scan(
+        self, sort: RecipeSort, filters: RecipeFilter, direction: str
+    ):
+        self._save_varied_recipes()
+        spec = RecipeListSpec(sort=sort, filters=filters)
+        with self.transaction_manager:
+            cursor = self.recipe_repository.get_summary_page(
+                1, spec=RecipeListSpec(sort=sort)
+            ).next_cursor
+
+        plan = self.query_planner.explain(
+            lambda: self.recipe_repository.get_summary_page(
+                2,
+                after=cursor if direction == "after" else None,
+                before=cursor if direction == "before" else None,
+                spec=spec,
+            )
+        )
+
+        index = {
+            RecipeSort.NEWEST: "ix_Recipes_created_id",
+            RecipeSort.RATING: "ix_Recipes_rating_id",
+            RecipeSort.REVIEW_COUNT: "ix_Recipes_review_count_id",
+            RecipeSort.PREPARATION_TIME: "ix_Recipes_preparation_time_id",
+        }[sort]
+        assert f"Recipes USING INDEX {index}" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def _save_searchable_recipe(
+        self, title: str, description: str, ingredients: str
+    ) -> Recipe:
+        user = self._get_user()
+        with self.transaction_manager:
+            saved_user = self.user_repository.save(user)
+            recipe = self._get_recipe(saved_user.id_safe.value)
+            recipe.content = RecipeContent(title, description)
+            recipe.instruction = RecipeInstruction(ingredients, "Сварить")
+            return self.recipe_repository.save(recipe)
+
+    def _search(self, query: str, limit: int = 10) -> list[int]:
+        with self.transaction_manager:
+            return [
+                r.recipe_id.value
+                for r in self.recipe_repository.search(query, limit)
+            ]
+
+    def test_search_matches_word_forms(self):
+        borscht = self._save_searchable_recipe(
+            "Борщ", "Наваристый суп", "Свёкла, картофель, капуста"
+        )
+        self._save_searchable_recipe("Оладьи", "Завтрак", "Мука, молоко")
+
+        assert self._search("картофелем") == [borscht.id_safe.value]
+        assert self._search("свекла капусту") == [borscht.id_safe.value]
+        assert self._search("борщи") == [borscht.id_safe.value]
+
+    def test_search_requires_every_word(self):
+        self._save_searchable_recipe("Борщ", "Суп", "Свёкла")
+
+        assert self._search("борщ молоко") == []
+
+    def test_search_ranks_title_matches_first(self):
+        in_body = self._save_searchable_recipe(
+            "Овощное жаркое", "Можно добавить грибы", "Кабачок, морковь"
+        )
+        in_title = self._save_searchable_recipe(
+            "Жареные грибы", "Шампиньоны и лук", "Шампиньоны, лук"
+        )
+
+        assert self._search("грибы") == [
+            in_title.id_safe.value,
+            in_body.id_safe.value,
+        ]
+
+    def test_search_limit_and_offset(self):
+        recipes = [
+            self._save_searchable_recipe(f"Суп {i}", "Суп", "Вода")
+            for i in range(3)
+        ]
+
+        with self.transaction_manager:
+            page = self.recipe_repository.search("суп", limit=2, offset=2)
+
+        assert len(self._search("суп", limit=2)) == 2  # noqa: PLR2004
+        assert len(page) == 1
+        assert {r.recipe_id for r in page} <= {r.id for r in recipes}
+
+    def test_search_returns_summaries(self):
+        saved = self._save_searchable_recipe("Борщ", "Суп", "Свёкла")
+
+        with self.transaction_manager:
+            (summary,) = self.recipe_repository.search("борщ", 10)
+
+        assert summary.recipe_id == saved.id
+        assert summary.title == "Борщ"
+        assert summary.cover is not None
+
+    def test_search_follows_updates(self):
+        saved = self._save_searchable_recipe("Борщ", "Суп", "Свёкла")
+        saved.content = RecipeContent("Щи", "Суп")
+        saved.instruction = RecipeInstruction("Капуста", "Сварить")
+
+        with self.transaction_manager:
+            self.recipe_repository.save(saved)
+
+        assert self._search("борщ") == []
+        assert self._search("капуста") == [saved.id_safe.value]
+
+    def test_search_forgets_removed_recipes(self):
+        saved = self._save_searchable_recipe("Борщ", "Суп", "Свёкла")
+
+        with self.transaction_manager:
+            self.recipe_repository.remove(saved)
+
+        assert self._search("борщ") == []
+
+    @pytest.mark.parametrize("query", ["", "  ", "?!", '"борщ" *', "борщ^("])
+    def test_search_without_words_or_with_syntax(self, query: str):
+        saved = self._save_searchable_recipe("Борщ", "Суп", "Свёкла")
+
+        expected = [saved.id_safe.value] if "борщ" in query else []
+        assert self._search(query) == expected
+
+    def _find(self, *ingredients: str) -> list[tuple[int, int]]:
+        with self.transaction_manager:
+            return [
+                (match.summary.recipe_id.value, match.matched_count)
+                for match in self.recipe_repository.find_by_ingredients(
+                    ingredients, limit=10
+                )
+            ]
+
+    def test_find_by_ingredients_ranks_by_matched_count(self):
+        omelette = self._save_searchable_recipe(
+            "Омлет", "Завтрак", "Яйца — 3 шт., молоко 100 мл, соль по вкусу"
+        )
+        pancakes = self._save_searchable_recipe(
+            "Блины", "Завтрак", "Мука 2 стакана, молоко, яйцо"
+        )
+        self._save_searchable_recipe("Салат", "Обед", "Огурцы, помидоры")
+
+        assert self._find("яйцо", "молоко", "мука") == [
+            (pancakes.id_safe.value, 3),
+            (omelette.id_safe.value, 2),
+        ]
+
+    def test_find_by_ingredients_requires_every_word_of_an_ingredient(self):
+        saved = self._save_searchable_recipe(
+            "Картофельное пюре", "Гарнир", "Картофель, сливочное масло"
+        )
+
+        assert self._find("сливочное масло") == [(saved.id_safe.value, 1)]
+        assert self._find("оливковое масло") == []
+        assert self._find("масло", "масла") == [(saved.id_safe.value, 1)]
+
+    def test_find_by_ingredients_without_tokens(self):
+        self._save_searchable_recipe("Борщ", "Суп", "Свёкла 1 кг")
+
+        assert self._find("", "1 кг") == []
+
+    def test_find_by_ingredients_limit_and_offset(self):
+        recipes = [
+            self._save_searchable_recipe(f"Суп {i}", "Суп", "Вода, соль")
+            for i in range(3)
+        ]
+
+        with self.transaction_manager:
+            page = self.recipe_repository.find_by_ingredients(
+                ["вода"], limit=2, offset=2
+            )
+
+        assert len(page) == 1
+        assert page[0].summary.recipe_id == recipes[0].id
+
+    def test_find_by_ingredients_follows_updates(self):
+        saved = self._save_searchable_recipe("Борщ", "Суп", "Свёкла")
+        saved.instruction = RecipeInstruction("Капуста", "Сварить")
+
+        with self.transaction_manager:
+            self.recipe_repository.save(saved)
+
+        assert self._find("свёкла") == []
+        assert self._find("капуста") == [(saved.id_safe.value, 1)]
+
+    def test_find_by_ingredients_forgets_removed_recipes(self):
+        saved = self._save_searchable_recipe("Борщ", "Суп", "Свёкла")
+
+        with self.transaction_manager:
+            self.recipe_repository.remove(saved)
+
+        assert self._find("свёкла") == []
+
+    def test_get_summary_page_empty(self):
+        with self.transaction_manager:
+            page = self.recipe_repository.get_summary_page(limit=2)
+
+        assert page.items == []
+        assert not page.has_next
+        assert not page.has_previous
+
+    def test_count(self):
+        self._save_recipes(3)
+
+        with self.transaction_manager:
+            assert self.recipe_repository.count() == 3  # noqa: PLR2004
+
+    def test_count_empty(self):
+        with self.transaction_manager:
+            assert self.recipe_repository.count() == 0
 
     def test_save_recipe_success(self):
         user = self._get_user()
@@ -145,3 +919,72 @@ class TestSQLAlchemyRecipeRepository:
         with self.transaction_manager:
             with pytest.raises(NotFoundError, match="Recipe"):
                 self.recipe_repository.get_by_id(saved_recipe.id_safe.value)
+
+    def test_adjust_rating_success(self):
+        user = self._get_user()
+        with self.transaction_manager:
+            saved_user = self.user_repository.save(user)
+            recipe = self._get_recipe(saved_user.id_safe.value)
+            saved_recipe = self.recipe_repository.save(recipe)
+
+        with self.transaction_manager:
+            self.recipe_repository.adjust_rating(
+                saved_recipe.id_safe.value, rating_delta=5, count_delta=1
+            )
+            self.recipe_repository.adjust_rating(
+                saved_recipe.id_safe.value, rating_delta=2, count_delta=1
+            )
+
+        with self.transaction_manager:
+            retrieved_recipe = self.recipe_repository.get_by_id(
+                saved_recipe.id_safe.value
+            )
+
+        assert retrieved_recipe.rating.rating_sum == 7  # noqa: PLR2004
+        assert retrieved_recipe.rating.review_count == 2  # noqa: PLR2004
+        assert retrieved_recipe.rating.average_rating == 3.5  # noqa: PLR2004
+
+    def test_adjust_rating_maintains_sortable_average(self):
+        (recipe,) = self._save_recipes(1)
+        recipe_id = recipe.id_safe.value
+        average = select(RecipeModel.average_rating).where(
+            RecipeModel.id == recipe_id
+        )
+
+        with self.transaction_manager.get_session() as session:
+            self.recipe_repository.adjust_rating(recipe_id, 5, 1)
+            self.recipe_repository.adjust_rating(recipe_id, 2, 1)
+            two_reviews = session.scalar(average)
+            self.recipe_repository.adjust_rating(recipe_id, -7, -2)
+            no_reviews = session.scalar(average)
+
+        assert two_reviews == 3.5  # noqa: PLR2004
+        assert no_reviews == 0
+
+    def test_save_does_not_overwrite_rating(self):
+        user = self._get_user()
+        with self.transaction_manager:
+            saved_user = self.user_repository.save(user)
+            recipe = self._get_recipe(saved_user.id_safe.value)
+            saved_recipe = self.recipe_repository.save(recipe)
+            self.recipe_repository.adjust_rating(
+                saved_recipe.id_safe.value, rating_delta=4, count_delta=1
+            )
+
+        with self.transaction_manager:
+            self.recipe_repository.save(saved_recipe)
+
+        with self.transaction_manager:
+            retrieved_recipe = self.recipe_repository.get_by_id(
+                saved_recipe.id_safe.value
+            )
+
+        assert retrieved_recipe.rating.rating_sum == 4  # noqa: PLR2004
+        assert retrieved_recipe.rating.review_count == 1
+
+    def test_adjust_rating_not_found(self):
+        with self.transaction_manager:
+            with pytest.raises(NotFoundError, match="Recipe"):
+                self.recipe_repository.adjust_rating(
+                    999, rating_delta=5, count_delta=1
+                )
@@ -1,8 +1,12 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
-from application.exceptions import NotFoundError
+from application.exceptions import (
+    AlreadyReviewedError,
+    NotFoundError,
+    ReviewChangedError,
+)
 from domain.entities.entity import Id
 from domain.entities.review.review import Review
 from domain.entities.user.role import RoleEnum
@@ -15,6 +19,7 @@ from infrastructure.sqlalchemy.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
 from infrastructure.sqlalchemy.transactions import SQLAlchemyTransactionManager
+from tests.integration.conftest import QueryPlanner
 
 
 class Counter:
@@ -28,10 +33,12 @@ class TestSQLAlchemyReviewRepository:
         review_repository: SQLAlchemyReviewRepository,
         user_repository: SQLAlchemyUserRepository,
         transaction_manager: SQLAlchemyTransactionManager,
+        query_planner: QueryPlanner,
     ):
         self.review_repository = review_repository
         self.user_repository = user_repository
         self.transaction_manager = transaction_manager
+        self.query_planner = query_planner
 
     def _get_user(self) -> User:
         Counter.counter += 1
@@ -43,13 +50,19 @@ class TestSQLAlchemyReviewRepository:
             role=RoleEnum.USER.value,
         )
 
-    def _get_review(self, user_id: int, recipe_id: int) -> Review:
+    def _save_reviewer(self) -> int:
+        # A user reviews a recipe once, every review needs its own author
+        return self.user_repository.save(self._get_user()).id_safe.value
+
+    def _get_review(
+        self, user_id: int, recipe_id: int, rating: int = 5
+    ) -> Review:
         Counter.counter += 1
         return Review(
             entity_id=Id(Counter.counter),
             recipe_id=Id(recipe_id),
             user_id=Id(user_id),
-            rating=5,
+            rating=rating,
             text="Great recipe!",
             created_at=datetime.now(),
         )
@@ -76,12 +89,10 @@ class TestSQLAlchemyReviewRepository:
                 self.review_repository.get_by_id(999)
 
     def test_get_by_recipe_id_success(self):
-        user = self._get_user()
         recipe_id = 1
         with self.transaction_manager:
-            saved_user = self.user_repository.save(user)
-            review1 = self._get_review(saved_user.id_safe.value, recipe_id)
-            review2 = self._get_review(saved_user.id_safe.value, recipe_id)
+            review1 = self._get_review(self._save_reviewer(), recipe_id)
+            review2 = self._get_review(self._save_reviewer(), recipe_id)
             self.review_repository.save(review1)
             self.review_repository.save(review2)
 
@@ -114,28 +125,159 @@ class TestSQLAlchemyReviewRepository:
         assert authored_reviews[0].author.username == user.username
         assert authored_reviews[0].review.recipe_id.value == recipe_id
 
-    def test_exists_for_user_and_recipe_true(self):
-        user = self._get_user()
-        recipe_id = 1
+    def _save_reviews(self, recipe_id: int, count: int) -> list[Review]:
+        # Two reviews share every timestamp, so the id breaks the ties
+        start = datetime(2025, 6, 1)
+        reviews = []
         with self.transaction_manager:
-            saved_user = self.user_repository.save(user)
-            review = self._get_review(saved_user.id_safe.value, recipe_id)
-            self.review_repository.save(review)
+            for i in range(count):
+                user = self.user_repository.save(self._get_user())
+                review = self._get_review(user.id_safe.value, recipe_id)
+                review.created_at = start + timedelta(hours=i // 2)
+                reviews.append(self.review_repository.save(review))
+        return reviews
+
+    def test_get_with_author_by_recipe_id_newest_first(self):
+        reviews = self._save_reviews(recipe_id=1, count=3)
 
         with self.transaction_manager:
-            exists = self.review_repository.exists_for_user_and_recipe(
-                saved_user.id_safe.value, recipe_id
+            authored_reviews = (
+                self.review_repository.get_with_author_by_recipe_id(1)
             )
 
-        assert exists is True
+        assert [r.review.id for r in authored_reviews] == [
+            r.id for r in reversed(reviews)
+        ]
+
+    def test_get_page_by_recipe_id_walks_newest_first(self):
+        reviews = self._save_reviews(recipe_id=1, count=5)
+        self._save_reviews(recipe_id=2, count=2)
+
+        pages = []
+        cursor = None
+        with self.transaction_manager:
+            while True:
+                page = self.review_repository.get_page_by_recipe_id(
+                    1, limit=2, after=cursor
+                )
+                pages.append([r.review.id for r in page.items])
+                if not page.has_next:
+                    break
+                cursor = page.next_cursor
+
+        newest_first = [r.id for r in reversed(reviews)]
+        assert pages == [newest_first[:2], newest_first[2:4], newest_first[4:]]
+        assert not page.has_previous
+
+    def test_get_page_by_recipe_id_exact_fit(self):
+        self._save_reviews(recipe_id=1, count=2)
 
-    def test_exists_for_user_and_recipe_false(self):
         with self.transaction_manager:
-            exists = self.review_repository.exists_for_user_and_recipe(
-                999, 999
+            page = self.review_repository.get_page_by_recipe_id(1, limit=2)
+
+        assert len(page.items) == 2  # noqa: PLR2004
+        assert page.next_cursor is None
+
+    def test_get_page_by_recipe_id_with_authors(self):
+        (review,) = self._save_reviews(recipe_id=1, count=1)
+
+        with self.transaction_manager:
+            page = self.review_repository.get_page_by_recipe_id(1, limit=10)
+
+        (authored,) = page.items
+        assert authored.author.id == review.user_id
+        assert authored.author.role == RoleEnum.USER.value
+
+    @pytest.mark.parametrize("after", [False, True])
+    def test_get_page_by_recipe_id_is_an_index_scan(self, after: bool):
+        self._save_reviews(recipe_id=1, count=3)
+        with self.transaction_manager:
+            cursor = self.review_repository.get_page_by_recipe_id(
+                1, limit=1
+            ).next_cursor
+
+        plan = self.query_planner.explain(
+            lambda: self.review_repository.get_page_by_recipe_id(
+                1, limit=1, after=cursor if after else None
+            )
+        )
+
+        assert "Reviews USING INDEX ix_Reviews_recipe_created_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_get_by_user_walks_newest_first(self):
+        start = datetime(2025, 6, 1)
+        with self.transaction_manager:
+            user_id = self._save_reviewer()
+            reviews = []
+            for recipe_id in range(1, 6):
+                review = self._get_review(user_id, recipe_id)
+                # Two reviews share every timestamp, the id breaks the ties
+                review.created_at = start + timedelta(hours=recipe_id // 2)
+                reviews.append(self.review_repository.save(review))
+            self.review_repository.save(
+                self._get_review(self._save_reviewer(), 1)
+            )
+
+        pages = []
+        cursor = None
+        with self.transaction_manager:
+            while True:
+                page = self.review_repository.get_by_user(
+                    user_id, limit=2, after=cursor
+                )
+                pages.append([review.id for review in page.items])
+                if not page.has_next:
+                    break
+                cursor = page.next_cursor
+
+        newest_first = [review.id for review in reversed(reviews)]
+        assert pages == [newest_first[:2], newest_first[2:4], newest_first[4:]]
+
+    @pytest.mark.parametrize("after", [False, True])
+    def test_get_by_user_is_an_index_scan(self, after: bool):
+        with self.transaction_manager:
+            user_id = self._save_reviewer()
+            for recipe_id in range(1, 4):
+                self.review_repository.save(
+                    self._get_review(user_id, recipe_id)
+                )
+            cursor = self.review_repository.get_by_user(
+                user_id, limit=1
+            ).next_cursor
+
+        plan = self.query_planner.explain(
+            lambda: self.review_repository.get_by_user(
+                user_id, limit=1, after=cursor if after else None
             )
+        )
+
+        assert "Reviews USING INDEX ix_Reviews_user_created_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+    def test_second_review_of_recipe_raises_already_reviewed(self):
+        with self.transaction_manager:
+            user_id = self._save_reviewer()
+            first = self.review_repository.save(self._get_review(user_id, 1))
+
+        with (
+            pytest.raises(AlreadyReviewedError),
+            self.transaction_manager,
+        ):
+            self.review_repository.save(self._get_review(user_id, 1, 2))
 
-        assert exists is False
+        with self.transaction_manager:
+            reviews = self.review_repository.get_by_recipe_id(1)
+        assert [review.id for review in reviews] == [first.id]
+
+    def test_same_user_reviews_other_recipes(self):
+        with self.transaction_manager:
+            user_id = self._save_reviewer()
+            self.review_repository.save(self._get_review(user_id, 1))
+            self.review_repository.save(self._get_review(user_id, 2))
+
+        with self.transaction_manager:
+            assert len(self.review_repository.get_by_recipe_id(2)) == 1
 
     def test_save_review_success(self):
         user = self._get_user()
@@ -154,3 +296,83 @@ class TestSQLAlchemyReviewRepository:
             assert retrieved_review.rating == review.rating
             assert retrieved_review.text == review.text
             assert retrieved_review.user_id == saved_user.id
+
+    def test_save_review_with_html(self):
+        user = self._get_user()
+        with self.transaction_manager:
+            saved_user = self.user_repository.save(user)
+            review = self._get_review(saved_user.id_safe.value, recipe_id=1)
+            review.text_html = "<p>Rendered</p>"
+            saved_review = self.review_repository.save(review)
+
+        with self.transaction_manager:
+            retrieved_review = self.review_repository.get_by_id(
+                saved_review.id_safe.value
+            )
+
+        assert retrieved_review.text_html == "<p>Rendered</p>"
+
+    def test_update_review(self):
+        with self.transaction_manager:
+            review = self.review_repository.save(
+                self._get_review(self._save_reviewer(), 1, rating=4)
+            )
+
+        review.update(2, "Too salty")
+        review.text_html = "<p>Too salty</p>"
+        with self.transaction_manager:
+            self.review_repository.update(review, previous_rating=4)
+
+        with self.transaction_manager:
+            stored = self.review_repository.get_by_id(review.id_safe.value)
+        assert (stored.rating, stored.text, stored.text_html) == (
+            2,
+            "Too salty",
+            "<p>Too salty</p>",
+        )
+
+    def test_update_review_with_stale_rating_raises_changed(self):
+        with self.transaction_manager:
+            review = self.review_repository.save(
+                self._get_review(self._save_reviewer(), 1, rating=4)
+            )
+
+        # Another request has already moved the rating from 3
+        review.update(2, "Too salty")
+        with (
+            pytest.raises(ReviewChangedError),
+            self.transaction_manager,
+        ):
+            self.review_repository.update(review, previous_rating=3)
+
+        with self.transaction_manager:
+            stored = self.review_repository.get_by_id(review.id_safe.value)
+        assert (stored.rating, stored.text) == (4, "Great recipe!")
+
+    def test_remove_review(self):
+        with self.transaction_manager:
+            user_id = self._save_reviewer()
+            kept = self.review_repository.save(self._get_review(user_id, 1))
+            removed = self.review_repository.save(
+                self._get_review(self._save_reviewer(), 1)
+            )
+
+        with self.transaction_manager:
+            self.review_repository.remove(removed)
+
+        with self.transaction_manager:
+            reviews = self.review_repository.get_by_recipe_id(1)
+        assert [review.id for review in reviews] == [kept.id]
+
+    def test_remove_review_twice_raises_not_found(self):
+        with self.transaction_manager:
+            review = self.review_repository.save(
+                self._get_review(self._save_reviewer(), 1)
+            )
+            self.review_repository.remove(review)
+
+        with (
+            pytest.raises(NotFoundError, match="Review"),
+            self.transaction_manager,
+        ):
+            self.review_repository.remove(review)
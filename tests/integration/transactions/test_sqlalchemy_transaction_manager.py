@@ -140,6 +140,42 @@ class TestSQLAlchemyTransactionManager:
 
         func(self)
 
+    def test_read_only_transaction_is_not_committed(self):
+        user = self._get_user()
+        with self.transaction_manager.read_only():
+            self._create_user(user)
+            assert self._is_user_saved(user)
+
+        assert self._get_session() is None
+        assert not self._is_user_saved(user)
+
+    def test_read_only_inside_transaction_shares_it(self):
+        user = self._get_user()
+        with self.transaction_manager:
+            outer = self._get_session()
+            with self.transaction_manager.read_only():
+                assert id(outer) == id(self._get_session())
+                self._create_user(user)
+
+        assert self._is_user_saved(user)
+
+    def test_read_only_wraps_infrastructure_exception(self):
+        with pytest.raises(ApplicationError, match=r".*Db unavailable.*"):
+            with self.transaction_manager.read_only():
+                raise sqlalchemy.exc.SQLAlchemyError("Db unavailable")
+        assert self._get_session() is None
+
+    def test_transactional_read_only(self):
+        user = self._get_user()
+
+        @transactional(read_only=True)
+        def func(self: Self) -> bool:
+            self._create_user(user)
+            return self._is_user_saved(user)
+
+        assert func(self)
+        assert not self._is_user_saved(user)
+
     def test_applicaion_exception_raises(self):
         with pytest.raises(ApplicationError, match="Some error"):
             with self.transaction_manager:
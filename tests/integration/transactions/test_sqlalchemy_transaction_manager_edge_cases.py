@@ -1,8 +1,14 @@
+import sqlite3
 from unittest.mock import MagicMock
 
 import pytest
+import sqlalchemy.exc
 
-from application.exceptions import ApplicationError
+from application.exceptions import (
+    AlreadyReviewedError,
+    ApplicationError,
+    IntegrityError,
+)
 from infrastructure.sqlalchemy.transactions import (
     SQLAlchemyTransactionManager,
 )
@@ -65,6 +71,28 @@ class TestSQLAlchemyTransactionManagerEdgeCases:
         with pytest.raises(ApplicationError):
             self.tm._handle_exception(err)  # type: ignore
 
+    def test_handle_exception_maps_known_unique_index(self):
+        err = sqlalchemy.exc.IntegrityError(
+            "INSERT",
+            {},
+            sqlite3.IntegrityError(
+                "UNIQUE constraint failed: Reviews.user_id, Reviews.recipe_id"
+            ),
+        )
+        with pytest.raises(AlreadyReviewedError) as raised:
+            self.tm._handle_exception(err)  # type: ignore
+        assert raised.value.cause is err
+        assert str(raised.value) == "User has already reviewed this recipe."
+
+    def test_handle_exception_other_unique_violation(self):
+        err = sqlalchemy.exc.IntegrityError(
+            "INSERT",
+            {},
+            sqlite3.IntegrityError("UNIQUE constraint failed: Users.username"),
+        )
+        with pytest.raises(IntegrityError):
+            self.tm._handle_exception(err)  # type: ignore
+
     def test_handle_exception_reraises_other_exception(self):
         err = RuntimeError("fail")
         with pytest.raises(RuntimeError):
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+import pytest
+
+from application.pagination import decode_cursor, encode_cursor
+from domain.pagination import Cursor
+
+
+class TestCursorToken:
+    def test_round_trip(self) -> None:
+        cursor = Cursor(datetime(2025, 6, 16, 21, 51, 3, 120), 42)
+
+        token = encode_cursor(cursor)
+
+        assert "=" not in token
+        assert decode_cursor(token) == cursor
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "",
+            "not-a-cursor",
+            "WzEsIDJd",  # [1, 2]
+            "WyJuZXdlc3QiLCAieCIsIDFd",  # ["newest", "x", 1]
+            "WyJuZXdlc3QiLCAiMjAyNS0wNi0xNiIsIDBd",  # [..., "2025-06-16", 0]
+            "WyJyYXRpbmciLCAiMjAyNS0wNi0xNiIsIDFd",  # ["rating", ...]
+        ],
+    )
+    def test_invalid_token_raises_error(self, token: str) -> None:
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(token)
+
+    @pytest.mark.parametrize(
+        "value,value_type",
+        [(4.25, float), (3, float), (45, int)],
+    )
+    def test_numeric_round_trip(
+        self, value: float, value_type: type[int | float]
+    ) -> None:
+        token = encode_cursor(Cursor(value, 42), "rating")
+
+        cursor = decode_cursor(token, "rating", value_type)
+
+        assert cursor == Cursor(value, 42)
+        assert type(cursor.value) is value_type
+
+    @pytest.mark.parametrize(
+        "value,value_type",
+        [("4.5", float), (4.5, int), (True, int)],
+    )
+    def test_wrong_value_type_raises_error(
+        self, value: object, value_type: type[int | float]
+    ) -> None:
+        token = encode_cursor(Cursor(value, 42), "time")  # type: ignore
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(token, "time", value_type)
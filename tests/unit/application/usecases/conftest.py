@@ -3,10 +3,17 @@ from unittest.mock import MagicMock, Mock, create_autospec
 
 import pytest
 
+from application.interfaces.services.html_renderer import IHtmlRenderer
 from application.interfaces.services.image_store import IImageStore
+from application.interfaces.services.page_cache import (
+    IPageCacheInvalidator,
+)
 from application.interfaces.services.password_hash_service import (
     IPasswordHasher,
 )
+from application.interfaces.services.recipe_count_cache import (
+    IRecipeCountCache,
+)
 from application.transactions.configuration import CurrentTransactionManager
 from application.transactions.transaction_manager import ITransactionManager
 from domain.clock import Clock, FixedClock
@@ -14,6 +21,7 @@ from domain.entities.recipe.factories import (
     IRecipeFactory,
     IRecipeImageFactory,
 )
+from domain.entities.recipe.value_objects import RecipeMarkup
 from domain.repositories.recipe_repository import IRecipeRepository
 from domain.repositories.review_repository import IReviewRepository
 from domain.repositories.user_repository import IUserRepository
@@ -65,11 +73,46 @@ def mock_image_store():
     return create_autospec(IImageStore, instance=True)
 
 
+@pytest.fixture
+def mock_recipe_count_cache():
+    return create_autospec(IRecipeCountCache, instance=True)
+
+
+@pytest.fixture
+def mock_page_cache():
+    return create_autospec(IPageCacheInvalidator, instance=True)
+
+
+@pytest.fixture
+def mock_html_renderer():
+    mock = create_autospec(IHtmlRenderer, instance=True)
+    mock.render.side_effect = lambda text: f"<p>{text}</p>"
+    mock.render_recipe.return_value = RecipeMarkup(
+        "<p>Description</p>", "<p>Ingredients</p>", "<p>Steps</p>"
+    )
+    return mock
+
+
 @pytest.fixture(autouse=True)
 def mock_transaction_manager():
     mock_manager = Mock(ITransactionManager)
     mock_context = Mock()
     mock_manager.__enter__ = MagicMock(return_value=mock_context)
     mock_manager.__exit__ = MagicMock(return_value=None)
+    mock_manager.read_only.return_value = mock_manager
 
     CurrentTransactionManager.set(mock_manager)
+    return mock_manager
+
+
+@pytest.fixture
+def transaction_log(mock_transaction_manager: Mock) -> list[str]:
+    """
+    Records "commit" when the transaction ends; tests append their own
+    calls to check what happens after it.
+    """
+    log: list[str] = []
+    mock_transaction_manager.__exit__.side_effect = lambda *args: log.append(
+        "commit"
+    )
+    return log
@@ -28,23 +28,32 @@ from domain.entities.user.role import RoleEnum
 
 class TestCreateRecipeUseCase:
     @pytest.fixture(autouse=True)
-    def setup(
+    def setup(  # noqa: PLR0913
         self,
         mock_recipe_repository: Mock,
         mock_recipe_factory: Mock,
         mock_recipe_image_factory: Mock,
         mock_image_store: Mock,
+        mock_recipe_count_cache: Mock,
+        mock_page_cache: Mock,
+        mock_html_renderer: Mock,
     ) -> None:
         self.mock_recipe_repository = mock_recipe_repository
         self.mock_recipe_factory = mock_recipe_factory
         self.mock_recipe_image_factory = mock_recipe_image_factory
         self.mock_image_store = mock_image_store
+        self.mock_recipe_count_cache = mock_recipe_count_cache
+        self.mock_page_cache = mock_page_cache
+        self.mock_html_renderer = mock_html_renderer
 
         self.use_case = CreateRecipeUseCase(
             recipe_factory=self.mock_recipe_factory,
             image_factory=mock_recipe_image_factory,
             recipe_repository=self.mock_recipe_repository,
             image_store=mock_image_store,
+            count_cache=mock_recipe_count_cache,
+            page_cache=mock_page_cache,
+            html_renderer=mock_html_renderer,
         )
 
         self.image = UploadImageCommand(
@@ -128,6 +137,29 @@ class TestCreateRecipeUseCase:
             )
         )
         self.mock_recipe_repository.save.assert_called_once_with(recipe)
+        self.mock_recipe_count_cache.adjust.assert_called_once_with(1)
+        self.mock_page_cache.invalidate_recipe.assert_called_once_with(
+            recipe.id_safe.value
+        )
+
+    def test_renders_markup_before_saving(self) -> None:
+        recipe = self.setup_recipe_entity()
+        command = self.setup_command(recipe)
+
+        def save(saved: Recipe) -> Recipe:
+            assert saved.markup is not None
+            return saved
+
+        self.mock_recipe_repository.save.side_effect = save
+
+        result = self.use_case.execute(
+            command=command, descriptor=self.setup_user()
+        )
+
+        self.mock_html_renderer.render_recipe.assert_called_once_with(recipe)
+        assert result.description_html == "<p>Description</p>"
+        assert result.ingredients_html == "<p>Ingredients</p>"
+        assert result.steps_html == "<p>Steps</p>"
 
     def test_successful_creation_with_images(self) -> None:
         recipe = self.setup_recipe_entity(recipe_id=1)
@@ -154,3 +186,16 @@ class TestCreateRecipeUseCase:
             self.mock_recipe_repository.save.call_count == 2  # noqa: PLR2004
         )
         assert self.mock_image_store.upload.call_count == 1
+
+    def test_caches_follow_the_commit(self, transaction_log: list[str]):
+        recipe = self.setup_recipe_entity()
+        self.mock_recipe_count_cache.adjust.side_effect = (
+            lambda delta: transaction_log.append("count")
+        )
+        self.mock_page_cache.invalidate_recipe.side_effect = (
+            lambda recipe_id: transaction_log.append("page")
+        )
+
+        self.use_case.execute(self.setup_command(recipe), self.setup_user())
+
+        assert transaction_log == ["commit", "count", "page"]
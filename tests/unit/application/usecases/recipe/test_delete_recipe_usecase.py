@@ -14,14 +14,24 @@ from domain.entities.recipe.value_objects import (
     RecipeInstruction,
 )
 from domain.entities.user.role import RoleEnum
+from domain.repositories.recipe_repository import RecipeLoadProfile
 
 
 class TestDeleteRecipeUseCase:
     @pytest.fixture(autouse=True)
-    def setup(self, mock_recipe_repository: Mock) -> None:
+    def setup(
+        self,
+        mock_recipe_repository: Mock,
+        mock_recipe_count_cache: Mock,
+        mock_page_cache: Mock,
+    ) -> None:
         self.mock_recipe_repository = mock_recipe_repository
+        self.mock_recipe_count_cache = mock_recipe_count_cache
+        self.mock_page_cache = mock_page_cache
         self.use_case = DeleteRecipeUseCase(
             recipe_repository=self.mock_recipe_repository,
+            count_cache=self.mock_recipe_count_cache,
+            page_cache=self.mock_page_cache,
         )
 
     def setup_recipe_entity(
@@ -51,8 +61,12 @@ class TestDeleteRecipeUseCase:
 
         self.use_case.execute(recipe_id=1, descriptor=user)
 
-        self.mock_recipe_repository.get_by_id.assert_called_once_with(1)
+        self.mock_recipe_repository.get_by_id.assert_called_once_with(
+            1, RecipeLoadProfile.OWNERSHIP_CHECK
+        )
         self.mock_recipe_repository.remove.assert_called_once_with(recipe)
+        self.mock_recipe_count_cache.adjust.assert_called_once_with(-1)
+        self.mock_page_cache.invalidate_recipe.assert_called_once_with(1)
 
     def test_forbidden_deletion_by_another_user(self) -> None:
         self.setup_recipe_entity(author_id=10)
@@ -61,5 +75,22 @@ class TestDeleteRecipeUseCase:
         with pytest.raises(PermissionError):
             self.use_case.execute(recipe_id=1, descriptor=user)
 
-        self.mock_recipe_repository.get_by_id.assert_called_once_with(1)
+        self.mock_recipe_repository.get_by_id.assert_called_once_with(
+            1, RecipeLoadProfile.OWNERSHIP_CHECK
+        )
         self.mock_recipe_repository.remove.assert_not_called()
+        self.mock_recipe_count_cache.adjust.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_not_called()
+
+    def test_caches_follow_the_commit(self, transaction_log: list[str]):
+        self.setup_recipe_entity(author_id=10)
+        self.mock_recipe_count_cache.adjust.side_effect = (
+            lambda delta: transaction_log.append("count")
+        )
+        self.mock_page_cache.invalidate_recipe.side_effect = (
+            lambda recipe_id: transaction_log.append("page")
+        )
+
+        self.use_case.execute(recipe_id=1, descriptor=self.setup_user(10))
+
+        assert transaction_log == ["commit", "count", "page"]
@@ -0,0 +1,92 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.dtos.recipe.recipe_dto import IngredientSearchPageDTO
+from application.usecases.recipe.find_recipes_by_ingredients_usecase import (
+    FindRecipesByIngredientsUseCase,
+)
+from domain.constants import MAX_INGREDIENTS_PER_QUERY, MAX_PER_PAGE
+from domain.entities.entity import Id
+from domain.entities.recipe.recipe import (
+    RecipeIngredientMatch,
+    RecipeSummary,
+)
+from domain.entities.recipe.value_objects import RecipeDetails, RecipeRating
+
+
+class TestFindRecipesByIngredientsUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_recipe_repository: Mock) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.use_case = FindRecipesByIngredientsUseCase(
+            recipe_repository=self.mock_recipe_repository
+        )
+
+    def setup_matches(self, count: int) -> None:
+        self.mock_recipe_repository.find_by_ingredients.return_value = [
+            RecipeIngredientMatch(
+                summary=RecipeSummary(
+                    recipe_id=Id(i),
+                    title=f"Title {i}",
+                    details=RecipeDetails(preparation_time=60, servings=4),
+                    author_id=Id(1),
+                    rating=RecipeRating.empty(),
+                    cover=None,
+                ),
+                matched_count=count - i + 1,
+            )
+            for i in range(1, count + 1)
+        ]
+
+    def test_successful_find(self) -> None:
+        self.setup_matches(2)
+
+        result = self.use_case.execute(
+            [" Мука ", "молоко", "мука", ""], page=1, per_page=10
+        )
+
+        assert isinstance(result, IngredientSearchPageDTO)
+        assert result.ingredients == ["Мука", "молоко"]
+        assert [m.recipe.id for m in result.matches] == [1, 2]
+        assert [m.matched_count for m in result.matches] == [2, 1]
+        assert not result.has_next
+        assert not result.has_previous
+        self.mock_recipe_repository.find_by_ingredients.assert_called_once_with(
+            ["Мука", "молоко"], limit=11, offset=0
+        )
+
+    def test_extra_match_means_next_page(self) -> None:
+        self.setup_matches(3)
+
+        result = self.use_case.execute(["мука"], page=2, per_page=2)
+
+        assert len(result.matches) == 2  # noqa: PLR2004
+        assert result.has_next
+        assert result.has_previous
+        self.mock_recipe_repository.find_by_ingredients.assert_called_once_with(
+            ["мука"], limit=3, offset=2
+        )
+
+    @pytest.mark.parametrize("ingredients", [[], ["", "  "]])
+    def test_no_ingredients_raises_error(self, ingredients: list[str]) -> None:
+        with pytest.raises(ValueError, match="No ingredients given"):
+            self.use_case.execute(ingredients, page=1, per_page=10)
+        self.mock_recipe_repository.find_by_ingredients.assert_not_called()
+
+    def test_too_many_ingredients_raises_error(self) -> None:
+        ingredients = [f"i{n}" for n in range(MAX_INGREDIENTS_PER_QUERY + 1)]
+
+        with pytest.raises(ValueError, match="Too many ingredients"):
+            self.use_case.execute(ingredients, page=1, per_page=10)
+        self.mock_recipe_repository.find_by_ingredients.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "page,per_page", [(0, 10), (1, 0), (1, MAX_PER_PAGE + 1)]
+    )
+    def test_invalid_pagination_raises_error(
+        self, page: int, per_page: int
+    ) -> None:
+        with pytest.raises(ValueError, match="Invalid pagination parameters"):
+            self.use_case.execute(["мука"], page=page, per_page=per_page)
+        self.mock_recipe_repository.find_by_ingredients.assert_not_called()
@@ -0,0 +1,44 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.dtos.recipe.recipe_dto import ContentVersionDTO
+from application.usecases.recipe.get_catalog_version_usecase import (
+    GetCatalogVersionUseCase,
+)
+
+
+class TestGetCatalogVersionUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, mock_recipe_repository: Mock, mock_recipe_count_cache: Mock
+    ) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.mock_recipe_count_cache = mock_recipe_count_cache
+        self.use_case = GetCatalogVersionUseCase(
+            recipe_repository=self.mock_recipe_repository,
+            count_cache=self.mock_recipe_count_cache,
+        )
+
+    def test_returns_version_with_cached_count(self) -> None:
+        modified = datetime(2025, 6, 16, 21, 51)
+        self.mock_recipe_repository.get_catalog_updated_at.return_value = (
+            modified
+        )
+        self.mock_recipe_count_cache.get.return_value = 12
+
+        result = self.use_case.execute()
+
+        assert result == ContentVersionDTO(modified, 12, dates_deletions=False)
+        self.mock_recipe_repository.count.assert_not_called()
+
+    def test_count_is_cached_on_miss(self) -> None:
+        self.mock_recipe_repository.get_catalog_updated_at.return_value = None
+        self.mock_recipe_count_cache.get.return_value = None
+        self.mock_recipe_repository.count.return_value = 0
+
+        result = self.use_case.execute()
+
+        assert result == ContentVersionDTO(None, 0, dates_deletions=False)
+        self.mock_recipe_count_cache.set.assert_called_once_with(0)
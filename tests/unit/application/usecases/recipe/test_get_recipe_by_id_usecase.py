@@ -1,44 +1,75 @@
+from collections import Counter
 from datetime import datetime
 from unittest.mock import Mock
 
 import pytest
 
 from application.dtos.recipe.recipe_dto import FullRecipeDTO
+from application.pagination import decode_cursor
 from application.usecases.recipe.get_recipe_by_id_usecase import (
     GetRecipeByIdUseCase,
 )
+from domain.constants import REVIEWS_PER_PAGE
 from domain.entities.entity import Id
-from domain.entities.recipe.recipe import Recipe
+from domain.entities.recipe.recipe import Recipe, RecipeDetail
 from domain.entities.recipe.value_objects import (
     RecipeContent,
     RecipeDetails,
     RecipeInstruction,
+    RecipeRating,
 )
 from domain.entities.review.review import AuthoredReview, Review
+from domain.entities.review.value_objects import RatingHistogram
 from domain.entities.user.role import RoleEnum
 from domain.entities.user.user import User
 from domain.entities.user.value_objects import FullName
+from domain.pagination import Cursor, KeysetPage
 
 
 class TestGetRecipeByIdUseCase:
     @pytest.fixture(autouse=True)
     def setup(
-        self,
-        mock_recipe_repository: Mock,
-        mock_review_repository: Mock,
-        mock_user_repository: Mock,
+        self, mock_recipe_repository: Mock, mock_review_repository: Mock
     ) -> None:
         self.mock_recipe_repository = mock_recipe_repository
         self.mock_review_repository = mock_review_repository
-        self.mock_user_repository = mock_user_repository
         self.use_case = GetRecipeByIdUseCase(
             recipe_repository=self.mock_recipe_repository,
             review_repository=self.mock_review_repository,
-            user_repository=mock_user_repository,
+        )
+        self.recipe: Recipe | None = None
+        self.author: User | None = None
+        self.reviews: list[AuthoredReview] = []
+
+    def setup_detail(
+        self,
+        *,
+        reviewed_by_viewer: bool = False,
+        next_cursor: Cursor | None = None,
+    ) -> None:
+        assert self.recipe and self.author
+        self.mock_recipe_repository.get_detail.return_value = RecipeDetail(
+            recipe=self.recipe,
+            author=self.author,
+            reviewed_by_viewer=reviewed_by_viewer,
+            rating_histogram=RatingHistogram.from_counts(
+                Counter(r.review.rating for r in self.reviews)
+            ),
+        )
+        self.mock_review_repository.get_page_by_recipe_id.return_value = (
+            KeysetPage(
+                items=self.reviews,
+                next_cursor=next_cursor,
+                previous_cursor=None,
+            )
         )
 
     def setup_recipe_entity(
-        self, *, recipe_id: int = 1, author_id: int = 1
+        self,
+        *,
+        recipe_id: int = 1,
+        author_id: int = 1,
+        rating: RecipeRating | None = None,
     ) -> Recipe:
         recipe = Recipe(
             entity_id=Id(recipe_id),
@@ -49,8 +80,9 @@ class TestGetRecipeByIdUseCase:
             ),
             author_id=Id(author_id),
             images=[],
+            rating=rating or RecipeRating.empty(),
         )
-        self.mock_recipe_repository.get_by_id.return_value = recipe
+        self.recipe = recipe
         return recipe
 
     def setup_review(self, *, recipe_id: int = 1, user_id: int = 1):
@@ -70,9 +102,7 @@ class TestGetRecipeByIdUseCase:
             role=RoleEnum.USER.value,
         )
         entity = AuthoredReview(review, user)
-        self.mock_review_repository.get_with_author_by_recipe_id.return_value = [
-            entity
-        ]
+        self.reviews.append(entity)
         return entity
 
     def setup_user_entity(
@@ -85,15 +115,18 @@ class TestGetRecipeByIdUseCase:
             password_hash="hash",
             role=RoleEnum.USER.value,
         )
-        self.mock_user_repository.get_by_id.return_value = user
+        self.author = user
         return user
 
     def test_successful_retrieval(self) -> None:
         author = self.setup_user_entity(user_id=1)
-        recipe = self.setup_recipe_entity(author_id=1)
+        recipe = self.setup_recipe_entity(
+            author_id=1, rating=RecipeRating(rating_sum=4, review_count=1)
+        )
         authored_review = self.setup_review(recipe_id=1)
         review = authored_review.review
         review_author = authored_review.author
+        self.setup_detail()
 
         result = self.use_case.execute(recipe_id=1)
 
@@ -123,21 +156,51 @@ class TestGetRecipeByIdUseCase:
         assert reviews_dto[0].review.rating == float(review.rating)
         assert reviews_dto[0].user.id == review_author.id_safe.value
 
-        self.mock_user_repository.get_by_id.assert_called_once_with(
-            author.id_safe.value
+        self.mock_recipe_repository.get_detail.assert_called_once_with(
+            recipe.id_safe.value, None
         )
-        self.mock_recipe_repository.get_by_id.assert_called_once_with(
-            recipe.id_safe.value
+        self.mock_review_repository.get_page_by_recipe_id.assert_called_once_with(
+            recipe.id_safe.value, limit=REVIEWS_PER_PAGE
         )
-        self.mock_review_repository.get_with_author_by_recipe_id.assert_called_once_with(
-            recipe.id_safe.value
+        assert result.next_reviews_cursor is None
+        assert result.reviewed_by_viewer is False
+
+        # Histogram
+        assert result.rating_histogram
+        assert result.rating_histogram.counts == (0, 0, 0, 0, 1, 0)
+        assert result.rating_histogram.percent(review.rating) == 100  # noqa: PLR2004
+
+    def test_more_reviews_than_a_page(self) -> None:
+        self.setup_user_entity()
+        self.setup_recipe_entity(
+            rating=RecipeRating(rating_sum=40, review_count=11)
         )
+        self.setup_review()
+        cursor = Cursor(datetime(2025, 6, 16, 21, 51), 1)
+        self.setup_detail(next_cursor=cursor)
+
+        result = self.use_case.execute(recipe_id=1)
+
+        assert result.next_reviews_cursor is not None
+        assert decode_cursor(result.next_reviews_cursor, "reviews") == cursor
+        # The summary still counts every review, not only the loaded page
+        assert result.summary.review_count == 11  # noqa: PLR2004
+
+    def test_reviewed_by_viewer(self) -> None:
+        self.setup_user_entity()
+        self.setup_recipe_entity()
+        self.setup_detail(reviewed_by_viewer=True)
+
+        result = self.use_case.execute(recipe_id=1, viewer_id=2)
+
+        assert result.reviewed_by_viewer is True
+        self.mock_recipe_repository.get_detail.assert_called_once_with(1, 2)
 
     def test_retrieval_with_no_reviews(self) -> None:
+        self.setup_user_entity()
         self.setup_recipe_entity()
-        self.mock_review_repository.get_with_author_by_recipe_id.return_value = (
-            []
-        )
+        self.setup_detail()
+
         result = self.use_case.execute(recipe_id=1)
 
         assert isinstance(result, FullRecipeDTO)
@@ -145,3 +208,18 @@ class TestGetRecipeByIdUseCase:
         assert result.summary.average_rating == 0
         assert result.summary.review_count == 0
         assert result.reviews == []
+        assert result.rating_histogram
+        assert result.rating_histogram.total == 0
+        assert result.rating_histogram.percent(5) == 0
+
+    def test_runs_in_read_only_transaction(
+        self, mock_transaction_manager: Mock
+    ) -> None:
+        self.setup_user_entity()
+        self.setup_recipe_entity()
+        self.setup_detail()
+
+        self.use_case.execute(recipe_id=1)
+
+        mock_transaction_manager.read_only.assert_called_once_with()
+        mock_transaction_manager.__enter__.assert_called_once()
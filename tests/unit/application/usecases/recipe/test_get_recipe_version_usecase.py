@@ -0,0 +1,55 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.dtos.recipe.recipe_dto import ContentVersionDTO
+from application.exceptions import NotFoundError
+from application.usecases.recipe.get_recipe_version_usecase import (
+    GetRecipeVersionUseCase,
+)
+from domain.entities.recipe.recipe import ContentVersion
+
+
+class TestGetRecipeVersionUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_recipe_repository: Mock) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.use_case = GetRecipeVersionUseCase(
+            recipe_repository=self.mock_recipe_repository
+        )
+
+    def test_returns_version(self) -> None:
+        modified = datetime(2025, 6, 16, 21, 51)
+        self.mock_recipe_repository.get_version.return_value = ContentVersion(
+            modified, 3
+        )
+
+        result = self.use_case.execute(recipe_id=1)
+
+        assert result == ContentVersionDTO(modified, 3)
+        self.mock_recipe_repository.get_version.assert_called_once_with(1)
+
+    def test_recipe_not_found(self) -> None:
+        self.mock_recipe_repository.get_version.side_effect = NotFoundError(
+            1, "Recipe"
+        )
+
+        with pytest.raises(NotFoundError):
+            self.use_case.execute(recipe_id=1)
+
+
+class TestContentVersion:
+    def test_combine_takes_latest_change_and_sums_rows(self) -> None:
+        version = ContentVersion.combine(
+            ContentVersion(datetime(2025, 6, 1), 1),
+            ContentVersion(None, 0),
+            ContentVersion(datetime(2025, 6, 2), 2),
+        )
+
+        assert version == ContentVersion(datetime(2025, 6, 2), 3)
+
+    def test_combine_without_timestamps(self) -> None:
+        version = ContentVersion.combine(ContentVersion(None, 0))
+
+        assert version == ContentVersion(None, 0)
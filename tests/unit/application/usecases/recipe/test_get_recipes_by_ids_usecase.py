@@ -0,0 +1,60 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.usecases.recipe.get_recipes_by_ids_usecase import (
+    GetRecipesByIdsUseCase,
+)
+from domain.constants import MAX_IDS_PER_QUERY
+from domain.entities.entity import Id
+from domain.entities.recipe.recipe import RecipeSummary
+from domain.entities.recipe.value_objects import RecipeDetails, RecipeRating
+
+
+class TestGetRecipesByIdsUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_recipe_repository: Mock) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.use_case = GetRecipesByIdsUseCase(
+            recipe_repository=self.mock_recipe_repository
+        )
+
+    def setup_results(self, *recipe_ids: int) -> None:
+        self.mock_recipe_repository.get_summaries_by_ids.return_value = [
+            RecipeSummary(
+                recipe_id=Id(i),
+                title=f"Title {i}",
+                details=RecipeDetails(preparation_time=60, servings=4),
+                author_id=Id(1),
+                rating=RecipeRating.empty(),
+                cover=None,
+            )
+            for i in recipe_ids
+        ]
+
+    def test_keeps_requested_order(self) -> None:
+        self.setup_results(1, 2, 3)
+
+        result = self.use_case.execute([3, 1, 3, 2])
+
+        assert [r.id for r in result] == [3, 1, 2]
+        self.mock_recipe_repository.get_summaries_by_ids.assert_called_once_with(
+            [3, 1, 2]
+        )
+
+    def test_skips_missing_recipes(self) -> None:
+        self.setup_results(2)
+
+        result = self.use_case.execute([1, 2])
+
+        assert [r.id for r in result] == [2]
+
+    def test_no_ids(self) -> None:
+        with pytest.raises(ValueError, match="No recipe ids given."):
+            self.use_case.execute([])
+
+    def test_too_many_ids(self) -> None:
+        with pytest.raises(ValueError, match="Too many recipe ids."):
+            self.use_case.execute(range(1, MAX_IDS_PER_QUERY + 2))
+
+        self.mock_recipe_repository.get_summaries_by_ids.assert_not_called()
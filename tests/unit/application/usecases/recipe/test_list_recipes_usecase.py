@@ -3,73 +3,194 @@ from unittest.mock import Mock
 
 import pytest
 
-from application.dtos.recipe.recipe_dto import RecipeSummaryDTO
+from application.commands.recipe.filter_recipes_command import (
+    FilterRecipesCommand,
+)
+from application.dtos.recipe.recipe_dto import RecipePageDTO, RecipeSummaryDTO
+from application.pagination import decode_cursor, encode_cursor
 from application.usecases.recipe.list_recipes_usecase import ListRecipesUseCase
 from domain.constants import MAX_PER_PAGE
 from domain.entities.entity import Id
-from domain.entities.recipe.recipe import Recipe
-from domain.entities.recipe.value_objects import (
-    RecipeContent,
-    RecipeDetails,
-    RecipeInstruction,
+from domain.entities.recipe.image import RecipeImage
+from domain.entities.recipe.recipe import RecipeSummary
+from domain.entities.recipe.value_objects import RecipeDetails, RecipeRating
+from domain.pagination import Cursor, KeysetPage
+from domain.repositories.recipe_repository import (
+    RecipeFilter,
+    RecipeListSpec,
+    RecipeSort,
 )
 
 
 class TestListRecipesUseCase:
     @pytest.fixture(autouse=True)
     def setup(
-        self, mock_recipe_repository: Mock, mock_review_repository: Mock
+        self, mock_recipe_repository: Mock, mock_recipe_count_cache: Mock
     ) -> None:
         self.mock_recipe_repository = mock_recipe_repository
-        self.mock_review_repository = mock_review_repository
+        self.mock_recipe_count_cache = mock_recipe_count_cache
+        self.mock_recipe_count_cache.get.return_value = 1
         self.use_case = ListRecipesUseCase(
             recipe_repository=self.mock_recipe_repository,
-            review_repository=self.mock_review_repository,
+            count_cache=self.mock_recipe_count_cache,
         )
 
-    def setup_recipe_entity(
-        self, *, recipe_id: int = 1, author_id: int = 1
-    ) -> Recipe:
-        recipe = Recipe(
-            entity_id=Id(recipe_id),
-            content=RecipeContent(title="Title", description="Description"),
+    def setup_recipe_page(
+        self,
+        *,
+        recipe_id: int = 1,
+        rating: RecipeRating | None = None,
+        cover: RecipeImage | None = None,
+        next_cursor: Cursor | None = None,
+        previous_cursor: Cursor | None = None,
+    ) -> RecipeSummary:
+        summary = RecipeSummary(
+            recipe_id=Id(recipe_id),
+            title="Title",
             details=RecipeDetails(preparation_time=60, servings=4),
-            instruction=RecipeInstruction(
-                ingredients="Ingredients", steps="Steps"
-            ),
-            author_id=Id(author_id),
-            images=[],
+            author_id=Id(1),
+            rating=rating or RecipeRating.empty(),
+            cover=cover,
+        )
+        self.mock_recipe_repository.get_summary_page.return_value = KeysetPage(
+            items=[summary],
+            next_cursor=next_cursor,
+            previous_cursor=previous_cursor,
         )
-        self.mock_recipe_repository.get_all.return_value = [recipe]
-        return recipe
+        return summary
 
-    def setup_review(self, *, user_id: int = 1):
-        from domain.entities.review.review import Review
+    def test_successful_list(self) -> None:
+        self.setup_recipe_page(
+            rating=RecipeRating(rating_sum=9, review_count=2)
+        )
+        result = self.use_case.execute(page=1, per_page=10)
+        assert isinstance(result, RecipePageDTO)
+        assert len(result.recipes) == 1
+        assert isinstance(result.recipes[0], RecipeSummaryDTO)
+        assert result.recipes[0].id == 1
+        assert result.recipes[0].average_rating == 4.5  # noqa: PLR2004
+        assert result.recipes[0].review_count == 2  # noqa: PLR2004
+        assert result.recipes[0].images == []
+        assert result.page == 1
+        assert not result.has_next
+        assert not result.has_previous
 
-        review = Review(
-            entity_id=Id(1),
-            recipe_id=Id(1),
-            user_id=Id(user_id),
-            rating=4,
-            text="Delicious recipe!",
-            created_at=datetime(2025, 6, 16, 21, 51),
+        self.mock_recipe_repository.get_summary_page.assert_called_once_with(
+            limit=10, offset=0, spec=RecipeListSpec()
         )
-        self.mock_review_repository.get_by_recipe_id.return_value = [review]
-        return review
 
-    def test_successful_list(self) -> None:
-        self.setup_recipe_entity()
-        self.setup_review()
+    def test_total_count_from_cache(self) -> None:
+        self.setup_recipe_page()
+        self.mock_recipe_count_cache.get.return_value = 21
+
+        result = self.use_case.execute(page=1, per_page=10)
+
+        assert result.total_count == 21  # noqa: PLR2004
+        assert result.total_pages == 3  # noqa: PLR2004
+        self.mock_recipe_repository.count.assert_not_called()
+
+    def test_total_count_computed_on_cache_miss(self) -> None:
+        self.setup_recipe_page()
+        self.mock_recipe_count_cache.get.return_value = None
+        self.mock_recipe_repository.count.return_value = 7
+
         result = self.use_case.execute(page=1, per_page=10)
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert isinstance(result[0], RecipeSummaryDTO)
-        assert result[0].id == 1
 
-        self.mock_recipe_repository.get_all.assert_called_once_with(
-            page=1, per_page=10
+        assert result.total_count == 7  # noqa: PLR2004
+        assert result.total_pages == 1
+        self.mock_recipe_count_cache.set.assert_called_once_with(7)
+
+    def test_cover_becomes_single_image(self) -> None:
+        self.setup_recipe_page(
+            cover=RecipeImage(
+                entity_id=Id(3),
+                filename="cover.jpg",
+                mime_type="image/jpeg",
+                recipe_id=Id(1),
+            )
+        )
+
+        result = self.use_case.execute(page=1, per_page=10)
+
+        assert [img.filename for img in result.recipes[0].images] == [
+            "cover.jpg"
+        ]
+
+    def test_list_without_reviews_has_zero_rating(self) -> None:
+        self.setup_recipe_page()
+
+        result = self.use_case.execute(page=1, per_page=10)
+
+        assert result.recipes[0].average_rating == 0
+        assert result.recipes[0].review_count == 0
+
+    def test_empty_page(self) -> None:
+        self.mock_recipe_repository.get_summary_page.return_value = KeysetPage(
+            items=[], next_cursor=None, previous_cursor=None
+        )
+
+        result = self.use_case.execute(page=1, per_page=10)
+
+        assert result.recipes == []
+        assert not result.has_next
+
+    def test_legacy_page_number_seeks_by_offset(self) -> None:
+        self.setup_recipe_page()
+
+        self.use_case.execute(page=3, per_page=10)
+
+        self.mock_recipe_repository.get_summary_page.assert_called_once_with(
+            limit=10, offset=20, spec=RecipeListSpec()
+        )
+
+    def test_cursors_are_encoded(self) -> None:
+        next_cursor = Cursor(datetime(2025, 6, 16, 21, 51), 1)
+        previous_cursor = Cursor(datetime(2025, 6, 17, 9, 30), 5)
+        self.setup_recipe_page(
+            next_cursor=next_cursor, previous_cursor=previous_cursor
+        )
+
+        result = self.use_case.execute(page=2, per_page=10)
+
+        assert result.has_next
+        assert result.has_previous
+        assert decode_cursor(result.next_cursor or "") == next_cursor
+        assert decode_cursor(result.previous_cursor or "") == previous_cursor
+
+    def test_after_cursor_is_decoded(self) -> None:
+        cursor = Cursor(datetime(2025, 6, 16, 21, 51), 7)
+        self.setup_recipe_page()
+
+        self.use_case.execute(page=2, per_page=10, after=encode_cursor(cursor))
+
+        self.mock_recipe_repository.get_summary_page.assert_called_once_with(
+            limit=10, after=cursor, before=None, spec=RecipeListSpec()
+        )
+
+    def test_before_cursor_is_decoded(self) -> None:
+        cursor = Cursor(datetime(2025, 6, 16, 21, 51), 7)
+        self.setup_recipe_page()
+
+        self.use_case.execute(
+            page=1, per_page=10, before=encode_cursor(cursor)
         )
-        self.mock_review_repository.get_by_recipe_id.assert_called_once_with(1)
+
+        self.mock_recipe_repository.get_summary_page.assert_called_once_with(
+            limit=10, after=None, before=cursor, spec=RecipeListSpec()
+        )
+
+    def test_invalid_cursor_raises_error(self) -> None:
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            self.use_case.execute(page=2, per_page=10, after="broken")
+        self.mock_recipe_repository.get_summary_page.assert_not_called()
+
+    def test_both_cursors_raise_error(self) -> None:
+        token = encode_cursor(Cursor(datetime(2025, 6, 16, 21, 51), 7))
+        with pytest.raises(ValueError, match="Invalid pagination parameters"):
+            self.use_case.execute(
+                page=2, per_page=10, after=token, before=token
+            )
+        self.mock_recipe_repository.get_summary_page.assert_not_called()
 
     @pytest.mark.parametrize(
         "page,per_page",
@@ -86,5 +207,90 @@ class TestListRecipesUseCase:
     ) -> None:
         with pytest.raises(ValueError, match="Invalid pagination parameters"):
             self.use_case.execute(page=page, per_page=per_page)
-        self.mock_recipe_repository.get_all.assert_not_called()
-        self.mock_review_repository.get_by_recipe_id.assert_not_called()
+        self.mock_recipe_repository.get_summary_page.assert_not_called()
+
+    def test_filters_become_spec(self) -> None:
+        self.setup_recipe_page()
+
+        self.use_case.execute(
+            page=1,
+            per_page=10,
+            filters=FilterRecipesCommand(
+                sort="rating", max_preparation_time=30, servings=4
+            ),
+        )
+
+        self.mock_recipe_repository.get_summary_page.assert_called_once_with(
+            limit=10,
+            offset=0,
+            spec=RecipeListSpec(
+                sort=RecipeSort.RATING,
+                filters=RecipeFilter(max_preparation_time=30, servings=4),
+            ),
+        )
+
+    def test_filtered_list_is_not_counted(self) -> None:
+        self.setup_recipe_page()
+
+        result = self.use_case.execute(
+            page=1, per_page=10, filters=FilterRecipesCommand(servings=4)
+        )
+
+        assert result.total_count is None
+        assert result.total_pages is None
+        self.mock_recipe_count_cache.get.assert_not_called()
+        self.mock_recipe_repository.count.assert_not_called()
+
+    def test_cursor_carries_sort_key(self) -> None:
+        cursor = Cursor(4.5, 7)
+        self.setup_recipe_page(next_cursor=cursor)
+        filters = FilterRecipesCommand(sort="rating")
+
+        result = self.use_case.execute(page=1, per_page=10, filters=filters)
+        self.use_case.execute(
+            page=2, per_page=10, after=result.next_cursor, filters=filters
+        )
+
+        assert decode_cursor(result.next_cursor or "", "rating", float) == (
+            cursor
+        )
+        self.mock_recipe_repository.get_summary_page.assert_called_with(
+            limit=10,
+            after=cursor,
+            before=None,
+            spec=RecipeListSpec(sort=RecipeSort.RATING),
+        )
+
+    def test_cursor_of_another_sort_raises_error(self) -> None:
+        token = encode_cursor(Cursor(datetime(2025, 6, 16, 21, 51), 7))
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            self.use_case.execute(
+                page=2,
+                per_page=10,
+                after=token,
+                filters=FilterRecipesCommand(sort="time"),
+            )
+        self.mock_recipe_repository.get_summary_page.assert_not_called()
+
+    def test_invalid_sort_raises_error(self) -> None:
+        with pytest.raises(ValueError, match="Invalid sort order"):
+            self.use_case.execute(
+                page=1,
+                per_page=10,
+                filters=FilterRecipesCommand(sort="title"),
+            )
+        self.mock_recipe_repository.get_summary_page.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            FilterRecipesCommand(max_preparation_time=0),
+            FilterRecipesCommand(servings=-1),
+        ],
+    )
+    def test_invalid_filters_raise_error(
+        self, filters: FilterRecipesCommand
+    ) -> None:
+        with pytest.raises(ValueError, match="Invalid filter parameters"):
+            self.use_case.execute(page=1, per_page=10, filters=filters)
+        self.mock_recipe_repository.get_summary_page.assert_not_called()
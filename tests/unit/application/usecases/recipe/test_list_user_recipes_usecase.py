@@ -0,0 +1,72 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.pagination import decode_cursor, encode_cursor
+from application.usecases.recipe.list_user_recipes_usecase import (
+    ListUserRecipesUseCase,
+)
+from domain.constants import MAX_PER_PAGE
+from domain.entities.entity import Id
+from domain.entities.recipe.recipe import RecipeSummary
+from domain.entities.recipe.value_objects import RecipeDetails, RecipeRating
+from domain.pagination import Cursor, KeysetPage
+
+
+class TestListUserRecipesUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_recipe_repository: Mock) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.use_case = ListUserRecipesUseCase(
+            recipe_repository=self.mock_recipe_repository
+        )
+
+    def setup_page(self, next_cursor: Cursor | None = None) -> None:
+        summary = RecipeSummary(
+            recipe_id=Id(3),
+            title="Borscht",
+            details=RecipeDetails(preparation_time=60, servings=4),
+            author_id=Id(7),
+            rating=RecipeRating(9, 2),
+            cover=None,
+        )
+        self.mock_recipe_repository.get_by_author.return_value = KeysetPage(
+            items=[summary], next_cursor=next_cursor, previous_cursor=None
+        )
+
+    def test_first_page(self) -> None:
+        self.setup_page()
+
+        result = self.use_case.execute(user_id=7)
+
+        assert [recipe.id for recipe in result.recipes] == [3]
+        assert result.recipes[0].average_rating == 4.5  # noqa: PLR2004
+        assert not result.has_next
+        self.mock_recipe_repository.get_by_author.assert_called_once_with(
+            7, limit=MAX_PER_PAGE, after=None
+        )
+
+    def test_next_page(self) -> None:
+        after = Cursor(datetime(2025, 6, 17), 4)
+        following = Cursor(datetime(2025, 6, 16), 3)
+        self.setup_page(next_cursor=following)
+
+        result = self.use_case.execute(
+            user_id=7, after=encode_cursor(after, "user_recipes")
+        )
+
+        assert result.next_cursor is not None
+        assert decode_cursor(result.next_cursor, "user_recipes") == following
+        self.mock_recipe_repository.get_by_author.assert_called_once_with(
+            7, limit=MAX_PER_PAGE, after=after
+        )
+
+    def test_invalid_cursor(self) -> None:
+        # A catalog cursor is not a cursor of the user's recipes
+        token = encode_cursor(Cursor(datetime(2025, 6, 17), 4))
+
+        with pytest.raises(ValueError, match="Invalid pagination cursor."):
+            self.use_case.execute(user_id=7, after=token)
+
+        self.mock_recipe_repository.get_by_author.assert_not_called()
@@ -0,0 +1,83 @@
+from unittest.mock import Mock
+
+import pytest
+
+from application.dtos.recipe.recipe_dto import RecipeSearchPageDTO
+from application.usecases.recipe.search_recipes_usecase import (
+    SearchRecipesUseCase,
+)
+from domain.constants import MAX_PER_PAGE, MAX_SEARCH_QUERY_LENGTH
+from domain.entities.entity import Id
+from domain.entities.recipe.recipe import RecipeSummary
+from domain.entities.recipe.value_objects import RecipeDetails, RecipeRating
+
+
+class TestSearchRecipesUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_recipe_repository: Mock) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.use_case = SearchRecipesUseCase(
+            recipe_repository=self.mock_recipe_repository
+        )
+
+    def setup_results(self, count: int) -> None:
+        self.mock_recipe_repository.search.return_value = [
+            RecipeSummary(
+                recipe_id=Id(i),
+                title=f"Title {i}",
+                details=RecipeDetails(preparation_time=60, servings=4),
+                author_id=Id(1),
+                rating=RecipeRating.empty(),
+                cover=None,
+            )
+            for i in range(1, count + 1)
+        ]
+
+    def test_successful_search(self) -> None:
+        self.setup_results(2)
+
+        result = self.use_case.execute("  борщ  ", page=1, per_page=10)
+
+        assert isinstance(result, RecipeSearchPageDTO)
+        assert result.query == "борщ"
+        assert [r.id for r in result.recipes] == [1, 2]
+        assert not result.has_next
+        assert not result.has_previous
+        self.mock_recipe_repository.search.assert_called_once_with(
+            "борщ", limit=11, offset=0
+        )
+
+    def test_extra_result_means_next_page(self) -> None:
+        self.setup_results(3)
+
+        result = self.use_case.execute("борщ", page=2, per_page=2)
+
+        assert [r.id for r in result.recipes] == [1, 2]
+        assert result.has_next
+        assert result.has_previous
+        self.mock_recipe_repository.search.assert_called_once_with(
+            "борщ", limit=3, offset=2
+        )
+
+    @pytest.mark.parametrize("query", ["", "   "])
+    def test_empty_query_raises_error(self, query: str) -> None:
+        with pytest.raises(ValueError, match="Search query is empty"):
+            self.use_case.execute(query, page=1, per_page=10)
+        self.mock_recipe_repository.search.assert_not_called()
+
+    def test_long_query_raises_error(self) -> None:
+        with pytest.raises(ValueError, match="Search query is too long"):
+            self.use_case.execute(
+                "a" * (MAX_SEARCH_QUERY_LENGTH + 1), page=1, per_page=10
+            )
+        self.mock_recipe_repository.search.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "page,per_page", [(0, 10), (1, 0), (1, MAX_PER_PAGE + 1)]
+    )
+    def test_invalid_pagination_raises_error(
+        self, page: int, per_page: int
+    ) -> None:
+        with pytest.raises(ValueError, match="Invalid pagination parameters"):
+            self.use_case.execute("борщ", page=page, per_page=per_page)
+        self.mock_recipe_repository.search.assert_not_called()
@@ -17,16 +17,27 @@ from domain.entities.recipe.value_objects import (
     RecipeContent,
     RecipeDetails,
     RecipeInstruction,
+    RecipeMarkup,
 )
 from domain.entities.user.role import RoleEnum
+from domain.repositories.recipe_repository import RecipeLoadProfile
 
 
 class TestUpdateRecipeUseCase:
     @pytest.fixture(autouse=True)
-    def setup(self, mock_recipe_repository: Mock):
+    def setup(
+        self,
+        mock_recipe_repository: Mock,
+        mock_page_cache: Mock,
+        mock_html_renderer: Mock,
+    ):
         self.mock_recipe_repository = mock_recipe_repository
+        self.mock_page_cache = mock_page_cache
+        self.mock_html_renderer = mock_html_renderer
         self.use_case = UpdateRecipeUseCase(
             recipe_repository=self.mock_recipe_repository,
+            page_cache=self.mock_page_cache,
+            html_renderer=self.mock_html_renderer,
         )
 
     def setup_recipe_entity(
@@ -101,8 +112,29 @@ class TestUpdateRecipeUseCase:
         assert result.author_id == user.user_id
 
         self.mock_recipe_repository.get_by_id.assert_called_once_with(
+            command.recipe_id, RecipeLoadProfile.FULL
+        )
+        self.mock_recipe_repository.save.assert_called_once_with(recipe)
+        self.mock_page_cache.invalidate_recipe.assert_called_once_with(
             command.recipe_id
         )
+
+    def test_update_renders_markup_of_new_texts(self):
+        recipe = self.setup_recipe_entity(author_id=1)
+        recipe.markup = RecipeMarkup("<p>Old</p>", "<p>Old</p>", "<p>Old</p>")
+        command = self.setup_command(recipe)
+
+        def render_recipe(rendered: Recipe) -> RecipeMarkup:
+            assert rendered.content.description == command.description
+            return RecipeMarkup("<p>New</p>", "<p>New</p>", "<p>New</p>")
+
+        self.mock_html_renderer.render_recipe.side_effect = render_recipe
+
+        self.use_case.execute(command=command, descriptor=self.setup_user())
+
+        assert recipe.markup == RecipeMarkup(
+            "<p>New</p>", "<p>New</p>", "<p>New</p>"
+        )
         self.mock_recipe_repository.save.assert_called_once_with(recipe)
 
     def test_update_for_non_existent_recipe_raises_error(self):
@@ -114,9 +146,10 @@ class TestUpdateRecipeUseCase:
             self.use_case.execute(command=command, descriptor=user)
 
         self.mock_recipe_repository.get_by_id.assert_called_once_with(
-            command.recipe_id
+            command.recipe_id, RecipeLoadProfile.FULL
         )
         self.mock_recipe_repository.save.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_not_called()
 
     def test_update_by_another_user_raises_error(self):
         recipe = self.setup_recipe_entity(author_id=1)
@@ -125,3 +158,15 @@ class TestUpdateRecipeUseCase:
 
         with pytest.raises(PermissionError):
             self.use_case.execute(command=command, descriptor=user)
+
+    def test_page_is_invalidated_after_commit(
+        self, transaction_log: list[str]
+    ):
+        recipe = self.setup_recipe_entity(author_id=1)
+        self.mock_page_cache.invalidate_recipe.side_effect = (
+            lambda recipe_id: transaction_log.append("page")
+        )
+
+        self.use_case.execute(self.setup_command(recipe), self.setup_user())
+
+        assert transaction_log == ["commit", "page"]
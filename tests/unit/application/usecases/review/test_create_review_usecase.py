@@ -7,6 +7,7 @@ from application.commands.review.create_review_command import (
     CreateReviewCommand,
 )
 from application.dtos.user.user_descriptor import UserDescriptor
+from application.exceptions import AlreadyReviewedError
 from application.usecases.review.create_review_usecase import (
     CreateReviewUseCase,
 )
@@ -19,14 +20,24 @@ from domain.entities.user.role import RoleEnum
 class TestCreateReviewUseCase:
     @pytest.fixture(autouse=True)
     def setup(
-        self, mock_review_repository: Mock, mock_review_factory: Mock
+        self,
+        mock_recipe_repository: Mock,
+        mock_review_repository: Mock,
+        mock_review_factory: Mock,
+        mock_page_cache: Mock,
+        mock_html_renderer: Mock,
     ) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
         self.mock_review_repository = mock_review_repository
         self.mock_review_factory = mock_review_factory
+        self.mock_page_cache = mock_page_cache
+        self.mock_html_renderer = mock_html_renderer
         self.use_case = CreateReviewUseCase(
             review_factory=self.mock_review_factory,
-            recipe_repository=Mock(),
+            recipe_repository=self.mock_recipe_repository,
             review_repository=self.mock_review_repository,
+            page_cache=self.mock_page_cache,
+            html_renderer=self.mock_html_renderer,
         )
 
     def setup_review_entity(
@@ -42,9 +53,6 @@ class TestCreateReviewUseCase:
         )
         self.mock_review_factory.create.return_value = review
         self.mock_review_repository.save.return_value = review
-        self.mock_review_repository.exists_for_user_and_recipe.return_value = (
-            False
-        )
         return review
 
     def setup_command(self) -> CreateReviewCommand:
@@ -81,31 +89,44 @@ class TestCreateReviewUseCase:
             )
         )
         self.mock_review_repository.save.assert_called_once_with(review)
-        self.mock_review_repository.exists_for_user_and_recipe.assert_called_once_with(
-            command.user_id, command.recipe_id
+        self.mock_recipe_repository.adjust_rating.assert_called_once_with(
+            command.recipe_id, rating_delta=review.rating, count_delta=1
+        )
+        self.mock_page_cache.invalidate_recipe.assert_called_once_with(
+            command.recipe_id
         )
 
-    def test_existing_review_raises_error(self) -> None:
-        command = self.setup_command()
-        user = self.setup_user()
-        self.mock_review_repository.exists_for_user_and_recipe.return_value = (
-            True
+    def test_renders_text_before_saving(self) -> None:
+        review = self.setup_review_entity()
+
+        result = self.use_case.execute(
+            command=self.setup_command(), descriptor=self.setup_user()
         )
+
+        self.mock_html_renderer.render.assert_called_once_with(review.text)
+        assert review.text_html == "<p>Delicious recipe!</p>"
+        assert result.text_html == "<p>Delicious recipe!</p>"
+
+    def test_existing_review_raises_error(self) -> None:
+        self.setup_review_entity()
+        self.mock_review_repository.save.side_effect = AlreadyReviewedError()
+
         with pytest.raises(
-            ValueError, match="User has already reviewed this recipe"
+            AlreadyReviewedError, match="User has already reviewed this recipe"
         ):
-            self.use_case.execute(command=command, descriptor=user)
+            self.use_case.execute(
+                command=self.setup_command(), descriptor=self.setup_user()
+            )
 
-        self.mock_review_factory.create.assert_not_called()
-        self.mock_review_repository.save.assert_not_called()
-        self.mock_review_repository.exists_for_user_and_recipe.assert_called_once_with(
-            command.user_id, command.recipe_id
-        )
+        self.mock_recipe_repository.adjust_rating.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_not_called()
 
     def test_unauthorized_role_raises_error(self) -> None:
         command = self.setup_command()
         user = UserDescriptor(
-            user_id=10, username="john_doe", role="Non-existent Role"  # type: ignore
+            user_id=10,
+            username="john_doe",
+            role="Non-existent Role",  # type: ignore
         )
         with pytest.raises(
             PermissionError, match="User cannot create reviews"
@@ -114,4 +135,15 @@ class TestCreateReviewUseCase:
 
         self.mock_review_factory.create.assert_not_called()
         self.mock_review_repository.save.assert_not_called()
-        self.mock_review_repository.exists_for_user_and_recipe.assert_not_called()
+
+    def test_page_is_invalidated_after_commit(
+        self, transaction_log: list[str]
+    ) -> None:
+        self.setup_review_entity()
+        self.mock_page_cache.invalidate_recipe.side_effect = (
+            lambda recipe_id: transaction_log.append("page")
+        )
+
+        self.use_case.execute(self.setup_command(), self.setup_user())
+
+        assert transaction_log == ["commit", "page"]
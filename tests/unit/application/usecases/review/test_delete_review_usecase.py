@@ -0,0 +1,94 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.dtos.user.user_descriptor import UserDescriptor
+from application.exceptions import NotFoundError
+from application.usecases.review.delete_review_usecase import (
+    DeleteReviewUseCase,
+)
+from domain.entities.entity import Id
+from domain.entities.review.review import Review
+from domain.entities.user.role import RoleEnum
+
+
+class TestDeleteReviewUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        mock_recipe_repository: Mock,
+        mock_review_repository: Mock,
+        mock_page_cache: Mock,
+    ) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.mock_review_repository = mock_review_repository
+        self.mock_page_cache = mock_page_cache
+        self.use_case = DeleteReviewUseCase(
+            recipe_repository=self.mock_recipe_repository,
+            review_repository=self.mock_review_repository,
+            page_cache=self.mock_page_cache,
+        )
+
+    def setup_review_entity(self, *, user_id: int = 10) -> Review:
+        review = Review(
+            entity_id=Id(5),
+            recipe_id=Id(1),
+            user_id=Id(user_id),
+            rating=4,
+            text="Delicious recipe!",
+            created_at=datetime(2025, 6, 16, 21, 51),
+        )
+        self.mock_review_repository.get_by_id.return_value = review
+        return review
+
+    def setup_user(self, user_id: int = 10) -> UserDescriptor:
+        return UserDescriptor(
+            user_id=user_id, username="john_doe", role=RoleEnum.USER.value
+        )
+
+    def test_successful_deletion(self) -> None:
+        review = self.setup_review_entity(user_id=10)
+
+        self.use_case.execute(review_id=5, descriptor=self.setup_user(10))
+
+        self.mock_review_repository.get_by_id.assert_called_once_with(5)
+        self.mock_review_repository.remove.assert_called_once_with(review)
+        self.mock_recipe_repository.adjust_rating.assert_called_once_with(
+            1, rating_delta=-4, count_delta=-1
+        )
+        self.mock_page_cache.invalidate_recipe.assert_called_once_with(1)
+
+    def test_forbidden_deletion_by_another_user(self) -> None:
+        self.setup_review_entity(user_id=10)
+
+        with pytest.raises(PermissionError):
+            self.use_case.execute(review_id=5, descriptor=self.setup_user(999))
+
+        self.mock_review_repository.remove.assert_not_called()
+        self.mock_recipe_repository.adjust_rating.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_not_called()
+
+    def test_already_deleted_review_leaves_counters(self) -> None:
+        self.setup_review_entity()
+        self.mock_review_repository.remove.side_effect = NotFoundError(
+            5, "Review"
+        )
+
+        with pytest.raises(NotFoundError):
+            self.use_case.execute(review_id=5, descriptor=self.setup_user())
+
+        self.mock_recipe_repository.adjust_rating.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_not_called()
+
+    def test_page_is_invalidated_after_commit(
+        self, transaction_log: list[str]
+    ) -> None:
+        self.setup_review_entity()
+        self.mock_page_cache.invalidate_recipe.side_effect = (
+            lambda recipe_id: transaction_log.append("page")
+        )
+
+        self.use_case.execute(review_id=5, descriptor=self.setup_user())
+
+        assert transaction_log == ["commit", "page"]
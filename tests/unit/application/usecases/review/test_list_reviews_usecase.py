@@ -0,0 +1,90 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.dtos.review.review_dto import ReviewPageDTO
+from application.pagination import decode_cursor, encode_cursor
+from application.usecases.review.list_reviews_usecase import (
+    ListReviewsUseCase,
+)
+from domain.constants import REVIEWS_PER_PAGE
+from domain.entities.entity import Id
+from domain.entities.review.review import AuthoredReview, Review
+from domain.entities.user.role import RoleEnum
+from domain.entities.user.user import User
+from domain.entities.user.value_objects import FullName
+from domain.pagination import Cursor, KeysetPage
+
+
+class TestListReviewsUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(self, mock_review_repository: Mock) -> None:
+        self.mock_review_repository = mock_review_repository
+        self.use_case = ListReviewsUseCase(
+            review_repository=self.mock_review_repository
+        )
+
+    def setup_page(self, next_cursor: Cursor | None = None) -> None:
+        user = User(
+            entity_id=Id(7),
+            username="reviewer",
+            full_name=FullName(surname="Doe", name="Jane", patronymic=None),
+            password_hash="hash",
+            role=RoleEnum.USER.value,
+        )
+        review = Review(
+            entity_id=Id(3),
+            recipe_id=Id(1),
+            user_id=Id(7),
+            rating=5,
+            text="Great!",
+            created_at=datetime(2025, 6, 16, 21, 51),
+        )
+        self.mock_review_repository.get_page_by_recipe_id.return_value = (
+            KeysetPage(
+                items=[AuthoredReview(review, user)],
+                next_cursor=next_cursor,
+                previous_cursor=None,
+            )
+        )
+
+    def test_first_page(self) -> None:
+        self.setup_page()
+
+        result = self.use_case.execute(recipe_id=1)
+
+        assert isinstance(result, ReviewPageDTO)
+        assert result.recipe_id == 1
+        assert [r.review.review_id for r in result.reviews] == [3]
+        assert result.reviews[0].user.id == 7  # noqa: PLR2004
+        assert not result.has_next
+        self.mock_review_repository.get_page_by_recipe_id.assert_called_once_with(
+            1, limit=REVIEWS_PER_PAGE, after=None
+        )
+
+    def test_next_page(self) -> None:
+        after = Cursor(datetime(2025, 6, 17), 4)
+        following = Cursor(datetime(2025, 6, 16, 21, 51), 3)
+        self.setup_page(next_cursor=following)
+
+        result = self.use_case.execute(
+            recipe_id=1, after=encode_cursor(after, "reviews")
+        )
+
+        assert result.next_cursor is not None
+        assert decode_cursor(result.next_cursor, "reviews") == following
+        self.mock_review_repository.get_page_by_recipe_id.assert_called_once_with(
+            1, limit=REVIEWS_PER_PAGE, after=after
+        )
+
+    @pytest.mark.parametrize(
+        "token",
+        ["garbage", encode_cursor(Cursor(datetime(2025, 6, 17), 4))],
+    )
+    def test_invalid_cursor(self, token: str) -> None:
+        # A recipe listing cursor is not a review cursor
+        with pytest.raises(ValueError, match="Invalid pagination cursor."):
+            self.use_case.execute(recipe_id=1, after=token)
+
+        self.mock_review_repository.get_page_by_recipe_id.assert_not_called()
@@ -0,0 +1,105 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.pagination import decode_cursor, encode_cursor
+from application.usecases.review.list_user_reviews_usecase import (
+    ListUserReviewsUseCase,
+)
+from domain.constants import REVIEWS_PER_PAGE
+from domain.entities.entity import Id
+from domain.entities.recipe.recipe import RecipeSummary
+from domain.entities.recipe.value_objects import RecipeDetails, RecipeRating
+from domain.entities.review.review import Review
+from domain.pagination import Cursor, KeysetPage
+
+
+class TestListUserReviewsUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, mock_recipe_repository: Mock, mock_review_repository: Mock
+    ) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.mock_review_repository = mock_review_repository
+        self.use_case = ListUserReviewsUseCase(
+            recipe_repository=self.mock_recipe_repository,
+            review_repository=self.mock_review_repository,
+        )
+
+    def setup_page(
+        self, recipe_ids: list[int], next_cursor: Cursor | None = None
+    ) -> None:
+        reviews = [
+            Review(
+                entity_id=Id(10 + recipe_id),
+                recipe_id=Id(recipe_id),
+                user_id=Id(7),
+                rating=5,
+                text="Great!",
+                created_at=datetime(2025, 6, 16, 21, 51),
+            )
+            for recipe_id in recipe_ids
+        ]
+        self.mock_review_repository.get_by_user.return_value = KeysetPage(
+            items=reviews, next_cursor=next_cursor, previous_cursor=None
+        )
+        self.mock_recipe_repository.get_summaries_by_ids.side_effect = (
+            lambda ids: [
+                RecipeSummary(
+                    recipe_id=Id(recipe_id),
+                    title=f"Recipe {recipe_id}",
+                    details=RecipeDetails(preparation_time=60, servings=4),
+                    author_id=Id(1),
+                    rating=RecipeRating.empty(),
+                    cover=None,
+                )
+                for recipe_id in ids
+            ]
+        )
+
+    def test_first_page_with_recipe_titles(self) -> None:
+        self.setup_page([2, 1])
+
+        result = self.use_case.execute(user_id=7)
+
+        assert [
+            (r.review.review_id, r.recipe_id, r.recipe_title)
+            for r in result.reviews
+        ] == [(12, 2, "Recipe 2"), (11, 1, "Recipe 1")]
+        assert not result.has_next
+        self.mock_review_repository.get_by_user.assert_called_once_with(
+            7, limit=REVIEWS_PER_PAGE, after=None
+        )
+        (ids,) = self.mock_recipe_repository.get_summaries_by_ids.call_args[0]
+        assert sorted(ids) == [1, 2]
+
+    def test_next_page(self) -> None:
+        after = Cursor(datetime(2025, 6, 17), 4)
+        following = Cursor(datetime(2025, 6, 16, 21, 51), 11)
+        self.setup_page([1], next_cursor=following)
+
+        result = self.use_case.execute(
+            user_id=7, after=encode_cursor(after, "user_reviews")
+        )
+
+        assert result.next_cursor is not None
+        assert decode_cursor(result.next_cursor, "user_reviews") == following
+        self.mock_review_repository.get_by_user.assert_called_once_with(
+            7, limit=REVIEWS_PER_PAGE, after=after
+        )
+
+    def test_review_of_a_removed_recipe_is_skipped(self) -> None:
+        self.setup_page([1, 2])
+        self.mock_recipe_repository.get_summaries_by_ids.side_effect = None
+        self.mock_recipe_repository.get_summaries_by_ids.return_value = []
+
+        result = self.use_case.execute(user_id=7)
+
+        assert result.reviews == []
+
+    def test_invalid_cursor(self) -> None:
+        with pytest.raises(ValueError, match="Invalid pagination cursor."):
+            self.use_case.execute(user_id=7, after="garbage")
+
+        self.mock_review_repository.get_by_user.assert_not_called()
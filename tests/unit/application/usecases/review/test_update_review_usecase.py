@@ -0,0 +1,132 @@
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from application.commands.review.update_review_command import (
+    UpdateReviewCommand,
+)
+from application.dtos.review.review_dto import ReviewDTO
+from application.dtos.user.user_descriptor import UserDescriptor
+from application.exceptions import ReviewChangedError
+from application.usecases.review.update_review_usecase import (
+    UpdateReviewUseCase,
+)
+from domain.entities.entity import Id
+from domain.entities.review.review import Review
+from domain.entities.user.role import RoleEnum
+
+
+class TestUpdateReviewUseCase:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self,
+        mock_recipe_repository: Mock,
+        mock_review_repository: Mock,
+        mock_page_cache: Mock,
+        mock_html_renderer: Mock,
+    ) -> None:
+        self.mock_recipe_repository = mock_recipe_repository
+        self.mock_review_repository = mock_review_repository
+        self.mock_page_cache = mock_page_cache
+        self.mock_html_renderer = mock_html_renderer
+        self.use_case = UpdateReviewUseCase(
+            recipe_repository=self.mock_recipe_repository,
+            review_repository=self.mock_review_repository,
+            page_cache=self.mock_page_cache,
+            html_renderer=self.mock_html_renderer,
+        )
+
+    def setup_review_entity(self, *, user_id: int = 10) -> Review:
+        review = Review(
+            entity_id=Id(5),
+            recipe_id=Id(1),
+            user_id=Id(user_id),
+            rating=4,
+            text="Delicious recipe!",
+            created_at=datetime(2025, 6, 16, 21, 51),
+            text_html="<p>Delicious recipe!</p>",
+        )
+        self.mock_review_repository.get_by_id.return_value = review
+        return review
+
+    def setup_user(
+        self, user_id: int = 10, role=RoleEnum.USER.value
+    ) -> UserDescriptor:
+        return UserDescriptor(user_id=user_id, username="john_doe", role=role)
+
+    def test_successful_update(self) -> None:
+        review = self.setup_review_entity()
+        command = UpdateReviewCommand(review_id=5, rating=2, text="Too salty")
+
+        result = self.use_case.execute(command, self.setup_user())
+
+        assert result == ReviewDTO.from_domain(review)
+        assert (result.rating, result.text) == (2, "Too salty")
+        assert result.text_html == "<p>Too salty</p>"
+        self.mock_review_repository.get_by_id.assert_called_once_with(5)
+        self.mock_review_repository.update.assert_called_once_with(review, 4)
+        self.mock_recipe_repository.adjust_rating.assert_called_once_with(
+            1, rating_delta=-2, count_delta=0
+        )
+        self.mock_page_cache.invalidate_recipe.assert_called_once_with(1)
+
+    def test_same_rating_leaves_counters(self) -> None:
+        self.setup_review_entity()
+        command = UpdateReviewCommand(review_id=5, rating=4, text="Tasty")
+
+        self.use_case.execute(command, self.setup_user())
+
+        self.mock_review_repository.update.assert_called_once()
+        self.mock_recipe_repository.adjust_rating.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_called_once_with(1)
+
+    def test_admin_updates_any_review(self) -> None:
+        self.setup_review_entity(user_id=10)
+        command = UpdateReviewCommand(review_id=5, rating=5, text="Tasty")
+
+        self.use_case.execute(
+            command, self.setup_user(user_id=1, role=RoleEnum.ADMIN.value)
+        )
+
+        self.mock_recipe_repository.adjust_rating.assert_called_once_with(
+            1, rating_delta=1, count_delta=0
+        )
+
+    def test_forbidden_update_by_another_user(self) -> None:
+        review = self.setup_review_entity(user_id=10)
+        command = UpdateReviewCommand(review_id=5, rating=0, text="Awful")
+
+        with pytest.raises(PermissionError):
+            self.use_case.execute(command, self.setup_user(user_id=999))
+
+        assert review.rating == 4  # noqa: PLR2004
+        self.mock_review_repository.update.assert_not_called()
+        self.mock_recipe_repository.adjust_rating.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_not_called()
+
+    def test_concurrent_change_leaves_counters(self) -> None:
+        self.setup_review_entity()
+        self.mock_review_repository.update.side_effect = ReviewChangedError()
+        command = UpdateReviewCommand(review_id=5, rating=2, text="Too salty")
+
+        with pytest.raises(ReviewChangedError):
+            self.use_case.execute(command, self.setup_user())
+
+        self.mock_recipe_repository.adjust_rating.assert_not_called()
+        self.mock_page_cache.invalidate_recipe.assert_not_called()
+
+    def test_page_is_invalidated_after_commit(
+        self, transaction_log: list[str]
+    ) -> None:
+        self.setup_review_entity()
+        self.mock_page_cache.invalidate_recipe.side_effect = (
+            lambda recipe_id: transaction_log.append("page")
+        )
+
+        self.use_case.execute(
+            UpdateReviewCommand(review_id=5, rating=2, text="Too salty"),
+            self.setup_user(),
+        )
+
+        assert transaction_log == ["commit", "page"]
@@ -5,6 +5,8 @@ import pytest
 from domain.clock import Clock
 from domain.entities.entity import Id
 from domain.entities.review.review import Review
+from domain.entities.review.value_objects import RatingHistogram
+from domain.entities.user.role import Role, RoleEnum
 
 
 @pytest.fixture
@@ -62,3 +64,60 @@ class TestReview:
         data = valid_review_data | {field: value}
         with pytest.raises(AssertionError, match=error):
             Review.create(**data)
+
+    def test_update_replaces_content_and_drops_html(self):
+        self.review.text_html = "<p>Delicious recipe!</p>"
+
+        self.review.update(2, "Too salty")
+
+        assert (self.review.rating, self.review.text) == (2, "Too salty")
+        assert self.review.text_html is None
+
+    @pytest.mark.parametrize(
+        "rating,text,error",
+        [
+            (6, "Too salty", "Rating must be between 0 and 5"),
+            (2, "  ", "Review text is required"),
+        ],
+    )
+    def test_update_with_invalid_data_keeps_review(
+        self, rating: int, text: str, error: str
+    ):
+        with pytest.raises(AssertionError, match=error):
+            self.review.update(rating, text)
+
+        assert (self.review.rating, self.review.text) == (
+            4,
+            "Delicious recipe!",
+        )
+
+    @pytest.mark.parametrize(
+        "user_id,role,allowed",
+        [
+            (10, RoleEnum.USER.value, True),
+            (11, RoleEnum.USER.value, False),
+            (11, RoleEnum.ADMIN.value, True),
+        ],
+    )
+    def test_ensure_can_mutate(self, user_id: int, role: Role, allowed: bool):
+        assert self.review.can_mutate(user_id, role) is allowed
+        if allowed:
+            self.review.ensure_can_mutate(user_id, role)
+        else:
+            with pytest.raises(PermissionError, match="this review"):
+                self.review.ensure_can_mutate(user_id, role)
+
+
+class TestRatingHistogram:
+    def test_from_counts_fills_missing_ratings(self):
+        histogram = RatingHistogram.from_counts({5: 3, 1: 1})
+
+        assert histogram.counts == (0, 1, 0, 0, 0, 3)
+
+    def test_empty(self):
+        assert RatingHistogram.empty().counts == (0, 0, 0, 0, 0, 0)
+
+    @pytest.mark.parametrize("counts", [(1, 2, 3), (0, 0, 0, 0, 0, -1)])
+    def test_invalid_counts_raise_assertion(self, counts: tuple[int, ...]):
+        with pytest.raises(AssertionError):
+            RatingHistogram(counts)
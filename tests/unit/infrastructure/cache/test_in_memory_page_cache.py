@@ -0,0 +1,59 @@
+from application.interfaces.services.page_cache import (
+    INDEX_PAGE_TAG,
+    CachedPage,
+    recipe_page_tag,
+)
+from infrastructure.cache.in_memory_page_cache import InMemoryPageCache
+
+
+PAGE = CachedPage(body=b"<html></html>", status=200, content_type="text/html")
+
+
+class TestInMemoryPageCache:
+    def test_miss_then_hit(self):
+        cache = InMemoryPageCache(ttl=60, max_entries=10)
+
+        assert cache.get("/") is None
+        cache.set("/", PAGE, [INDEX_PAGE_TAG])
+
+        assert cache.get("/") == PAGE
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+    def test_expired_entry_misses(self):
+        cache = InMemoryPageCache(ttl=0, max_entries=10)
+        cache.set("/", PAGE, [INDEX_PAGE_TAG])
+
+        assert cache.get("/") is None
+        assert cache.stats().entries == 0
+
+    def test_oldest_entry_is_evicted(self):
+        cache = InMemoryPageCache(ttl=60, max_entries=2)
+        cache.set("/?page=1", PAGE, [INDEX_PAGE_TAG])
+        cache.set("/?page=2", PAGE, [INDEX_PAGE_TAG])
+
+        cache.set("/?page=3", PAGE, [INDEX_PAGE_TAG])
+
+        assert cache.get("/?page=1") is None
+        assert cache.get("/?page=2") == PAGE
+        assert cache.get("/?page=3") == PAGE
+
+    def test_invalidate_recipe_drops_its_page_and_index(self):
+        cache = InMemoryPageCache(ttl=60, max_entries=10)
+        cache.set("/", PAGE, [INDEX_PAGE_TAG])
+        cache.set("/recipes/1", PAGE, [recipe_page_tag(1)])
+        cache.set("/recipes/2", PAGE, [recipe_page_tag(2)])
+
+        cache.invalidate_recipe(1)
+
+        assert cache.get("/") is None
+        assert cache.get("/recipes/1") is None
+        assert cache.get("/recipes/2") == PAGE
+
+    def test_clear(self):
+        cache = InMemoryPageCache(ttl=60, max_entries=10)
+        cache.set("/", PAGE, [INDEX_PAGE_TAG])
+
+        cache.clear()
+
+        assert cache.get("/") is None
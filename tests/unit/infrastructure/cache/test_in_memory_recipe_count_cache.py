@@ -0,0 +1,56 @@
+from infrastructure.cache.in_memory_recipe_count_cache import (
+    InMemoryRecipeCountCache,
+)
+
+
+class TestInMemoryRecipeCountCache:
+    def test_empty_cache_misses(self):
+        cache = InMemoryRecipeCountCache(ttl=60)
+
+        assert cache.get() is None
+
+    def test_set_and_get(self):
+        cache = InMemoryRecipeCountCache(ttl=60)
+
+        cache.set(5)
+
+        assert cache.get() == 5  # noqa: PLR2004
+
+    def test_adjust(self):
+        cache = InMemoryRecipeCountCache(ttl=60)
+        cache.set(5)
+
+        cache.adjust(1)
+        cache.adjust(-3)
+
+        assert cache.get() == 3  # noqa: PLR2004
+
+    def test_adjust_never_goes_negative(self):
+        cache = InMemoryRecipeCountCache(ttl=60)
+        cache.set(0)
+
+        cache.adjust(-1)
+
+        assert cache.get() == 0
+
+    def test_adjust_empty_cache_stays_empty(self):
+        cache = InMemoryRecipeCountCache(ttl=60)
+
+        cache.adjust(1)
+
+        assert cache.get() is None
+
+    def test_invalidate(self):
+        cache = InMemoryRecipeCountCache(ttl=60)
+        cache.set(5)
+
+        cache.invalidate()
+
+        assert cache.get() is None
+
+    def test_expired_value_misses(self):
+        cache = InMemoryRecipeCountCache(ttl=0)
+
+        cache.set(5)
+
+        assert cache.get() is None
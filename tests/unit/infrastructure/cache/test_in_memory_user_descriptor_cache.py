@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+from application.dtos.user.user_descriptor import UserDescriptor
+from domain.entities.user.role import RoleEnum
+from infrastructure.cache.in_memory_user_descriptor_cache import (
+    InMemoryUserDescriptorCache,
+)
+
+
+def descriptor(user_id: int) -> UserDescriptor:
+    return UserDescriptor(user_id, f"user{user_id}", RoleEnum.USER.value)
+
+
+class TestInMemoryUserDescriptorCache:
+    def test_empty_cache_misses(self):
+        cache = InMemoryUserDescriptorCache(ttl=10, max_entries=10)
+
+        assert cache.get(1) is None
+
+    def test_set_and_get(self):
+        cache = InMemoryUserDescriptorCache(ttl=10, max_entries=10)
+
+        cache.set(descriptor(1))
+
+        assert cache.get(1) == descriptor(1)
+        assert cache.get(2) is None
+
+    def test_entry_expires(self):
+        cache = InMemoryUserDescriptorCache(ttl=10, max_entries=10)
+        with patch("time.monotonic", return_value=100.0):
+            cache.set(descriptor(1))
+
+        with patch("time.monotonic", return_value=109.0):
+            assert cache.get(1) == descriptor(1)
+        with patch("time.monotonic", return_value=110.0):
+            assert cache.get(1) is None
+
+    def test_oldest_entry_is_evicted(self):
+        cache = InMemoryUserDescriptorCache(ttl=10, max_entries=2)
+
+        for user_id in (1, 2, 3):
+            cache.set(descriptor(user_id))
+
+        assert cache.get(1) is None
+        assert cache.get(2) == descriptor(2)
+        assert cache.get(3) == descriptor(3)
+
+    def test_clear(self):
+        cache = InMemoryUserDescriptorCache(ttl=10, max_entries=10)
+        cache.set(descriptor(1))
+
+        cache.clear()
+
+        assert cache.get(1) is None
+
+    def test_zero_ttl_disables_cache(self):
+        cache = InMemoryUserDescriptorCache(ttl=0, max_entries=10)
+
+        cache.set(descriptor(1))
+
+        assert cache.get(1) is None
@@ -0,0 +1,119 @@
+from datetime import datetime
+from unittest.mock import create_autospec
+
+from application.dtos.review.review_dto import ReviewDTO
+from infrastructure.presentation.presentators.caching_markdown_renderer import (
+    CachingMarkdownRenderer,
+)
+from presentation.presentators.markdown_renderer import IMarkdownRenderer
+
+
+# "борщ" is four letters of two bytes each in UTF-8, "abcd" four of one
+CYRILLIC_EXTRA_BYTES = 4
+
+
+class TestCachingMarkdownRenderer:
+    def setup_method(self):
+        self.renderer = create_autospec(IMarkdownRenderer, instance=True)
+        self.renderer.render.side_effect = lambda text: f"<p>{text}</p>"
+
+    def entry_size(self, text: str) -> int:
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=10_000)
+        cache.render(text)
+        return cache.stats().resident_bytes
+
+    def test_miss_then_hit(self):
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=10_000)
+
+        assert cache.render("text") == "<p>text</p>"
+        assert cache.render("text") == "<p>text</p>"
+
+        self.renderer.render.assert_called_once_with("text")
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        assert stats.resident_bytes > len("<p>text</p>")
+
+    def test_batch_renders_only_the_misses_at_once(self):
+        self.renderer.render_many.side_effect = lambda texts: [
+            f"<p>{text}</p>" for text in texts
+        ]
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=10_000)
+        cache.render("b")
+
+        rendered = cache.render_many(["a", "b", "c"])
+
+        assert rendered == ["<p>a</p>", "<p>b</p>", "<p>c</p>"]
+        self.renderer.render_many.assert_called_once_with(["a", "c"])
+        assert cache.render_many(["c", "a"]) == ["<p>c</p>", "<p>a</p>"]
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (3, 3, 3)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        size = self.entry_size("a")
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=size * 2)
+        cache.render("a")
+        cache.render("b")
+        cache.render("a")  # "b" is now the least recently used
+
+        cache.render("c")
+
+        stats = cache.stats()
+        assert (stats.entries, stats.evictions) == (2, 1)
+        assert stats.resident_bytes == size * 2
+        cache.render("a")
+        assert cache.stats().hits == 2  # noqa: PLR2004
+        cache.render("b")
+        assert cache.stats().misses == 4  # noqa: PLR2004
+
+    def test_budget_counts_bytes_not_entries(self):
+        small = self.entry_size("a")
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=small * 3)
+        cache.render("a")
+        cache.render("b")
+
+        cache.render("x" * small * 2)
+
+        stats = cache.stats()
+        assert stats.entries == 1
+        assert stats.evictions == 2  # noqa: PLR2004
+        assert stats.resident_bytes <= small * 3
+
+    def test_result_larger_than_budget_is_not_cached(self):
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=50)
+
+        assert cache.render("x" * 100) == f"<p>{'x' * 100}</p>"
+
+        stats = cache.stats()
+        assert (stats.entries, stats.resident_bytes) == (0, 0)
+        assert stats.evictions == 0
+
+    def test_non_ascii_text_is_measured_in_bytes(self):
+        extra = self.entry_size("борщ") - self.entry_size("abcd")
+
+        assert extra == CYRILLIC_EXTRA_BYTES
+
+    def test_clear(self):
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=10_000)
+        cache.render("text")
+
+        cache.clear()
+
+        assert (cache.stats().entries, cache.stats().resident_bytes) == (0, 0)
+        cache.render("text")
+        assert self.renderer.render.call_count == 2  # noqa: PLR2004
+
+    def test_dto_helpers_go_through_the_cache(self):
+        cache = CachingMarkdownRenderer(self.renderer, max_bytes=10_000)
+        review = ReviewDTO(
+            review_id=1,
+            user_id=1,
+            rating=5,
+            text="Tasty",
+            created_at=datetime(2025, 6, 16),
+        )
+
+        cache.render_review(review)
+        rendered = cache.render_review(review)
+
+        assert rendered.text == "<p>Tasty</p>"
+        self.renderer.render.assert_called_once_with("Tasty")
@@ -0,0 +1,107 @@
+from datetime import datetime
+from unittest.mock import create_autospec
+
+from application.dtos.review.review_dto import AuthoredReviewDTO, ReviewDTO
+from application.dtos.user.user_dto import UserDTO
+from infrastructure.presentation.presentators.markdown_renderer import (
+    MarkdownRenderer,
+)
+from infrastructure.presentation.presentators.process_pool_markdown_renderer import (
+    ProcessPoolMarkdownRenderer,
+)
+from presentation.presentators.markdown_renderer import IMarkdownRenderer
+
+
+def authored_review(
+    review_id: int, text_html: str | None
+) -> AuthoredReviewDTO:
+    return AuthoredReviewDTO(
+        review=ReviewDTO(
+            review_id=review_id,
+            user_id=1,
+            rating=5,
+            text=f"review {review_id}",
+            created_at=datetime(2025, 6, 16),
+            text_html=text_html,
+        ),
+        user=UserDTO(
+            id=1,
+            username="user",
+            surname="Doe",
+            name="John",
+            patronymic=None,
+            role="user",
+        ),
+    )
+
+
+class TestProcessPoolMarkdownRenderer:
+    def setup_method(self):
+        self.renderer = create_autospec(IMarkdownRenderer, instance=True)
+        self.renderer.render_many.side_effect = lambda texts: [
+            f"<p>{text}</p>" for text in texts
+        ]
+
+    def test_batch_below_threshold_is_rendered_in_place(self):
+        pool = ProcessPoolMarkdownRenderer(
+            self.renderer, threshold=3, chunk_size=1
+        )
+
+        assert pool.render_many(["a", "b"]) == ["<p>a</p>", "<p>b</p>"]
+
+        self.renderer.render_many.assert_called_once_with(["a", "b"])
+        assert pool._executor is None
+
+    def test_zero_threshold_never_starts_the_pool(self):
+        pool = ProcessPoolMarkdownRenderer(
+            self.renderer, threshold=0, chunk_size=1
+        )
+
+        pool.render_many(["text"] * 100)
+
+        assert pool._executor is None
+
+    def test_single_text_is_rendered_in_place(self):
+        self.renderer.render.return_value = "<p>text</p>"
+        pool = ProcessPoolMarkdownRenderer(
+            self.renderer, threshold=1, chunk_size=1
+        )
+
+        assert pool.render("text") == "<p>text</p>"
+        assert pool._executor is None
+
+    def test_long_batch_is_rendered_by_workers_in_order(self):
+        texts = [f"**review {i}**" for i in range(7)]
+        renderer = MarkdownRenderer()
+        pool = ProcessPoolMarkdownRenderer(
+            renderer, threshold=5, chunk_size=2, max_workers=2
+        )
+        try:
+            rendered = pool.render_many(texts)
+            assert pool._executor is not None
+        finally:
+            pool.shutdown()
+
+        assert rendered == renderer.render_many(texts)
+        assert pool._executor is None
+
+    def test_stored_html_is_kept_and_the_rest_rendered_as_one_batch(self):
+        reviews = [
+            authored_review(1, None),
+            authored_review(2, "<p>stored</p>"),
+            authored_review(3, None),
+        ]
+        pool = ProcessPoolMarkdownRenderer(
+            self.renderer, threshold=0, chunk_size=1
+        )
+
+        rendered = pool.render_authored_reviews(reviews)
+
+        assert [r.review.text for r in rendered] == [
+            "<p>review 1</p>",
+            "<p>stored</p>",
+            "<p>review 3</p>",
+        ]
+        self.renderer.render_many.assert_called_once_with(
+            ["review 1", "review 3"]
+        )
@@ -0,0 +1,31 @@
+from infrastructure.presentation.presentators.markdown_renderer import (
+    MarkdownRenderer,
+)
+from infrastructure.presentation.presentators.sanitized_html_renderer import (
+    SanitizedHtmlRenderer,
+)
+from infrastructure.presentation.sanitizer.bleach_markdown_sanitizer import (
+    BleachMarkdownSanitizer,
+)
+
+
+class TestSanitizedHtmlRenderer:
+    def setup_method(self):
+        self.renderer = SanitizedHtmlRenderer(
+            MarkdownRenderer(), BleachMarkdownSanitizer()
+        )
+
+    def test_render_markdown(self):
+        html = self.renderer.render("**bold** and _italic_")
+
+        assert "<strong>bold</strong>" in html
+        assert "<em>italic</em>" in html
+
+    def test_render_strips_unsafe_html(self):
+        html = self.renderer.render(
+            'Text <script>alert(1)</script><img src=x onerror="alert(2)">'
+        )
+
+        assert "<script>" not in html
+        assert "onerror" not in html
+        assert "Text" in html
@@ -0,0 +1,28 @@
+# ruff: noqa: RUF001 -- Cyrillic units look like Latin letters
+import pytest
+
+from infrastructure.sqlalchemy.search.ingredients import ingredient_tokens
+
+
+class TestIngredientTokens:
+    def test_stems_words(self):
+        assert ingredient_tokens("Картофель, морковь") == {
+            "картофел",
+            "морков",
+        }
+
+    def test_word_forms_share_tokens(self):
+        assert ingredient_tokens("помидоры") == ingredient_tokens("помидор")
+        assert ingredient_tokens("Яйца") == ingredient_tokens("яйцо")
+
+    @pytest.mark.parametrize(
+        "text",
+        ["200 г", "1 ст. ложка", "по вкусу", "0,5 л", "3 шт.", "", " , "],
+    )
+    def test_drops_quantities_and_units(self, text: str):
+        assert ingredient_tokens(text) == set()
+
+    def test_ingredient_list_with_quantities(self):
+        assert ingredient_tokens(
+            "Мука — 200 г\nСоль по вкусу\nМасло сливочное 50 г"
+        ) == ingredient_tokens("мука, соль, сливочное масло")
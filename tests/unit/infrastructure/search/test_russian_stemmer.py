@@ -0,0 +1,51 @@
+import pytest
+
+from infrastructure.sqlalchemy.search.recipe_search import search_terms
+from infrastructure.sqlalchemy.search.russian_stemmer import stem
+
+
+class TestRussianStemmer:
+    @pytest.mark.parametrize(
+        "word,expected",
+        [
+            # Reference output of the Snowball Russian stemmer
+            ("вазы", "ваз"),
+            ("важнейшие", "важн"),
+            ("кошками", "кошк"),
+            ("картофелем", "картофел"),
+            ("вдохновенный", "вдохновен"),
+            ("сливочное", "сливочн"),
+            ("знаменитостей", "знаменит"),
+            ("подумавши", "подума"),
+            ("рассказывали", "рассказыва"),
+        ],
+    )
+    def test_stem(self, word: str, expected: str) -> None:
+        assert stem(word) == expected
+
+    @pytest.mark.parametrize(
+        "forms",
+        [
+            ("картофель", "картофеля", "картофелем"),
+            ("помидор", "помидоры", "помидорами"),
+            ("свёкла", "свеклы", "Свекле"),
+        ],
+    )
+    def test_word_forms_share_a_stem(self, forms: tuple[str, ...]) -> None:
+        assert len({stem(form) for form in forms}) == 1
+
+    @pytest.mark.parametrize("word", ["soup", "42", "щ", "вкс"])
+    def test_words_without_russian_endings_are_kept(self, word: str) -> None:
+        assert stem(word) == word
+
+
+class TestSearchTerms:
+    def test_splits_on_punctuation_and_markdown(self) -> None:
+        assert search_terms("**Борщ**: свёкла, картофель!") == [
+            "борщ",
+            "свекл",
+            "картофел",
+        ]
+
+    def test_no_words(self) -> None:
+        assert search_terms(" ,.! ") == []